@@ -32,9 +32,10 @@ create_db_user() {
 }
 
 if [[ "$1" = 'background-jobs' ]]; then
+    export DJANGO_SETTINGS_MODULE=km_api.worker_settings
     ${MANAGE_CMD} cleanemailconfirmations
     ${MANAGE_CMD} updatelegacyusers
-    ${MANAGE_CMD} updatesubscriptions
+    ${MANAGE_CMD} runsubscriptionworker --once
     ${MANAGE_CMD} sendreminderemails
     exit 0
 fi
@@ -42,6 +43,7 @@ fi
 if [[ "$1" = 'migrate' ]]; then
     create_db_user
     ${MANAGE_CMD} migrate
+    ${MANAGE_CMD} createcachetable
     ${MANAGE_CMD} collectstatic --no-input
     ${MANAGE_CMD} createadmin
     exit 0
@@ -55,6 +57,16 @@ if [[ "$1" = 'server' ]]; then
     exec gunicorn km_api.wsgi:application $@
 fi
 
+if [[ "$1" = 'subscription-worker' ]]; then
+    export DJANGO_SETTINGS_MODULE=km_api.worker_settings
+    exec ${MANAGE_CMD} runsubscriptionworker
+fi
+
+if [[ "$1" = 'task-worker' ]]; then
+    export DJANGO_SETTINGS_MODULE=km_api.worker_settings
+    exec ${MANAGE_CMD} runtaskworker
+fi
+
 if [[ "$1" = '' ]]; then
     echo "No command provided."
     exit 1
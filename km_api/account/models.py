@@ -86,6 +86,19 @@ class User(PermissionsMixin, AbstractBaseUser):
         verbose_name = _("user")
         verbose_name_plural = _("users")
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Create an instance from a database row.
+
+        The name of the user's image is recorded so that changes to it
+        can be detected when the user is saved.
+        """
+        instance = super().from_db(db, field_names, values)
+        instance._saved_image_name = instance.__dict__.get("image")
+
+        return instance
+
     def get_full_name(self):
         """
         Get the user's full name.
@@ -117,3 +130,11 @@ class User(PermissionsMixin, AbstractBaseUser):
             return self.email_addresses.get(is_primary=True)
         except EmailAddress.DoesNotExist:
             return None
+
+    def save(self, *args, **kwargs):
+        """
+        Save the user and record the name of their image.
+        """
+        super().save(*args, **kwargs)
+
+        self._saved_image_name = self.image.name
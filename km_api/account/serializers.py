@@ -9,6 +9,11 @@ from rest_email_auth.serializers import (
 
 from rest_framework import serializers
 
+from custom_storages.serializers import (
+    ImageDerivativesField,
+    UploadTokenField,
+)
+
 
 class RegistrationSerializer(BaseRegistrationSerializer):
     """
@@ -70,6 +75,19 @@ class UserSerializer(serializers.ModelSerializer):
     or name. It does **not** allow for changing the user's password.
     """
 
+    image_derivatives = ImageDerivativesField(
+        help_text="URLs of resized copies of the user's image.",
+        source="image",
+    )
+    image_upload_token = UploadTokenField(
+        get_user_model()._meta.get_field("image"),
+        help_text=(
+            "A token for an image uploaded using the profile image upload "
+            "endpoint. Setting this field replaces the user's image."
+        ),
+        source="image",
+    )
+
     class Meta:
         extra_kwargs = {
             "first_name": {"help_text": "The user's first name."},
@@ -81,6 +99,8 @@ class UserSerializer(serializers.ModelSerializer):
             "updated_at",
             "first_name",
             "image",
+            "image_derivatives",
+            "image_upload_token",
             "is_staff",
             "last_name",
         )
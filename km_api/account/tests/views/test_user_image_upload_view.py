@@ -0,0 +1,40 @@
+from rest_framework import status
+from rest_framework.reverse import reverse
+
+from account import views
+
+
+user_image_upload_view = views.UserImageUploadView.as_view()
+url = reverse("account:profile-image-upload")
+
+
+def test_anonymous(api_rf):
+    """
+    Anonymous users should not be able to request an upload.
+    """
+    request = api_rf.post(url, {"filename": "foo.png"})
+    response = user_image_upload_view(request)
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_create_upload(api_rf, user_factory):
+    """
+    Authenticated users should be able to request an upload for their
+    profile image.
+    """
+    user = user_factory()
+    api_rf.user = user
+
+    request = api_rf.post(url, {"filename": "foo.png"})
+    response = user_image_upload_view(request)
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.data["key"].endswith(".png")
+    assert set(response.data.keys()) == {
+        "form_fields",
+        "key",
+        "method",
+        "token",
+        "url",
+    }
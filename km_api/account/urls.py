@@ -2,6 +2,7 @@
 """
 
 from django.conf.urls import url
+from django.urls import path
 
 from account import views
 
@@ -11,5 +12,10 @@ app_name = "account"
 
 urlpatterns = [
     url(r"^profile/$", views.UserDetailView.as_view(), name="profile"),
+    path(
+        "profile/image-upload/",
+        views.UserImageUploadView.as_view(),
+        name="profile-image-upload",
+    ),
     url(r"^users/$", views.UserListView.as_view(), name="user-list"),
 ]
@@ -7,6 +7,7 @@ from rest_framework import generics, pagination
 from rest_framework.permissions import IsAuthenticated
 
 from account import permissions, serializers
+from custom_storages.serializers import UploadRequestSerializer
 
 
 class UserDetailView(generics.RetrieveUpdateAPIView):
@@ -34,6 +35,34 @@ class UserDetailView(generics.RetrieveUpdateAPIView):
         return self.request.user
 
 
+class UserImageUploadView(generics.CreateAPIView):
+    """
+    post:
+    Request an upload for the current user's profile image.
+
+    The response contains the `url`, `method`, and `form_fields` needed
+    to upload the image directly to storage. Once the upload has
+    completed, the returned `token` can be provided as the
+    `image_upload_token` of the user's profile.
+    """
+
+    permission_classes = (IsAuthenticated,)
+    serializer_class = UploadRequestSerializer
+
+    def perform_create(self, serializer):
+        """
+        Create an upload for the requesting user's image.
+
+        Args:
+            serializer:
+                The serializer containing the upload request.
+        """
+        serializer.save(
+            field=get_user_model()._meta.get_field("image"),
+            instance=self.request.user,
+        )
+
+
 class UserListView(generics.ListAPIView):
     """
     get:
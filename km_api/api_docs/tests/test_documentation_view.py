@@ -0,0 +1,102 @@
+from unittest import mock
+
+import pytest
+from rest_framework import status
+from rest_framework.reverse import reverse
+
+from api_docs import views
+
+
+DOCS_URL = reverse("api-docs:docs-index")
+SCHEMA_JS_URL = reverse("api-docs:schema-js")
+
+
+@pytest.fixture(autouse=True)
+def clear_docs_cache():
+    """
+    Start each test without a cached schema or rendered documentation.
+    """
+    with mock.patch.dict(views._rendered, clear=True), mock.patch.object(
+        views, "_schema", None
+    ):
+        yield
+
+
+def test_get_docs(api_client, settings):
+    """
+    Anonymous users should receive documentation that can be cached by
+    shared caches.
+    """
+    settings.API_DOCS_MAX_AGE = 60
+
+    response = api_client.get(DOCS_URL)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Type"] == "text/html; charset=utf-8"
+    assert response["Cache-Control"] == "max-age=60, public"
+    assert b"Know Me API" in response.content
+
+
+def test_get_docs_authenticated(api_client, settings, user_factory):
+    """
+    Documentation rendered for an authenticated user should only be
+    cached by their own browser.
+    """
+    settings.API_DOCS_MAX_AGE = 60
+    api_client.force_authenticate(user=user_factory())
+
+    response = api_client.get(DOCS_URL)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Cache-Control"] == "max-age=60, private"
+
+
+def test_get_docs_cached(api_client):
+    """
+    The documentation should only be rendered once per process.
+    """
+    with mock.patch(
+        "api_docs.views.get_schema", wraps=views.get_schema
+    ) as mock_get_schema:
+        first = api_client.get(DOCS_URL)
+        second = api_client.get(DOCS_URL)
+
+    assert mock_get_schema.call_count == 1
+    assert first.content == second.content
+
+
+def test_get_schema_corejson(api_client):
+    """
+    The schema should also be available as Core JSON with the URL it
+    was requested from.
+    """
+    response = api_client.get(DOCS_URL, {"format": "corejson"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Type"] == "application/coreapi+json"
+    assert b"http://testserver/docs/" in response.content
+
+
+def test_get_schema_js(api_client):
+    """
+    The script used by the documentation should embed the schema.
+    """
+    response = api_client.get(SCHEMA_JS_URL)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Type"] == "application/javascript; charset=utf-8"
+    assert b"window.schema" in response.content
+
+
+def test_get_schema_generated_once():
+    """
+    The schema should only be generated the first time it is requested.
+    """
+    with mock.patch(
+        "api_docs.views.schemas.SchemaGenerator.get_schema", autospec=True
+    ) as mock_generate:
+        first = views.get_schema()
+        second = views.get_schema()
+
+    assert mock_generate.call_count == 1
+    assert first is second is mock_generate.return_value
@@ -0,0 +1,28 @@
+from django.conf.urls import url
+from rest_framework import renderers
+
+from api_docs import views
+
+
+app_name = "api-docs"
+
+
+urlpatterns = [
+    url(
+        r"^$",
+        views.DocumentationView.as_view(
+            renderer_classes=[
+                renderers.DocumentationRenderer,
+                renderers.CoreJSONRenderer,
+            ]
+        ),
+        name="docs-index",
+    ),
+    url(
+        r"^schema.js$",
+        views.DocumentationView.as_view(
+            renderer_classes=[renderers.SchemaJSRenderer]
+        ),
+        name="schema-js",
+    ),
+]
@@ -0,0 +1,108 @@
+"""Views serving the API's documentation.
+
+Generating the schema inspects every view and serializer, and the
+rendered documentation page is around a megabyte of HTML. Both only
+change when the application is deployed, so each process does the work
+once and reuses the result for every later request.
+"""
+
+import threading
+
+import coreapi
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from rest_framework import schemas
+from rest_framework.schemas.views import SchemaView
+
+
+TITLE = "Know Me API"
+
+_lock = threading.Lock()
+_rendered = {}
+_schema = None
+
+
+def get_schema():
+    """
+    Get the schema of the API.
+
+    The schema is generated the first time it is requested in each
+    process.
+
+    Returns:
+        A ``coreapi.Document`` describing the public API.
+    """
+    global _schema
+
+    with _lock:
+        if _schema is None:
+            generator = schemas.SchemaGenerator(title=TITLE)
+            _schema = generator.get_schema(public=True)
+
+    return _schema
+
+
+class DocumentationView(SchemaView):
+    """
+    View that serves the API's schema in the format chosen by the
+    renderers it is created with.
+    """
+
+    public = True
+
+    def get(self, request, *args, **kwargs):
+        """
+        Get the rendered schema.
+
+        Responses are rendered once per process for each combination of
+        URL, format, and whether the user is authenticated since those
+        are the only parts of the request the rendered content depends
+        on.
+
+        Args:
+            request:
+                The request being made.
+
+        Returns:
+            A response containing the rendered schema.
+        """
+        url = request.build_absolute_uri(request.path)
+        renderer = request.accepted_renderer
+        key = (url, renderer.format, request.user.is_authenticated)
+
+        content = _rendered.get(key)
+        if content is None:
+            schema = get_schema()
+            document = coreapi.Document(
+                content=dict(schema),
+                description=schema.description,
+                title=schema.title,
+                url=url,
+            )
+            content = renderer.render(
+                document,
+                request.accepted_media_type,
+                self.get_renderer_context(),
+            )
+            _rendered[key] = content
+
+        content_type = renderer.media_type
+        if renderer.charset:
+            content_type += f"; charset={renderer.charset}"
+
+        response = HttpResponse(content, content_type=content_type)
+
+        # Authenticated users are shown their session in the
+        # documentation, so only their own browser may cache it.
+        if request.user.is_authenticated:
+            patch_cache_control(
+                response, max_age=settings.API_DOCS_MAX_AGE, private=True
+            )
+        else:
+            patch_cache_control(
+                response, max_age=settings.API_DOCS_MAX_AGE, public=True
+            )
+        patch_vary_headers(response, ("Accept", "Authorization", "Cookie"))
+
+        return response
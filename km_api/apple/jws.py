@@ -0,0 +1,179 @@
+"""Verification of the JSON web signatures used by the App Store.
+
+App Store server notifications, and the transactions they contain, are
+signed using ES256. The header of each signature contains the chain of
+certificates used to create it. A signature is only trusted if the
+chain ends in one of the root certificates listed in the
+``APPLE_ROOT_CERTIFICATE_FINGERPRINTS`` setting.
+"""
+
+import base64
+import binascii
+import json
+
+from cryptography import x509
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.asymmetric.utils import (
+    encode_dss_signature,
+)
+from django.conf import settings
+from django.utils import timezone
+
+
+# Extensions marking the certificates Apple uses to sign App Store data.
+INTERMEDIATE_CERTIFICATE_OID = x509.ObjectIdentifier(
+    "1.2.840.113635.100.6.2.1"
+)
+LEAF_CERTIFICATE_OID = x509.ObjectIdentifier("1.2.840.113635.100.6.11.1")
+
+
+class JWSException(Exception):
+    """
+    Exception indicating a signature could not be verified.
+    """
+
+    def __init__(self, msg):
+        """
+        Create a new exception.
+
+        Args:
+            msg:
+                The message describing why the signature is invalid.
+        """
+        self.msg = msg
+
+
+def decode(token):
+    """
+    Verify a signature and decode its payload.
+
+    Args:
+        token:
+            The signature in JWS compact serialization.
+
+    Returns:
+        The decoded payload.
+
+    Raises:
+        JWSException:
+            If the signature is malformed or could not be verified.
+    """
+    parts = token.split(".")
+    if len(parts) != 3:
+        raise JWSException("The signature is malformed.")
+
+    header = _decode_json(parts[0])
+    if header.get("alg") != "ES256":
+        raise JWSException("The signature does not use ES256.")
+
+    chain = _load_chain(header.get("x5c"))
+    verify_chain(chain)
+
+    signature = _decode_segment(parts[2])
+    if len(signature) != 64:
+        raise JWSException("The signature is malformed.")
+
+    try:
+        chain[0].public_key().verify(
+            encode_dss_signature(
+                int.from_bytes(signature[:32], "big"),
+                int.from_bytes(signature[32:], "big"),
+            ),
+            f"{parts[0]}.{parts[1]}".encode("ascii"),
+            ec.ECDSA(hashes.SHA256()),
+        )
+    except InvalidSignature:
+        raise JWSException("The signature is invalid.")
+
+    return _decode_json(parts[1])
+
+
+def verify_chain(chain):
+    """
+    Verify the chain of certificates used to create a signature.
+
+    Args:
+        chain:
+            A list containing the leaf, intermediate, and root
+            certificates, in that order.
+
+    Raises:
+        JWSException:
+            If the chain is not trusted.
+    """
+    if len(chain) != 3:
+        raise JWSException("The certificate chain must have 3 certificates.")
+
+    root_fingerprint = chain[-1].fingerprint(hashes.SHA256()).hex()
+    trusted = {
+        fingerprint.replace(":", "").lower()
+        for fingerprint in settings.APPLE_ROOT_CERTIFICATE_FINGERPRINTS
+    }
+    if root_fingerprint not in trusted:
+        raise JWSException("The root certificate is not trusted.")
+
+    for certificate, oid in zip(
+        chain, (LEAF_CERTIFICATE_OID, INTERMEDIATE_CERTIFICATE_OID)
+    ):
+        try:
+            certificate.extensions.get_extension_for_oid(oid)
+        except x509.ExtensionNotFound:
+            raise JWSException(
+                "The certificate chain was not issued for App Store data."
+            )
+
+    # The validity period of a certificate is given as naive UTC times.
+    now = timezone.now().replace(tzinfo=None)
+    for certificate, issuer in zip(chain, chain[1:]):
+        if not (
+            certificate.not_valid_before <= now <= certificate.not_valid_after
+        ):
+            raise JWSException("A certificate in the chain has expired.")
+
+        try:
+            certificate.verify_directly_issued_by(issuer)
+        except (InvalidSignature, TypeError, ValueError):
+            raise JWSException("The certificate chain is invalid.")
+
+
+def _decode_json(segment):
+    """
+    Decode a segment of a signature containing a JSON object.
+    """
+    try:
+        value = json.loads(_decode_segment(segment))
+    except ValueError:
+        raise JWSException("The signature is malformed.")
+
+    if not isinstance(value, dict):
+        raise JWSException("The signature is malformed.")
+
+    return value
+
+
+def _decode_segment(segment):
+    """
+    Decode a base64url encoded segment of a signature.
+    """
+    try:
+        return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+    except (binascii.Error, ValueError):
+        raise JWSException("The signature is malformed.")
+
+
+def _load_chain(encoded_chain):
+    """
+    Load the certificate chain from the header of a signature.
+    """
+    if not isinstance(encoded_chain, list):
+        raise JWSException("The signature has no certificate chain.")
+
+    try:
+        return [
+            x509.load_der_x509_certificate(base64.b64decode(certificate))
+            for certificate in encoded_chain
+        ]
+    except (binascii.Error, TypeError, ValueError):
+        raise JWSException("The certificate chain is malformed.")
@@ -0,0 +1,183 @@
+"""Processing of App Store server notifications.
+
+Apple sends a notification whenever the status of a subscription
+changes, for example when it is renewed, cancelled, or refunded. Each
+notification contains the latest transaction of the subscription, which
+is used to update the matching receipt without having to poll Apple.
+"""
+
+import datetime
+import logging
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+from django.utils import timezone
+
+from apple import jws
+from know_me import models, renewals, subscriptions
+
+
+logger = logging.getLogger(__name__)
+
+
+def process_notification(signed_payload):
+    """
+    Verify a notification and apply it to the receipt it refers to.
+
+    Notifications for receipts that we do not know about, from a
+    different App Store environment, that do not contain a transaction,
+    or that are older than the last notification applied to the
+    receipt are ignored.
+
+    Args:
+        signed_payload:
+            The signed payload of the notification.
+
+    Returns:
+        The updated receipt, or ``None`` if the notification was
+        ignored.
+
+    Raises:
+        apple.jws.JWSException:
+            If the notification or its transaction could not be
+            verified.
+        django.core.exceptions.ImproperlyConfigured:
+            If the ``APPLE_BUNDLE_ID`` setting is not set.
+    """
+    # Any app can have notifications signed by Apple, so the bundle ID
+    # is the only thing tying a notification to our app.
+    if not settings.APPLE_BUNDLE_ID:
+        raise ImproperlyConfigured(
+            "APPLE_BUNDLE_ID must be set to accept App Store server "
+            "notifications."
+        )
+
+    payload = jws.decode(signed_payload)
+    notification_type = payload.get("notificationType")
+    data = payload.get("data") or {}
+
+    if data.get("bundleId") != settings.APPLE_BUNDLE_ID:
+        raise jws.JWSException("The notification is for a different app.")
+
+    environment = data.get("environment")
+    if environment != settings.APPLE_ENVIRONMENT:
+        logger.info(
+            "Ignoring %s notification from the %s environment.",
+            notification_type,
+            environment,
+        )
+
+        return None
+
+    signed_ms = payload.get("signedDate")
+    if signed_ms is None:
+        raise jws.JWSException("The notification is missing its signed date.")
+
+    signed_time = _from_timestamp_ms(signed_ms)
+
+    signed_transaction = data.get("signedTransactionInfo")
+    if not signed_transaction:
+        logger.info(
+            "Ignoring %s notification without a transaction.",
+            notification_type,
+        )
+
+        return None
+
+    transaction_info = jws.decode(signed_transaction)
+
+    product_id = transaction_info.get("productId")
+    if product_id not in settings.APPLE_PRODUCT_CODES["KNOW_ME_PREMIUM"]:
+        logger.warning(
+            "Ignoring %s notification for unknown product %r.",
+            notification_type,
+            product_id,
+        )
+
+        return None
+
+    original_transaction_id = transaction_info.get("originalTransactionId")
+    expiration_ms = transaction_info.get(
+        "revocationDate", transaction_info.get("expiresDate")
+    )
+    if original_transaction_id is None or expiration_ms is None:
+        raise jws.JWSException("The transaction is missing required fields.")
+
+    expiration_time = _from_timestamp_ms(expiration_ms)
+
+    with transaction.atomic():
+        receipt = (
+            models.AppleReceipt.objects.select_for_update()
+            .filter(transaction_id=str(original_transaction_id))
+            .first()
+        )
+        if receipt is None:
+            logger.info(
+                "Ignoring %s notification for unknown transaction %s.",
+                notification_type,
+                original_transaction_id,
+            )
+
+            return None
+
+        # Apple does not guarantee that notifications are delivered in
+        # order, so an older notification must not undo a newer one.
+        if (
+            receipt.last_notification_time is not None
+            and signed_time <= receipt.last_notification_time
+        ):
+            logger.info(
+                "Ignoring %s notification for %r signed at %s, which is "
+                "older than the last applied notification.",
+                notification_type,
+                receipt,
+                signed_time.isoformat(),
+            )
+
+            return None
+
+        receipt.expiration_time = expiration_time
+        receipt.last_notification_time = signed_time
+        receipt.next_renewal_check = (
+            expiration_time - subscriptions.RENEWAL_WINDOW
+        )
+        receipt.renewal_attempts = 0
+        receipt.save(
+            update_fields=[
+                "expiration_time",
+                "last_notification_time",
+                "next_renewal_check",
+                "renewal_attempts",
+                "time_updated",
+            ]
+        )
+
+        renewals.set_subscription_active(
+            receipt.subscription_id, expiration_time > timezone.now()
+        )
+
+    logger.info(
+        "Applied %s notification to %r, which now expires at %s.",
+        notification_type,
+        receipt,
+        expiration_time.isoformat(),
+    )
+
+    return receipt
+
+
+def _from_timestamp_ms(timestamp_ms):
+    """
+    Convert a timestamp used by the App Store to a datetime.
+
+    Args:
+        timestamp_ms:
+            The number of milliseconds since the epoch.
+
+    Returns:
+        A timezone aware datetime in UTC.
+    """
+    return datetime.datetime.fromtimestamp(
+        int(timestamp_ms) / 1000, tz=datetime.timezone.utc
+    )
@@ -1,13 +1,33 @@
 import enum
 import logging
+import threading
+import time
+from concurrent import futures
 
 import requests
 from django.conf import settings
+from requests.adapters import HTTPAdapter
 
 
 logger = logging.getLogger(__name__)
 
 
+ENVIRONMENT_PRODUCTION = "PRODUCTION"
+ENVIRONMENT_SANDBOX = "SANDBOX"
+
+# The number of seconds to wait for Apple to respond to a request.
+REQUEST_TIMEOUT = 30
+
+# The number of requests to Apple that may be made at once by the pool
+# used to query both environments.
+RACE_WORKERS = 8
+
+_executor = None
+_executor_lock = threading.Lock()
+_session = None
+_session_lock = threading.Lock()
+
+
 class ReceiptCodes(enum.IntEnum):
     """
     Enum containing the possible status codes that can be returned from
@@ -26,7 +46,76 @@ class ReceiptCodes(enum.IntEnum):
     COULD_NOT_AUTHORIZE = 21010
 
 
-def get_receipt_info(receipt_data):
+# For each environment, the statuses that identify the environment a
+# receipt belongs to when returned by that environment's endpoint.
+DECISIVE_STATUSES = {
+    ENVIRONMENT_PRODUCTION: {
+        ReceiptCodes.VALID: ENVIRONMENT_PRODUCTION,
+        ReceiptCodes.TEST_RECEIPT: ENVIRONMENT_SANDBOX,
+    },
+    ENVIRONMENT_SANDBOX: {
+        ReceiptCodes.VALID: ENVIRONMENT_SANDBOX,
+        ReceiptCodes.PRODUCTION_RECEIPT: ENVIRONMENT_PRODUCTION,
+    },
+}
+
+
+def get_receipt_environment(receipt_data):
+    """
+    Determine which environment an Apple receipt belongs to.
+
+    The receipt is sent to the production and sandbox endpoints at the
+    same time, and the first response that identifies the environment
+    is used without waiting for the other endpoint.
+
+    Args:
+        receipt_data:
+            The base64 encoded receipt data to check.
+
+    Returns:
+        Either ``ENVIRONMENT_PRODUCTION`` or ``ENVIRONMENT_SANDBOX``, or
+        ``None`` if the receipt is not valid in either environment.
+
+    Raises:
+        requests.RequestException:
+            If neither endpoint identified the environment and at least
+            one of the requests failed.
+    """
+    endpoints = {
+        ENVIRONMENT_PRODUCTION: (
+            settings.APPLE_RECEIPT_VALIDATION_PRODUCTION_ENDPOINT
+        ),
+        ENVIRONMENT_SANDBOX: (
+            settings.APPLE_RECEIPT_VALIDATION_SANDBOX_ENDPOINT
+        ),
+    }
+    pending = {
+        _get_executor().submit(
+            get_receipt_info, receipt_data, endpoint=endpoint
+        ): environment
+        for environment, endpoint in endpoints.items()
+    }
+
+    error = None
+    for future in futures.as_completed(pending):
+        try:
+            status = future.result()["status"]
+        except requests.RequestException as e:
+            error = error or e
+
+            continue
+
+        environment = DECISIVE_STATUSES[pending[future]].get(status)
+        if environment is not None:
+            return environment
+
+    if error is not None:
+        raise error
+
+    return None
+
+
+def get_receipt_info(receipt_data, endpoint=None):
     """
     Get information about an Apple receipt by sending its base64 encoded
     data.
@@ -35,10 +124,15 @@ def get_receipt_info(receipt_data):
         receipt_data:
             The base64 encoded receipt data that is sent to Apple to
             verify.
+        endpoint:
+            The URL of the validation endpoint to use. Defaults to the
+            ``APPLE_RECEIPT_VALIDATION_ENDPOINT`` setting.
 
     Returns:
         The receipt data returned by Apple.
     """
+    endpoint = endpoint or settings.APPLE_RECEIPT_VALIDATION_ENDPOINT
+
     logger.debug(
         "Sending receipt data to apple for validation: %s", receipt_data
     )
@@ -46,16 +140,28 @@ def get_receipt_info(receipt_data):
     data = None
     retry = True
     while retry:
-        response = requests.post(
-            settings.APPLE_RECEIPT_VALIDATION_ENDPOINT,
+        start = time.perf_counter()
+        response = _get_session().post(
+            endpoint,
             json={
                 "password": settings.APPLE_SHARED_SECRET,
                 "receipt-data": receipt_data,
             },
+            timeout=REQUEST_TIMEOUT,
         )
+        duration = (time.perf_counter() - start) * 1000
+
         response.raise_for_status()
         data = response.json()
 
+        logger.info(
+            "Apple receipt validation by %s returned status %s in %.1fms",
+            endpoint,
+            data.get("status"),
+            duration,
+            extra={"duration_ms": duration, "endpoint": endpoint},
+        )
+
         # If Apple had some internal failure when returning the receipt,
         # the request should be retried.
         retry = data.get("is-retryable", False)
@@ -64,3 +170,44 @@ def get_receipt_info(receipt_data):
             logger.info("Retrying Apple receipt verification.")
 
     return data
+
+
+def _get_executor():
+    """
+    Get the pool of workers used to query both environments at once.
+
+    The pool is created the first time it is needed so that processes
+    that never query Apple do not start any threads.
+    """
+    global _executor
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = futures.ThreadPoolExecutor(
+                    max_workers=RACE_WORKERS,
+                    thread_name_prefix="apple-receipts",
+                )
+
+    return _executor
+
+
+def _get_session():
+    """
+    Get the session shared by every request to Apple.
+
+    Sharing a session lets requests reuse the pooled connections to
+    Apple's endpoints rather than opening a new connection each time.
+    """
+    global _session
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_maxsize=RACE_WORKERS)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _session = session
+
+    return _session
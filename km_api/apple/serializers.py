@@ -1,8 +1,39 @@
-from django.conf import settings
 from django.utils.translation import ugettext_lazy as _, ugettext
 from rest_framework import serializers
 
-from apple import receipts
+from apple import jws, notifications, receipts
+
+
+class NotificationSerializer(serializers.Serializer):
+    """
+    Serializer used to process an App Store server notification.
+    """
+
+    signedPayload = serializers.CharField(
+        help_text=_("The signed payload of the notification."),
+        style={"base_template": "textarea.html"},
+        write_only=True,
+    )
+
+    def save(self):
+        """
+        Verify the notification and apply it to the receipt it refers
+        to.
+
+        Returns:
+            The updated receipt, or ``None`` if the notification was
+            ignored.
+
+        Raises:
+            serializers.ValidationError:
+                If the notification could not be verified.
+        """
+        try:
+            return notifications.process_notification(
+                self.validated_data["signedPayload"]
+            )
+        except jws.JWSException as e:
+            raise serializers.ValidationError({"signedPayload": [e.msg]})
 
 
 class ReceiptTypeSerializer(serializers.Serializer):
@@ -31,10 +62,8 @@ class ReceiptTypeSerializer(serializers.Serializer):
         Validate the provided receipt and determine which environment it
         belongs to.
 
-        The complications here stem from the fact that if we receive a
-        response indicating the receipt is valid, we have to determine
-        if we queried against Apple's production or sandbox endpoint in
-        order to return the correct environment.
+        The receipt is checked against Apple's production and sandbox
+        endpoints at the same time.
 
         Args:
             attrs:
@@ -43,27 +72,12 @@ class ReceiptTypeSerializer(serializers.Serializer):
         Returns:
             The validated data.
         """
-        receipt_data = attrs["receipt_data"]
-        receipt_info = receipts.get_receipt_info(receipt_data)
-        status = receipt_info["status"]
-
-        if status == receipts.ReceiptCodes.PRODUCTION_RECEIPT:
-            attrs["environment"] = "PRODUCTION"
-        elif status == receipts.ReceiptCodes.TEST_RECEIPT:
-            attrs["environment"] = "SANDBOX"
-        elif status == receipts.ReceiptCodes.VALID:
-            # Figure out if we validated against the production or
-            # sandbox endpoint and set the environment accordingly.
-            url = settings.APPLE_RECEIPT_VALIDATION_ENDPOINT
-            prod_url = settings.APPLE_RECEIPT_VALIDATION_PRODUCTION_ENDPOINT
-
-            if url == prod_url:
-                attrs["environment"] = "PRODUCTION"
-            else:
-                attrs["environment"] = "SANDBOX"
-        else:
+        environment = receipts.get_receipt_environment(attrs["receipt_data"])
+        if environment is None:
             raise serializers.ValidationError(
                 {"receipt_data": ugettext("The provided receipt is invalid.")}
             )
 
+        attrs["environment"] = environment
+
         return attrs
@@ -0,0 +1,135 @@
+import datetime
+
+import pytest
+from cryptography.hazmat.primitives.asymmetric import ec
+
+from apple import jws
+
+
+def test_decode(app_store_signer):
+    """
+    Decoding a payload signed with a trusted certificate chain should
+    return the payload.
+    """
+    payload = {"foo": "bar"}
+
+    assert jws.decode(app_store_signer.sign(payload)) == payload
+
+
+def test_decode_expired_certificate(app_store_signer):
+    """
+    If a certificate in the chain has expired, the signature should be
+    rejected.
+    """
+    leaf = app_store_signer.create_certificate(
+        "Expired Leaf",
+        app_store_signer.leaf_key,
+        app_store_signer.intermediate_key,
+        issuer=app_store_signer.intermediate,
+        marker=jws.LEAF_CERTIFICATE_OID,
+        not_valid_after=datetime.datetime.now(datetime.timezone.utc)
+        - datetime.timedelta(minutes=1),
+    )
+    token = app_store_signer.sign(
+        {}, chain=[leaf, app_store_signer.intermediate, app_store_signer.root],
+    )
+
+    with pytest.raises(jws.JWSException):
+        jws.decode(token)
+
+
+@pytest.mark.parametrize(
+    "token", ["", "foo", "a.b.c", "a.b.c.d", "e30.e30.e30"]
+)
+def test_decode_malformed(token):
+    """
+    Malformed signatures should be rejected.
+    """
+    with pytest.raises(jws.JWSException):
+        jws.decode(token)
+
+
+def test_decode_missing_marker(app_store_signer):
+    """
+    If the leaf certificate was not issued for App Store data, the
+    signature should be rejected.
+    """
+    leaf = app_store_signer.create_certificate(
+        "Unmarked Leaf",
+        app_store_signer.leaf_key,
+        app_store_signer.intermediate_key,
+        issuer=app_store_signer.intermediate,
+    )
+    token = app_store_signer.sign(
+        {}, chain=[leaf, app_store_signer.intermediate, app_store_signer.root],
+    )
+
+    with pytest.raises(jws.JWSException):
+        jws.decode(token)
+
+
+def test_decode_tampered_payload(app_store_signer):
+    """
+    If the payload was modified after it was signed, the signature
+    should be rejected.
+    """
+    header, _, signature = app_store_signer.sign({"foo": "bar"}).split(".")
+    _, payload, _ = app_store_signer.sign({"foo": "baz"}).split(".")
+
+    with pytest.raises(jws.JWSException):
+        jws.decode(f"{header}.{payload}.{signature}")
+
+
+def test_decode_untrusted_root(app_store_signer, settings):
+    """
+    If the root certificate is not trusted, the signature should be
+    rejected.
+    """
+    settings.APPLE_ROOT_CERTIFICATE_FINGERPRINTS = ["00" * 32]
+
+    with pytest.raises(jws.JWSException):
+        jws.decode(app_store_signer.sign({}))
+
+
+def test_decode_wrong_algorithm(app_store_signer):
+    """
+    Signatures that do not use ES256 should be rejected.
+    """
+    token = app_store_signer.sign({}, header={"alg": "none"})
+
+    with pytest.raises(jws.JWSException):
+        jws.decode(token)
+
+
+def test_decode_wrong_key(app_store_signer):
+    """
+    If the payload was not signed by the key of the leaf certificate,
+    the signature should be rejected.
+    """
+    token = app_store_signer.sign(
+        {}, key=ec.generate_private_key(ec.SECP256R1())
+    )
+
+    with pytest.raises(jws.JWSException):
+        jws.decode(token)
+
+
+def test_decode_wrong_issuer(app_store_signer):
+    """
+    If a certificate was not issued by the next certificate in the
+    chain, the signature should be rejected.
+    """
+    intermediate_key = ec.generate_private_key(ec.SECP256R1())
+    intermediate = app_store_signer.create_certificate(
+        "Other Intermediate",
+        intermediate_key,
+        intermediate_key,
+        ca=True,
+        marker=jws.INTERMEDIATE_CERTIFICATE_OID,
+    )
+    token = app_store_signer.sign(
+        {}, chain=[app_store_signer.leaf, intermediate, app_store_signer.root],
+    )
+
+    with pytest.raises(jws.JWSException):
+        jws.decode(token)
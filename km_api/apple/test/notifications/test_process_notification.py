@@ -0,0 +1,204 @@
+import datetime
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.utils import timezone
+
+from apple import jws, notifications
+from know_me import subscriptions
+
+
+PREMIUM_PRODUCT_CODE = "premium"
+
+
+@pytest.fixture(autouse=True)
+def premium_product_code(settings):
+    settings.APPLE_PRODUCT_CODES = {"KNOW_ME_PREMIUM": [PREMIUM_PRODUCT_CODE]}
+
+
+def to_ms(time):
+    return int(time.timestamp() * 1000)
+
+
+def test_process_notification_renewal(app_store_signer, apple_receipt_factory):
+    """
+    A notification for a renewed subscription should update the
+    expiration time and renewal schedule of its receipt and activate
+    the subscription.
+    """
+    receipt = apple_receipt_factory(
+        renewal_attempts=3, subscription__is_active=False
+    )
+    expires = timezone.now().replace(microsecond=0) + datetime.timedelta(
+        days=30
+    )
+    token = app_store_signer.sign_notification(
+        {
+            "expiresDate": to_ms(expires),
+            "originalTransactionId": receipt.transaction_id,
+            "productId": PREMIUM_PRODUCT_CODE,
+        }
+    )
+
+    result = notifications.process_notification(token)
+    receipt.refresh_from_db()
+    receipt.subscription.refresh_from_db()
+
+    assert result == receipt
+    assert receipt.expiration_time == expires
+    assert receipt.next_renewal_check == expires - subscriptions.RENEWAL_WINDOW
+    assert receipt.renewal_attempts == 0
+    assert receipt.subscription.is_active
+
+
+def test_process_notification_out_of_order(
+    app_store_signer, apple_receipt_factory
+):
+    """
+    A notification signed before the last notification applied to the
+    receipt should not undo the newer notification.
+    """
+    receipt = apple_receipt_factory(subscription__is_active=False)
+    now = timezone.now().replace(microsecond=0)
+    renewed = app_store_signer.sign_notification(
+        {
+            "expiresDate": to_ms(now + datetime.timedelta(days=30)),
+            "originalTransactionId": receipt.transaction_id,
+            "productId": PREMIUM_PRODUCT_CODE,
+        },
+        signed_date=now,
+    )
+    expired = app_store_signer.sign_notification(
+        {
+            "expiresDate": to_ms(now - datetime.timedelta(days=1)),
+            "originalTransactionId": receipt.transaction_id,
+            "productId": PREMIUM_PRODUCT_CODE,
+        },
+        signed_date=now - datetime.timedelta(days=1),
+    )
+
+    notifications.process_notification(renewed)
+
+    assert notifications.process_notification(expired) is None
+
+    receipt.refresh_from_db()
+    receipt.subscription.refresh_from_db()
+
+    assert receipt.expiration_time == now + datetime.timedelta(days=30)
+    assert receipt.last_notification_time == now
+    assert receipt.subscription.is_active
+
+
+def test_process_notification_revoked(app_store_signer, apple_receipt_factory):
+    """
+    A notification for a refunded transaction should expire the receipt
+    at the time it was revoked and deactivate the subscription.
+    """
+    receipt = apple_receipt_factory(subscription__is_active=True)
+    revoked = timezone.now().replace(microsecond=0) - datetime.timedelta(
+        hours=1
+    )
+    token = app_store_signer.sign_notification(
+        {
+            "expiresDate": to_ms(revoked + datetime.timedelta(days=30)),
+            "originalTransactionId": receipt.transaction_id,
+            "productId": PREMIUM_PRODUCT_CODE,
+            "revocationDate": to_ms(revoked),
+        }
+    )
+
+    notifications.process_notification(token)
+    receipt.refresh_from_db()
+    receipt.subscription.refresh_from_db()
+
+    assert receipt.expiration_time == revoked
+    assert not receipt.subscription.is_active
+
+
+def test_process_notification_unknown_product(
+    app_store_signer, apple_receipt_factory
+):
+    """
+    Notifications for products other than the premium subscription
+    should be ignored.
+    """
+    receipt = apple_receipt_factory()
+    token = app_store_signer.sign_notification(
+        {
+            "expiresDate": to_ms(timezone.now()),
+            "originalTransactionId": receipt.transaction_id,
+            "productId": "other",
+        }
+    )
+
+    assert notifications.process_notification(token) is None
+
+
+def test_process_notification_unknown_transaction(app_store_signer, db):
+    """
+    Notifications for transactions without a receipt should be ignored.
+    """
+    token = app_store_signer.sign_notification(
+        {
+            "expiresDate": to_ms(timezone.now()),
+            "originalTransactionId": "unknown",
+            "productId": PREMIUM_PRODUCT_CODE,
+        }
+    )
+
+    assert notifications.process_notification(token) is None
+
+
+def test_process_notification_without_transaction(app_store_signer):
+    """
+    Notifications without a transaction, such as test notifications,
+    should be ignored.
+    """
+    token = app_store_signer.sign_notification(None)
+
+    assert notifications.process_notification(token) is None
+
+
+def test_process_notification_without_bundle_id(app_store_signer, settings):
+    """
+    Notifications should not be accepted until the bundle ID of the app
+    is configured.
+    """
+    settings.APPLE_BUNDLE_ID = ""
+    token = app_store_signer.sign_notification(None)
+
+    with pytest.raises(ImproperlyConfigured):
+        notifications.process_notification(token)
+
+
+def test_process_notification_wrong_bundle(app_store_signer):
+    """
+    Notifications for other apps should be rejected.
+    """
+    token = app_store_signer.sign_notification(
+        None, bundleId="com.example.other"
+    )
+
+    with pytest.raises(jws.JWSException):
+        notifications.process_notification(token)
+
+
+def test_process_notification_wrong_environment(
+    app_store_signer, apple_receipt_factory, settings
+):
+    """
+    Notifications from a different App Store environment than the one
+    the deployment serves should be ignored.
+    """
+    settings.APPLE_ENVIRONMENT = "Production"
+    receipt = apple_receipt_factory()
+    token = app_store_signer.sign_notification(
+        {
+            "expiresDate": to_ms(timezone.now()),
+            "originalTransactionId": receipt.transaction_id,
+            "productId": PREMIUM_PRODUCT_CODE,
+        },
+        environment="Sandbox",
+    )
+
+    assert notifications.process_notification(token) is None
@@ -0,0 +1,110 @@
+import pytest
+import requests
+
+from apple.receipts import (
+    ENVIRONMENT_PRODUCTION,
+    ENVIRONMENT_SANDBOX,
+    ReceiptCodes,
+    get_receipt_environment,
+)
+
+
+def test_get_environment_invalid(
+    apple_receipt_client, apple_sandbox_receipt_client
+):
+    """
+    If neither endpoint accepts the receipt, the environment should be
+    ``None``.
+    """
+    data = "invalid-receipt"
+    apple_receipt_client.enqueue_status(
+        data, {"status": ReceiptCodes.MALFORMED_RECEIPT_DATA}
+    )
+    apple_sandbox_receipt_client.enqueue_status(
+        data, {"status": ReceiptCodes.MALFORMED_RECEIPT_DATA}
+    )
+
+    assert get_receipt_environment(data) is None
+
+
+def test_get_environment_production(apple_receipt_client):
+    """
+    A receipt accepted by the production endpoint should belong to the
+    production environment even if the sandbox endpoint does not
+    answer decisively.
+    """
+    data = "production-receipt"
+    apple_receipt_client.enqueue_status(data, {"status": ReceiptCodes.VALID})
+
+    assert get_receipt_environment(data) == ENVIRONMENT_PRODUCTION
+
+
+def test_get_environment_production_from_sandbox(apple_sandbox_receipt_client):
+    """
+    A receipt that the sandbox endpoint identifies as a production
+    receipt should belong to the production environment.
+    """
+    data = "production-receipt"
+    apple_sandbox_receipt_client.enqueue_status(
+        data, {"status": ReceiptCodes.PRODUCTION_RECEIPT}
+    )
+
+    assert get_receipt_environment(data) == ENVIRONMENT_PRODUCTION
+
+
+def test_get_environment_request_failed(
+    apple_sandbox_receipt_client, settings
+):
+    """
+    If one endpoint fails, the answer of the other endpoint should
+    still be used.
+    """
+    data = "sandbox-receipt"
+    apple_sandbox_receipt_client.enqueue_status(
+        data, {"status": ReceiptCodes.VALID}
+    )
+
+    settings.APPLE_RECEIPT_VALIDATION_PRODUCTION_ENDPOINT = (
+        "http://localhost:1"
+    )
+
+    assert get_receipt_environment(data) == ENVIRONMENT_SANDBOX
+
+
+def test_get_environment_requests_failed(settings):
+    """
+    If neither endpoint answers, the error should be raised.
+    """
+    settings.APPLE_RECEIPT_VALIDATION_PRODUCTION_ENDPOINT = (
+        "http://localhost:1"
+    )
+    settings.APPLE_RECEIPT_VALIDATION_SANDBOX_ENDPOINT = "http://localhost:1"
+
+    with pytest.raises(requests.RequestException):
+        get_receipt_environment("receipt")
+
+
+def test_get_environment_sandbox(apple_sandbox_receipt_client):
+    """
+    A receipt accepted by the sandbox endpoint should belong to the
+    sandbox environment.
+    """
+    data = "sandbox-receipt"
+    apple_sandbox_receipt_client.enqueue_status(
+        data, {"status": ReceiptCodes.VALID}
+    )
+
+    assert get_receipt_environment(data) == ENVIRONMENT_SANDBOX
+
+
+def test_get_environment_sandbox_from_production(apple_receipt_client):
+    """
+    A receipt that the production endpoint identifies as a test receipt
+    should belong to the sandbox environment.
+    """
+    data = "sandbox-receipt"
+    apple_receipt_client.enqueue_status(
+        data, {"status": ReceiptCodes.TEST_RECEIPT}
+    )
+
+    assert get_receipt_environment(data) == ENVIRONMENT_SANDBOX
@@ -0,0 +1,50 @@
+import datetime
+
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.reverse import reverse
+
+
+URL = reverse("apple:notifications")
+
+
+def test_post_invalid_signature(api_client, app_store_signer, settings):
+    """
+    Notifications that cannot be verified should be rejected.
+    """
+    settings.APPLE_ROOT_CERTIFICATE_FINGERPRINTS = ["00" * 32]
+    token = app_store_signer.sign_notification(None)
+
+    response = api_client.post(URL, {"signedPayload": token})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "signedPayload" in response.data
+
+
+def test_post_renewal(
+    api_client, app_store_signer, apple_receipt_factory, settings
+):
+    """
+    Unauthenticated requests containing a valid notification should
+    update the receipt the notification refers to.
+    """
+    settings.APPLE_PRODUCT_CODES = {"KNOW_ME_PREMIUM": ["premium"]}
+    receipt = apple_receipt_factory(subscription__is_active=False)
+    expires = timezone.now().replace(microsecond=0) + datetime.timedelta(
+        days=30
+    )
+    token = app_store_signer.sign_notification(
+        {
+            "expiresDate": int(expires.timestamp() * 1000),
+            "originalTransactionId": receipt.transaction_id,
+            "productId": "premium",
+        }
+    )
+
+    response = api_client.post(URL, {"signedPayload": token})
+    receipt.refresh_from_db()
+    receipt.subscription.refresh_from_db()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert receipt.expiration_time == expires
+    assert receipt.subscription.is_active
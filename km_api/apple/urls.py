@@ -7,9 +7,14 @@ app_name = "apple"
 
 
 urlpatterns = [
+    path(
+        "notifications/",
+        views.NotificationView.as_view(),
+        name="notifications",
+    ),
     path(
         "receipt-type-query/",
         views.ReceiptTypeQueryView.as_view(),
         name="receipt-type-query",
-    )
+    ),
 ]
@@ -1,8 +1,42 @@
-from rest_framework import generics, status
+from rest_framework import generics, permissions, status
+from rest_framework.response import Response
 
 from apple import serializers
 
 
+class NotificationView(generics.GenericAPIView):
+    """
+    post:
+    Receive an App Store server notification. The notification's
+    signature is verified before the subscription it refers to is
+    updated. Notifications for unknown subscriptions are accepted and
+    ignored so that Apple does not retry them.
+
+    A notification with an invalid signature will cause a 400 response.
+    """
+
+    authentication_classes = ()
+    permission_classes = (permissions.AllowAny,)
+    serializer_class = serializers.NotificationSerializer
+
+    def post(self, request, *args, **kwargs):
+        """
+        Process the notification contained in the request.
+
+        Args:
+            request:
+                The request containing the notification.
+
+        Returns:
+            An empty response with a 200 status code.
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+
+        return Response(status=status.HTTP_200_OK)
+
+
 class ReceiptTypeQueryView(generics.CreateAPIView):
     """
     post:
@@ -0,0 +1,11 @@
+"""Benchmarks for performance sensitive parts of the API.
+
+Each benchmark is a module that can be run from the ``km_api``
+directory. For example::
+
+    DJANGO_SECRET_KEY=benchmark python -m benchmarks.km_user_list
+
+Benchmarks that need data create a temporary test database, so they
+can be run against the same database configuration as the application
+without modifying its data.
+"""
@@ -0,0 +1,188 @@
+"""Benchmark the cold start of the application and management commands.
+
+Usage::
+
+    DJANGO_SECRET_KEY=benchmark python -m benchmarks.cold_start
+
+Each target is run in a new interpreter, the same way gunicorn workers
+and scheduled jobs are started, and the median wall time and peak
+memory of the process are reported. Management commands are run against
+an empty SQLite database, so the results are dominated by setting up
+Django rather than by the work each command does. Commands are measured
+with both the default settings and the slimmed down settings used by
+background workers.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+COMMANDS = [
+    "cleanemailconfirmations",
+    "runsubscriptionworker --once",
+    "sendreminderemails",
+    "updatelegacyusers",
+    "updatesubscriptions",
+]
+
+DEFAULT_SETTINGS = "km_api.settings"
+WORKER_SETTINGS = "km_api.worker_settings"
+
+# Setting any of these would cause the application to use Postgres
+# rather than the temporary database.
+POSTGRES_VARIABLES = (
+    "DJANGO_DB_HOST",
+    "DJANGO_DB_PASSWORD",
+    "DJANGO_DB_PORT",
+    "DJANGO_DB_USER",
+)
+
+
+def get_environment(database, settings_module):
+    """
+    Get the environment to run a target in.
+
+    Args:
+        database:
+            The path of the SQLite database to use.
+        settings_module:
+            The name of the settings module to use.
+
+    Returns:
+        A dictionary containing the environment variables.
+    """
+    env = {
+        key: value
+        for key, value in os.environ.items()
+        if key not in POSTGRES_VARIABLES
+    }
+    env["DJANGO_DB_NAME"] = database
+    env["DJANGO_SETTINGS_MODULE"] = settings_module
+
+    return env
+
+
+def run(args, env):
+    """
+    Run a target in a new process.
+
+    Args:
+        args:
+            The arguments to run the process with.
+        env:
+            The environment to run the process in.
+
+    Returns:
+        A tuple containing the wall time of the process in milliseconds
+        and its peak memory usage in megabytes.
+    """
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        args, cwd=BASE_DIR, env=env, stdout=subprocess.DEVNULL
+    )
+    _, status, usage = os.wait4(process.pid, 0)
+    duration = (time.perf_counter() - start) * 1000
+
+    # The process has already been reaped by ``os.wait4``.
+    if os.WIFSIGNALED(status):
+        process.returncode = -os.WTERMSIG(status)
+    else:
+        process.returncode = os.WEXITSTATUS(status)
+
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, args)
+
+    # Linux reports the maximum resident set size in kilobytes.
+    return duration, usage.ru_maxrss / 1024
+
+
+def measure(args, env, repeat):
+    """
+    Measure a target.
+
+    Args:
+        args:
+            The arguments to run the target's process with.
+        env:
+            The environment to run the process in.
+        repeat:
+            The number of times to run the process.
+
+    Returns:
+        A tuple containing the median wall time of the process in
+        milliseconds and its largest peak memory usage in megabytes.
+    """
+    results = [run(args, env) for _ in range(repeat)]
+
+    return (
+        statistics.median(duration for duration, _ in results),
+        max(memory for _, memory in results),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--command",
+        action="append",
+        dest="commands",
+        help=(
+            "A management command to measure, including its arguments. "
+            "May be given multiple times. Defaults to the commands run "
+            "by background workers."
+        ),
+    )
+    parser.add_argument(
+        "--repeat",
+        default=5,
+        help="The number of times to start each target.",
+        type=int,
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        database = os.path.join(directory, "db.sqlite3")
+        manage = [sys.executable, "manage.py"]
+
+        subprocess.run(
+            manage + ["migrate", "--verbosity", "0"],
+            check=True,
+            cwd=BASE_DIR,
+            env=get_environment(database, DEFAULT_SETTINGS),
+        )
+
+        targets = [
+            (
+                "wsgi.application",
+                DEFAULT_SETTINGS,
+                [sys.executable, "-c", "import km_api.wsgi"],
+            )
+        ]
+        for command in args.commands or COMMANDS:
+            for settings_module in (DEFAULT_SETTINGS, WORKER_SETTINGS):
+                targets.append(
+                    (command, settings_module, manage + command.split())
+                )
+
+        print(f"Starting each target {args.repeat} times")
+        for label, settings_module, target_args in targets:
+            duration, memory = measure(
+                target_args,
+                get_environment(database, settings_module),
+                args.repeat,
+            )
+            print(
+                f"{label:<30} {settings_module:<25} {duration:>8.1f}ms "
+                f"{memory:>7.1f}MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""Benchmark listing the Know Me users shared with a single user.
+
+Usage::
+
+    DJANGO_SECRET_KEY=benchmark python -m benchmarks.km_user_list
+
+The benchmark compares the query previously used by ``KMUserListView``
+with the current implementation, and measures a full request to the
+view with and without pagination.
+"""
+
+import argparse
+
+from benchmarks import utils
+
+
+def create_data(count):
+    """
+    Create a user with access to a number of other Know Me users.
+
+    Args:
+        count:
+            The number of Know Me users to share with the user.
+
+    Returns:
+        The user that the Know Me users are shared with.
+    """
+    from django.contrib.auth import get_user_model
+
+    from know_me import models
+
+    user_model = get_user_model()
+
+    users = user_model.objects.bulk_create(
+        user_model(first_name=f"User {i}", password="!")
+        for i in range(count + 1)
+    )
+    # Not every database backend sets the primary key of bulk created
+    # objects.
+    users = list(user_model.objects.order_by("pk"))
+
+    km_users = models.KMUser.objects.bulk_create(
+        models.KMUser(user=user) for user in users
+    )
+    km_users = list(models.KMUser.objects.order_by("pk"))
+
+    models.Subscription.objects.bulk_create(
+        models.Subscription(is_active=True, user=user) for user in users
+    )
+
+    viewer = users[0]
+    models.KMUserAccessor.objects.bulk_create(
+        models.KMUserAccessor(
+            email=f"viewer-{i}@example.com",
+            is_accepted=True,
+            km_user=km_user,
+            user_with_access=viewer,
+        )
+        for i, km_user in enumerate(km_users[1:])
+    )
+
+    return viewer
+
+
+def legacy_queryset(user):
+    """
+    The query used by ``KMUserListView`` before it was rewritten as a
+    union.
+    """
+    from django.conf import settings
+    from django.db.models import Case, PositiveSmallIntegerField, Q, Value
+    from django.db.models import When
+
+    from know_me import models
+
+    filter_args = Q(km_user_accessor__is_accepted=True)
+    filter_args &= Q(km_user_accessor__user_with_access=user)
+    if settings.KNOW_ME_PREMIUM_ENABLED:
+        filter_args &= Q(
+            km_user_accessor__km_user__user__know_me_subscription__is_active=True  # noqa
+        )
+    filter_args |= Q(user=user)
+
+    return (
+        models.KMUser.objects.filter(filter_args)
+        .distinct()
+        .annotate(
+            owned_by_user=Case(
+                When(user=user, then=Value(1)),
+                default=Value(0),
+                output_field=PositiveSmallIntegerField(),
+            )
+        )
+        .order_by("-owned_by_user", "created_at")
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--count",
+        default=5000,
+        help="The number of Know Me users shared with the viewer.",
+        type=int,
+    )
+    parser.add_argument(
+        "--repeat",
+        default=5,
+        help="The number of times each measurement is repeated.",
+        type=int,
+    )
+    args = parser.parse_args()
+
+    utils.setup()
+
+    from rest_framework.test import APIRequestFactory, force_authenticate
+
+    from know_me import views
+
+    with utils.test_database():
+        viewer = create_data(args.count)
+
+        def fetch(queryset_factory):
+            def run():
+                for km_user in queryset_factory(viewer):
+                    km_user.is_premium_user
+                    km_user.name
+
+            return run
+
+        def current_queryset(user):
+            view = views.KMUserListView()
+            view.request = APIRequestFactory().get("/")
+            view.request.user = user
+
+            return view.get_queryset()
+
+        def request(params):
+            def run():
+                request = APIRequestFactory().get("/", params)
+                force_authenticate(request, user=viewer)
+                response = views.KMUserListView.as_view()(request)
+                response.render()
+
+            return run
+
+        measurements = (
+            ("Legacy query", fetch(legacy_queryset)),
+            ("Union query", fetch(current_queryset)),
+            ("Full response", request({})),
+            ("First page (100 users)", request({"page_size": 100})),
+        )
+
+        print(f"Listing {args.count} shared Know Me users")
+        for label, func in measurements:
+            duration, queries = utils.measure(func, repeat=args.repeat)
+            print(f"{label:<25} {duration:>10.1f}ms {queries:>8} queries")
+
+
+if __name__ == "__main__":
+    main()
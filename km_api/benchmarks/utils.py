@@ -0,0 +1,76 @@
+"""Utilities shared by benchmarks.
+"""
+
+import contextlib
+import os
+import statistics
+import time
+
+import django
+
+
+def setup():
+    """
+    Configure Django for a benchmark.
+    """
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "km_api.settings")
+    django.setup()
+
+
+@contextlib.contextmanager
+def test_database():
+    """
+    Context manager that creates a test database for the duration of
+    the block.
+    """
+    from django.db import connection
+    from django.test.utils import (
+        setup_test_environment,
+        teardown_test_environment,
+    )
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+def measure(func, repeat=5):
+    """
+    Measure the execution of a function.
+
+    Args:
+        func:
+            The function to measure. It is called once before
+            measurements begin to warm up any caches.
+        repeat:
+            The number of times to call the function.
+
+    Returns:
+        A tuple containing the median duration of a call in
+        milliseconds and the number of queries made by a single call.
+    """
+    from django.db import connection
+
+    query_count = 0
+
+    def count_query(execute, sql, params, many, context):
+        nonlocal query_count
+        query_count += 1
+
+        return execute(sql, params, many, context)
+
+    with connection.execute_wrapper(count_query):
+        func()
+
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append((time.perf_counter() - start) * 1000)
+
+    return statistics.median(durations), query_count
@@ -30,8 +30,10 @@ from know_me.profile.factories import (
     ProfileFactory,
     ProfileTopicFactory,
 )
+from test_utils.app_store_signer import AppStoreSigner
 from test_utils.apple_receipt_validator import (
     AppleReceiptValidationClient,
+    apple_sandbox_validator_app,
     apple_validator_app,
 )
 
@@ -39,6 +41,42 @@ from test_utils.apple_receipt_validator import (
 logger = logging.getLogger(__name__)
 
 
+def check_validation_client(client):
+    """
+    Check that every status enqueued with a validation client was used.
+
+    Args:
+        client:
+            The client to check.
+    """
+    status = client.get_server_status()
+
+    assert status["is_empty"], (
+        "The Apple receipt validation server has queued status responses that "
+        "were not consumed:\n{}"
+    ).format(status["store"])
+
+
+def create_validation_client(server, settings):
+    """
+    Create a client for a mock validation service.
+
+    Args:
+        server:
+            A tuple containing the hostname and port of the service.
+        settings:
+            The settings providing the shared secret to use.
+
+    Returns:
+        A client for the service.
+    """
+    host, port = server
+
+    return AppleReceiptValidationClient(
+        f"http://{host}:{port}", settings.APPLE_SHARED_SECRET
+    )
+
+
 def get_free_port():
     s = socket.socket(socket.AF_INET, type=socket.SOCK_STREAM)
     s.bind(("localhost", 0))
@@ -47,6 +85,32 @@ def get_free_port():
     return port
 
 
+def start_validation_server(app):
+    """
+    Launch a mock validation service in a background thread.
+
+    Args:
+        app:
+            The Flask app of the service.
+
+    Returns:
+        A tuple containing the hostname and port of the launched server.
+    """
+    port = get_free_port()
+    mock_server_thread = Thread(
+        target=app.run, kwargs={"host": "localhost", "port": port},
+    )
+    mock_server_thread.setDaemon(True)
+    mock_server_thread.start()
+
+    # Give the Flask app time to boot
+    logger.info("Booting mock Apple receipt validation server...")
+    time.sleep(1)
+    logger.info("Finished booting Apple receipt validation server.")
+
+    return "localhost", port
+
+
 class UserAPIRequestFactory(APIRequestFactory):
     """
     Request factory that makes all requests as a particular user.
@@ -119,21 +183,38 @@ def api_rf():
 
 @pytest.fixture
 def apple_receipt_client(apple_validation_server, settings):
-    host, port = apple_validation_server
-    client = AppleReceiptValidationClient(
-        f"http://{host}:{port}", settings.APPLE_SHARED_SECRET
-    )
+    """
+    Fixture to get a client for the mock production validation service.
+    """
+    client = create_validation_client(apple_validation_server, settings)
 
     yield client
 
-    # After the client has been used, all enqueued mock responses should
-    # be consumed.
-    status = client.get_server_status()
+    check_validation_client(client)
 
-    assert status["is_empty"], (
-        "The Apple receipt validation server has queued status responses that "
-        "were not consumed:\n{}"
-    ).format(status["store"])
+
+@pytest.fixture
+def app_store_signer(_app_store_signer, settings):
+    """
+    Fixture to get a signer whose signatures are trusted as if they
+    were created by the App Store.
+    """
+    settings.APPLE_BUNDLE_ID = _app_store_signer.bundle_id
+    settings.APPLE_ENVIRONMENT = "Sandbox"
+    settings.APPLE_ROOT_CERTIFICATE_FINGERPRINTS = [
+        _app_store_signer.root_fingerprint
+    ]
+
+    return _app_store_signer
+
+
+@pytest.fixture(scope="session")
+def _app_store_signer():
+    """
+    Fixture to generate the certificate chain of the signer once per
+    test session.
+    """
+    return AppStoreSigner()
 
 
 @pytest.fixture
@@ -146,11 +227,46 @@ def apple_receipt_factory(db):
 
 
 @pytest.fixture(autouse=True)
-def apple_receipt_validation_settings(apple_validation_server, settings):
+def apple_receipt_validation_settings(
+    apple_sandbox_validation_server, apple_validation_server, settings
+):
     host, port = apple_validation_server
+    sandbox_host, sandbox_port = apple_sandbox_validation_server
 
     settings.APPLE_SHARED_SECRET = "mock-secret"
     settings.APPLE_RECEIPT_VALIDATION_ENDPOINT = f"http://{host}:{port}"
+    settings.APPLE_RECEIPT_VALIDATION_PRODUCTION_ENDPOINT = (
+        f"http://{host}:{port}"
+    )
+    settings.APPLE_RECEIPT_VALIDATION_SANDBOX_ENDPOINT = (
+        f"http://{sandbox_host}:{sandbox_port}"
+    )
+
+
+@pytest.fixture
+def apple_sandbox_receipt_client(apple_sandbox_validation_server, settings):
+    """
+    Fixture to get a client for the mock sandbox validation service.
+    """
+    client = create_validation_client(
+        apple_sandbox_validation_server, settings
+    )
+
+    yield client
+
+    check_validation_client(client)
+
+
+@pytest.fixture(autouse=True, scope="session")
+def apple_sandbox_validation_server():
+    """
+    Fixture to launch a server that mocks Apple's sandbox receipt
+    validation service.
+
+    Returns:
+        A tuple containing the hostname and port of the launched server.
+    """
+    return start_validation_server(apple_sandbox_validator_app)
 
 
 @pytest.fixture(autouse=True, scope="session")
@@ -162,20 +278,7 @@ def apple_validation_server():
     Returns:
         A tuple containing the hostname and port of the launched server.
     """
-    port = get_free_port()
-    mock_server_thread = Thread(
-        target=apple_validator_app.run,
-        kwargs={"host": "localhost", "port": port},
-    )
-    mock_server_thread.setDaemon(True)
-    mock_server_thread.start()
-
-    # Give the Flask app time to boot
-    logger.info("Booting mock Apple receipt validation server...")
-    time.sleep(1)
-    logger.info("Finished booting Apple receipt validation server.")
-
-    return "localhost", port
+    return start_validation_server(apple_validator_app)
 
 
 @pytest.fixture
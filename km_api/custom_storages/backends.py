@@ -1,6 +1,12 @@
 """Custom storage backends.
 """
 
+import collections
+import threading
+import time
+
+import boto3
+from django.conf import settings
 from storages.backends.s3boto3 import S3Boto3Storage
 
 
@@ -9,12 +15,201 @@ class MediaStorage(S3Boto3Storage):
     Storage class for media files.
 
     Prefixes all file paths with ``media/``.
+
+    Because media files are private, every URL generated by the storage
+    is signed. Signed URLs are cached in memory by storage key so that
+    repeatedly serializing the same file does not require signing its
+    URL again. A cached URL is only reused for ``url_cache_timeout``
+    seconds, which is shorter than the lifetime of the signature, so a
+    URL handed out from the cache is always valid for at least
+    ``querystring_expire - url_cache_timeout`` seconds.
     """
 
     default_acl = "private"
     encryption = True
     location = "media"
 
+    # The maximum number of signed URLs kept in memory.
+    url_cache_size = 10000
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self._signing_client = None
+        self._signing_client_lock = threading.Lock()
+        self._url_cache = collections.OrderedDict()
+        self._url_cache_lock = threading.Lock()
+
+    @property
+    def signing_client(self):
+        """
+        A boto3 client used to sign URLs.
+
+        Unlike the storage's connection, which is created once per
+        thread, a single client is shared by every thread because
+        signing a URL does not make any requests.
+        """
+        if self._signing_client is None:
+            with self._signing_client_lock:
+                if self._signing_client is None:
+                    self._signing_client = boto3.session.Session().client(
+                        "s3",
+                        aws_access_key_id=self.access_key,
+                        aws_secret_access_key=self.secret_key,
+                        aws_session_token=self.security_token,
+                        config=self.config,
+                        endpoint_url=self.endpoint_url,
+                        region_name=self.region_name,
+                        use_ssl=self.use_ssl,
+                        verify=self.verify,
+                    )
+
+        return self._signing_client
+
+    @property
+    def url_cache_timeout(self):
+        """
+        The number of seconds a signed URL is reused for.
+        """
+        return self.querystring_expire // 2
+
+    def generate_upload(
+        self, name, expire=None, content_type=None, max_size=None
+    ):
+        """
+        Generate the parameters for a presigned POST request that
+        uploads a file directly to S3.
+
+        The generated policy enforces the same ACL and encryption
+        settings that the storage uses when it saves a file itself, as
+        well as the size and content type of the file.
+
+        Args:
+            name:
+                The name to store the uploaded file under.
+            expire:
+                The number of seconds that the upload parameters are
+                valid for. Defaults to the storage's querystring
+                expiration time.
+            content_type:
+                The content type that the file must be uploaded with.
+                Defaults to allowing any content type.
+            max_size:
+                The maximum size of the file in bytes. Defaults to the
+                ``MEDIA_UPLOAD_MAX_SIZE`` setting.
+
+        Returns:
+            A dictionary containing the ``method``, ``url``, and
+            ``fields`` required to perform the upload.
+        """
+        if expire is None:
+            expire = self.querystring_expire
+
+        if max_size is None:
+            max_size = settings.MEDIA_UPLOAD_MAX_SIZE
+
+        key = self._encode_name(self._normalize_name(self._clean_name(name)))
+
+        fields = {}
+        if self.default_acl:
+            fields["acl"] = self.default_acl
+        if self.encryption:
+            fields["x-amz-server-side-encryption"] = "AES256"
+        if content_type:
+            fields["Content-Type"] = content_type
+
+        conditions = [{key: value} for key, value in fields.items()]
+        conditions.append(["content-length-range", 0, max_size])
+
+        post = self.connection.meta.client.generate_presigned_post(
+            Bucket=self.bucket_name,
+            Conditions=conditions,
+            ExpiresIn=expire,
+            Fields=fields,
+            Key=key,
+        )
+
+        return {"fields": post["fields"], "method": "POST", "url": post["url"]}
+
+    def url(self, name, parameters=None, expire=None):
+        """
+        Get the URL of a file.
+
+        Requests for a URL with the default parameters and expiration
+        are served from the signed URL cache.
+
+        Args:
+            name:
+                The name of the file to get the URL of.
+            parameters:
+                Additional parameters to sign with the URL.
+            expire:
+                The number of seconds the URL should be valid for.
+
+        Returns:
+            The URL of the file.
+        """
+        if (
+            parameters is not None
+            or expire is not None
+            or self.custom_domain
+            or not self.querystring_auth
+        ):
+            return super().url(name, parameters=parameters, expire=expire)
+
+        return self.urls([name])[name]
+
+    def urls(self, names):
+        """
+        Get the signed URLs of multiple files at once.
+
+        URLs are looked up in and added to the signed URL cache as a
+        batch, and each distinct file is only signed once.
+
+        Args:
+            names:
+                An iterable containing the names of the files to get the
+                URLs of.
+
+        Returns:
+            A dictionary mapping each of the provided names to its URL.
+        """
+        now = time.monotonic()
+        keys = {
+            name: self._encode_name(
+                self._normalize_name(self._clean_name(name))
+            )
+            for name in names
+        }
+        signed = {}
+
+        with self._url_cache_lock:
+            for key in set(keys.values()):
+                cached = self._url_cache.get(key)
+                if cached is not None and cached[1] > now:
+                    signed[key] = cached[0]
+
+        missing = set(keys.values()) - set(signed)
+        for key in missing:
+            signed[key] = self.signing_client.generate_presigned_url(
+                "get_object",
+                ExpiresIn=self.querystring_expire,
+                Params={"Bucket": self.bucket_name, "Key": key},
+            )
+
+        if missing:
+            expires_at = now + self.url_cache_timeout
+
+            with self._url_cache_lock:
+                for key in missing:
+                    self._url_cache[key] = (signed[key], expires_at)
+                    self._url_cache.move_to_end(key)
+
+                while len(self._url_cache) > self.url_cache_size:
+                    self._url_cache.popitem(last=False)
+
+        return {name: signed[key] for name, key in keys.items()}
+
 
 class StaticStorage(S3Boto3Storage):
     """
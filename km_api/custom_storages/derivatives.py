@@ -0,0 +1,242 @@
+"""Generation of resized copies of uploaded images.
+
+Phones displaying an avatar or a thumbnail do not need the full size
+image a user uploaded. After a new image is saved, a task is queued to
+generate a set of smaller derivatives so that the request saving the
+image is not slowed down. Until the derivatives exist, the URL of the
+original image is used in their place.
+
+Derivatives are stored next to the original image with a name derived
+from the original's, so their URLs can be computed without storing any
+additional information about them. For example, the derivatives of
+``know-me/users/1/images/foo.png`` are stored as
+``know-me/users/1/images/foo.small.jpeg``,
+``know-me/users/1/images/foo.small.webp``, and so on.
+"""
+
+import hashlib
+import io
+import logging
+import os
+
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from PIL import Image, features
+
+from custom_storages import uploads
+
+
+logger = logging.getLogger(__name__)
+
+
+DERIVATIVE_FORMATS = (("jpeg", "JPEG"), ("webp", "WEBP"))
+"""
+The formats that derivatives are generated in as pairs of the file
+extension and the name of the format used by Pillow.
+"""
+
+DERIVATIVE_SIZES = (("small", 128), ("medium", 512))
+"""
+The derivatives generated for each image as pairs of the derivative's
+name and the maximum width and height of the derivative in pixels.
+"""
+
+DERIVATIVE_QUALITY = 80
+"""
+The quality used to encode derivatives.
+"""
+
+EXISTS_KEY = "custom-storages:derivatives-exist:{digest}"
+
+
+def generate_derivatives(storage, name):
+    """
+    Generate the derivatives of an image.
+
+    If the derivatives of the image already exist, they are not
+    generated again. Images that cannot be opened are skipped.
+
+    Args:
+        storage:
+            The storage backend that the image is stored in.
+        name:
+            The name of the image to generate derivatives of.
+
+    Returns:
+        A list containing the names of the derivatives that were
+        generated.
+    """
+    names = get_derivative_names(name)
+    if not names:
+        return []
+
+    # Derivatives are saved in order, so if the last one exists they
+    # have all been generated.
+    if derivatives_exist(storage, name):
+        logger.debug("Derivatives of %s already exist", name)
+
+        return []
+
+    try:
+        with storage.open(name) as f:
+            original = Image.open(f)
+            original.load()
+    except (IOError, OSError, Image.DecompressionBombError):
+        logger.warning("Could not open %s to generate derivatives", name)
+
+        return []
+
+    if original.mode not in ("RGB", "RGBA"):
+        original = original.convert("RGBA")
+
+    generated = []
+    for size_name, size in DERIVATIVE_SIZES:
+        image = original.copy()
+        image.thumbnail((size, size), Image.LANCZOS)
+
+        for extension, image_format in get_formats():
+            converted = image
+            if image_format == "JPEG" and image.mode != "RGB":
+                converted = image.convert("RGB")
+
+            buffer = io.BytesIO()
+            converted.save(
+                buffer, format=image_format, quality=DERIVATIVE_QUALITY
+            )
+
+            derivative_name = names[size_name][extension]
+            if storage.exists(derivative_name):
+                storage.delete(derivative_name)
+
+            storage.save(derivative_name, ContentFile(buffer.getvalue()))
+            generated.append(derivative_name)
+
+    cache.set(_get_exists_key(name), True, timeout=None)
+
+    logger.info("Generated %d derivatives of %s", len(generated), name)
+
+    return generated
+
+
+def derivatives_exist(storage, name):
+    """
+    Determine if the derivatives of an image have been generated.
+
+    Since derivatives are never removed while the original image is in
+    use, a positive result is cached indefinitely.
+
+    Args:
+        storage:
+            The storage backend that the image is stored in.
+        name:
+            The name of the original image.
+
+    Returns:
+        A boolean indicating if every derivative of the image exists.
+    """
+    names = get_derivative_names(name)
+    if not names:
+        return False
+
+    key = _get_exists_key(name)
+    if cache.get(key):
+        return True
+
+    # Derivatives are saved in order, so if the last one exists they
+    # have all been generated.
+    last_size = DERIVATIVE_SIZES[-1][0]
+    last_extension = get_formats()[-1][0]
+    if not storage.exists(names[last_size][last_extension]):
+        return False
+
+    cache.set(key, True, timeout=None)
+
+    return True
+
+
+def get_derivative_names(name):
+    """
+    Get the names of the derivatives of an image.
+
+    Args:
+        name:
+            The name of the original image.
+
+    Returns:
+        A dictionary mapping the name of each derivative size to a
+        dictionary that maps each format's file extension to the name of
+        the derivative in that size and format. If no name is provided,
+        an empty dictionary is returned.
+    """
+    if not name:
+        return {}
+
+    root = os.path.splitext(name)[0]
+    extensions = [extension for extension, _ in get_formats()]
+
+    return {
+        size_name: {
+            extension: f"{root}.{size_name}.{extension}"
+            for extension in extensions
+        }
+        for size_name, _ in DERIVATIVE_SIZES
+    }
+
+
+def get_formats():
+    """
+    Get the derivative formats supported by the installed version of
+    Pillow.
+
+    Returns:
+        The entries of ``DERIVATIVE_FORMATS`` that can be encoded.
+    """
+    return tuple(
+        (extension, image_format)
+        for extension, image_format in DERIVATIVE_FORMATS
+        if image_format != "WEBP" or features.check("webp")
+    )
+
+
+def schedule_derivatives(field, name):
+    """
+    Queue the generation of an image's derivatives.
+
+    The task is saved using the current database transaction, so it is
+    only run once the image that was saved with it is committed.
+
+    Args:
+        field:
+            The model's ``ImageField`` that the image is stored in.
+        name:
+            The name of the image to generate derivatives of.
+
+    Returns:
+        The queued :py:class:`task_queue.models.Task` instance, or
+        ``None`` if no name was provided.
+    """
+    if not name:
+        return None
+
+    # Imported here because the tasks module imports this module.
+    from custom_storages.tasks import generate_image_derivatives
+
+    return generate_image_derivatives.enqueue(
+        field=uploads.get_field_label(field), name=name
+    )
+
+
+def _get_exists_key(name):
+    """
+    Get the cache key recording that an image's derivatives exist.
+
+    Args:
+        name:
+            The name of the original image.
+
+    Returns:
+        The cache key for the image.
+    """
+    digest = hashlib.sha256(name.encode()).hexdigest()
+
+    return EXISTS_KEY.format(digest=digest)
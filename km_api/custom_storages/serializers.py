@@ -0,0 +1,275 @@
+"""Serializers for the ``custom_storages`` module.
+"""
+
+import collections
+
+from django.db import models
+from django.utils.translation import ugettext_lazy as _
+from rest_framework import serializers
+
+from custom_storages import derivatives, uploads
+
+
+def presign_file_urls(instances, serializer):
+    """
+    Sign the URLs of the files that will be serialized as a batch.
+
+    Each file field of the serializer that is read from the instances is
+    inspected, and the names of the files (including the derivatives
+    exposed by any :class:`ImageDerivativesField`) are grouped by
+    storage. Every
+    storage that supports batch signing through a ``urls`` method (such
+    as :class:`custom_storages.backends.MediaStorage`) signs its files
+    at once, which populates the storage's signed URL cache before the
+    instances are serialized.
+
+    Args:
+        instances:
+            A list of the instances being serialized.
+        serializer:
+            The serializer used to serialize each instance.
+    """
+    file_fields = [
+        field
+        for field in serializer.fields.values()
+        if isinstance(field, (serializers.FileField, ImageDerivativesField))
+        and not field.write_only
+    ]
+    if not file_fields:
+        return
+
+    names_by_storage = collections.defaultdict(set)
+    storages = {}
+    for instance in instances:
+        for field in file_fields:
+            value = instance
+            for attr in field.source_attrs:
+                value = getattr(value, attr, None)
+
+            if not value:
+                continue
+
+            storages[id(value.storage)] = value.storage
+            if isinstance(field, ImageDerivativesField):
+                names_by_storage[id(value.storage)].update(
+                    field.get_file_names(value)
+                )
+            else:
+                names_by_storage[id(value.storage)].add(value.name)
+
+    for storage_id, names in names_by_storage.items():
+        storage = storages[storage_id]
+        if hasattr(storage, "urls"):
+            storage.urls(names)
+
+
+class ImageDerivativesField(serializers.Field):
+    """
+    Read-only field exposing the URLs of the derivatives of an image.
+
+    The field should be given the same ``source`` as the image field
+    whose derivatives are being exposed. See
+    :py:mod:`custom_storages.derivatives` for how derivatives are
+    generated. Until the derivatives have been generated, the URL of the
+    original image is given for each derivative.
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Create a new image derivatives field.
+
+        Args:
+            kwargs:
+                Additional keyword arguments passed to the parent class.
+        """
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def get_file_names(self, value):
+        """
+        Get the names of the derivatives of an image.
+
+        Args:
+            value:
+                The image to get the derivatives of.
+
+        Returns:
+            A list containing the name of every derivative, or the name
+            of the original image if the derivatives have not been
+            generated yet.
+        """
+        if not derivatives.derivatives_exist(value.storage, value.name):
+            return [value.name]
+
+        return [
+            name
+            for formats in derivatives.get_derivative_names(
+                value.name
+            ).values()
+            for name in formats.values()
+        ]
+
+    def to_representation(self, value):
+        """
+        Get the URLs of an image's derivatives.
+
+        Args:
+            value:
+                The image to get the derivative URLs of.
+
+        Returns:
+            A dictionary mapping each derivative size to a dictionary
+            containing the URL of the derivative in each format. If there
+            is no image, ``None`` is returned.
+        """
+        if not value:
+            return None
+
+        request = self.context.get("request")
+        representation = {}
+        exists = derivatives.derivatives_exist(value.storage, value.name)
+
+        names = derivatives.get_derivative_names(value.name)
+        for size_name, formats in names.items():
+            representation[size_name] = {}
+
+            for extension, name in formats.items():
+                url = value.storage.url(name if exists else value.name)
+                if request is not None:
+                    url = request.build_absolute_uri(url)
+
+                representation[size_name][extension] = url
+
+        return representation
+
+
+class PresignedURLListSerializer(serializers.ListSerializer):
+    """
+    List serializer that signs the URLs of every file in the list as a
+    batch before serializing the individual items.
+
+    Use it by setting ``list_serializer_class`` in the ``Meta`` class
+    of a serializer with file fields.
+    """
+
+    def to_representation(self, data):
+        """
+        Serialize a list of instances.
+
+        Args:
+            data:
+                The instances to serialize.
+
+        Returns:
+            A list containing the serialized representation of each
+            instance.
+        """
+        iterable = data.all() if isinstance(data, models.Manager) else data
+        instances = list(iterable)
+
+        presign_file_urls(instances, self.child)
+
+        return super().to_representation(instances)
+
+
+class UploadRequestSerializer(serializers.Serializer):
+    """
+    Serializer for requesting a direct upload of a file.
+    """
+
+    filename = serializers.CharField(
+        help_text=_("The original name of the file being uploaded."),
+        max_length=255,
+        write_only=True,
+    )
+    form_fields = serializers.DictField(
+        help_text=_(
+            "Form fields that must be included in the upload request."
+        ),
+        read_only=True,
+        source="fields",
+    )
+    key = serializers.CharField(
+        help_text=_("The storage key that the file will be saved as."),
+        read_only=True,
+    )
+    method = serializers.CharField(
+        help_text=_("The HTTP method to use when uploading the file."),
+        read_only=True,
+    )
+    token = serializers.CharField(
+        help_text=_(
+            "A token that is provided in place of the file once the upload "
+            "has completed."
+        ),
+        read_only=True,
+    )
+    url = serializers.CharField(
+        help_text=_("The URL to upload the file to."), read_only=True
+    )
+
+    def create(self, validated_data):
+        """
+        Create a new upload for a file field.
+
+        Args:
+            validated_data:
+                The validated data provided to the serializer. In
+                addition to the ``filename``, this must contain the
+                ``field`` that the upload is for and the ``instance``
+                used to generate the upload's path. These are typically
+                passed as arguments to ``save``.
+
+        Returns:
+            A dictionary describing the new upload.
+        """
+        return uploads.create_upload(
+            validated_data["field"],
+            validated_data["instance"],
+            validated_data["filename"],
+            request=self.context.get("request"),
+        )
+
+
+class UploadTokenField(serializers.CharField):
+    """
+    Field that accepts an upload token in place of a file.
+
+    The field should be given the same ``source`` as the file field it
+    sets, which causes the storage key of the uploaded file to be saved
+    to the file field.
+    """
+
+    def __init__(self, model_field, **kwargs):
+        """
+        Create a new upload token field.
+
+        Args:
+            model_field:
+                The ``FileField`` that tokens must have been issued for.
+            kwargs:
+                Additional keyword arguments passed to the parent class.
+        """
+        kwargs.setdefault("required", False)
+        kwargs["write_only"] = True
+        super().__init__(**kwargs)
+
+        self.model_field = model_field
+
+    def to_internal_value(self, data):
+        """
+        Convert an upload token into the key of the uploaded file.
+
+        Args:
+            data:
+                The upload token.
+
+        Returns:
+            The storage key of the uploaded file.
+        """
+        token = super().to_internal_value(data)
+
+        try:
+            return uploads.read_upload_token(token, field=self.model_field)
+        except uploads.InvalidUploadToken as e:
+            raise serializers.ValidationError(str(e))
@@ -0,0 +1,21 @@
+"""Tasks provided by the ``custom_storages`` module.
+"""
+
+from custom_storages import derivatives, uploads
+from task_queue.registry import task
+
+
+@task("custom_storages.generate_image_derivatives")
+def generate_image_derivatives(field, name):
+    """
+    Generate the derivatives of an uploaded image.
+
+    Args:
+        field:
+            The label of the model field that the image is stored in.
+        name:
+            The name of the image to generate derivatives of.
+    """
+    derivatives.generate_derivatives(
+        uploads.get_labeled_field(field).storage, name
+    )
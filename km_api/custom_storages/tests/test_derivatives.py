@@ -0,0 +1,126 @@
+import io
+from unittest import mock
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image
+
+from custom_storages import derivatives
+from know_me.models import KMUser
+from task_queue import worker
+
+
+def save_image(name, size=(1000, 500), mode="RGB"):
+    """
+    Save an image to the default storage.
+    """
+    image = Image.new(mode, size)
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+
+    return default_storage.save(name, ContentFile(buffer.getvalue()))
+
+
+def test_generate_derivatives():
+    """
+    Derivatives should be generated in every size and format with the
+    aspect ratio of the original image preserved.
+    """
+    name = save_image("derivatives/generate.png")
+
+    generated = derivatives.generate_derivatives(default_storage, name)
+
+    names = derivatives.get_derivative_names(name)
+    expected = [n for formats in names.values() for n in formats.values()]
+    assert generated == expected
+
+    for size_name, size in derivatives.DERIVATIVE_SIZES:
+        for extension, name in names[size_name].items():
+            with default_storage.open(name) as f:
+                image = Image.open(f)
+
+                assert image.size == (size, size // 2)
+                assert image.format == extension.upper()
+
+
+def test_derivatives_exist():
+    """
+    Derivatives should only be reported as existing once they have been
+    generated, after which the result is cached.
+    """
+    name = save_image("derivatives/exist.png")
+
+    assert not derivatives.derivatives_exist(default_storage, name)
+
+    derivatives.generate_derivatives(default_storage, name)
+
+    with mock.patch.object(default_storage, "exists") as mock_exists:
+        assert derivatives.derivatives_exist(default_storage, name)
+
+    assert mock_exists.call_count == 0
+
+
+def test_generate_derivatives_existing():
+    """
+    If the derivatives of an image already exist, they should not be
+    generated again.
+    """
+    name = save_image("derivatives/existing.png")
+    derivatives.generate_derivatives(default_storage, name)
+
+    assert derivatives.generate_derivatives(default_storage, name) == []
+
+
+def test_generate_derivatives_invalid_image():
+    """
+    Files that are not images should be skipped.
+    """
+    name = default_storage.save(
+        "derivatives/invalid.png", ContentFile(b"not an image")
+    )
+
+    assert derivatives.generate_derivatives(default_storage, name) == []
+
+
+def test_generate_derivatives_transparent():
+    """
+    Images with transparency should be converted before being saved as
+    a JPEG.
+    """
+    name = save_image("derivatives/transparent.png", mode="LA")
+
+    assert derivatives.generate_derivatives(default_storage, name)
+
+
+def test_get_derivative_names():
+    """
+    Derivatives should be stored next to the original image.
+    """
+    names = derivatives.get_derivative_names("foo/bar.png")
+
+    assert names["small"]["jpeg"] == "foo/bar.small.jpeg"
+    assert names["medium"]["webp"] == "foo/bar.medium.webp"
+
+
+def test_schedule_derivatives(db):
+    """
+    Scheduling the derivatives of an image should queue a task that
+    generates them.
+    """
+    name = save_image("derivatives/scheduled.png")
+    field = KMUser._meta.get_field("image")
+
+    task = derivatives.schedule_derivatives(field, name)
+
+    assert task.name == "custom_storages.generate_image_derivatives"
+    assert worker.run_tasks(worker.claim_tasks(10)) == (1, 0)
+    assert derivatives.derivatives_exist(default_storage, name)
+
+
+def test_schedule_derivatives_no_name():
+    """
+    Nothing should be scheduled for an empty image.
+    """
+    field = KMUser._meta.get_field("image")
+
+    assert derivatives.schedule_derivatives(field, "") is None
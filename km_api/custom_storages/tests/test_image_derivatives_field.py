@@ -0,0 +1,57 @@
+from custom_storages import derivatives
+from custom_storages.serializers import ImageDerivativesField
+
+
+def test_to_representation(api_rf, image, km_user_factory):
+    """
+    The field should contain the absolute URL of each derivative.
+    """
+    km_user = km_user_factory(image=image)
+    derivatives.generate_derivatives(km_user.image.storage, km_user.image.name)
+    request = api_rf.get("/")
+    field = ImageDerivativesField()
+    field._context = {"request": request}
+
+    names = derivatives.get_derivative_names(km_user.image.name)
+    expected = {
+        size_name: {
+            extension: request.build_absolute_uri(
+                km_user.image.storage.url(name)
+            )
+            for extension, name in formats.items()
+        }
+        for size_name, formats in names.items()
+    }
+
+    assert field.to_representation(km_user.image) == expected
+
+
+def test_to_representation_not_generated(api_rf, image, km_user_factory):
+    """
+    Until the derivatives have been generated, the URL of the original
+    image should be given in their place.
+    """
+    km_user = km_user_factory(image=image)
+    request = api_rf.get("/")
+    field = ImageDerivativesField()
+    field._context = {"request": request}
+
+    url = request.build_absolute_uri(km_user.image.url)
+    representation = field.to_representation(km_user.image)
+
+    assert representation == {
+        size_name: {extension: url for extension in formats}
+        for size_name, formats in derivatives.get_derivative_names(
+            km_user.image.name
+        ).items()
+    }
+    assert field.get_file_names(km_user.image) == [km_user.image.name]
+
+
+def test_to_representation_no_image(km_user_factory):
+    """
+    If there is no image, the field should be ``None``.
+    """
+    km_user = km_user_factory(image=None)
+
+    assert ImageDerivativesField().to_representation(km_user.image) is None
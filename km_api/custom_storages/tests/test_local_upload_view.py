@@ -0,0 +1,49 @@
+from django.core.files.storage import default_storage
+from rest_framework import status
+
+from custom_storages import uploads, views
+from know_me import models
+
+
+local_upload_view = views.LocalUploadView.as_view()
+
+
+def test_put_invalid_token(api_rf):
+    """
+    Uploads with an invalid token should be rejected.
+    """
+    request = api_rf.put("/", b"foo", content_type="image/png")
+    response = local_upload_view(request, token="foo")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_put_too_large(api_rf, km_user_factory, settings):
+    """
+    Uploads larger than the maximum upload size should be rejected.
+    """
+    settings.MEDIA_UPLOAD_MAX_SIZE = 2
+    field = models.KMUser._meta.get_field("image")
+    upload = uploads.create_upload(field, km_user_factory(), "foo.png")
+
+    request = api_rf.put("/", b"foo", content_type="image/png")
+    response = local_upload_view(request, token=upload["token"])
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert not default_storage.exists(upload["key"])
+
+
+def test_put_upload(api_rf, km_user_factory):
+    """
+    Sending the contents of a file with a valid token should save the
+    file to the key specified by the token.
+    """
+    field = models.KMUser._meta.get_field("image")
+    upload = uploads.create_upload(field, km_user_factory(), "foo.png")
+
+    request = api_rf.put("/", b"foo", content_type="image/png")
+    response = local_upload_view(request, token=upload["token"])
+
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    with default_storage.open(upload["key"]) as f:
+        assert f.read() == b"foo"
@@ -0,0 +1,158 @@
+from unittest import mock
+
+from custom_storages.backends import MediaStorage
+
+
+def create_storage():
+    """
+    Create a media storage instance with a mock signing client.
+    """
+    storage = MediaStorage(
+        access_key="foo", bucket_name="bucket", secret_key="bar"
+    )
+    storage._signing_client = mock.Mock()
+    storage._signing_client.generate_presigned_url.side_effect = (
+        lambda *args, **kwargs: f"https://s3/{kwargs['Params']['Key']}"
+    )
+
+    return storage
+
+
+def test_generate_upload(settings):
+    """
+    The policy of a presigned upload should limit the size and content
+    type of the uploaded file.
+    """
+    settings.MEDIA_UPLOAD_MAX_SIZE = 1024
+    storage = create_storage()
+    mock_client = mock.Mock()
+    mock_client.generate_presigned_post.return_value = {
+        "fields": {"key": "media/foo.png"},
+        "url": "https://s3",
+    }
+
+    with mock.patch.object(
+        MediaStorage, "connection", new_callable=mock.PropertyMock
+    ) as mock_connection:
+        mock_connection.return_value.meta.client = mock_client
+        upload = storage.generate_upload("foo.png", content_type="image/png")
+
+    kwargs = mock_client.generate_presigned_post.call_args[1]
+
+    assert upload["method"] == "POST"
+    assert kwargs["Fields"]["Content-Type"] == "image/png"
+    assert {"Content-Type": "image/png"} in kwargs["Conditions"]
+    assert ["content-length-range", 0, 1024] in kwargs["Conditions"]
+
+
+def test_generate_upload_max_size():
+    """
+    A maximum size given for an upload should override the default.
+    """
+    storage = create_storage()
+    mock_client = mock.Mock()
+    mock_client.generate_presigned_post.return_value = {
+        "fields": {},
+        "url": "https://s3",
+    }
+
+    with mock.patch.object(
+        MediaStorage, "connection", new_callable=mock.PropertyMock
+    ) as mock_connection:
+        mock_connection.return_value.meta.client = mock_client
+        storage.generate_upload("foo.png", max_size=10)
+
+    kwargs = mock_client.generate_presigned_post.call_args[1]
+
+    assert ["content-length-range", 0, 10] in kwargs["Conditions"]
+    assert "Content-Type" not in kwargs["Fields"]
+
+
+def test_url_cached():
+    """
+    Requesting the URL of the same file twice should only sign the URL
+    once.
+    """
+    storage = create_storage()
+
+    assert storage.url("foo.png") == "https://s3/media/foo.png"
+    assert storage.url("foo.png") == "https://s3/media/foo.png"
+    assert storage.signing_client.generate_presigned_url.call_count == 1
+
+
+def test_url_cache_expired():
+    """
+    Cached URLs should be signed again after the cache timeout has
+    elapsed.
+    """
+    storage = create_storage()
+
+    with mock.patch("custom_storages.backends.time.monotonic") as mock_time:
+        mock_time.return_value = 0
+        storage.url("foo.png")
+
+        mock_time.return_value = storage.url_cache_timeout + 1
+        storage.url("foo.png")
+
+    assert storage.signing_client.generate_presigned_url.call_count == 2
+
+
+def test_url_cache_size():
+    """
+    The least recently signed URLs should be evicted once the cache is
+    full.
+    """
+    storage = create_storage()
+    storage.url_cache_size = 1
+
+    storage.url("foo.png")
+    storage.url("bar.png")
+    storage.url("foo.png")
+
+    assert storage.signing_client.generate_presigned_url.call_count == 3
+
+
+def test_url_custom_expiration():
+    """
+    URLs requested with a custom expiration should bypass the cache.
+    """
+    storage = create_storage()
+    storage._bucket = mock.Mock()
+    storage._bucket.meta.client.generate_presigned_url.return_value = "url"
+
+    assert storage.url("foo.png", expire=60) == "url"
+    assert storage.signing_client.generate_presigned_url.call_count == 0
+
+
+def test_urls_batch():
+    """
+    Signing a batch of URLs should sign each distinct file once.
+    """
+    storage = create_storage()
+    storage.url("foo.png")
+
+    urls = storage.urls(["foo.png", "bar.png", "bar.png"])
+
+    assert urls == {
+        "bar.png": "https://s3/media/bar.png",
+        "foo.png": "https://s3/media/foo.png",
+    }
+    assert storage.signing_client.generate_presigned_url.call_count == 2
+
+
+def test_signing_client_real():
+    """
+    The default signing client should be able to sign URLs without
+    making any requests.
+    """
+    storage = MediaStorage(
+        access_key="foo",
+        bucket_name="bucket",
+        region_name="us-east-1",
+        secret_key="bar",
+    )
+
+    url = storage.url("foo.png")
+
+    assert "media/foo.png" in url
+    assert "Signature" in url or "X-Amz-Signature" in url
@@ -0,0 +1,48 @@
+from unittest import mock
+
+from custom_storages.serializers import presign_file_urls
+from know_me.profile.serializers import MediaResourceSerializer
+
+
+def test_presign_file_urls(media_resource_factory):
+    """
+    The names of every file in the list should be signed as a single
+    batch by the storage.
+    """
+    resources = [media_resource_factory(), media_resource_factory()]
+    storage = resources[0].file.storage
+
+    with mock.patch.object(storage, "urls", create=True) as mock_urls:
+        presign_file_urls(resources, MediaResourceSerializer())
+
+    assert mock_urls.call_count == 1
+    assert mock_urls.call_args[0][0] == {r.file.name for r in resources}
+
+
+def test_presign_file_urls_unsupported_storage(media_resource_factory):
+    """
+    Storages without batch signing support should be ignored.
+    """
+    resources = [media_resource_factory()]
+
+    presign_file_urls(resources, MediaResourceSerializer())
+
+
+def test_list_serializer(api_rf, media_resource_factory):
+    """
+    Serializing a list of instances should sign the file URLs before
+    serializing each instance.
+    """
+    resources = [media_resource_factory(), media_resource_factory()]
+    request = api_rf.get("/")
+
+    with mock.patch(
+        "custom_storages.serializers.presign_file_urls"
+    ) as mock_presign:
+        serializer = MediaResourceSerializer(
+            resources, context={"request": request}, many=True
+        )
+        data = serializer.data
+
+    assert len(data) == 2
+    assert mock_presign.call_count == 1
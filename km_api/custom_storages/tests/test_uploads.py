@@ -0,0 +1,122 @@
+from unittest import mock
+
+import pytest
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+
+from custom_storages import uploads
+from know_me import models
+from know_me.journal.models import Entry
+
+
+def test_create_upload_local(api_rf, km_user_factory):
+    """
+    If the storage backend does not support presigned uploads, the
+    upload should be directed to the local upload endpoint.
+    """
+    km_user = km_user_factory()
+    field = models.KMUser._meta.get_field("image")
+    request = api_rf.post("/")
+
+    upload = uploads.create_upload(field, km_user, "foo.png", request=request)
+
+    assert upload["key"].startswith(f"know-me/users/{km_user.pk}/images/")
+    assert upload["method"] == "PUT"
+    assert upload["fields"] == {}
+    assert upload["url"].startswith("http://testserver/media-uploads/")
+    assert uploads.read_upload_token(upload["token"]) == upload["key"]
+
+
+def test_create_upload_presigned(km_user_factory, settings):
+    """
+    If the storage backend supports presigned uploads, the upload
+    parameters should be generated by the backend.
+    """
+    km_user = km_user_factory()
+    field = models.KMUser._meta.get_field("image")
+    mock_generate = mock.Mock(
+        return_value={
+            "fields": {"key": "foo"},
+            "method": "POST",
+            "url": "https://s3",
+        }
+    )
+
+    with mock.patch.object(
+        field.storage, "generate_upload", mock_generate, create=True
+    ):
+        upload = uploads.create_upload(field, km_user, "foo.png")
+
+    assert mock_generate.call_count == 1
+    assert mock_generate.call_args[0] == (upload["key"],)
+    assert mock_generate.call_args[1] == {
+        "content_type": "image/png",
+        "expire": settings.MEDIA_UPLOAD_EXPIRATION,
+        "max_size": settings.MEDIA_UPLOAD_MAX_SIZE,
+    }
+    assert upload["method"] == "POST"
+    assert upload["url"] == "https://s3"
+
+
+def test_get_max_upload_size(settings):
+    """
+    The maximum upload size of a field should default to the
+    ``MEDIA_UPLOAD_MAX_SIZE`` setting.
+    """
+    settings.MEDIA_UPLOAD_MAX_SIZE = 1024
+    field = models.KMUser._meta.get_field("image")
+
+    assert uploads.get_max_upload_size(field) == 1024
+
+    with mock.patch.object(field, "max_upload_size", 10, create=True):
+        assert uploads.get_max_upload_size(field) == 10
+
+
+def test_read_upload_token_bad_signature():
+    """
+    Tampered tokens should be rejected.
+    """
+    with pytest.raises(uploads.InvalidUploadToken):
+        uploads.read_upload_token("foo")
+
+
+def test_read_upload_token_missing_file(km_user_factory):
+    """
+    If a field is given, the uploaded file must exist in storage.
+    """
+    field = models.KMUser._meta.get_field("image")
+    upload = uploads.create_upload(field, km_user_factory(), "foo.png")
+
+    with pytest.raises(uploads.InvalidUploadToken):
+        uploads.read_upload_token(upload["token"], field=field)
+
+
+def test_read_upload_token_wrong_field(km_user_factory):
+    """
+    A token issued for one field should not be usable for a different
+    field.
+    """
+    field = models.KMUser._meta.get_field("image")
+    upload = uploads.create_upload(field, km_user_factory(), "foo.png")
+    default_storage.save(upload["key"], ContentFile(b"foo"))
+
+    with pytest.raises(uploads.InvalidUploadToken):
+        uploads.read_upload_token(
+            upload["token"], field=Entry._meta.get_field("attachment")
+        )
+
+
+def test_read_upload_token_uploaded(km_user_factory):
+    """
+    Once the file has been uploaded, the token should resolve to the
+    file's storage key.
+    """
+    field = models.KMUser._meta.get_field("image")
+    upload = uploads.create_upload(field, km_user_factory(), "foo.png")
+    default_storage.save(upload["key"], ContentFile(b"foo"))
+
+    assert uploads.get_token_field(upload["token"]) == field
+    assert (
+        uploads.read_upload_token(upload["token"], field=field)
+        == upload["key"]
+    )
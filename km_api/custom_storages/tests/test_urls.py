@@ -0,0 +1,39 @@
+import importlib
+
+import pytest
+from django.test import override_settings
+
+from custom_storages import urls
+
+
+@pytest.fixture
+def reload_urls():
+    """
+    Fixture to restore the URL configuration once the storage settings
+    used by a test have been reset.
+    """
+    yield
+
+    importlib.reload(urls)
+
+
+@override_settings(DEFAULT_FILE_STORAGE="inmemorystorage.InMemoryStorage")
+def test_local_storage(reload_urls):
+    """
+    If files are not stored in S3, the local upload endpoint should be
+    available.
+    """
+    patterns = importlib.reload(urls).urlpatterns
+
+    assert [pattern.name for pattern in patterns] == ["local-upload"]
+
+
+@override_settings(
+    DEFAULT_FILE_STORAGE="custom_storages.backends.MediaStorage"
+)
+def test_s3_storage(reload_urls):
+    """
+    If files are stored in S3, uploads are made directly to S3 so the
+    local upload endpoint should not be available.
+    """
+    assert importlib.reload(urls).urlpatterns == []
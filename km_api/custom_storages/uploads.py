@@ -0,0 +1,232 @@
+"""Utilities for uploading files directly to storage.
+
+Rather than sending files through the API, clients request an upload
+for a specific file field. They receive a signed token identifying the
+storage key that the file should be written to as well as the
+parameters of the request used to perform the upload. Once the upload
+is complete, the token is sent in place of the file to the endpoint
+that owns the file field.
+
+If the configured storage backend supports presigned uploads (such as
+:class:`custom_storages.backends.MediaStorage`), the client uploads the
+file directly to the backend. Otherwise the upload is accepted by
+:class:`custom_storages.views.LocalUploadView`, which allows the same
+flow to be used in development and testing.
+"""
+
+import mimetypes
+
+from django.apps import apps
+from django.conf import settings
+from django.core import signing
+from rest_framework.reverse import reverse
+
+
+UPLOAD_TOKEN_SALT = "custom_storages.uploads"
+
+
+class InvalidUploadToken(Exception):
+    """
+    Exception indicating an upload token could not be used.
+    """
+
+    pass
+
+
+def create_upload(field, instance, filename, request=None):
+    """
+    Create an upload for a file field.
+
+    Args:
+        field:
+            The model's ``FileField`` that the upload is for.
+        instance:
+            A model instance used to generate the upload path. The
+            instance does not need to be saved, but it must have any
+            relations required by the field's ``upload_to`` function.
+        filename:
+            The original name of the file being uploaded.
+        request:
+            The request used to construct an absolute URL for local
+            uploads.
+
+    Returns:
+        A dictionary containing the storage ``key`` of the upload, the
+        ``token`` used to reference the upload, and the ``method``,
+        ``url``, and ``fields`` needed to make the upload request.
+        Presigned uploads must be made with the content type given in
+        the ``fields``.
+    """
+    storage = field.storage
+    key = storage.get_available_name(
+        field.generate_filename(instance, filename),
+        max_length=field.max_length,
+    )
+    token = signing.dumps(
+        {"field": get_field_label(field), "key": key}, salt=UPLOAD_TOKEN_SALT
+    )
+
+    if supports_presigned_uploads(storage):
+        upload = storage.generate_upload(
+            key,
+            content_type=mimetypes.guess_type(filename)[0],
+            expire=settings.MEDIA_UPLOAD_EXPIRATION,
+            max_size=get_max_upload_size(field),
+        )
+    else:
+        upload = {
+            "fields": {},
+            "method": "PUT",
+            "url": reverse(
+                "custom-storages:local-upload",
+                kwargs={"token": token},
+                request=request,
+            ),
+        }
+
+    return {"key": key, "token": token, **upload}
+
+
+def get_field_label(field):
+    """
+    Get a label uniquely identifying a model field.
+
+    Args:
+        field:
+            The field to get the label of.
+
+    Returns:
+        A string containing the model's label and the field's name.
+    """
+    return f"{field.model._meta.label}.{field.name}"
+
+
+def get_labeled_field(label):
+    """
+    Get the model field identified by a label.
+
+    Args:
+        label:
+            A label created by :py:func:`get_field_label`.
+
+    Returns:
+        The model field with the given label.
+    """
+    model_label, field_name = label.rsplit(".", 1)
+
+    return apps.get_model(model_label)._meta.get_field(field_name)
+
+
+def get_max_upload_size(field):
+    """
+    Get the maximum size of a file uploaded for a file field.
+
+    Args:
+        field:
+            The field to get the maximum upload size of.
+
+    Returns:
+        The maximum size in bytes, taken from the field's
+        ``max_upload_size`` attribute if it is set or the
+        ``MEDIA_UPLOAD_MAX_SIZE`` setting otherwise.
+    """
+    return (
+        getattr(field, "max_upload_size", None)
+        or settings.MEDIA_UPLOAD_MAX_SIZE
+    )
+
+
+def get_token_field(token):
+    """
+    Get the model field that an upload token was issued for.
+
+    Args:
+        token:
+            The token to get the field of.
+
+    Returns:
+        The ``FileField`` instance the token was issued for.
+
+    Raises:
+        InvalidUploadToken:
+            If the token is invalid.
+    """
+    return get_labeled_field(_load_token(token)["field"])
+
+
+def read_upload_token(token, field=None, check_exists=True, max_age=None):
+    """
+    Read the storage key from an upload token.
+
+    Args:
+        token:
+            The token to read.
+        field:
+            If provided, the token must have been issued for this field.
+        check_exists:
+            A boolean indicating if the uploaded file must exist in the
+            field's storage.
+        max_age:
+            The maximum age of the token in seconds. Tokens do not
+            expire by default because the upload itself is limited by
+            the expiration of the upload parameters.
+
+    Returns:
+        The storage key that the token refers to.
+
+    Raises:
+        InvalidUploadToken:
+            If the token is invalid, expired, issued for a different
+            field, or the uploaded file does not exist.
+    """
+    payload = _load_token(token, max_age=max_age)
+
+    if field is not None:
+        if payload["field"] != get_field_label(field):
+            raise InvalidUploadToken(
+                "The upload token was issued for a different field."
+            )
+
+        if check_exists and not field.storage.exists(payload["key"]):
+            raise InvalidUploadToken("The file has not been uploaded yet.")
+
+    return payload["key"]
+
+
+def supports_presigned_uploads(storage):
+    """
+    Determine if files can be uploaded directly to a storage backend.
+
+    Args:
+        storage:
+            The storage backend or its class.
+
+    Returns:
+        A boolean indicating if the backend can generate the parameters
+        for a presigned upload. If not, uploads must be made through
+        :class:`custom_storages.views.LocalUploadView`.
+    """
+    return hasattr(storage, "generate_upload")
+
+
+def _load_token(token, max_age=None):
+    """
+    Load the payload of an upload token.
+
+    Args:
+        token:
+            The token to load.
+        max_age:
+            The maximum age of the token in seconds.
+
+    Returns:
+        The dictionary stored in the token.
+
+    Raises:
+        InvalidUploadToken:
+            If the token is invalid or older than the maximum age.
+    """
+    try:
+        return signing.loads(token, max_age=max_age, salt=UPLOAD_TOKEN_SALT)
+    except signing.BadSignature:
+        raise InvalidUploadToken("The upload token is invalid or expired.")
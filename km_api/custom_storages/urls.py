@@ -0,0 +1,25 @@
+"""URLs for the ``custom_storages`` module.
+"""
+
+from django.core.files.storage import get_storage_class
+from django.urls import path
+
+from custom_storages import uploads, views
+
+
+app_name = "custom-storages"
+
+
+urlpatterns = []
+
+# Files are only uploaded through the API if the storage backend cannot
+# accept them directly, such as when files are stored locally or in
+# memory during development and testing.
+if not uploads.supports_presigned_uploads(get_storage_class()):
+    urlpatterns.append(
+        path(
+            "uploads/<str:token>/",
+            views.LocalUploadView.as_view(),
+            name="local-upload",
+        )
+    )
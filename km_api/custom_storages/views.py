@@ -0,0 +1,62 @@
+"""Views for the ``custom_storages`` module.
+"""
+
+import logging
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from rest_framework import status, views
+from rest_framework.response import Response
+
+from custom_storages import uploads
+
+
+logger = logging.getLogger(__name__)
+
+
+class LocalUploadView(views.APIView):
+    """
+    put:
+    Upload a file using a token obtained from an upload endpoint.
+
+    This view stands in for direct uploads to S3 when the application is
+    not configured to use S3 for file storage. The request body is
+    stored as the file's content, so this view is not intended for
+    use in production.
+    """
+
+    # Possession of the token is what grants permission to upload.
+    authentication_classes = ()
+    parser_classes = ()
+    permission_classes = ()
+
+    def put(self, request, token, *args, **kwargs):
+        try:
+            field = uploads.get_token_field(token)
+            key = uploads.read_upload_token(
+                token,
+                check_exists=False,
+                field=field,
+                max_age=settings.MEDIA_UPLOAD_EXPIRATION,
+            )
+        except uploads.InvalidUploadToken as e:
+            return Response(
+                {"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if len(request.body) > uploads.get_max_upload_size(field):
+            return Response(
+                {"detail": "The uploaded file is too large."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        content = ContentFile(request.body)
+
+        if field.storage.exists(key):
+            field.storage.delete(key)
+
+        field.storage.save(key, content)
+
+        logger.info("Received local upload for %s", key)
+
+        return Response(status=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,14 @@
+"""Routing of database reads to read replicas.
+
+Reads are only sent to a replica inside a :py:func:`read_from_replicas`
+block. The :py:class:`db_routing.middleware.ReplicaRoutingMiddleware`
+opens one for every ``GET`` and ``HEAD`` request. Everything else,
+including management commands, uses the primary database unless it
+opts in explicitly.
+"""
+
+from db_routing.routing import (  # noqa
+    pin_user,
+    read_from_primary,
+    read_from_replicas,
+)
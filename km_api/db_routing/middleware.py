@@ -0,0 +1,56 @@
+"""Middleware to route the database reads made by requests.
+"""
+
+from django.conf import settings
+
+from db_routing import routing
+
+
+REPLICA_METHODS = ("GET", "HEAD")
+
+
+class ReplicaRoutingMiddleware(object):
+    """
+    Middleware that allows ``GET`` and ``HEAD`` requests to read from a
+    replica.
+
+    Users who make any other kind of request are pinned to the primary
+    database for ``DATABASE_REPLICA_PIN_SECONDS`` so that they see their
+    own writes.
+    """
+
+    def __init__(self, get_response):
+        """
+        Create a new middleware instance.
+
+        Args:
+            get_response:
+                The callable used to get the response to a request.
+        """
+        self.get_response = get_response
+
+    def __call__(self, request):
+        """
+        Handle a request.
+
+        Args:
+            request:
+                The request being made.
+
+        Returns:
+            The response to the request.
+        """
+        if not settings.DATABASE_REPLICAS:
+            return self.get_response(request)
+
+        if request.method in REPLICA_METHODS:
+            with routing.read_from_replicas(request):
+                return self.get_response(request)
+
+        response = self.get_response(request)
+
+        user = getattr(request, "user", None)
+        if user is not None:
+            routing.pin_user(user)
+
+        return response
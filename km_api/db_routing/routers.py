@@ -0,0 +1,106 @@
+"""Database routers.
+"""
+
+import random
+
+from django.conf import settings
+
+from db_routing import routing
+
+
+# Models that are never read from a replica. The database cache is used
+# to decide where to read from, so it must not depend on that decision.
+PRIMARY_ONLY_APP_LABELS = {"django_cache"}
+
+
+class ReplicaRouter(object):
+    """
+    Router that sends reads to the replicas listed in the
+    ``DATABASE_REPLICAS`` setting when the current thread allows it.
+
+    Writes and migrations always use the primary database.
+    """
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        """
+        Determine if migrations may be run on a database.
+
+        Args:
+            db:
+                The alias of the database.
+            app_label:
+                The label of the app being migrated.
+            model_name:
+                The name of the model being migrated.
+            **hints:
+                Additional information about the migration.
+
+        Returns:
+            ``False`` for replicas, which are populated by replication,
+            and ``None`` to let Django decide otherwise.
+        """
+        if db in settings.DATABASE_REPLICAS:
+            return False
+
+        return None
+
+    def allow_relation(self, obj1, obj2, **hints):
+        """
+        Determine if a relation between two objects is allowed.
+
+        Args:
+            obj1:
+                The first object.
+            obj2:
+                The second object.
+            **hints:
+                Additional information about the relation.
+
+        Returns:
+            ``True`` because the primary and its replicas contain the
+            same data.
+        """
+        return True
+
+    def db_for_read(self, model, **hints):
+        """
+        Get the database to read a model from.
+
+        Args:
+            model:
+                The model being read.
+            **hints:
+                Additional information about the query.
+
+        Returns:
+            The alias of a replica or of the primary database. The
+            primary database is named explicitly so that Django does not
+            fall back to the database that a related instance was loaded
+            from, such as a shard.
+        """
+        if (
+            not settings.DATABASE_REPLICAS
+            or model._meta.app_label in PRIMARY_ONLY_APP_LABELS
+        ):
+            return "default"
+
+        context = routing.get_context()
+        if context is None or not context.can_read_from_replica():
+            return "default"
+
+        return random.choice(settings.DATABASE_REPLICAS)
+
+    def db_for_write(self, model, **hints):
+        """
+        Get the database to write a model to.
+
+        Args:
+            model:
+                The model being written.
+            **hints:
+                Additional information about the query.
+
+        Returns:
+            The alias of the primary database.
+        """
+        return "default"
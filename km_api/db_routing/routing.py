@@ -0,0 +1,157 @@
+"""Tracking of where the current thread should read from.
+"""
+
+import contextlib
+import threading
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.functional import SimpleLazyObject
+
+
+PIN_KEY = "db-routing:pin:{user_id}"
+
+_state = threading.local()
+
+
+class ReplicaContext(object):
+    """
+    The conditions under which reads may be sent to a replica.
+    """
+
+    def __init__(self, request=None):
+        """
+        Create a new replica context.
+
+        Args:
+            request:
+                The request being handled, if any. If a request is
+                given, reads are sent to the primary database until the
+                requesting user is known and only if that user has not
+                recently written to the database.
+        """
+        self.request = request
+        self._is_pinned = None
+
+    def can_read_from_replica(self):
+        """
+        Determine if reads may currently be sent to a replica.
+
+        Returns:
+            A boolean indicating if reads may be sent to a replica.
+        """
+        # Reads inside a transaction have to see the transaction's
+        # writes.
+        if transaction.get_connection().in_atomic_block:
+            return False
+
+        if self.request is None:
+            return True
+
+        if self._is_pinned is None:
+            user = _get_resolved_user(self.request)
+            if user is None:
+                return False
+
+            self._is_pinned = user.is_authenticated and bool(
+                cache.get(PIN_KEY.format(user_id=user.pk))
+            )
+
+        return not self._is_pinned
+
+
+def get_context():
+    """
+    Get the replica context of the current thread.
+
+    Returns:
+        The current :py:class:`ReplicaContext`, or ``None`` if reads
+        should go to the primary database.
+    """
+    return getattr(_state, "context", None)
+
+
+def pin_user(user):
+    """
+    Send a user's reads to the primary database for a short time.
+
+    This is used after a user writes to the database so that they are
+    not shown data that has not reached the replicas yet.
+
+    Args:
+        user:
+            The user who wrote to the database.
+    """
+    if not settings.DATABASE_REPLICAS or not user.is_authenticated:
+        return
+
+    cache.set(
+        PIN_KEY.format(user_id=user.pk),
+        True,
+        settings.DATABASE_REPLICA_PIN_SECONDS,
+    )
+
+
+@contextlib.contextmanager
+def read_from_primary():
+    """
+    Send all reads made in the block to the primary database.
+    """
+    with _use_context(None):
+        yield
+
+
+@contextlib.contextmanager
+def read_from_replicas(request=None):
+    """
+    Allow reads made in the block to be sent to a replica.
+
+    Args:
+        request:
+            The request being handled, if any. See
+            :py:class:`ReplicaContext`.
+    """
+    with _use_context(ReplicaContext(request)):
+        yield
+
+
+def _get_resolved_user(request):
+    """
+    Get the user who made a request if they are already known.
+
+    Args:
+        request:
+            The request to get the user of.
+
+    Returns:
+        The user who made the request, or ``None`` if the request has
+        not been authenticated yet. Authentication is never triggered
+        because it would have to read from the database.
+    """
+    user = request.__dict__.get("user")
+
+    # The lazy user set by Django's authentication middleware caches the
+    # user it loads on the request.
+    if isinstance(user, SimpleLazyObject):
+        user = getattr(request, "_cached_user", None)
+
+    return user
+
+
+@contextlib.contextmanager
+def _use_context(context):
+    """
+    Replace the replica context of the current thread within a block.
+
+    Args:
+        context:
+            The context to use.
+    """
+    previous = get_context()
+    _state.context = context
+
+    try:
+        yield
+    finally:
+        _state.context = previous
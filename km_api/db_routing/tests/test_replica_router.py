@@ -0,0 +1,89 @@
+from unittest import mock
+
+import pytest
+
+from db_routing import read_from_primary, read_from_replicas, routers
+from know_me.models import KMUser
+
+
+@pytest.fixture
+def replicas(settings):
+    """
+    Configure a single replica.
+    """
+    settings.DATABASE_REPLICAS = ["replica0"]
+
+
+def test_allow_migrate_replica(replicas):
+    """
+    Migrations should not be run on replicas.
+    """
+    router = routers.ReplicaRouter()
+
+    assert router.allow_migrate("replica0", "know_me") is False
+    assert router.allow_migrate("default", "know_me") is None
+
+
+def test_db_for_read_no_context(replicas):
+    """
+    Outside of a replica block, reads should use the primary database.
+    """
+    router = routers.ReplicaRouter()
+
+    assert router.db_for_read(KMUser) == "default"
+
+
+def test_db_for_read_primary_block(replicas):
+    """
+    Reads in a primary block nested in a replica block should use the
+    primary database.
+    """
+    router = routers.ReplicaRouter()
+
+    with read_from_replicas(), read_from_primary():
+        assert router.db_for_read(KMUser) == "default"
+
+
+def test_db_for_read_replica(replicas):
+    """
+    Reads in a replica block should use a replica.
+    """
+    router = routers.ReplicaRouter()
+
+    with read_from_replicas():
+        assert router.db_for_read(KMUser) == "replica0"
+
+
+def test_db_for_read_no_replicas(settings):
+    """
+    If there are no replicas, reads should use the primary database.
+    """
+    settings.DATABASE_REPLICAS = []
+    router = routers.ReplicaRouter()
+
+    with read_from_replicas():
+        assert router.db_for_read(KMUser) == "default"
+
+
+def test_db_for_read_transaction(replicas):
+    """
+    Reads inside a transaction should use the primary database.
+    """
+    router = routers.ReplicaRouter()
+    connection = mock.Mock(in_atomic_block=True)
+
+    with read_from_replicas(), mock.patch(
+        "db_routing.routing.transaction.get_connection",
+        return_value=connection,
+    ):
+        assert router.db_for_read(KMUser) == "default"
+
+
+def test_db_for_write(replicas):
+    """
+    Writes should always use the primary database.
+    """
+    router = routers.ReplicaRouter()
+
+    with read_from_replicas():
+        assert router.db_for_write(KMUser) == "default"
@@ -0,0 +1,86 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+import pytest
+
+from db_routing import middleware, routing
+
+
+@pytest.fixture
+def replicas(settings):
+    """
+    Configure a single replica and clear any pinned users.
+    """
+    settings.DATABASE_REPLICAS = ["replica0"]
+    cache.clear()
+
+
+def make_user(pk=1):
+    """
+    Create an authenticated user that does not exist in the database.
+    """
+    return mock.Mock(is_authenticated=True, pk=pk)
+
+
+def test_get_pinned_user(replicas):
+    """
+    A user who recently wrote to the database should read from the
+    primary database.
+    """
+    user = make_user()
+    routing.pin_user(user)
+
+    request = RequestFactory().get("/")
+    request.user = user
+
+    def get_response(request):
+        assert not routing.get_context().can_read_from_replica()
+
+        return HttpResponse()
+
+    middleware.ReplicaRoutingMiddleware(get_response)(request)
+
+
+def test_get_unauthenticated(replicas):
+    """
+    Reads made before the requesting user is known should use the
+    primary database. Once the user is known, reads should use a
+    replica.
+    """
+    request = RequestFactory().get("/")
+
+    def get_response(request):
+        context = routing.get_context()
+        assert not context.can_read_from_replica()
+
+        request.user = make_user()
+
+        assert context.can_read_from_replica()
+
+        return HttpResponse()
+
+    middleware.ReplicaRoutingMiddleware(get_response)(request)
+
+    assert routing.get_context() is None
+
+
+def test_post_pins_user(replicas):
+    """
+    Making a request that may write to the database should pin the
+    requesting user to the primary database.
+    """
+    user = make_user()
+    request = RequestFactory().post("/")
+    request.user = user
+
+    def get_response(request):
+        assert routing.get_context() is None
+
+        return HttpResponse()
+
+    middleware.ReplicaRoutingMiddleware(get_response)(request)
+
+    assert cache.get(routing.PIN_KEY.format(user_id=user.pk))
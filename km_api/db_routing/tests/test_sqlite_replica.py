@@ -0,0 +1,103 @@
+from django.core.cache import cache
+from django.db import connections
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+
+import pytest
+
+from db_routing import read_from_replicas, routing
+from know_me.models import KMUser
+
+
+REPLICA = "replica0"
+
+
+@pytest.fixture
+def sqlite_replica(settings, transactional_db):
+    """
+    Add a replica alias connected to the test database.
+
+    Data is committed by the ``transactional_db`` fixture so that it is
+    visible through the replica's connection.
+    """
+    connections.databases[REPLICA] = dict(connections["default"].settings_dict)
+    settings.DATABASE_REPLICAS = [REPLICA]
+    cache.clear()
+
+    yield REPLICA
+
+    connections[REPLICA].close()
+    delattr(connections._connections, REPLICA)
+    del connections.databases[REPLICA]
+
+
+def get_km_user_table_queries(captured):
+    """
+    Get the queries for the Know Me user table from a captured context.
+    """
+    table = KMUser._meta.db_table
+
+    return [q["sql"] for q in captured.captured_queries if table in q["sql"]]
+
+
+def run_query(request=None):
+    """
+    Read the Know Me users in a replica block and capture the queries
+    made to each database.
+    """
+    with CaptureQueriesContext(connections["default"]) as primary:
+        with CaptureQueriesContext(connections[REPLICA]) as replica:
+            with read_from_replicas(request):
+                km_user_ids = list(KMUser.objects.values_list("pk", flat=True))
+
+    return (
+        km_user_ids,
+        get_km_user_table_queries(primary),
+        get_km_user_table_queries(replica),
+    )
+
+
+def test_read_from_replica(km_user_factory, sqlite_replica):
+    """
+    Reads in a replica block should be sent to the replica's connection.
+    """
+    km_user = km_user_factory()
+
+    km_user_ids, primary_queries, replica_queries = run_query()
+
+    assert km_user_ids == [km_user.pk]
+    assert primary_queries == []
+    assert len(replica_queries) == 1
+
+
+def test_read_pinned_user(km_user_factory, sqlite_replica):
+    """
+    Reads for a user who recently wrote to the database should be sent
+    to the primary database's connection.
+    """
+    km_user = km_user_factory()
+    request = RequestFactory().get("/")
+    request.user = km_user.user
+    routing.pin_user(km_user.user)
+
+    km_user_ids, primary_queries, replica_queries = run_query(request)
+
+    assert km_user_ids == [km_user.pk]
+    assert len(primary_queries) == 1
+    assert replica_queries == []
+
+
+def test_write_to_primary(sqlite_replica, user_factory):
+    """
+    Writes in a replica block should be sent to the primary database's
+    connection.
+    """
+    user = user_factory()
+
+    with CaptureQueriesContext(connections["default"]) as primary:
+        with CaptureQueriesContext(connections[REPLICA]) as replica:
+            with read_from_replicas():
+                KMUser.objects.create(user=user)
+
+    assert get_km_user_table_queries(primary)
+    assert get_km_user_table_queries(replica) == []
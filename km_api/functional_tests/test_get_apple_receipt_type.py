@@ -22,17 +22,11 @@ def test_get_receipt_type_invalid(api_client, apple_receipt_client):
     }
 
 
-def test_get_receipt_type_production(
-    api_client, apple_receipt_client, settings
-):
+def test_get_receipt_type_production(api_client, apple_receipt_client):
     """
     If the provided Apple receipt is valid in the production environment
     then the environment should be set to ``PRODUCTION``.
     """
-    # Pretend that the endpoint we are using is the production endpoint.
-    endpoint = settings.APPLE_RECEIPT_VALIDATION_ENDPOINT
-    settings.APPLE_RECEIPT_VALIDATION_PRODUCTION_ENDPOINT = endpoint
-
     # Assuming some set of receipt data maps to a valid production
     # receipt...
     receipt_data = "foobar"
@@ -46,7 +40,7 @@ def test_get_receipt_type_production(
     assert response.json() == {"environment": "PRODUCTION"}
 
 
-def test_get_receipt_type_sandbox(api_client, apple_receipt_client):
+def test_get_receipt_type_sandbox(api_client, apple_sandbox_receipt_client):
     """
     If the provided Apple receipt is from the sandbox environment then
     the ``environment`` key of the response should be set to
@@ -54,7 +48,7 @@ def test_get_receipt_type_sandbox(api_client, apple_receipt_client):
     """
     # Assuming some receipt data maps to a valid sandbox receipt...
     receipt_data = "foobar"
-    apple_receipt_client.enqueue_status(receipt_data, {"status": 21007})
+    apple_sandbox_receipt_client.enqueue_status(receipt_data, {"status": 0})
 
     # ...then the type check endpoint should return that the receipt is
     # from the test environment.
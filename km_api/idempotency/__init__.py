@@ -0,0 +1,14 @@
+"""Replaying the responses to retried requests.
+
+Clients on unreliable networks may retry a ``POST`` request whose
+response was lost, even though the original request succeeded. A client
+can include an ``Idempotency-Key`` header in such requests. The first
+successful response for each of a user's keys is stored, and retries
+using the same key are given the stored response instead of performing
+the request again.
+
+Stored responses are kept for ``IDEMPOTENCY_KEY_TTL`` seconds and
+removed by the ``purgeidempotencyrecords`` management command.
+"""
+
+default_app_config = "idempotency.apps.IdempotencyConfig"
@@ -0,0 +1,24 @@
+from django.contrib import admin
+
+from idempotency import models
+
+
+@admin.register(models.IdempotencyRecord)
+class IdempotencyRecordAdmin(admin.ModelAdmin):
+    """
+    Admin for idempotency records.
+    """
+
+    date_hierarchy = "created_at"
+    fields = (
+        "user",
+        "key",
+        "fingerprint",
+        "status_code",
+        "response",
+        "created_at",
+    )
+    list_display = ("key", "user", "status_code", "created_at")
+    raw_id_fields = ("user",)
+    readonly_fields = ("created_at",)
+    search_fields = ("key", "user__email")
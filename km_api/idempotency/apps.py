@@ -0,0 +1,14 @@
+"""App configurations for the ``idempotency`` module.
+"""
+
+from django.apps import AppConfig
+from django.utils.translation import ugettext_lazy as _
+
+
+class IdempotencyConfig(AppConfig):
+    """
+    Default app config.
+    """
+
+    name = "idempotency"
+    verbose_name = _("Idempotency")
@@ -0,0 +1,30 @@
+from django.core import management
+
+from idempotency import records
+
+
+class Command(management.BaseCommand):
+    """
+    Management command to delete expired idempotency records.
+    """
+
+    help = (
+        "Delete the responses stored for idempotency keys that are older "
+        "than IDEMPOTENCY_KEY_TTL. This should be run periodically."
+    )
+
+    def handle(self, *args, **options):
+        """
+        Execute the command.
+
+        Args:
+            *args:
+                Positional arguments provided to the command.
+            **options:
+                Keyword arguments provided to the command.
+        """
+        deleted = records.purge_expired()
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Deleted {deleted} expired records.")
+        )
@@ -0,0 +1,88 @@
+# Generated by Django 2.2.28 on 2026-10-19 14:06
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IdempotencyRecord",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True,
+                        db_index=True,
+                        help_text="The time that the key was first used.",
+                        verbose_name="created at",
+                    ),
+                ),
+                (
+                    "fingerprint",
+                    models.CharField(
+                        help_text="A digest of the request made with the key.",
+                        max_length=64,
+                        verbose_name="fingerprint",
+                    ),
+                ),
+                (
+                    "key",
+                    models.CharField(
+                        help_text="The idempotency key provided by the client.",
+                        max_length=255,
+                        verbose_name="key",
+                    ),
+                ),
+                (
+                    "response",
+                    models.TextField(
+                        blank=True,
+                        help_text="The JSON encoded body of the stored response.",
+                        verbose_name="response",
+                    ),
+                ),
+                (
+                    "status_code",
+                    models.PositiveSmallIntegerField(
+                        blank=True,
+                        help_text="The status code of the stored response. This is empty while the original request is still being processed.",
+                        null=True,
+                        verbose_name="status code",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        help_text="The user who made the request.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="idempotency_records",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="user",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "idempotency record",
+                "verbose_name_plural": "idempotency records",
+                "unique_together": {("user", "key")},
+            },
+        ),
+    ]
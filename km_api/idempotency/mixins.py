@@ -0,0 +1,115 @@
+"""Mixins for views that accept idempotency keys.
+"""
+
+from django.utils.translation import ugettext_lazy as _
+from rest_framework import status
+from rest_framework.response import Response
+
+from idempotency import records
+
+
+HEADER = "HTTP_IDEMPOTENCY_KEY"
+MAX_KEY_LENGTH = 255
+
+KEY_IN_USE = _("A request with this idempotency key is still being processed.")
+KEY_MISMATCH = _(
+    "This idempotency key was already used for a different request."
+)
+KEY_TOO_LONG = _(
+    "Idempotency keys may not be longer than %(max_length)d characters."
+)
+
+
+class IdempotentCreateMixin(object):
+    """
+    Mixin for views whose ``POST`` requests may be retried with an
+    ``Idempotency-Key`` header.
+
+    The first successful response for each of a user's keys is stored
+    and returned again for retries, with an ``Idempotent-Replayed``
+    header. Unsuccessful responses are not stored so that the request
+    can be retried. A request that is still in flight after
+    ``IDEMPOTENCY_IN_FLIGHT_TIMEOUT`` seconds is assumed to have been
+    abandoned, and a retry may claim its key. Requests without the
+    header are handled normally.
+    """
+
+    def post(self, request, *args, **kwargs):
+        """
+        Handle a ``POST`` request, replaying a stored response if the
+        request is a retry.
+
+        Args:
+            request:
+                The request being made.
+            *args:
+                Positional arguments captured from the URL.
+            **kwargs:
+                Keyword arguments captured from the URL.
+
+        Returns:
+            The response to the request.
+        """
+        key = request.META.get(HEADER)
+        if not key or not request.user.is_authenticated:
+            return super().post(request, *args, **kwargs)
+
+        if len(key) > MAX_KEY_LENGTH:
+            return Response(
+                {"detail": KEY_TOO_LONG % {"max_length": MAX_KEY_LENGTH}},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        fingerprint = records.get_fingerprint(request)
+        record, created = records.claim_key(request.user, key, fingerprint)
+
+        if not created:
+            return self.replay_response(record, fingerprint)
+
+        try:
+            response = super().post(request, *args, **kwargs)
+        except Exception:
+            record.delete()
+
+            raise
+
+        if not status.is_success(response.status_code):
+            record.delete()
+
+            return response
+
+        records.complete_record(record, response)
+
+        return response
+
+    def replay_response(self, record, fingerprint):
+        """
+        Build the response to a retried request.
+
+        Args:
+            record:
+                The record of the original request.
+            fingerprint:
+                The fingerprint of the retried request.
+
+        Returns:
+            The stored response, or an error if the original request is
+            still being processed or was a different request.
+        """
+        if record.fingerprint != fingerprint:
+            return Response(
+                {"detail": KEY_MISMATCH},
+                status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            )
+
+        if not record.is_complete:
+            return Response(
+                {"detail": KEY_IN_USE}, status=status.HTTP_409_CONFLICT
+            )
+
+        headers = self.get_success_headers(record.data)
+        headers["Idempotent-Replayed"] = "true"
+
+        return Response(
+            record.data, headers=headers, status=record.status_code
+        )
@@ -0,0 +1,80 @@
+import json
+
+from django.conf import settings
+from django.db import models
+from django.utils.translation import ugettext_lazy as _
+
+
+class IdempotencyRecord(models.Model):
+    """
+    The outcome of a request made with an idempotency key.
+
+    Only a digest of the request is stored, which is enough to detect a
+    key being reused for a different request.
+    """
+
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        db_index=True,
+        help_text=_("The time that the key was first used."),
+        verbose_name=_("created at"),
+    )
+    fingerprint = models.CharField(
+        help_text=_("A digest of the request made with the key."),
+        max_length=64,
+        verbose_name=_("fingerprint"),
+    )
+    key = models.CharField(
+        help_text=_("The idempotency key provided by the client."),
+        max_length=255,
+        verbose_name=_("key"),
+    )
+    response = models.TextField(
+        blank=True,
+        help_text=_("The JSON encoded body of the stored response."),
+        verbose_name=_("response"),
+    )
+    status_code = models.PositiveSmallIntegerField(
+        blank=True,
+        help_text=_(
+            "The status code of the stored response. This is empty while "
+            "the original request is still being processed."
+        ),
+        null=True,
+        verbose_name=_("status code"),
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        help_text=_("The user who made the request."),
+        on_delete=models.CASCADE,
+        related_name="idempotency_records",
+        verbose_name=_("user"),
+    )
+
+    class Meta:
+        unique_together = ("user", "key")
+        verbose_name = _("idempotency record")
+        verbose_name_plural = _("idempotency records")
+
+    def __str__(self):
+        """
+        Get a user readable string representation of the instance.
+
+        Returns:
+            A string containing the key and the ID of its user.
+        """
+        return f"{self.key} (user {self.user_id})"
+
+    @property
+    def data(self):
+        """
+        The decoded body of the stored response.
+        """
+        return json.loads(self.response)
+
+    @property
+    def is_complete(self):
+        """
+        A boolean indicating if a response has been stored.
+        """
+        return self.status_code is not None
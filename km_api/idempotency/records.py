@@ -0,0 +1,148 @@
+"""Creation and expiry of idempotency records.
+"""
+
+import datetime
+import hashlib
+import json
+import logging
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework.utils.encoders import JSONEncoder
+
+from idempotency import models
+
+
+logger = logging.getLogger(__name__)
+
+
+def claim_key(user, key, fingerprint):
+    """
+    Claim an idempotency key for a request.
+
+    Args:
+        user:
+            The user making the request.
+        key:
+            The idempotency key provided with the request.
+        fingerprint:
+            The fingerprint of the request.
+
+    Returns:
+        A tuple containing the record for the key and a boolean
+        indicating if the record was created by this call. If it was,
+        the caller is responsible for processing the request.
+    """
+    # An expired record has not been purged yet, but should not prevent
+    # the key from being used again. The same applies to a record whose
+    # request has been in flight for too long, since the process
+    # handling it most likely died before it could finish or remove the
+    # record.
+    models.IdempotencyRecord.objects.filter(
+        Q(created_at__lt=get_expiry_cutoff())
+        | Q(created_at__lt=get_in_flight_cutoff(), status_code__isnull=True,),
+        key=key,
+        user=user,
+    ).delete()
+
+    return models.IdempotencyRecord.objects.get_or_create(
+        key=key, user=user, defaults={"fingerprint": fingerprint}
+    )
+
+
+def get_expiry_cutoff():
+    """
+    Get the time before which records are expired.
+
+    Returns:
+        A timezone aware datetime.
+    """
+    return timezone.now() - datetime.timedelta(
+        seconds=settings.IDEMPOTENCY_KEY_TTL
+    )
+
+
+def get_in_flight_cutoff():
+    """
+    Get the time before which incomplete records are abandoned.
+
+    Returns:
+        A timezone aware datetime.
+    """
+    return timezone.now() - datetime.timedelta(
+        seconds=settings.IDEMPOTENCY_IN_FLIGHT_TIMEOUT
+    )
+
+
+def get_fingerprint(request):
+    """
+    Compute a digest identifying a request.
+
+    Args:
+        request:
+            The request to compute the fingerprint of.
+
+    Returns:
+        The hex encoded SHA-256 digest of the request's method, path,
+        and data.
+    """
+    data = request.data
+    if hasattr(data, "lists"):
+        data = dict(data.lists())
+
+    # Uploaded files are represented by their names, which is enough to
+    # tell retries apart from different requests.
+    payload = json.dumps(
+        [request.method, request.get_full_path(), data],
+        default=str,
+        sort_keys=True,
+    )
+
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def complete_record(record, response):
+    """
+    Store the response to the request that claimed a record.
+
+    Args:
+        record:
+            The record claimed for the request.
+        response:
+            The successful response to the request.
+
+    Returns:
+        A boolean indicating if the response was stored. It is not
+        stored if the record was abandoned and the key claimed again
+        by a retry in the meantime.
+    """
+    record.response = json.dumps(response.data, cls=JSONEncoder)
+    record.status_code = response.status_code
+
+    updated = models.IdempotencyRecord.objects.filter(
+        pk=record.pk, status_code__isnull=True
+    ).update(response=record.response, status_code=record.status_code)
+    if not updated:
+        logger.warning(
+            "Idempotency record %s was reclaimed before it completed",
+            record.pk,
+        )
+
+    return bool(updated)
+
+
+def purge_expired():
+    """
+    Delete every expired record.
+
+    Returns:
+        The number of records deleted.
+    """
+    deleted, _ = models.IdempotencyRecord.objects.filter(
+        created_at__lt=get_expiry_cutoff()
+    ).delete()
+
+    logger.info("Purged %d expired idempotency records", deleted)
+
+    return deleted
@@ -0,0 +1,17 @@
+from unittest import mock
+
+from django.core import management
+
+from idempotency import records
+
+
+def test_purge():
+    """
+    The command should purge the expired idempotency records.
+    """
+    with mock.patch.object(
+        records, "purge_expired", autospec=True, return_value=3
+    ) as mock_purge:
+        management.call_command("purgeidempotencyrecords")
+
+    assert mock_purge.call_count == 1
@@ -0,0 +1,40 @@
+from idempotency import models
+
+
+def test_data(user_factory):
+    """
+    The data of a record should be the decoded response.
+    """
+    record = models.IdempotencyRecord(
+        fingerprint="fingerprint",
+        key="key",
+        response='{"foo": "bar"}',
+        status_code=201,
+        user=user_factory(),
+    )
+
+    assert record.data == {"foo": "bar"}
+
+
+def test_is_complete():
+    """
+    A record should be complete once its status code is set.
+    """
+    record = models.IdempotencyRecord()
+
+    assert not record.is_complete
+
+    record.status_code = 201
+
+    assert record.is_complete
+
+
+def test_string_conversion(user_factory):
+    """
+    Converting a record to a string should return its key and the ID of
+    its user.
+    """
+    user = user_factory()
+    record = models.IdempotencyRecord(key="key", user=user)
+
+    assert str(record) == f"key (user {user.pk})"
@@ -0,0 +1,177 @@
+import datetime
+
+from django.utils import timezone
+from rest_framework import generics, status
+from rest_framework.response import Response
+
+from idempotency import mixins, models
+
+
+class CounterView(generics.CreateAPIView):
+    """
+    View that counts the ``POST`` requests it handles.
+    """
+
+    permission_classes = ()
+    response_status = status.HTTP_201_CREATED
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.calls = 0
+
+    def post(self, request, *args, **kwargs):
+        self.calls += 1
+
+        return Response(
+            {"calls": self.calls, "url": "/counter/"},
+            status=self.response_status,
+        )
+
+
+class IdempotentCounterView(mixins.IdempotentCreateMixin, CounterView):
+    """
+    Counter view that accepts idempotency keys.
+    """
+
+
+def test_post_error_not_stored(api_rf, user_factory):
+    """
+    Unsuccessful responses should not be stored so that the request can
+    be retried.
+    """
+    api_rf.user = user_factory()
+    view = IdempotentCounterView(response_status=status.HTTP_400_BAD_REQUEST)
+
+    response = view.dispatch(
+        api_rf.post("/", {"foo": "bar"}, HTTP_IDEMPOTENCY_KEY="key")
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert not models.IdempotencyRecord.objects.exists()
+
+
+def test_post_in_progress(api_rf, user_factory):
+    """
+    Retrying a request that is still being processed should return a
+    conflict.
+    """
+    api_rf.user = user_factory()
+    view = IdempotentCounterView()
+    request = api_rf.post("/", {"foo": "bar"}, HTTP_IDEMPOTENCY_KEY="key")
+    view.dispatch(request)
+    models.IdempotencyRecord.objects.update(status_code=None)
+
+    response = view.dispatch(
+        api_rf.post("/", {"foo": "bar"}, HTTP_IDEMPOTENCY_KEY="key")
+    )
+
+    assert response.status_code == status.HTTP_409_CONFLICT
+    assert view.calls == 1
+
+
+def test_post_in_progress_abandoned(api_rf, settings, user_factory):
+    """
+    Retrying a request that has been in flight for longer than the in
+    flight timeout should process the request again.
+    """
+    settings.IDEMPOTENCY_IN_FLIGHT_TIMEOUT = 60
+    api_rf.user = user_factory()
+    view = IdempotentCounterView()
+    request = api_rf.post("/", {"foo": "bar"}, HTTP_IDEMPOTENCY_KEY="key")
+    view.dispatch(request)
+    models.IdempotencyRecord.objects.update(
+        created_at=timezone.now() - datetime.timedelta(minutes=5),
+        status_code=None,
+    )
+
+    response = view.dispatch(
+        api_rf.post("/", {"foo": "bar"}, HTTP_IDEMPOTENCY_KEY="key")
+    )
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert view.calls == 2
+    assert models.IdempotencyRecord.objects.get().is_complete
+
+
+def test_post_key_reused(api_rf, user_factory):
+    """
+    Reusing a key for a different request should be rejected.
+    """
+    api_rf.user = user_factory()
+    view = IdempotentCounterView()
+    view.dispatch(api_rf.post("/", {"foo": "bar"}, HTTP_IDEMPOTENCY_KEY="key"))
+
+    response = view.dispatch(
+        api_rf.post("/", {"foo": "baz"}, HTTP_IDEMPOTENCY_KEY="key")
+    )
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert view.calls == 1
+
+
+def test_post_key_too_long(api_rf, user_factory):
+    """
+    Keys longer than the maximum length should be rejected.
+    """
+    api_rf.user = user_factory()
+    view = IdempotentCounterView()
+
+    response = view.dispatch(
+        api_rf.post(
+            "/", HTTP_IDEMPOTENCY_KEY="k" * (mixins.MAX_KEY_LENGTH + 1)
+        )
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert view.calls == 0
+
+
+def test_post_other_user(api_rf, user_factory):
+    """
+    Keys should be scoped to the user who made the request.
+    """
+    view = IdempotentCounterView()
+    api_rf.user = user_factory()
+    view.dispatch(api_rf.post("/", HTTP_IDEMPOTENCY_KEY="key"))
+
+    api_rf.user = user_factory()
+    response = view.dispatch(api_rf.post("/", HTTP_IDEMPOTENCY_KEY="key"))
+
+    assert response.data["calls"] == 2
+
+
+def test_post_replay(api_rf, user_factory):
+    """
+    Retrying a request with the same key should return the stored
+    response without handling the request again.
+    """
+    api_rf.user = user_factory()
+    view = IdempotentCounterView()
+    first = view.dispatch(
+        api_rf.post("/", {"foo": "bar"}, HTTP_IDEMPOTENCY_KEY="key")
+    )
+
+    retry = view.dispatch(
+        api_rf.post("/", {"foo": "bar"}, HTTP_IDEMPOTENCY_KEY="key")
+    )
+
+    assert retry.status_code == status.HTTP_201_CREATED
+    assert retry.data == first.data
+    assert retry["Idempotent-Replayed"] == "true"
+    assert retry["Location"] == "/counter/"
+    assert view.calls == 1
+
+
+def test_post_without_key(api_rf, user_factory):
+    """
+    Requests without a key should always be handled.
+    """
+    api_rf.user = user_factory()
+    view = IdempotentCounterView()
+
+    view.dispatch(api_rf.post("/"))
+    response = view.dispatch(api_rf.post("/"))
+
+    assert response.data["calls"] == 2
+    assert not models.IdempotencyRecord.objects.exists()
@@ -0,0 +1,168 @@
+import datetime
+from unittest import mock
+
+from django.utils import timezone
+from rest_framework.parsers import JSONParser
+from rest_framework.request import Request
+
+from idempotency import models, records
+
+
+def make_request(request):
+    """
+    Wrap a request so that its JSON data can be parsed.
+    """
+    return Request(request, parsers=[JSONParser()])
+
+
+def test_claim_key_expired(settings, user_factory):
+    """
+    Claiming a key whose record has expired should replace the record.
+    """
+    settings.IDEMPOTENCY_KEY_TTL = 60
+    user = user_factory()
+    expired_at = timezone.now() - datetime.timedelta(minutes=5)
+    with mock.patch("django.utils.timezone.now", return_value=expired_at):
+        old = models.IdempotencyRecord.objects.create(
+            fingerprint="old", key="key", status_code=201, user=user
+        )
+
+    record, created = records.claim_key(user, "key", "new")
+
+    assert created
+    assert record.pk != old.pk
+    assert record.fingerprint == "new"
+
+
+def test_claim_key_abandoned(settings, user_factory):
+    """
+    Claiming a key whose request has been in flight for longer than the
+    in flight timeout should replace the record.
+    """
+    settings.IDEMPOTENCY_IN_FLIGHT_TIMEOUT = 60
+    user = user_factory()
+    started_at = timezone.now() - datetime.timedelta(minutes=5)
+    with mock.patch("django.utils.timezone.now", return_value=started_at):
+        old = models.IdempotencyRecord.objects.create(
+            fingerprint="old", key="key", user=user
+        )
+
+    record, created = records.claim_key(user, "key", "new")
+
+    assert created
+    assert record.pk != old.pk
+    assert record.fingerprint == "new"
+
+
+def test_claim_key_completed(settings, user_factory):
+    """
+    A completed record should not be replaced once the in flight
+    timeout has passed.
+    """
+    settings.IDEMPOTENCY_IN_FLIGHT_TIMEOUT = 60
+    user = user_factory()
+    started_at = timezone.now() - datetime.timedelta(minutes=5)
+    with mock.patch("django.utils.timezone.now", return_value=started_at):
+        old = models.IdempotencyRecord.objects.create(
+            fingerprint="old", key="key", status_code=201, user=user
+        )
+
+    record, created = records.claim_key(user, "key", "new")
+
+    assert not created
+    assert record == old
+
+
+def test_claim_key_existing(user_factory):
+    """
+    Claiming a key that was already claimed should return the existing
+    record.
+    """
+    user = user_factory()
+    existing, _ = records.claim_key(user, "key", "fingerprint")
+
+    record, created = records.claim_key(user, "key", "fingerprint")
+
+    assert not created
+    assert record == existing
+
+
+def test_complete_record(user_factory):
+    """
+    Completing a record should store the response.
+    """
+    record = models.IdempotencyRecord.objects.create(
+        fingerprint="foo", key="key", user=user_factory()
+    )
+    response = mock.Mock(data={"foo": "bar"}, status_code=201)
+
+    assert records.complete_record(record, response)
+
+    record.refresh_from_db()
+
+    assert record.data == {"foo": "bar"}
+    assert record.status_code == 201
+
+
+def test_complete_record_reclaimed(user_factory):
+    """
+    If the record was reclaimed by a retry, the response should not
+    overwrite the retry's record.
+    """
+    user = user_factory()
+    record = models.IdempotencyRecord.objects.create(
+        fingerprint="foo", key="key", user=user
+    )
+    record.delete()
+    retry = models.IdempotencyRecord.objects.create(
+        fingerprint="foo", key="key", user=user
+    )
+    response = mock.Mock(data={"foo": "bar"}, status_code=201)
+
+    assert not records.complete_record(record, response)
+
+    retry.refresh_from_db()
+
+    assert not retry.is_complete
+
+
+def test_get_fingerprint(api_rf):
+    """
+    Requests should have the same fingerprint if and only if they have
+    the same method, path, and data.
+    """
+    first = records.get_fingerprint(
+        make_request(api_rf.post("/foo/", {"a": 1, "b": 2}, format="json"))
+    )
+    same = records.get_fingerprint(
+        make_request(api_rf.post("/foo/", {"b": 2, "a": 1}, format="json"))
+    )
+    other_data = records.get_fingerprint(
+        make_request(api_rf.post("/foo/", {"a": 2}, format="json"))
+    )
+    other_path = records.get_fingerprint(
+        make_request(api_rf.post("/bar/", {"a": 1, "b": 2}, format="json"))
+    )
+
+    assert first == same
+    assert first != other_data
+    assert first != other_path
+
+
+def test_purge_expired(settings, user_factory):
+    """
+    Purging should delete only the records that have expired.
+    """
+    settings.IDEMPOTENCY_KEY_TTL = 60
+    user = user_factory()
+    expired_at = timezone.now() - datetime.timedelta(minutes=5)
+    with mock.patch("django.utils.timezone.now", return_value=expired_at):
+        models.IdempotencyRecord.objects.create(
+            fingerprint="old", key="old", user=user
+        )
+    current = models.IdempotencyRecord.objects.create(
+        fingerprint="new", key="new", user=user
+    )
+
+    assert records.purge_expired() == 1
+    assert list(models.IdempotencyRecord.objects.all()) == [current]
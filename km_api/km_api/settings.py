@@ -14,7 +14,7 @@ https://docs.djangoproject.com/en/1.11/ref/settings/
 import logging
 import os
 
-import requests
+from django.core.exceptions import ImproperlyConfigured
 
 
 # Ignored warnings:
@@ -73,15 +73,22 @@ if allowed_host_string:
 # If we are running in an ECS environment, we need to add the IP of the
 # host machine running the task. This is needed because the load
 # balancer checks the status endpoint on the private IP rather than the
-# domain name we have set up.
+# domain name we have set up. The IP is looked up the first time a host
+# is validated rather than on every import of the settings.
 if os.getenv("DJANGO_RUNNING_ON_ECS", "False").lower() == "true":
-    resp = requests.get("http://169.254.170.2/v2/metadata")
-    data = resp.json()
-
-    container_meta = data["Containers"][0]
-    private_ip = container_meta["Networks"][0]["IPv4Addresses"][0]
-
-    ALLOWED_HOSTS.append(private_ip)
+    import functools
+
+    from startup import hosts
+
+    ALLOWED_HOSTS = hosts.LazyHostList(
+        ALLOWED_HOSTS,
+        functools.partial(
+            hosts.discover_ecs_hosts,
+            cache_path=os.getenv(
+                "DJANGO_ECS_HOSTS_CACHE_PATH", hosts.DEFAULT_CACHE_PATH
+            ),
+        ),
+    )
 
 
 # Application definition
@@ -109,10 +116,14 @@ THIRD_PARTY_APPS = [
 CUSTOM_APPS = [
     "account",
     "custom_storages",
+    "idempotency",
     "km_auth",
     "know_me",
     "know_me.journal",
     "know_me.profile",
+    "sharding",
+    "startup",
+    "task_queue",
 ]
 
 INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + CUSTOM_APPS
@@ -125,6 +136,8 @@ MIDDLEWARE = [
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "db_routing.middleware.ReplicaRoutingMiddleware",
+    "sharding.middleware.ShardRoutingMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -191,6 +204,79 @@ else:
         }
     }
 
+# Read replicas of the default database. Each replica uses the same
+# credentials as the default database.
+DB_REPLICA_HOSTS = [
+    host
+    for host in os.getenv("DJANGO_DB_REPLICA_HOSTS", "").split(",")
+    if host
+]
+
+DATABASE_REPLICAS = []
+for index, host in enumerate(DB_REPLICA_HOSTS):
+    alias = f"replica{index}"
+    DATABASES[alias] = {
+        **DATABASES["default"],
+        "HOST": host,
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS.append(alias)
+
+# The number of seconds after a user writes to the database that their
+# reads are sent to the default database rather than a replica.
+DATABASE_REPLICA_PIN_SECONDS = int(
+    os.getenv("DJANGO_DB_REPLICA_PIN_SECONDS", "10")
+)
+
+# Shards that store the data owned by Know Me users in addition to the
+# default database. Each shard is a database with the given name that
+# is accessed the same way as the default database.
+DB_SHARD_NAMES = [
+    name for name in os.getenv("DJANGO_DB_SHARD_NAMES", "").split(",") if name
+]
+
+SHARD_DATABASES = []
+for index, name in enumerate(DB_SHARD_NAMES):
+    alias = f"shard{index}"
+    DATABASES[alias] = {**DATABASES["default"], "NAME": name}
+    if DATABASES[alias]["ENGINE"] == "django.db.backends.sqlite3":
+        DATABASES[alias]["NAME"] = os.path.join(BASE_DIR, name)
+    SHARD_DATABASES.append(alias)
+
+DATABASE_ROUTERS = [
+    "sharding.routers.ShardRouter",
+    "db_routing.routers.ReplicaRouter",
+]
+
+
+# Cache
+# https://docs.djangoproject.com/en/2.2/topics/cache/
+
+CACHE_TABLE = os.getenv("DJANGO_CACHE_TABLE")
+
+if CACHE_TABLE:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+            "LOCATION": CACHE_TABLE,
+        }
+    }
+else:
+    CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+
+# Users who write to the database are pinned to it using the cache so
+# that their next requests do not read stale data from a replica. The
+# pin has to be visible to every process, which an in-memory cache is
+# not.
+if DATABASE_REPLICAS and not CACHE_TABLE:
+    raise ImproperlyConfigured(
+        "DJANGO_CACHE_TABLE must be set when DJANGO_DB_REPLICA_HOSTS is "
+        "set so that every process shares the users pinned to the primary "
+        "database."
+    )
+
 
 # Password validation
 # https://docs.djangoproject.com/en/1.11/ref/settings/#auth-password-validators
@@ -220,6 +306,12 @@ if os.environ.get("DJANGO_SES_ENABLED", "False").lower() == "true":
     )
     EMAIL_BACKEND = "django_amazon_ses.EmailBackend"
 
+# If enabled, email is saved to the task queue and sent by a worker
+# using the backend configured above.
+if os.environ.get("DJANGO_EMAIL_QUEUE_ENABLED", "False").lower() == "true":
+    TASK_QUEUE_EMAIL_BACKEND = EMAIL_BACKEND
+    EMAIL_BACKEND = "task_queue.backends.QueuedEmailBackend"
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/1.11/topics/i18n/
@@ -240,6 +332,18 @@ USE_TZ = True
 MEDIA_ROOT = os.environ.get("DJANGO_MEDIA_ROOT")
 MEDIA_URL = "/media/"
 
+# The number of seconds that the parameters for a direct file upload are
+# valid for.
+MEDIA_UPLOAD_EXPIRATION = int(
+    os.getenv("DJANGO_MEDIA_UPLOAD_EXPIRATION", "3600")
+)
+
+# The maximum size in bytes of a file uploaded directly to storage.
+# Model fields may set a ``max_upload_size`` attribute to override it.
+MEDIA_UPLOAD_MAX_SIZE = int(
+    os.getenv("DJANGO_MEDIA_UPLOAD_MAX_SIZE", str(100 * 1024 * 1024))
+)
+
 
 # Static files (CSS, JavaScript, Images)
 # https://docs.djangoproject.com/en/1.11/howto/static-files/
@@ -250,6 +354,11 @@ STATIC_URL = "/static/"
 
 # File Storage
 
+# The ACL of uploaded files is set by each storage class. Defining the
+# setting opts in to the behavior of newer versions of django-storages,
+# which do not apply a public ACL unless asked to.
+AWS_DEFAULT_ACL = None
+
 if os.environ.get("DJANGO_S3_STORAGE", "False").lower() == "true":
     DEFAULT_FILE_STORAGE = "custom_storages.backends.MediaStorage"
     STATICFILES_STORAGE = "custom_storages.backends.StaticStorage"
@@ -285,6 +394,16 @@ CORS_ORIGIN_ALLOW_ALL = True
 
 # Apple Settings
 
+# The bundle ID of the app. App Store server notifications are only
+# accepted once it is set, and notifications for other apps are
+# rejected.
+APPLE_BUNDLE_ID = os.getenv("DJANGO_APPLE_BUNDLE_ID", "")
+
+# The App Store environment that the deployment serves, either
+# "Production" or "Sandbox". App Store server notifications from the
+# other environment are ignored.
+APPLE_ENVIRONMENT = os.getenv("DJANGO_APPLE_ENVIRONMENT", "Production")
+
 km_premium_codes_str = os.getenv(
     "DJANGO_APPLE_PRODUCT_CODES_KNOW_ME_PREMIUM", ""
 )
@@ -293,15 +412,27 @@ km_premium_codes = (
 )
 APPLE_PRODUCT_CODES = {"KNOW_ME_PREMIUM": km_premium_codes}
 
-# We can compare the endpoint being used against the known production
-# endpoint to determine if we are in a production environment.
-APPLE_RECEIPT_VALIDATION_PRODUCTION_ENDPOINT = (
-    "https://buy.itunes.apple.com/verifyReceipt"
-)
 APPLE_RECEIPT_VALIDATION_ENDPOINT = os.environ.get(
     "DJANGO_APPLE_RECEIPT_VALIDATION_ENDPOINT",
     "https://sandbox.itunes.apple.com/verifyReceipt",
 )
+
+# The endpoints of each environment. Both are queried when determining
+# which environment a receipt belongs to.
+APPLE_RECEIPT_VALIDATION_PRODUCTION_ENDPOINT = os.environ.get(
+    "DJANGO_APPLE_RECEIPT_VALIDATION_PRODUCTION_ENDPOINT",
+    "https://buy.itunes.apple.com/verifyReceipt",
+)
+APPLE_RECEIPT_VALIDATION_SANDBOX_ENDPOINT = os.environ.get(
+    "DJANGO_APPLE_RECEIPT_VALIDATION_SANDBOX_ENDPOINT",
+    "https://sandbox.itunes.apple.com/verifyReceipt",
+)
+# The SHA-256 fingerprints of the root certificates trusted to sign App
+# Store server notifications. The default is Apple Root CA - G3.
+APPLE_ROOT_CERTIFICATE_FINGERPRINTS = os.getenv(
+    "DJANGO_APPLE_ROOT_CERTIFICATE_FINGERPRINTS",
+    "63343abfb89a6a03ebb57e9b3f5fa7be7c4f5c756f3017b3a8c488c3653e9179",
+).split(",")
 APPLE_SHARED_SECRET = os.getenv("DJANGO_APPLE_SHARED_SECRET", "")
 
 
@@ -330,6 +461,21 @@ REST_FRAMEWORK = {
     "PAGE_SIZE": 10,
 }
 
+# The number of seconds that clients may cache the API documentation
+# for. The documentation only changes when the application is deployed.
+API_DOCS_MAX_AGE = int(os.getenv("DJANGO_API_DOCS_MAX_AGE", "86400"))
+
+# The number of seconds after which a request made with an
+# ``Idempotency-Key`` header that has not finished is assumed to have
+# been abandoned, allowing the key to be claimed by a retry.
+IDEMPOTENCY_IN_FLIGHT_TIMEOUT = int(
+    os.getenv("DJANGO_IDEMPOTENCY_IN_FLIGHT_TIMEOUT", "60")
+)
+
+# The number of seconds that the response to a request made with an
+# ``Idempotency-Key`` header is replayed for retries of the request.
+IDEMPOTENCY_KEY_TTL = int(os.getenv("DJANGO_IDEMPOTENCY_KEY_TTL", "86400"))
+
 
 # Logging Configuration
 
@@ -362,11 +508,17 @@ LOGGING = {
 
 LOGGING_CUSTOM_APPS = (
     "account",
+    "apple",
     "custom_storages",
+    "db_routing",
+    "idempotency",
     "km_auth",
     "know_me",
     "permission_utils",
     "rest_order",
+    "sharding",
+    "startup",
+    "task_queue",
     "templated_email",
 )
 
@@ -389,3 +541,11 @@ KNOW_ME_PREMIUM_ENABLED = (
 Boolean indicating if a premium subscription should be required to
 perform various Know Me operations.
 """
+
+KNOW_ME_RESPONSE_CACHE_TIMEOUT = int(
+    os.getenv("DJANGO_KNOW_ME_RESPONSE_CACHE_TIMEOUT", "0")
+)
+"""
+The number of seconds that responses containing a Know Me user's data
+are cached for. Responses are not cached if this is 0.
+"""
@@ -17,8 +17,6 @@ from django.conf.urls import include, url
 from django.contrib import admin
 from django.urls import path
 
-from rest_framework.documentation import include_docs_urls
-
 
 urlpatterns = [
     url(r"^account/", include("rest_email_auth.urls")),
@@ -30,7 +28,8 @@ urlpatterns = [
     ),
     path("apple/", include("apple.urls")),
     url(r"^auth/", include("km_auth.urls")),
-    url(r"^docs/", include_docs_urls(title="Know Me API")),
+    url(r"^docs/", include("api_docs.urls")),
     url(r"^know-me/", include("know_me.urls")),
+    path("media-uploads/", include("custom_storages.urls")),
     url(r"^status/", include("status.urls")),
 ]
@@ -0,0 +1,37 @@
+"""
+Django settings for processes that do not serve requests.
+
+Background workers and scheduled management commands only need the
+models, their signals, and email templates. The apps and middleware
+that are only used to serve HTTP requests are removed so they are not
+imported on every run.
+
+Usage::
+
+    DJANGO_SETTINGS_MODULE=km_api.worker_settings python manage.py \\
+        updatesubscriptions
+"""
+
+from km_api.settings import *  # noqa: F401, F403
+from km_api.settings import INSTALLED_APPS
+
+
+# Apps that only contribute to serving requests, such as the admin site,
+# CORS headers, API filtering, and static files.
+REQUEST_ONLY_APPS = [
+    "corsheaders",
+    "django.contrib.admin",
+    "django.contrib.messages",
+    "django.contrib.staticfiles",
+    "django_filters",
+    "dry_rest_permissions",
+    "storages",
+]
+
+INSTALLED_APPS = [
+    app for app in INSTALLED_APPS if app not in REQUEST_ONLY_APPS
+]
+
+MIDDLEWARE = []
+
+ROOT_URLCONF = "km_api.worker_urls"
@@ -0,0 +1,9 @@
+"""
+URL configuration for processes that do not serve requests.
+
+Management commands load the URL configuration while running system
+checks, which would import every view and serializer. Workers never
+handle requests or build links to the API, so they have no routes.
+"""
+
+urlpatterns = []
@@ -0,0 +1,143 @@
+"""Maintenance of the materialized access to Know Me users.
+
+Checking if a user can access a Know Me user requires combining the
+owner of the Know Me user and the accessors granting access to it. The
+results of that computation are stored as
+:py:class:`know_me.models.KMUserAccess` rows so that access decisions
+are a single indexed lookup.
+
+The functions in this module recompute the rows affected by a change to
+one of the underlying models. The premium status of the owner is not
+stored because it changes when the owner's receipt expires without
+anything being saved. It is checked with
+:py:func:`know_me.models.get_premium_filter` when access is decided.
+"""
+
+import logging
+
+from django.db import transaction
+
+from know_me import models
+
+
+logger = logging.getLogger(__name__)
+
+
+def rebuild_access():
+    """
+    Rebuild the access of every user to every Know Me user.
+
+    Returns:
+        The number of access rows created.
+    """
+    entries = [
+        models.KMUserAccess(
+            can_see_private=True,
+            can_write=True,
+            is_owner=True,
+            km_user_id=km_user_id,
+            user_id=user_id,
+        )
+        for km_user_id, user_id in models.KMUser.objects.values_list(
+            "pk", "user_id"
+        )
+    ]
+
+    accessors = models.KMUserAccessor.objects.filter(
+        is_accepted=True, user_with_access__isnull=False
+    ).values_list("km_user_id", "user_with_access_id", "is_admin")
+    for km_user_id, user_id, is_admin in accessors:
+        entries.append(
+            models.KMUserAccess(
+                can_see_private=is_admin,
+                can_write=is_admin,
+                km_user_id=km_user_id,
+                user_id=user_id,
+            )
+        )
+
+    with transaction.atomic():
+        models.KMUserAccess.objects.all().delete()
+        models.KMUserAccess.objects.bulk_create(entries, batch_size=1000)
+
+    logger.info("Rebuilt %d Know Me user access entries", len(entries))
+
+    return len(entries)
+
+
+def remove_accessor_access(accessor):
+    """
+    Remove the access granted by an accessor.
+
+    Args:
+        accessor:
+            The accessor that no longer grants access.
+    """
+    if accessor.user_with_access_id is None:
+        return
+
+    models.KMUserAccess.objects.filter(
+        is_owner=False,
+        km_user_id=accessor.km_user_id,
+        user_id=accessor.user_with_access_id,
+    ).delete()
+
+
+def update_accessor_access(accessor):
+    """
+    Update the access granted by an accessor.
+
+    If the accessor used to grant access to a different user, that
+    user's access is removed.
+
+    Args:
+        accessor:
+            The accessor that was created or modified.
+    """
+    previous_user_id = getattr(accessor, "_saved_user_with_access_id", None)
+    if previous_user_id not in (None, accessor.user_with_access_id):
+        models.KMUserAccess.objects.filter(
+            is_owner=False,
+            km_user_id=accessor.km_user_id,
+            user_id=previous_user_id,
+        ).delete()
+
+    if accessor.user_with_access_id is None:
+        return
+
+    if not accessor.is_accepted:
+        remove_accessor_access(accessor)
+
+        return
+
+    models.KMUserAccess.objects.update_or_create(
+        km_user_id=accessor.km_user_id,
+        user_id=accessor.user_with_access_id,
+        defaults={
+            "can_see_private": accessor.is_admin,
+            "can_write": accessor.is_admin,
+            "is_owner": False,
+        },
+    )
+
+
+def update_owner_access(km_user):
+    """
+    Update the access of a Know Me user's owner.
+
+    Args:
+        km_user:
+            The Know Me user whose owner should be granted access.
+    """
+    models.KMUserAccess.objects.filter(
+        is_owner=True, km_user_id=km_user.pk
+    ).exclude(user_id=km_user.user_id).delete()
+    models.KMUserAccess.objects.update_or_create(
+        km_user_id=km_user.pk,
+        user_id=km_user.user_id,
+        defaults={
+            "can_see_private": True,
+            "can_write": True,
+            "is_owner": True,
+        },
+    )
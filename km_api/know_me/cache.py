@@ -0,0 +1,148 @@
+"""Caching of responses containing a Know Me user's data.
+
+Responses are cached under a key that includes a generation token for
+the Know Me user that owns the data. Any change to the Know Me user's
+profiles, media, journal, accessors, or its owner's subscription
+replaces the token, so every response cached for the Know Me user stops
+being used at once without having to track the individual keys. Stale
+responses are left to expire from the cache.
+
+The generation is a random token rather than a counter so that if it is
+evicted from the cache, the replacement can never match a token that
+was used before.
+"""
+
+import hashlib
+import uuid
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+
+from know_me import models
+
+
+GENERATION_KEY = "know-me:generation:{km_user_id}"
+RESPONSE_KEY = "know-me:response:{digest}"
+
+
+def bump_generation(*km_user_ids):
+    """
+    Invalidate the cached responses of one or more Know Me users.
+
+    The generation is replaced immediately and again once the current
+    transaction is committed. Otherwise a request made before the commit
+    could cache data that does not include the change under the new
+    generation.
+
+    Args:
+        *km_user_ids:
+            The IDs of the Know Me users whose data changed. ``None``
+            values are ignored.
+    """
+    keys = [
+        GENERATION_KEY.format(km_user_id=km_user_id)
+        for km_user_id in set(km_user_ids)
+        if km_user_id is not None
+    ]
+    if not keys:
+        return
+
+    def replace_generations():
+        cache.set_many({key: uuid.uuid4().hex for key in keys}, timeout=None)
+
+    replace_generations()
+    transaction.on_commit(replace_generations)
+
+
+def get_access_level(user, km_user_id):
+    """
+    Get a description of a user's access to a Know Me user.
+
+    Users with the same access level are shown the same data, so the
+    level is used to share cached responses between them.
+
+    Args:
+        user:
+            The user accessing the Know Me user.
+        km_user_id:
+            The ID of the Know Me user being accessed.
+
+    Returns:
+        A string describing the user's access, or ``None`` if the user
+        does not have access to the Know Me user.
+    """
+    if not user.is_authenticated:
+        return None
+
+    # The owner's premium status is checked on every request because a
+    # subscription lapses when its receipt expires, without a save that
+    # would replace the generation.
+    owner_is_premium = models.Subscription.objects.premium().filter(
+        user__km_user=OuterRef("km_user")
+    )
+    access = (
+        models.KMUserAccess.objects.filter(km_user_id=km_user_id, user=user)
+        .annotate(owner_is_premium=Exists(owner_is_premium))
+        .values_list(
+            "is_owner", "can_write", "can_see_private", "owner_is_premium"
+        )
+        .first()
+    )
+    if access is None:
+        return None
+
+    return "".join(str(int(flag)) for flag in access)
+
+
+def get_generation(km_user_id):
+    """
+    Get the current generation of a Know Me user's cached responses.
+
+    Args:
+        km_user_id:
+            The ID of the Know Me user.
+
+    Returns:
+        A string identifying the current generation.
+    """
+    key = GENERATION_KEY.format(km_user_id=km_user_id)
+
+    generation = cache.get(key)
+    if generation is None:
+        cache.add(key, uuid.uuid4().hex, timeout=None)
+        generation = cache.get(key)
+
+    return generation
+
+
+def get_response_key(view, request, access_level, generation, user=None):
+    """
+    Get the cache key for the response to a request.
+
+    Args:
+        view:
+            The view handling the request.
+        request:
+            The request being made.
+        access_level:
+            The requesting user's access level for the Know Me user that
+            owns the data.
+        generation:
+            The current generation of the Know Me user's responses.
+        user:
+            If given, the response is cached for this user only.
+
+    Returns:
+        The key to cache the response under.
+    """
+    parts = (
+        f"{view.__module__}.{view.__class__.__name__}",
+        request.build_absolute_uri(),
+        access_level,
+        generation,
+        str(user.pk) if user is not None else "",
+    )
+    digest = hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+    return RESPONSE_KEY.format(digest=digest)
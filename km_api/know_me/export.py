@@ -0,0 +1,287 @@
+"""Utilities for exporting all of the data owned by a Know Me user.
+
+Exports are produced as generators so that they can be written to a
+file or streamed to a client without ever holding an entire account in
+memory. Rows are pulled from the database in chunks using
+``QuerySet.iterator``.
+"""
+import json
+import logging
+import zipfile
+
+from django.core.files.storage import default_storage
+from django.core.serializers.json import DjangoJSONEncoder
+
+from know_me import models
+from know_me.journal import models as journal_models
+from know_me.profile import models as profile_models
+
+
+logger = logging.getLogger(__name__)
+
+
+EXPORT_CHUNK_SIZE = 500
+"""
+The number of rows fetched from the database at a time while exporting.
+"""
+
+EXPORT_DATA_FILENAME = "data.ndjson"
+"""
+The name of the file containing the exported records within a zip
+archive.
+"""
+
+EXPORT_MEDIA_DIRECTORY = "media"
+"""
+The directory within a zip archive that media files are stored in.
+"""
+
+
+# Each record type is described by the model it comes from, the lookup
+# used to filter the model's rows to a single Know Me user, and the
+# fields included in the export.
+EXPORT_SPECS = (
+    (
+        "km_user",
+        models.KMUser,
+        "pk",
+        ("id", "created_at", "updated_at", "image", "is_legacy_user", "quote"),
+    ),
+    (
+        "profile",
+        profile_models.Profile,
+        "km_user",
+        ("id", "created_at", "updated_at", "is_private", "name"),
+    ),
+    (
+        "profile_topic",
+        profile_models.ProfileTopic,
+        "km_user",
+        ("id", "created_at", "updated_at", "is_detailed", "name", "profile"),
+    ),
+    (
+        "profile_item",
+        profile_models.ProfileItem,
+        "km_user",
+        (
+            "id",
+            "created_at",
+            "updated_at",
+            "description",
+            "image",
+            "media_resource",
+            "name",
+            "topic",
+        ),
+    ),
+    (
+        "list_entry",
+        profile_models.ListEntry,
+        "km_user",
+        ("id", "created_at", "updated_at", "profile_item", "text"),
+    ),
+    (
+        "media_resource",
+        profile_models.MediaResource,
+        "km_user",
+        (
+            "id",
+            "created_at",
+            "updated_at",
+            "cover_art",
+            "cover_style",
+            "file",
+            "link",
+            "name",
+        ),
+    ),
+    (
+        "media_resource_cover_style",
+        profile_models.MediaResourceCoverStyle,
+        "km_user",
+        ("id", "created_at", "updated_at", "cover_style_override", "name"),
+    ),
+    (
+        "journal_entry",
+        journal_models.Entry,
+        "km_user",
+        ("id", "created_at", "updated_at", "attachment", "text"),
+    ),
+    (
+        "journal_entry_comment",
+        journal_models.EntryComment,
+        "entry__km_user",
+        ("id", "created_at", "updated_at", "entry", "text", "user"),
+    ),
+)
+
+# The file fields whose contents are included in a zip export.
+EXPORT_MEDIA_FIELDS = (
+    (models.KMUser, "pk", "image"),
+    (profile_models.ProfileItem, "km_user", "image"),
+    (profile_models.MediaResource, "km_user", "file"),
+    (journal_models.Entry, "km_user", "attachment"),
+)
+
+
+class _StreamBuffer:
+    """
+    A write-only file-like object whose contents can be drained.
+
+    The buffer is used as the target of a :class:`zipfile.ZipFile` so
+    that the archive can be streamed as it is being written. Because it
+    does not support seeking, the zip file is written in streaming mode.
+    """
+
+    def __init__(self):
+        self._chunks = []
+
+    def drain(self):
+        """
+        Returns:
+            All data written to the buffer since the last drain.
+        """
+        data = b"".join(self._chunks)
+        self._chunks = []
+
+        return data
+
+    def flush(self):
+        pass
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+
+        return len(data)
+
+
+def iter_export_records(km_user, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Iterate over every record owned by a Know Me user.
+
+    Args:
+        km_user:
+            The Know Me user to export the data of.
+        chunk_size:
+            The number of rows to fetch from the database at a time.
+
+    Yields:
+        A dictionary for each record with the keys ``type`` and
+        ``data``. The ``type`` identifies what the record is, and
+        ``data`` contains the record's fields.
+    """
+    for record_type, model, owner_lookup, fields in EXPORT_SPECS:
+        # The Know Me user is given as a hint so the rows are read from
+        # the database that stores the Know Me user's data.
+        queryset = (
+            model.objects.db_manager(hints={"instance": km_user})
+            .filter(**{owner_lookup: km_user.pk})
+            .order_by("pk")
+            .values(*fields)
+        )
+
+        for row in queryset.iterator(chunk_size=chunk_size):
+            yield {"type": record_type, "data": row}
+
+
+def iter_media_names(km_user, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Iterate over the names of the files owned by a Know Me user.
+
+    Args:
+        km_user:
+            The Know Me user whose files should be listed.
+        chunk_size:
+            The number of rows to fetch from the database at a time.
+
+    Yields:
+        The storage name of each file owned by the Know Me user.
+    """
+    for model, owner_lookup, field_name in EXPORT_MEDIA_FIELDS:
+        # See iter_export_records for why the Know Me user is a hint.
+        queryset = (
+            model.objects.db_manager(hints={"instance": km_user})
+            .filter(**{owner_lookup: km_user.pk})
+            .exclude(**{field_name: ""})
+            .exclude(**{f"{field_name}__isnull": True})
+            .order_by("pk")
+            .values_list(field_name, flat=True)
+        )
+
+        yield from queryset.iterator(chunk_size=chunk_size)
+
+
+def iter_ndjson(km_user, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Export a Know Me user's data as newline delimited JSON.
+
+    Args:
+        km_user:
+            The Know Me user to export the data of.
+        chunk_size:
+            The number of rows to fetch from the database at a time.
+
+    Yields:
+        A line of encoded JSON for each exported record.
+    """
+    for record in iter_export_records(km_user, chunk_size=chunk_size):
+        line = json.dumps(record, cls=DjangoJSONEncoder) + "\n"
+
+        yield line.encode()
+
+
+def iter_zip(km_user, chunk_size=EXPORT_CHUNK_SIZE, storage=default_storage):
+    """
+    Export a Know Me user's data and media files as a zip archive.
+
+    The archive contains the output of :py:func:`iter_ndjson` as well as
+    a copy of every file uploaded by the user. Files that can no longer
+    be found in storage are skipped.
+
+    Args:
+        km_user:
+            The Know Me user to export the data of.
+        chunk_size:
+            The number of rows to fetch from the database at a time.
+        storage:
+            The storage backend to read media files from.
+
+    Yields:
+        Chunks of the zip archive as bytes.
+    """
+    buffer = _StreamBuffer()
+
+    with zipfile.ZipFile(buffer, mode="w") as archive:
+        # The buffer cannot seek back to rewrite an entry's header once
+        # its size is known, so every entry must reserve room for sizes
+        # over the 2 GiB limit of a standard zip entry.
+        with archive.open(
+            EXPORT_DATA_FILENAME, force_zip64=True, mode="w"
+        ) as data_file:
+            for line in iter_ndjson(km_user, chunk_size=chunk_size):
+                data_file.write(line)
+
+                yield buffer.drain()
+
+        for name in iter_media_names(km_user, chunk_size=chunk_size):
+            if not storage.exists(name):
+                logger.warning(
+                    "Skipping missing file %s while exporting Know Me user "
+                    "%d",
+                    name,
+                    km_user.pk,
+                )
+
+                continue
+
+            media_file = storage.open(name)
+            archive_name = f"{EXPORT_MEDIA_DIRECTORY}/{name}"
+            with media_file, archive.open(
+                archive_name, force_zip64=True, mode="w"
+            ) as dest:
+                for chunk in media_file.chunks():
+                    dest.write(chunk)
+
+                    yield buffer.drain()
+
+    yield buffer.drain()
@@ -0,0 +1,87 @@
+"""Custom model fields for the Know Me app.
+"""
+
+import zlib
+
+from django import forms
+from django.db import models
+
+
+class CompressedTextField(models.BinaryField):
+    """
+    Field that stores text compressed with zlib.
+
+    The compression is transparent: the field's value is always a
+    string in Python and is only compressed when it is written to the
+    database.
+    """
+
+    empty_values = [None, "", b""]
+
+    def __init__(self, *args, **kwargs):
+        """
+        Create a new field that is editable by default, unlike a plain
+        binary field.
+        """
+        kwargs.setdefault("editable", True)
+
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        """
+        Deconstruct the field for migrations.
+
+        Returns:
+            The name, path, arguments, and keyword arguments used to
+            recreate the field.
+        """
+        name, path, args, kwargs = super().deconstruct()
+
+        if self.editable:
+            del kwargs["editable"]
+        else:
+            kwargs["editable"] = False
+
+        return name, path, args, kwargs
+
+    def formfield(self, **kwargs):
+        """
+        Edit the field's text in a text area.
+        """
+        return forms.CharField(
+            required=not self.blank, widget=forms.Textarea, **kwargs,
+        )
+
+    def from_db_value(self, value, expression, connection):
+        """
+        Decompress a value read from the database.
+        """
+        return self.to_python(value)
+
+    def get_db_prep_value(self, value, connection, prepared=False):
+        """
+        Compress a value before it is written to the database.
+        """
+        if isinstance(value, str):
+            value = zlib.compress(value.encode("utf-8"))
+
+        return super().get_db_prep_value(value, connection, prepared)
+
+    def to_python(self, value):
+        """
+        Convert a value to the string stored by the field.
+        """
+        if isinstance(value, (bytes, memoryview)):
+            value = bytes(value)
+            if not value:
+                return ""
+
+            return zlib.decompress(value).decode("utf-8")
+
+        return value
+
+    def value_to_string(self, obj):
+        """
+        Serialize the field's text rather than the compressed bytes.
+        """
+        return self.value_from_object(obj)
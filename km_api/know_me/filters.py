@@ -1,9 +1,7 @@
 """Filter backends for the ``know_me`` module.
 """
 
-from django.db.models import Q
-from django.shortcuts import get_object_or_404
-
+from django.http import Http404
 from rest_framework import filters
 
 from know_me import models
@@ -34,17 +32,11 @@ class KMUserAccessFilterBackend(filters.BaseFilterBackend):
             The provided queryset filtered to only include items owned
             by the user specified in the provided views arguments.
         """
-        # Requesting user has access to KMUser
-        query = Q(km_user_accessor__user_with_access=request.user)
-        query &= Q(km_user_accessor__is_accepted=True)
-
-        # Requesting user is KMUser
-        query |= Q(user=request.user)
-
-        # In rare cases, this query will return duplicate rows. See #343
-        # for details.
-        km_user_query = models.KMUser.objects.filter(query).distinct()
+        km_user_id = view.kwargs.get("pk")
 
-        km_user = get_object_or_404(km_user_query, pk=view.kwargs.get("pk"))
+        if not models.KMUserAccess.objects.filter(
+            km_user_id=km_user_id, user=request.user
+        ).exists():
+            raise Http404
 
-        return queryset.filter(km_user=km_user)
+        return queryset.filter(km_user_id=km_user_id)
@@ -0,0 +1,20 @@
+# Generated by Django 2.2.28 on 2026-10-19 14:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("journal", "0003_entry_order"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="entry",
+            index=models.Index(
+                fields=["km_user", "created_at"],
+                name="journal_ent_km_user_af7471_idx",
+            ),
+        ),
+    ]
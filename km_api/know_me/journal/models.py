@@ -1,3 +1,4 @@
+from django.apps import apps
 from django.conf import settings
 from django.db import models
 from django.utils.translation import ugettext_lazy as _
@@ -61,6 +62,10 @@ class Entry(mixins.IsAuthenticatedMixin, models.Model):
     )
 
     class Meta:
+        indexes = [
+            # Used to list the newest entries of several Know Me users.
+            models.Index(fields=["km_user", "created_at"])
+        ]
         ordering = ("-created_at",)
         verbose_name = _("journal entry")
         verbose_name_plural = _("journal entries")
@@ -94,6 +99,29 @@ class Entry(mixins.IsAuthenticatedMixin, models.Model):
             "know-me:journal:entry-comment-list", kwargs={"pk": self.pk}
         )
 
+    @classmethod
+    def get_batch_object_permissions(cls, instances, request):
+        """
+        Check the object permissions of several instances at once.
+
+        Args:
+            instances:
+                The journal entries to check permissions on.
+            request:
+                The request to check permissions for.
+
+        Returns:
+            A list containing a dictionary with the ``read`` and
+            ``write`` permissions of each instance.
+        """
+        permissions = apps.get_model(
+            "know_me", "KMUser"
+        ).get_batch_permissions(
+            {entry.km_user_id for entry in instances}, request
+        )
+
+        return [permissions[entry.km_user_id] for entry in instances]
+
     def has_object_read_permission(self, request):
         """
         Check read permissions on the instance for a request.
@@ -173,6 +201,50 @@ class EntryComment(mixins.IsAuthenticatedMixin, models.Model):
             "know-me:journal:entry-comment-detail", kwargs={"pk": self.pk}
         )
 
+    @classmethod
+    def get_batch_object_permissions(cls, instances, request):
+        """
+        Check the object permissions of several instances at once.
+
+        The author of a comment can always read, write, and destroy it.
+        Other users can read it if they have read access to the entry's
+        journal and destroy it if they have write access to the journal.
+
+        Args:
+            instances:
+                The comments to check permissions on.
+            request:
+                The request to check permissions for.
+
+        Returns:
+            A list containing a dictionary with the ``destroy``,
+            ``read``, and ``write`` permissions of each instance.
+        """
+        entry_owners = dict(
+            Entry.objects.filter(
+                pk__in={comment.entry_id for comment in instances}
+            ).values_list("pk", "km_user_id")
+        )
+        km_user_permissions = apps.get_model(
+            "know_me", "KMUser"
+        ).get_batch_permissions(set(entry_owners.values()), request)
+
+        permissions = []
+        for comment in instances:
+            is_author = comment.user_id == request.user.pk
+            entry_permissions = km_user_permissions[
+                entry_owners[comment.entry_id]
+            ]
+            permissions.append(
+                {
+                    "destroy": is_author or entry_permissions["write"],
+                    "read": is_author or entry_permissions["read"],
+                    "write": is_author,
+                }
+            )
+
+        return permissions
+
     def has_object_destroy_permission(self, request):
         """
         Check destroy permissions on the instance for a request.
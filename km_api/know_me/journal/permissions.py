@@ -1,8 +1,10 @@
 from django.conf import settings
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 
 from rest_framework import permissions
 
+from know_me.models import Subscription
 from know_me.journal import models
 
 
@@ -30,10 +32,15 @@ class HasEntryCommentListPermissions(permissions.BasePermission):
             A boolean indicating if the requesting user should be
             granted access to the view.
         """
-        query = {"pk": view.kwargs.get("pk")}
-        if settings.KNOW_ME_PREMIUM_ENABLED:
-            query["km_user__user__know_me_subscription__is_active"] = True
-
-        entry = get_object_or_404(models.Entry, **query)
+        entry = get_object_or_404(models.Entry, pk=view.kwargs.get("pk"))
+
+        # The subscription is checked with a separate query because it
+        # is not stored on the shard that the entry may be stored on.
+        if settings.KNOW_ME_PREMIUM_ENABLED and not (
+            Subscription.objects.premium()
+            .filter(user__km_user=entry.km_user_id)
+            .exists()
+        ):
+            raise Http404
 
         return entry.has_object_read_permission(request)
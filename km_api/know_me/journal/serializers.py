@@ -1,18 +1,23 @@
-from dry_rest_permissions.generics import DRYPermissionsField
-
 from rest_framework import serializers
 
 from account.serializers import UserInfoSerializer
+from custom_storages.serializers import UploadTokenField
 from know_me.journal import models
+from know_me.list_serializers import KMListSerializer
+from permission_utils.serializers import BatchPermissionsField
+from serializer_utils.fields import TemplatedHyperlinkedIdentityField
+from serializer_utils.mixins import SparseFieldsetMixin
 
 
-class EntryCommentSerializer(serializers.HyperlinkedModelSerializer):
+class EntryCommentSerializer(
+    SparseFieldsetMixin, serializers.HyperlinkedModelSerializer
+):
     """
     Serializer for comments on journal entries.
     """
 
-    permissions = DRYPermissionsField()
-    url = serializers.HyperlinkedIdentityField(
+    permissions = BatchPermissionsField()
+    url = TemplatedHyperlinkedIdentityField(
         view_name="know-me:journal:entry-comment-detail"
     )
     user = UserInfoSerializer(read_only=True)
@@ -27,10 +32,13 @@ class EntryCommentSerializer(serializers.HyperlinkedModelSerializer):
             "text",
             "user",
         )
+        list_serializer_class = KMListSerializer
         model = models.EntryComment
 
 
-class EntryListSerializer(serializers.HyperlinkedModelSerializer):
+class EntryListSerializer(
+    SparseFieldsetMixin, serializers.HyperlinkedModelSerializer
+):
     """
     Serializer for a list of journal entries.
     """
@@ -38,15 +46,22 @@ class EntryListSerializer(serializers.HyperlinkedModelSerializer):
     comment_count = serializers.IntegerField(
         read_only=True, source="comments.count"
     )
-    comments_url = serializers.HyperlinkedIdentityField(
+    comments_url = TemplatedHyperlinkedIdentityField(
         view_name="know-me:journal:entry-comment-list"
     )
-    permissions = DRYPermissionsField()
-    url = serializers.HyperlinkedIdentityField(
+    permissions = BatchPermissionsField()
+    url = TemplatedHyperlinkedIdentityField(
         view_name="know-me:journal:entry-detail"
     )
 
     class Meta:
+        expandable_fields = {
+            "comments": (
+                EntryCommentSerializer,
+                {"many": True, "read_only": True},
+            )
+        }
+        field_prefetches = {"comments": ("comments__user",)}
         fields = (
             "id",
             "url",
@@ -59,15 +74,38 @@ class EntryListSerializer(serializers.HyperlinkedModelSerializer):
             "permissions",
             "text",
         )
+        list_serializer_class = KMListSerializer
         model = models.Entry
 
 
+class EntryFeedSerializer(EntryListSerializer):
+    """
+    Serializer for journal entries in the feed of recent entries.
+
+    The number of comments on each entry is read from an annotation
+    rather than counted separately for every entry.
+    """
+
+    comment_count = serializers.IntegerField(read_only=True)
+
+
 class EntryDetailSerializer(EntryListSerializer):
     """
     Serializer for a single journal entry.
     """
 
+    attachment_upload_token = UploadTokenField(
+        models.Entry._meta.get_field("attachment"),
+        help_text=(
+            "A token for a file uploaded using the Know Me user's upload "
+            "endpoint. This may be provided in place of the attachment."
+        ),
+        source="attachment",
+    )
     comments = EntryCommentSerializer(many=True, read_only=True)
 
     class Meta(EntryListSerializer.Meta):
-        fields = EntryListSerializer.Meta.fields + ("comments",)
+        fields = EntryListSerializer.Meta.fields + (
+            "attachment_upload_token",
+            "comments",
+        )
@@ -27,6 +27,42 @@ def test_get_absolute_url(entry_comment_factory):
     assert comment.get_absolute_url() == expected
 
 
+def test_get_batch_object_permissions(
+    api_rf, entry_comment_factory, user_factory
+):
+    """
+    The author of a comment should always have access to it, while other
+    users should have the access granted by the entry.
+    """
+    user = user_factory()
+    authored = entry_comment_factory(user=user)
+    on_own_entry = entry_comment_factory(entry__km_user__user=user)
+    other = entry_comment_factory()
+
+    api_rf.user = user
+    request = api_rf.get("/")
+
+    comments = [authored, on_own_entry, other]
+    expected = [
+        {
+            "destroy": comment.has_object_destroy_permission(request),
+            "read": comment.has_object_read_permission(request),
+            "write": comment.has_object_write_permission(request),
+        }
+        for comment in comments
+    ]
+
+    assert (
+        models.EntryComment.get_batch_object_permissions(comments, request)
+        == expected
+    )
+    assert expected == [
+        {"destroy": True, "read": True, "write": True},
+        {"destroy": True, "read": True, "write": False},
+        {"destroy": False, "read": False, "write": False},
+    ]
+
+
 @mock.patch("know_me.journal.models.Entry.has_object_write_permission")
 def test_has_object_destroy_permission_other(
     mock_parent_permission, api_rf, entry_comment_factory
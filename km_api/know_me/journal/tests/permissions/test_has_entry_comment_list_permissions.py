@@ -1,6 +1,8 @@
+import datetime
 from unittest import mock
 
 from django.http import Http404
+from django.utils import timezone
 
 import pytest
 
@@ -96,6 +98,33 @@ def test_has_permission_no_subscription(
         permission.has_permission(request, view)
 
 
+def test_has_permission_expired_subscription(
+    api_rf, apple_receipt_factory, enable_premium_requirement, entry_factory
+):
+    """
+    If the receipt of the journal owner's subscription has expired, a
+    404 error should be raised even if the subscription has not been
+    deactivated yet.
+    """
+    entry = entry_factory()
+    apple_receipt_factory(
+        expiration_time=timezone.now() - datetime.timedelta(days=1),
+        subscription__is_active=True,
+        subscription__user=entry.km_user.user,
+    )
+
+    api_rf.user = entry.km_user.user
+    request = api_rf.get("/")
+
+    view = mock.Mock(name="Mock View")
+    view.kwargs = {"pk": entry.pk}
+
+    permission = permissions.HasEntryCommentListPermissions()
+
+    with pytest.raises(Http404):
+        permission.has_permission(request, view)
+
+
 def test_has_permission_nonexistent_entry(api_rf, db):
     """
     If there is no entry with the given ID, the permission check should
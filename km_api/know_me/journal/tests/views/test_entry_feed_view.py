@@ -0,0 +1,135 @@
+from unittest import mock
+
+from rest_framework import status
+from rest_framework.reverse import reverse
+
+from know_me.journal import models
+
+
+URL = reverse("know-me:journal:entry-feed")
+
+
+def test_get_anonymous(api_client):
+    """
+    Anonymous users should not be able to access the feed.
+    """
+    response = api_client.get(URL)
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_get_comment_count(
+    api_client, entry_comment_factory, entry_factory, km_user_factory
+):
+    """
+    Each entry should include the number of comments on it.
+    """
+    km_user = km_user_factory()
+    api_client.force_authenticate(user=km_user.user)
+
+    commented = entry_factory(km_user=km_user)
+    entry_comment_factory(entry=commented)
+    entry_comment_factory(entry=commented)
+    entry_factory(km_user=km_user)
+
+    response = api_client.get(URL)
+    counts = {
+        entry["id"]: entry["comment_count"]
+        for entry in response.data["results"]
+    }
+
+    assert response.status_code == status.HTTP_200_OK
+    assert counts[commented.pk] == 2
+    assert sorted(counts.values()) == [0, 2]
+
+
+def test_get_readable_entries(
+    api_client,
+    enable_premium_requirement,
+    entry_factory,
+    km_user_accessor_factory,
+    km_user_factory,
+):
+    """
+    The feed should include the requesting user's own entries and the
+    entries shared with them by premium users, starting with the newest.
+    """
+    km_user = km_user_factory()
+    api_client.force_authenticate(user=km_user.user)
+
+    premium = km_user_factory(user__has_premium=True)
+    km_user_accessor_factory(
+        is_accepted=True, km_user=premium, user_with_access=km_user.user
+    )
+    expired = km_user_factory()
+    km_user_accessor_factory(
+        is_accepted=True, km_user=expired, user_with_access=km_user.user
+    )
+
+    own = entry_factory(km_user=km_user)
+    shared = entry_factory(km_user=premium)
+    entry_factory(km_user=expired)
+    entry_factory()
+
+    response = api_client.get(URL)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [entry["id"] for entry in response.data["results"]] == [
+        shared.pk,
+        own.pk,
+    ]
+
+
+def test_get_sharded(api_client, entry_factory, km_user_factory, settings):
+    """
+    If sharding is enabled, the entries from each shard should be
+    merged.
+    """
+    km_user = km_user_factory()
+    other = km_user_factory()
+    api_client.force_authenticate(user=km_user.user)
+
+    own = entry_factory(km_user=km_user)
+    entry_factory(km_user=other)
+
+    with mock.patch(
+        "know_me.journal.views.routing.get_km_user_shards",
+        autospec=True,
+        return_value={"default": [km_user.pk]},
+    ) as mock_get_shards:
+        settings.SHARD_DATABASES = ["shard0"]
+        response = api_client.get(URL)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert mock_get_shards.call_count == 1
+    assert [entry["id"] for entry in response.data["results"]] == [own.pk]
+
+
+def test_get_queries(
+    api_client,
+    django_assert_num_queries,
+    entry_comment_factory,
+    entry_factory,
+    km_user_accessor_factory,
+    km_user_factory,
+):
+    """
+    The number of queries should not depend on the number of entries or
+    Know Me users in the feed.
+    """
+    km_user = km_user_factory()
+    api_client.force_authenticate(user=km_user.user)
+
+    for _ in range(3):
+        shared = km_user_factory()
+        km_user_accessor_factory(
+            is_accepted=True, km_user=shared, user_with_access=km_user.user
+        )
+        entry_comment_factory(entry=entry_factory(km_user=shared))
+
+    # One query for the entries and two for their permissions.
+    with django_assert_num_queries(3):
+        response = api_client.get(URL)
+
+    assert len(response.data["results"]) == 3
+    assert models.Entry.objects.count() == 3
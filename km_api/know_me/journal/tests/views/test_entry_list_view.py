@@ -109,6 +109,45 @@ def test_filter_queryset_keyword(api_rf, entry_factory, km_user_factory):
     assert list(view.filter_queryset(query)) == [foo_entry]
 
 
+def test_filter_queryset_expand_comments(
+    api_rf, entry_factory, km_user_factory
+):
+    """
+    Expanding the comments of the entries should prefetch the comments
+    and their authors.
+    """
+    km_user = km_user_factory()
+    api_rf.user = km_user.user
+
+    entry_factory(km_user=km_user)
+
+    view = views.EntryListView()
+    view.kwargs = {"pk": km_user.pk}
+    view.request = view.initialize_request(
+        api_rf.get("/", {"expand": "comments"})
+    )
+
+    queryset = view.filter_queryset(models.Entry.objects.all())
+
+    assert queryset._prefetch_related_lookups == ("comments__user",)
+
+
+def test_filter_queryset_no_expand(api_rf, entry_factory, km_user_factory):
+    """
+    If the comments are not expanded, nothing should be prefetched.
+    """
+    km_user = km_user_factory()
+    api_rf.user = km_user.user
+
+    view = views.EntryListView()
+    view.kwargs = {"pk": km_user.pk}
+    view.request = view.initialize_request(api_rf.get("/"))
+
+    queryset = view.filter_queryset(models.Entry.objects.all())
+
+    assert queryset._prefetch_related_lookups == ()
+
+
 def test_get_permissions():
     """
     Test the permission classes used by the view.
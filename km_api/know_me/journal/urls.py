@@ -12,6 +12,7 @@ journal_urls = [
         views.EntryCommentDetailView.as_view(),
         name="entry-comment-detail",
     ),
+    url(r"^entries/$", views.EntryFeedView.as_view(), name="entry-feed"),
     url(
         r"^entries/(?P<pk>[0-9]+)/$",
         views.EntryDetailView.as_view(),
@@ -1,24 +1,36 @@
+from django.conf import settings
+from django.db.models import Count, IntegerField, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
 from django_filters import rest_framework as filters
 
 from dry_rest_permissions.generics import DRYPermissions
 
 from rest_framework import generics, pagination
+from rest_framework.permissions import IsAuthenticated
 
 from watson import search as watson
 
+from idempotency.mixins import IdempotentCreateMixin
 from know_me.filters import KMUserAccessFilterBackend
 from know_me.journal import models, permissions, serializers
-from know_me.models import KMUser
+from know_me.models import KMUser, KMUserAccess, get_premium_filter
+from know_me.pagination import TimelineCursorPagination
 from know_me.permissions import (
     HasKMUserAccess,
     ObjectOwnerHasPremium,
     CollectionOwnerHasPremium,
 )
+from know_me.view_mixins import KMUserResponseCacheMixin
 from permission_utils.view_mixins import DocumentActionMixin
+from serializer_utils.view_mixins import SparseFieldsetViewMixin
+from sharding import routing
 
 
 class EntryCommentDetailView(
-    DocumentActionMixin, generics.RetrieveUpdateDestroyAPIView
+    KMUserResponseCacheMixin,
+    SparseFieldsetViewMixin,
+    DocumentActionMixin,
+    generics.RetrieveUpdateDestroyAPIView,
 ):
     """
     delete:
@@ -41,6 +53,9 @@ class EntryCommentDetailView(
     Only the user who made the comment is allowed to update it.
     """
 
+    cache_vary_on_user = True
+    km_user_lookup_field = "entry__km_user_id"
+    km_user_lookup_model = models.EntryComment
     permission_classes = (DRYPermissions, ObjectOwnerHasPremium)
     queryset = models.EntryComment.objects.all()
     serializer_class = serializers.EntryCommentSerializer
@@ -62,7 +77,12 @@ class EntryCommentDetailView(
         return comment.entry.km_user.user
 
 
-class EntryCommentListView(generics.ListCreateAPIView):
+class EntryCommentListView(
+    IdempotentCreateMixin,
+    KMUserResponseCacheMixin,
+    SparseFieldsetViewMixin,
+    generics.ListCreateAPIView,
+):
     """
     get:
     List the comments attached to a journal entry.
@@ -77,6 +97,8 @@ class EntryCommentListView(generics.ListCreateAPIView):
     subscription in order for comments to be created.
     """
 
+    cache_vary_on_user = True
+    km_user_lookup_model = models.Entry
     permission_classes = (
         DRYPermissions,
         permissions.HasEntryCommentListPermissions,
@@ -112,7 +134,11 @@ class EntryCommentListView(generics.ListCreateAPIView):
         return serializer.save(entry=entry, user=self.request.user)
 
 
-class EntryDetailView(generics.RetrieveUpdateDestroyAPIView):
+class EntryDetailView(
+    KMUserResponseCacheMixin,
+    SparseFieldsetViewMixin,
+    generics.RetrieveUpdateDestroyAPIView,
+):
     """
     delete:
     Delete a specific journal entry.
@@ -127,6 +153,8 @@ class EntryDetailView(generics.RetrieveUpdateDestroyAPIView):
     Update a specific journal entry.
     """
 
+    cache_vary_on_user = True
+    km_user_lookup_model = models.Entry
     permission_classes = (DRYPermissions, ObjectOwnerHasPremium)
     queryset = models.Entry.objects.all()
     serializer_class = serializers.EntryDetailSerializer
@@ -149,7 +177,100 @@ class EntryDetailView(generics.RetrieveUpdateDestroyAPIView):
         return entry.km_user.user
 
 
-class EntryListView(generics.ListCreateAPIView):
+class EntryFeedView(SparseFieldsetViewMixin, generics.ListAPIView):
+    """
+    get:
+    List the journal entries of every Know Me user that the requesting
+    user can read, starting with the newest entry.
+
+    This includes the requesting user's own journal and the journals
+    shared with them by users with an active premium subscription. The
+    response is paginated with a cursor, and the `next` URL should be
+    followed to get older entries.
+    """
+
+    pagination_class = TimelineCursorPagination
+    permission_classes = (IsAuthenticated,)
+    serializer_class = serializers.EntryFeedSerializer
+
+    def get_querysets(self):
+        """
+        Get the entries that the requesting user can read.
+
+        Returns:
+            A list containing a queryset of the readable entries stored
+            on each shard. If sharding is disabled, the list contains a
+            single queryset that finds the readable Know Me users in a
+            subquery.
+        """
+        access = Q(user=self.request.user)
+
+        # Shared journals are only readable while their owner has
+        # premium access, the same as the individual journal lists.
+        if settings.KNOW_ME_PREMIUM_ENABLED:
+            access &= Q(is_owner=True) | get_premium_filter(
+                "km_user__user__know_me_subscription__"
+            )
+
+        km_user_ids = KMUserAccess.objects.filter(access).values_list(
+            "km_user_id", flat=True
+        )
+
+        # The comments are counted in a subquery so that only the
+        # entries on the requested page are counted rather than every
+        # entry being grouped before the page is selected.
+        comment_counts = (
+            models.EntryComment.objects.filter(entry=OuterRef("pk"))
+            .order_by()
+            .values("entry")
+            .annotate(count=Count("pk"))
+            .values("count")
+        )
+        entries = models.Entry.objects.annotate(
+            comment_count=Coalesce(
+                Subquery(comment_counts, output_field=IntegerField()), 0
+            )
+        )
+
+        if not routing.is_enabled():
+            return [entries.filter(km_user_id__in=km_user_ids)]
+
+        return [
+            entries.using(database).filter(km_user_id__in=shard_km_user_ids)
+            for database, shard_km_user_ids in routing.get_km_user_shards(
+                km_user_ids
+            ).items()
+        ]
+
+    def list(self, request, *args, **kwargs):
+        """
+        List a page of the readable entries.
+
+        The entries on each shard are queried separately and merged by
+        the paginator.
+
+        Args:
+            request:
+                The request being made.
+
+        Returns:
+            A response containing the page of entries.
+        """
+        querysets = [
+            self.filter_queryset(queryset) for queryset in self.get_querysets()
+        ]
+        page = self.paginate_queryset(querysets)
+        serializer = self.get_serializer(page, many=True)
+
+        return self.get_paginated_response(serializer.data)
+
+
+class EntryListView(
+    IdempotentCreateMixin,
+    KMUserResponseCacheMixin,
+    SparseFieldsetViewMixin,
+    generics.ListCreateAPIView,
+):
     """
     get:
     List the journal entries of a specific Know Me user.
@@ -161,6 +282,7 @@ class EntryListView(generics.ListCreateAPIView):
     Create a new journal entry for the specified Know Me user.
     """
 
+    cache_vary_on_user = True
     filter_backends = (KMUserAccessFilterBackend, filters.DjangoFilterBackend)
     filterset_fields = {"created_at": ["gte", "lte"]}
     pagination_class = pagination.PageNumberPagination
@@ -0,0 +1,18 @@
+"""List serializers shared by the Know Me serializers.
+"""
+
+from custom_storages.serializers import PresignedURLListSerializer
+from permission_utils.serializers import BatchPermissionsListSerializer
+
+
+class KMListSerializer(
+    BatchPermissionsListSerializer, PresignedURLListSerializer
+):
+    """
+    List serializer for objects owned by a Know Me user.
+
+    Before the individual instances are serialized, their permissions
+    are evaluated and the URLs of their files are signed as a batch.
+    """
+
+    pass
@@ -0,0 +1,85 @@
+import sys
+
+from django.core import management
+
+import db_routing
+from know_me import export, models
+
+
+class Command(management.BaseCommand):
+    """
+    Management command to export all of the data owned by a Know Me
+    user.
+    """
+
+    help = (
+        "Export the profiles, media resources, and journal of a Know Me user "
+        "as newline delimited JSON or as a zip archive including media files."
+    )
+
+    def add_arguments(self, parser):
+        """
+        Add the command's arguments.
+
+        Args:
+            parser:
+                The parser to add arguments to.
+        """
+        parser.add_argument(
+            "km_user_id",
+            help="The ID of the Know Me user to export.",
+            type=int,
+        )
+        parser.add_argument(
+            "--media",
+            action="store_true",
+            help="Export a zip archive that includes the user's media files.",
+        )
+        parser.add_argument(
+            "--output",
+            help=(
+                "The path of the file to write the export to. If not given, "
+                "the export is written to stdout."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        """
+        Execute the command.
+
+        Args:
+            *args:
+                Positional arguments provided to the command.
+            **options:
+                Keyword arguments provided to the command.
+        """
+        # The export only reads data, so it can be served by a replica.
+        with db_routing.read_from_replicas():
+            try:
+                km_user = models.KMUser.objects.get(pk=options["km_user_id"])
+            except models.KMUser.DoesNotExist:
+                raise management.CommandError(
+                    f"There is no Know Me user with the ID "
+                    f"{options['km_user_id']}."
+                )
+
+            if options["media"]:
+                chunks = export.iter_zip(km_user)
+            else:
+                chunks = export.iter_ndjson(km_user)
+
+            if options["output"]:
+                with open(options["output"], "wb") as f:
+                    for chunk in chunks:
+                        f.write(chunk)
+
+                self.stderr.write(
+                    self.style.SUCCESS(
+                        f"Exported Know Me user {km_user.pk} to "
+                        f"{options['output']}."
+                    )
+                )
+            else:
+                out = getattr(sys.stdout, "buffer", sys.stdout)
+                for chunk in chunks:
+                    out.write(chunk)
@@ -0,0 +1,48 @@
+from django.contrib.auth import get_user_model
+from django.core import management
+
+from custom_storages import derivatives
+from know_me import models
+from know_me.profile.models import ProfileItem
+
+
+class Command(management.BaseCommand):
+    """
+    Management command to generate the resized copies of every image
+    that does not have them yet.
+    """
+
+    help = (
+        "Generate resized copies of the images of every user, Know Me user, "
+        "and profile item. Images whose copies already exist are skipped."
+    )
+
+    def handle(self, *args, **options):
+        """
+        Execute the command.
+
+        Args:
+            *args:
+                Positional arguments provided to the command.
+            **options:
+                Keyword arguments provided to the command.
+        """
+        image_models = (get_user_model(), models.KMUser, ProfileItem)
+
+        generated = 0
+        for model in image_models:
+            storage = model._meta.get_field("image").storage
+            names = (
+                model.objects.exclude(image="")
+                .exclude(image__isnull=True)
+                .order_by("pk")
+                .values_list("image", flat=True)
+            )
+
+            for name in names.iterator():
+                if derivatives.generate_derivatives(storage, name):
+                    generated += 1
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Generated derivatives of {generated} images.")
+        )
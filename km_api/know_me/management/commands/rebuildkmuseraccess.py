@@ -0,0 +1,31 @@
+from django.core import management
+
+from know_me import access
+
+
+class Command(management.BaseCommand):
+    """
+    Management command to rebuild the materialized access to every Know
+    Me user.
+    """
+
+    help = (
+        "Rebuild the access of every user to every Know Me user from the "
+        "Know Me users and accessors."
+    )
+
+    def handle(self, *args, **options):
+        """
+        Execute the command.
+
+        Args:
+            *args:
+                Positional arguments provided to the command.
+            **options:
+                Keyword arguments provided to the command.
+        """
+        count = access.rebuild_access()
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt {count} access entries.")
+        )
@@ -0,0 +1,111 @@
+import time
+
+from django.core import management
+from django.utils import timezone
+
+import db_routing
+from know_me import renewals
+
+
+class Command(management.BaseCommand):
+    """
+    Management command to renew Apple subscriptions as they come due.
+    """
+
+    help = (
+        "Renew Apple subscriptions as their receipts approach expiration. "
+        "The worker sleeps until the next receipt is due. Any number of "
+        "workers may be run at once."
+    )
+
+    def add_arguments(self, parser):
+        """
+        Add the command's arguments.
+
+        Args:
+            parser:
+                The parser to add arguments to.
+        """
+        parser.add_argument(
+            "--batch-size",
+            default=20,
+            help="The maximum number of receipts to claim at once.",
+            type=int,
+        )
+        parser.add_argument(
+            "--max-sleep",
+            default=300.0,
+            help=(
+                "The maximum number of seconds to sleep before checking for "
+                "receipts that became due earlier than expected."
+            ),
+            type=float,
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit once there are no more receipts due.",
+        )
+
+    def get_sleep_time(self, max_sleep):
+        """
+        Get the number of seconds to sleep until the next receipt is due.
+
+        Args:
+            max_sleep:
+                The maximum number of seconds to sleep.
+
+        Returns:
+            The number of seconds to sleep.
+        """
+        next_check = renewals.get_next_check_time()
+        if next_check is None:
+            return max_sleep
+
+        delay = (next_check - timezone.now()).total_seconds()
+
+        return min(max(delay, 0), max_sleep)
+
+    def handle(self, *args, **options):
+        """
+        Execute the command.
+
+        Args:
+            *args:
+                Positional arguments provided to the command.
+            **options:
+                Keyword arguments provided to the command.
+        """
+        total = 0
+
+        # Subscriptions are updated based on the receipts that are read,
+        # so the receipts must be up to date.
+        with db_routing.read_from_primary():
+            while True:
+                receipts = renewals.claim_receipts(options["batch_size"])
+
+                if not receipts:
+                    orphans = renewals.deactivate_orphan_subscriptions()
+                    if orphans:
+                        self.stdout.write(
+                            f"Deactivated {orphans} orphan subscription(s)."
+                        )
+
+                    if options["once"]:
+                        break
+
+                    time.sleep(self.get_sleep_time(options["max_sleep"]))
+
+                    continue
+
+                for receipt in receipts:
+                    renewals.renew_receipt(receipt)
+
+                total += len(receipts)
+
+                if options["verbosity"] > 1:
+                    self.stdout.write(f"Checked {len(receipts)} receipts.")
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Finished checking {total} receipts.")
+        )
@@ -72,6 +72,12 @@ class Command(management.BaseCommand):
                 user=km_user.user,
             )
 
-        models.Subscription.objects.filter(
+        # The subscriptions are saved individually so that the premium
+        # status of their owners' Know Me users is updated.
+        former_legacy_subscriptions = models.Subscription.objects.filter(
             is_legacy_subscription=True, user__km_user__is_legacy_user=False
-        ).update(is_legacy_subscription=False, is_active=False)
+        )
+        for subscription in former_legacy_subscriptions:
+            subscription.is_active = False
+            subscription.is_legacy_subscription = False
+            subscription.save()
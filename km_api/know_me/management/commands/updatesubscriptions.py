@@ -3,7 +3,8 @@ import datetime
 from django.core import management
 from django.utils import timezone
 
-from know_me import models, subscriptions
+import db_routing
+from know_me import models, renewals, subscriptions
 
 
 class Command(management.BaseCommand):
@@ -11,7 +12,7 @@ class Command(management.BaseCommand):
     Management command to update the status of all subscriptions.
     """
 
-    RENEWAL_WINDOW = datetime.timedelta(hours=1)
+    RENEWAL_WINDOW = subscriptions.RENEWAL_WINDOW
     """
     The amount of time prior to an existing subscription's expiration
     date that we should begin attempting to renew it.
@@ -37,11 +38,7 @@ class Command(management.BaseCommand):
         Returns:
             The number of deactivated subscriptions.
         """
-        return models.Subscription.objects.filter(
-            apple_receipt__isnull=True,
-            is_legacy_subscription=False,
-            is_active=True,
-        ).update(is_active=False)
+        return renewals.deactivate_orphan_subscriptions()
 
     def handle(self, *args, **options):
         """
@@ -53,24 +50,29 @@ class Command(management.BaseCommand):
             **options:
                 Keyword arguments provided to the command.
         """
-        self.stdout.write(
-            "Deactivating all subscriptions without a receipt..."
-        )
-        orphan_subs = self.deactivate_orphan_subscriptions()
-        self.stdout.write(f"Deactivated {orphan_subs} orphan subscription(s).")
-
-        now = timezone.now()
-        cutoff_time = now + self.RENEWAL_WINDOW
-        self.stdout.write(
-            f"Updating Apple subscriptions that expire before "
-            f"{cutoff_time.isoformat()}..."
-        )
+        # Subscriptions are updated based on the receipts that are read,
+        # so the receipts must be up to date.
+        with db_routing.read_from_primary():
+            self.stdout.write(
+                "Deactivating all subscriptions without a receipt..."
+            )
+            orphan_subs = self.deactivate_orphan_subscriptions()
+            self.stdout.write(
+                f"Deactivated {orphan_subs} orphan subscription(s)."
+            )
 
-        self.update_apple_subscriptions(now, self.RENEWAL_WINDOW)
+            now = timezone.now()
+            cutoff_time = now + self.RENEWAL_WINDOW
+            self.stdout.write(
+                f"Updating Apple subscriptions that expire before "
+                f"{cutoff_time.isoformat()}..."
+            )
 
-        self.stdout.write(
-            self.style.SUCCESS("Finished updating Apple subscriptions.")
-        )
+            self.update_apple_subscriptions(now, self.RENEWAL_WINDOW)
+
+            self.stdout.write(
+                self.style.SUCCESS("Finished updating Apple subscriptions.")
+            )
 
     def update_apple_subscriptions(
         self, now: datetime.datetime, renewal_window: datetime.timedelta
@@ -98,8 +100,9 @@ class Command(management.BaseCommand):
             is_active = True
 
             try:
-                receipt.update_info()
-                receipt.save()
+                changed = receipt.update_info()
+                if changed:
+                    receipt.save(update_fields=changed)
 
                 if receipt.expiration_time < now:
                     is_active = False
@@ -124,8 +127,8 @@ class Command(management.BaseCommand):
 
                 is_active = False
 
-            models.Subscription.objects.filter(apple_receipt=receipt).update(
-                is_active=is_active
+            renewals.set_subscription_active(
+                receipt.subscription_id, is_active
             )
 
         if receipt_pks_to_delete:
@@ -0,0 +1,20 @@
+# Generated by Django 2.2.28 on 2026-10-19 13:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("know_me", "0018_reminderfrequency"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="kmuseraccessor",
+            index=models.Index(
+                fields=["user_with_access", "is_accepted", "km_user"],
+                name="know_me_kmu_user_wi_be54af_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,138 @@
+# Generated by Django 2.2.28 on 2026-10-19 13:43
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def populate_access(apps, _):
+    """
+    Create the access entries for the owners and accepted accessors of
+    existing Know Me users.
+    """
+    KMUser = apps.get_model("know_me", "KMUser")
+    KMUserAccess = apps.get_model("know_me", "KMUserAccess")
+    KMUserAccessor = apps.get_model("know_me", "KMUserAccessor")
+    Subscription = apps.get_model("know_me", "Subscription")
+
+    premium_user_ids = set(
+        Subscription.objects.filter(is_active=True).values_list(
+            "user_id", flat=True
+        )
+    )
+    owners = dict(KMUser.objects.values_list("pk", "user_id"))
+
+    entries = [
+        KMUserAccess(
+            can_see_private=True,
+            can_write=True,
+            is_owner=True,
+            km_user_id=km_user_id,
+            owner_is_premium=user_id in premium_user_ids,
+            user_id=user_id,
+        )
+        for km_user_id, user_id in owners.items()
+    ]
+
+    accessors = KMUserAccessor.objects.filter(
+        is_accepted=True, user_with_access__isnull=False
+    ).values_list("km_user_id", "user_with_access_id", "is_admin")
+    for km_user_id, user_id, is_admin in accessors:
+        entries.append(
+            KMUserAccess(
+                can_see_private=is_admin,
+                can_write=is_admin,
+                km_user_id=km_user_id,
+                owner_is_premium=owners[km_user_id] in premium_user_ids,
+                user_id=user_id,
+            )
+        )
+
+    KMUserAccess.objects.bulk_create(entries, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("know_me", "0019_kmuseraccessor_shared_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="KMUserAccess",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "can_see_private",
+                    models.BooleanField(
+                        default=False,
+                        help_text="A boolean indicating if the user can see the Know Me user's private profiles.",
+                        verbose_name="can see private",
+                    ),
+                ),
+                (
+                    "can_write",
+                    models.BooleanField(
+                        default=False,
+                        help_text="A boolean indicating if the user can modify the Know Me user.",
+                        verbose_name="can write",
+                    ),
+                ),
+                (
+                    "is_owner",
+                    models.BooleanField(
+                        default=False,
+                        help_text="A boolean indicating if the user owns the Know Me user.",
+                        verbose_name="is owner",
+                    ),
+                ),
+                (
+                    "owner_is_premium",
+                    models.BooleanField(
+                        default=False,
+                        help_text="A boolean indicating if the owner of the Know Me user has an active premium subscription.",
+                        verbose_name="owner is premium",
+                    ),
+                ),
+                (
+                    "km_user",
+                    models.ForeignKey(
+                        help_text="The Know Me user that the user has access to.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="access_entries",
+                        related_query_name="access_entry",
+                        to="know_me.KMUser",
+                        verbose_name="Know Me user",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        help_text="The user who has access to the Know Me user.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="km_user_access_entries",
+                        related_query_name="km_user_access_entry",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="user",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Know Me user access",
+                "verbose_name_plural": "Know Me user access",
+                "unique_together": {("user", "km_user")},
+            },
+        ),
+        migrations.RunPython(
+            code=populate_access, reverse_code=migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 2.2.28 on 2026-10-19 14:12
+
+import datetime
+
+from django.db import migrations, models
+from django.db.models import F
+import django.utils.timezone
+
+
+def schedule_renewal_checks(apps, _):
+    """
+    Schedule the renewal check of existing receipts for the start of
+    the renewal window before they expire.
+    """
+    AppleReceipt = apps.get_model("know_me", "AppleReceipt")
+
+    AppleReceipt.objects.update(
+        next_renewal_check=F("expiration_time") - datetime.timedelta(hours=1)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("know_me", "0020_kmuseraccess"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="applereceipt",
+            name="next_renewal_check",
+            field=models.DateTimeField(
+                db_index=True,
+                default=django.utils.timezone.now,
+                help_text="The time that the subscription worker should next check if the receipt has been renewed.",
+                verbose_name="next renewal check",
+            ),
+        ),
+        migrations.AddField(
+            model_name="applereceipt",
+            name="renewal_attempts",
+            field=models.PositiveSmallIntegerField(
+                default=0,
+                help_text="The number of checks since the receipt's expiration time last changed that found it had not been renewed.",
+                verbose_name="renewal attempts",
+            ),
+        ),
+        migrations.RunPython(
+            code=schedule_renewal_checks,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
@@ -0,0 +1,87 @@
+# Generated by Django 2.2.28 on 2026-10-19 14:22
+
+import hashlib
+
+from django.db import migrations, models
+import know_me.fields
+
+
+def compress_receipt_data(apps, _):
+    """
+    Copy the receipt data of existing receipts into the compressed
+    column and record its hash.
+    """
+    AppleReceipt = apps.get_model("know_me", "AppleReceipt")
+
+    receipts = AppleReceipt.objects.only("pk", "receipt_data")
+    for receipt in receipts.iterator():
+        receipt.compressed_receipt_data = receipt.receipt_data
+        receipt.receipt_data_hash = hashlib.sha256(
+            receipt.receipt_data.encode()
+        ).hexdigest()
+        receipt.save(
+            update_fields=["compressed_receipt_data", "receipt_data_hash"]
+        )
+
+
+def decompress_receipt_data(apps, _):
+    """
+    Copy the compressed receipt data of existing receipts back into the
+    text column.
+    """
+    AppleReceipt = apps.get_model("know_me", "AppleReceipt")
+
+    receipts = AppleReceipt.objects.only("pk", "compressed_receipt_data")
+    for receipt in receipts.iterator():
+        receipt.receipt_data = receipt.compressed_receipt_data
+        receipt.save(update_fields=["receipt_data"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("know_me", "0021_applereceipt_renewal_schedule"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="applereceipt",
+            name="compressed_receipt_data",
+            field=know_me.fields.CompressedTextField(
+                default="",
+                help_text="The base64 encoded data used to identify the receipt with Apple.",
+                verbose_name="receipt data",
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="applereceipt",
+            name="receipt_data_hash",
+            field=models.CharField(
+                default="",
+                editable=False,
+                help_text="The SHA256 hash of the receipt data.",
+                max_length=64,
+                verbose_name="receipt data hash",
+            ),
+            preserve_default=False,
+        ),
+        migrations.RunPython(
+            code=compress_receipt_data, reverse_code=decompress_receipt_data,
+        ),
+        # Give the old column a default so that it can be added back if
+        # the migration is reversed.
+        migrations.AlterField(
+            model_name="applereceipt",
+            name="receipt_data",
+            field=models.TextField(default=""),
+        ),
+        migrations.RemoveField(
+            model_name="applereceipt", name="receipt_data",
+        ),
+        migrations.RenameField(
+            model_name="applereceipt",
+            old_name="compressed_receipt_data",
+            new_name="receipt_data",
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 2.2.28 on 2026-10-19 15:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("know_me", "0022_applereceipt_compressed_data"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="applereceipt",
+            name="last_notification_time",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="The time that the most recently applied App Store server notification for the receipt was signed.",
+                null=True,
+                verbose_name="last notification time",
+            ),
+        ),
+    ]
@@ -0,0 +1,16 @@
+# Generated by Django 2.2.28 on 2026-10-19 15:32
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("know_me", "0023_applereceipt_last_notification_time"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="kmuseraccess", name="owner_is_premium",
+        ),
+    ]
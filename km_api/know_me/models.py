@@ -1,10 +1,12 @@
 """Models for the Know Me app.
 """
+import hashlib
 import logging
 import uuid
 
 import email_utils
 from django.conf import settings
+from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.utils import timezone
@@ -13,7 +15,7 @@ from rest_email_auth.models import EmailAddress
 from rest_framework.reverse import reverse
 from solo.models import SingletonModel
 
-from know_me import subscriptions
+from know_me import fields, subscriptions
 from permission_utils import model_mixins as mixins
 
 
@@ -59,12 +61,44 @@ class AppleReceipt(mixins.IsAuthenticatedMixin, models.Model):
         primary_key=True,
         verbose_name=_("ID"),
     )
-    receipt_data = models.TextField(
+    last_notification_time = models.DateTimeField(
+        blank=True,
+        help_text=_(
+            "The time that the most recently applied App Store server "
+            "notification for the receipt was signed."
+        ),
+        null=True,
+        verbose_name=_("last notification time"),
+    )
+    next_renewal_check = models.DateTimeField(
+        db_index=True,
+        default=timezone.now,
+        help_text=_(
+            "The time that the subscription worker should next check if the "
+            "receipt has been renewed."
+        ),
+        verbose_name=_("next renewal check"),
+    )
+    receipt_data = fields.CompressedTextField(
         help_text=_(
             "The base64 encoded data used to identify the receipt with Apple."
         ),
         verbose_name=_("receipt data"),
     )
+    receipt_data_hash = models.CharField(
+        editable=False,
+        help_text=_("The SHA256 hash of the receipt data."),
+        max_length=64,
+        verbose_name=_("receipt data hash"),
+    )
+    renewal_attempts = models.PositiveSmallIntegerField(
+        default=0,
+        help_text=_(
+            "The number of checks since the receipt's expiration time last "
+            "changed that found it had not been renewed."
+        ),
+        verbose_name=_("renewal attempts"),
+    )
     subscription = models.OneToOneField(
         "know_me.Subscription",
         help_text=_("The Know Me subscription the receipt belongs to."),
@@ -145,6 +179,58 @@ class AppleReceipt(mixins.IsAuthenticatedMixin, models.Model):
 
         return True
 
+    @staticmethod
+    def get_receipt_data_hash(receipt_data):
+        """
+        Get the hash used to detect changes to receipt data.
+
+        Args:
+            receipt_data:
+                The receipt data to hash.
+
+        Returns:
+            The SHA256 hash of the receipt data.
+        """
+        return hashlib.sha256(receipt_data.encode()).hexdigest()
+
+    def save(self, *args, **kwargs):
+        """
+        Save the receipt and keep the hash of its receipt data up to
+        date, regardless of how the receipt data was set.
+        """
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "receipt_data" in update_fields:
+            self.receipt_data_hash = self.get_receipt_data_hash(
+                self.receipt_data
+            )
+
+            if update_fields is not None:
+                kwargs["update_fields"] = set(update_fields) | {
+                    "receipt_data_hash"
+                }
+
+        super().save(*args, **kwargs)
+
+    def set_receipt_data(self, receipt_data):
+        """
+        Set the receipt data and its hash.
+
+        Args:
+            receipt_data:
+                The new receipt data.
+
+        Returns:
+            A boolean indicating if the receipt data changed.
+        """
+        receipt_data_hash = self.get_receipt_data_hash(receipt_data)
+        if receipt_data_hash == self.receipt_data_hash:
+            return False
+
+        self.receipt_data = receipt_data
+        self.receipt_data_hash = receipt_data_hash
+
+        return True
+
     def update_info(self):
         """
         Revalidate the instance's information with the Apple store and
@@ -153,17 +239,48 @@ class AppleReceipt(mixins.IsAuthenticatedMixin, models.Model):
         If the verification process returns an error, the receipt's
         expiration time is marked as the current time.
 
+        The next renewal check is scheduled for the start of the renewal
+        window before the new expiration time.
+
         .. note::
 
             This method does **NOT** save the instance, it only updates
             the fields on the instance itself. To persist the updated
             information, the ``save`` method must be called explicitly.
+            Passing the returned field names as ``update_fields`` avoids
+            rewriting the receipt when nothing changed.
+
+        Returns:
+            A list containing the names of the fields that must be saved
+            to persist the changes, which is empty if nothing changed.
         """
         transaction = subscriptions.validate_apple_receipt(self.receipt_data)
+        expiration_time = transaction.expires_date
+
+        values = {
+            "expiration_time": expiration_time,
+            "next_renewal_check": (
+                expiration_time - subscriptions.RENEWAL_WINDOW
+            ),
+            "renewal_attempts": 0,
+            "transaction_id": transaction.original_transaction_id,
+        }
+
+        changed = []
+        for name, value in values.items():
+            if getattr(self, name) != value:
+                setattr(self, name, value)
+                changed.append(name)
+
+        # Comparing hashes avoids comparing receipts that are often tens
+        # of kilobytes long.
+        if self.set_receipt_data(transaction.latest_receipt_data):
+            changed += ["receipt_data", "receipt_data_hash"]
 
-        self.expiration_time = transaction.expires_date
-        self.receipt_data = transaction.latest_receipt_data
-        self.transaction_id = transaction.original_transaction_id
+        if changed:
+            changed.append("time_updated")
+
+        return sorted(changed)
 
 
 class Config(SingletonModel):
@@ -281,6 +398,19 @@ class KMUser(mixins.IsAuthenticatedMixin, models.Model):
         """
         return self.user.get_short_name()
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Create an instance from a database row.
+
+        The name of the Know Me user's image is recorded so that changes
+        to it can be detected when the Know Me user is saved.
+        """
+        instance = super().from_db(db, field_names, values)
+        instance._saved_image_name = instance.__dict__.get("image")
+
+        return instance
+
     @property
     def name(self):
         """
@@ -299,6 +429,71 @@ class KMUser(mixins.IsAuthenticatedMixin, models.Model):
         """
         return reverse("know-me:km-user-detail", kwargs={"pk": self.pk})
 
+    @classmethod
+    def get_batch_object_permissions(cls, instances, request):
+        """
+        Check the object permissions of several instances at once.
+
+        Args:
+            instances:
+                The Know Me users to check permissions on.
+            request:
+                The request to check permissions for.
+
+        Returns:
+            A list containing a dictionary with the ``read`` and
+            ``write`` permissions of each instance.
+        """
+        permissions = cls.get_batch_permissions(
+            {km_user.pk for km_user in instances}, request
+        )
+
+        return [permissions[km_user.pk] for km_user in instances]
+
+    @classmethod
+    def get_batch_permissions(cls, km_user_ids, request):
+        """
+        Get the access the requesting user has to several Know Me users.
+
+        The results are the same as those given by
+        :py:meth:`has_object_read_permission` and
+        :py:meth:`has_object_write_permission`, but only two queries are
+        made regardless of the number of Know Me users.
+
+        Args:
+            km_user_ids:
+                The IDs of the Know Me users to check permissions on.
+            request:
+                The request to check permissions for.
+
+        Returns:
+            A dictionary mapping each Know Me user's ID to a dictionary
+            containing the ``read`` and ``write`` permissions the
+            requesting user has on the Know Me user.
+        """
+        permissions = {
+            pk: {"read": False, "write": False} for pk in km_user_ids
+        }
+        if not permissions or not request.user.is_authenticated:
+            return permissions
+
+        owned_ids = cls.objects.filter(
+            pk__in=list(permissions), user=request.user
+        ).values_list("pk", flat=True)
+        for pk in owned_ids:
+            permissions[pk] = {"read": True, "write": True}
+
+        accessors = KMUserAccessor.objects.filter(
+            is_accepted=True,
+            km_user__in=list(permissions),
+            user_with_access=request.user,
+        ).values_list("km_user_id", "is_admin")
+        for pk, is_admin in accessors:
+            permissions[pk]["read"] = True
+            permissions[pk]["write"] |= is_admin
+
+        return permissions
+
     def get_media_resource_list_url(self):
         """
         Get the absolute URL of the instance's media resource list view.
@@ -392,9 +587,30 @@ class KMUser(mixins.IsAuthenticatedMixin, models.Model):
             A boolean indicating if the Know Me user has an active
             premium subscription.
         """
-        return Subscription.objects.filter(
-            is_active=True, user=self.user
-        ).exists()
+        # If the subscription was selected along with the user, we can
+        # avoid an additional query.
+        user_model = get_user_model()
+        if KMUser.user.is_cached(self) and (
+            user_model.know_me_subscription.is_cached(self.user)
+        ):
+            try:
+                return self.user.know_me_subscription.is_premium
+            except Subscription.DoesNotExist:
+                return False
+
+        return (
+            Subscription.objects.premium()
+            .filter(user_id=self.user_id)
+            .exists()
+        )
+
+    def save(self, *args, **kwargs):
+        """
+        Save the Know Me user and record the name of its image.
+        """
+        super().save(*args, **kwargs)
+
+        self._saved_image_name = self.image.name
 
     def share(self, email, is_admin=False):
         """
@@ -447,6 +663,72 @@ class KMUser(mixins.IsAuthenticatedMixin, models.Model):
         return accessor
 
 
+class KMUserAccess(models.Model):
+    """
+    The access a user has to a Know Me user.
+
+    Rows are derived from the owner of each Know Me user and the accepted
+    accessors granting access to it. They are kept up to date by the
+    receivers in :py:mod:`know_me.signals` and can be rebuilt with the
+    ``rebuildkmuseraccess`` management command. There is only a row for
+    a user and a Know Me user if the user can read the Know Me user.
+    Whether the owner is premium is not stored since it depends on the
+    current time.
+    """
+
+    can_see_private = models.BooleanField(
+        default=False,
+        help_text=_(
+            "A boolean indicating if the user can see the Know Me user's "
+            "private profiles."
+        ),
+        verbose_name=_("can see private"),
+    )
+    can_write = models.BooleanField(
+        default=False,
+        help_text=_(
+            "A boolean indicating if the user can modify the Know Me user."
+        ),
+        verbose_name=_("can write"),
+    )
+    is_owner = models.BooleanField(
+        default=False,
+        help_text=_("A boolean indicating if the user owns the Know Me user."),
+        verbose_name=_("is owner"),
+    )
+    km_user = models.ForeignKey(
+        "know_me.KMUser",
+        help_text=_("The Know Me user that the user has access to."),
+        on_delete=models.CASCADE,
+        related_name="access_entries",
+        related_query_name="access_entry",
+        verbose_name=_("Know Me user"),
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        help_text=_("The user who has access to the Know Me user."),
+        on_delete=models.CASCADE,
+        related_name="km_user_access_entries",
+        related_query_name="km_user_access_entry",
+        verbose_name=_("user"),
+    )
+
+    class Meta:
+        unique_together = ("user", "km_user")
+        verbose_name = _("Know Me user access")
+        verbose_name_plural = _("Know Me user access")
+
+    def __str__(self):
+        """
+        Get a string representation of the instance.
+
+        Returns:
+            A string describing the user and the Know Me user they have
+            access to.
+        """
+        return f"Access for user {self.user_id} to {self.km_user_id}"
+
+
 class KMUserAccessor(mixins.IsAuthenticatedMixin, models.Model):
     """
     Model to store KMUser access information.
@@ -494,6 +776,10 @@ class KMUserAccessor(mixins.IsAuthenticatedMixin, models.Model):
     )
 
     class Meta(object):
+        indexes = [
+            # Used to find the Know Me users shared with a user.
+            models.Index(fields=["user_with_access", "is_accepted", "km_user"])
+        ]
         unique_together = ("km_user", "user_with_access")
         verbose_name = _("Know Me user accessor")
         verbose_name_plural = _("Know Me user accessors")
@@ -516,6 +802,21 @@ class KMUserAccessor(mixins.IsAuthenticatedMixin, models.Model):
         """
         return reverse("know-me:accessor-accept", kwargs={"pk": self.pk})
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Create an instance from a database row.
+
+        The user granted access by the accessor is recorded so that the
+        access of a previous user can be removed if it changes.
+        """
+        instance = super().from_db(db, field_names, values)
+        instance._saved_user_with_access_id = instance.__dict__.get(
+            "user_with_access_id"
+        )
+
+        return instance
+
     def get_absolute_url(self, request=None):
         """
         Get the URL of the instance's detail view.
@@ -596,6 +897,14 @@ class KMUserAccessor(mixins.IsAuthenticatedMixin, models.Model):
         """
         return request.user == self.km_user.user
 
+    def save(self, *args, **kwargs):
+        """
+        Save the accessor and record the user it grants access to.
+        """
+        super().save(*args, **kwargs)
+
+        self._saved_user_with_access_id = self.user_with_access_id
+
     def send_invite(self):
         """
         Send a notification email about the invite.
@@ -815,6 +1124,51 @@ class ReminderEmailSubscriber(mixins.IsAuthenticatedMixin, models.Model):
         return request.user == self.user
 
 
+def get_premium_filter(prefix=""):
+    """
+    Get a filter matching subscriptions that currently grant premium
+    access.
+
+    The stored ``is_active`` flag is only cleared once a subscription's
+    receipt has been checked after it expires. Checking the expiration
+    time of the receipt as well means access ends on time regardless of
+    how often receipts are checked. Legacy subscriptions and
+    subscriptions without a receipt do not expire.
+
+    Args:
+        prefix:
+            The lookup from the model being filtered to its subscription,
+            including the trailing ``__``. Defaults to filtering
+            subscriptions themselves.
+
+    Returns:
+        A ``Q`` object containing the filter.
+    """
+    return models.Q(**{f"{prefix}is_active": True}) & (
+        models.Q(**{f"{prefix}is_legacy_subscription": True})
+        | models.Q(**{f"{prefix}apple_receipt__isnull": True})
+        | models.Q(
+            **{f"{prefix}apple_receipt__expiration_time__gt": timezone.now()}
+        )
+    )
+
+
+class SubscriptionQuerySet(models.QuerySet):
+    """
+    Queryset for Know Me subscriptions.
+    """
+
+    def premium(self):
+        """
+        Get the subscriptions that currently grant premium access.
+
+        Returns:
+            A queryset containing the subscriptions matched by
+            :py:func:`get_premium_filter`.
+        """
+        return self.filter(get_premium_filter())
+
+
 class Subscription(mixins.IsAuthenticatedMixin, models.Model):
     """
     A subscription to Know Me.
@@ -850,6 +1204,8 @@ class Subscription(mixins.IsAuthenticatedMixin, models.Model):
         verbose_name=_("user"),
     )
 
+    objects = SubscriptionQuerySet.as_manager()
+
     class Meta:
         ordering = ("time_created",)
         verbose_name = _("Know Me subscription")
@@ -867,6 +1223,20 @@ class Subscription(mixins.IsAuthenticatedMixin, models.Model):
             user=self.user.get_full_name()
         )
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Create an instance from a database row.
+
+        The owner of the subscription is recorded so that the premium
+        status of a previous owner can be updated if the subscription is
+        transferred.
+        """
+        instance = super().from_db(db, field_names, values)
+        instance._saved_user_id = instance.__dict__.get("user_id")
+
+        return instance
+
     def has_object_read_permission(self, request):
         """
         Check if the requesting user has read permissions on the
@@ -896,3 +1266,29 @@ class Subscription(mixins.IsAuthenticatedMixin, models.Model):
             permissions to the instance.
         """
         return request.user == self.user
+
+    @property
+    def is_premium(self):
+        """
+        Returns:
+            A boolean indicating if the subscription currently grants
+            premium access. See :py:func:`get_premium_filter`.
+        """
+        if not self.is_active:
+            return False
+
+        if self.is_legacy_subscription:
+            return True
+
+        try:
+            return self.apple_receipt.expiration_time > timezone.now()
+        except AppleReceipt.DoesNotExist:
+            return True
+
+    def save(self, *args, **kwargs):
+        """
+        Save the subscription and record its owner.
+        """
+        super().save(*args, **kwargs)
+
+        self._saved_user_id = self.user_id
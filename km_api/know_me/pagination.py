@@ -0,0 +1,175 @@
+"""Pagination classes for the ``know_me`` module.
+"""
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from django.utils.translation import ugettext_lazy as _
+from rest_framework import pagination
+from rest_framework.exceptions import NotFound
+
+
+class OptionalPageNumberPagination(pagination.PageNumberPagination):
+    """
+    Page number pagination that is only applied if the client requests
+    a page.
+
+    This allows pagination to be added to endpoints whose clients expect
+    a plain list without breaking those clients.
+    """
+
+    max_page_size = 100
+    page_size_query_param = "page_size"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        Paginate a queryset if a page was requested.
+
+        Args:
+            queryset:
+                The queryset to paginate.
+            request:
+                The request being made.
+            view:
+                The view being accessed.
+
+        Returns:
+            A list containing the instances on the requested page, or
+            ``None`` if no page was requested.
+        """
+        if (
+            self.page_query_param not in request.query_params
+            and self.page_size_query_param not in request.query_params
+        ):
+            return None
+
+        return super().paginate_queryset(queryset, request, view=view)
+
+
+class TimelineCursorPagination(pagination.CursorPagination):
+    """
+    Cursor pagination of results from newest to oldest that can merge
+    the results of several querysets.
+
+    Results are ordered by their creation time with their primary key
+    breaking ties, which gives every result a unique position. The
+    cursor is the position of the last result on the previous page, so
+    every page is found with a range query on each queryset no matter
+    how far into the results it is. Because primary keys are unique
+    across shards, the querysets may come from different shards.
+
+    Only the next page of results is linked to.
+    """
+
+    invalid_cursor_message = _("Invalid cursor")
+    max_page_size = 100
+    ordering = ("-created_at", "-pk")
+    page_size_query_param = "page_size"
+
+    def decode_position(self, request):
+        """
+        Get the position to continue from.
+
+        Args:
+            request:
+                The request being made.
+
+        Returns:
+            A tuple containing the creation time and primary key of the
+            last result on the previous page, or ``None`` if the first
+            page is being requested.
+
+        Raises:
+            NotFound:
+                If the cursor provided in the request is invalid.
+        """
+        cursor = self.decode_cursor(request)
+        if cursor is None:
+            return None
+
+        created_at, _, pk = (cursor.position or "").partition("|")
+        try:
+            position = (parse_datetime(created_at), int(pk))
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message)
+
+        if position[0] is None:
+            raise NotFound(self.invalid_cursor_message)
+
+        return position
+
+    def get_next_link(self):
+        """
+        Get the URL of the next page of results.
+
+        Returns:
+            The URL of the next page, or ``None`` if this is the last
+            page.
+        """
+        if not self.has_next:
+            return None
+
+        last = self.page[-1]
+        position = f"{last.created_at.isoformat()}|{last.pk}"
+
+        return self.encode_cursor(
+            pagination.Cursor(offset=0, reverse=False, position=position)
+        )
+
+    def get_previous_link(self):
+        """
+        Previous pages are not linked to.
+
+        Returns:
+            ``None``
+        """
+        return None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        Get a page of results.
+
+        Args:
+            queryset:
+                The queryset to paginate, or a list of querysets whose
+                results are merged.
+            request:
+                The request being made.
+            view:
+                The view being accessed.
+
+        Returns:
+            A list containing the instances on the requested page.
+        """
+        if isinstance(queryset, (list, tuple)):
+            querysets = queryset
+        else:
+            querysets = [queryset]
+
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        position = self.decode_position(request)
+
+        results = []
+        for queryset in querysets:
+            if position is not None:
+                created_at, pk = position
+                queryset = queryset.filter(
+                    Q(created_at__lt=created_at)
+                    | Q(created_at=created_at, pk__lt=pk)
+                )
+
+            # One extra result is fetched to determine if there is a
+            # next page.
+            results.extend(
+                queryset.order_by(*self.ordering)[: self.page_size + 1]
+            )
+
+        results.sort(
+            key=lambda instance: (instance.created_at, instance.pk),
+            reverse=True,
+        )
+
+        self.has_next = len(results) > self.page_size
+        self.page = results[: self.page_size]
+
+        return self.page
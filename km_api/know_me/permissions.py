@@ -1,6 +1,5 @@
 from django.conf import settings
 from django.http import Http404
-from django.shortcuts import get_object_or_404
 
 from rest_framework import permissions
 
@@ -41,9 +40,9 @@ class CollectionOwnerHasPremium(permissions.BasePermission):
 
         user = view.get_subscription_owner(request)
 
-        if not models.Subscription.objects.filter(
-            is_active=True, user=user
-        ).exists():
+        if not (
+            models.Subscription.objects.premium().filter(user=user).exists()
+        ):
             raise Http404
 
         return True
@@ -59,7 +58,8 @@ class HasKMUserAccess(permissions.IsAuthenticated):
         Determine if the requesting user has access to the given view.
 
         If the requesting user is the Know Me user or has an accessor
-        granting access, then they are given permission.
+        granting access, then they are given permission. The decision is
+        made from the user's materialized access to the Know Me user.
 
         Args:
             request:
@@ -74,19 +74,13 @@ class HasKMUserAccess(permissions.IsAuthenticated):
         if not super().has_permission(request, view):
             return False
 
-        km_user = get_object_or_404(models.KMUser, pk=view.kwargs.get("pk"))
-
-        if km_user.user == request.user:
-            return True
-
-        try:
-            accessor = km_user.km_user_accessors.get(
-                is_accepted=True, user_with_access=request.user
-            )
-        except models.KMUserAccessor.DoesNotExist:
+        access = models.KMUserAccess.objects.filter(
+            km_user_id=view.kwargs.get("pk"), user=request.user
+        ).first()
+        if access is None:
             raise Http404()
 
-        if accessor.is_admin:
+        if access.is_owner or access.can_write:
             return True
 
         return request.method in permissions.SAFE_METHODS
@@ -120,9 +114,11 @@ class HasPremium(permissions.IsAuthenticated):
         if not super().has_permission(request, view):
             return False
 
-        return models.Subscription.objects.filter(
-            is_active=True, user=request.user
-        ).exists()
+        return (
+            models.Subscription.objects.premium()
+            .filter(user=request.user)
+            .exists()
+        )
 
 
 class ObjectOwnerHasPremium(permissions.BasePermission):
@@ -161,9 +157,9 @@ class ObjectOwnerHasPremium(permissions.BasePermission):
 
         user = view.get_subscription_owner(request, obj)
 
-        if not models.Subscription.objects.filter(
-            is_active=True, user=user
-        ).exists():
+        if not (
+            models.Subscription.objects.premium().filter(user=user).exists()
+        ):
             raise Http404
 
         return True
@@ -1,6 +1,6 @@
 from rest_framework import filters
 
-from know_me.models import KMUser
+from know_me.models import KMUserAccess
 
 
 class ProfileFilterBackend(filters.BaseFilterBackend):
@@ -31,13 +31,10 @@ class ProfileFilterBackend(filters.BaseFilterBackend):
             A queryset containing the profiles accessible to the
             requesting user.
         """
-        km_user = KMUser.objects.get(pk=view.kwargs.get("pk"))
-
-        if request.user == km_user.user:
-            return queryset
-
-        if km_user.km_user_accessors.filter(
-            is_admin=True, user_with_access=request.user
+        if KMUserAccess.objects.filter(
+            can_see_private=True,
+            km_user_id=view.kwargs.get("pk"),
+            user=request.user,
         ).exists():
             return queryset
 
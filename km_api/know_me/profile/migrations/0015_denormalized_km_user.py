@@ -0,0 +1,90 @@
+# Generated by Django 2.2.28 on 2026-10-19 13:36
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+import django.db.models.deletion
+
+
+def populate_km_user(apps, _):
+    """
+    Populate the owner of existing profile topics, profile items, and
+    list entries from the profiles they belong to.
+    """
+    ListEntry = apps.get_model("profile", "ListEntry")
+    Profile = apps.get_model("profile", "Profile")
+    ProfileItem = apps.get_model("profile", "ProfileItem")
+    ProfileTopic = apps.get_model("profile", "ProfileTopic")
+
+    ProfileTopic.objects.update(
+        km_user=Subquery(
+            Profile.objects.filter(pk=OuterRef("profile")).values("km_user")
+        )
+    )
+    ProfileItem.objects.update(
+        km_user=Subquery(
+            ProfileTopic.objects.filter(pk=OuterRef("topic")).values("km_user")
+        )
+    )
+    ListEntry.objects.update(
+        km_user=Subquery(
+            ProfileItem.objects.filter(pk=OuterRef("profile_item")).values(
+                "km_user"
+            )
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("know_me", "0019_kmuseraccessor_shared_index"),
+        ("profile", "0014_mediaresourcecoverstyle"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="listentry",
+            name="km_user",
+            field=models.ForeignKey(
+                editable=False,
+                help_text="The Know Me user who owns the list entry. This is kept in sync with the list entry's profile.",
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="list_entries",
+                related_query_name="list_entry",
+                to="know_me.KMUser",
+                verbose_name="Know Me user",
+            ),
+        ),
+        migrations.AddField(
+            model_name="profileitem",
+            name="km_user",
+            field=models.ForeignKey(
+                editable=False,
+                help_text="The Know Me user who owns the item. This is kept in sync with the item's profile.",
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="profile_items",
+                related_query_name="profile_item",
+                to="know_me.KMUser",
+                verbose_name="Know Me user",
+            ),
+        ),
+        migrations.AddField(
+            model_name="profiletopic",
+            name="km_user",
+            field=models.ForeignKey(
+                editable=False,
+                help_text="The Know Me user who owns the topic. This is kept in sync with the topic's profile.",
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="profile_topics",
+                related_query_name="profile_topic",
+                to="know_me.KMUser",
+                verbose_name="Know Me user",
+            ),
+        ),
+        migrations.RunPython(
+            code=populate_km_user, reverse_code=migrations.RunPython.noop
+        ),
+    ]
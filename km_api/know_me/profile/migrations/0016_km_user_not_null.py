@@ -0,0 +1,53 @@
+# Generated by Django 2.2.28 on 2026-10-19 13:39
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("profile", "0015_denormalized_km_user"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="listentry",
+            name="km_user",
+            field=models.ForeignKey(
+                editable=False,
+                help_text="The Know Me user who owns the list entry. This is kept in sync with the list entry's profile.",
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="list_entries",
+                related_query_name="list_entry",
+                to="know_me.KMUser",
+                verbose_name="Know Me user",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="profileitem",
+            name="km_user",
+            field=models.ForeignKey(
+                editable=False,
+                help_text="The Know Me user who owns the item. This is kept in sync with the item's profile.",
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="profile_items",
+                related_query_name="profile_item",
+                to="know_me.KMUser",
+                verbose_name="Know Me user",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="profiletopic",
+            name="km_user",
+            field=models.ForeignKey(
+                editable=False,
+                help_text="The Know Me user who owns the topic. This is kept in sync with the topic's profile.",
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="profile_topics",
+                related_query_name="profile_topic",
+                to="know_me.KMUser",
+                verbose_name="Know Me user",
+            ),
+        ),
+    ]
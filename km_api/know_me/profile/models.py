@@ -1,3 +1,4 @@
+from django.apps import apps
 from django.db import models
 from django.utils.translation import ugettext_lazy as _
 
@@ -40,10 +41,48 @@ def get_profile_item_image_upload_path(item, filename):
         The path to upload the profile item's image to.
     """
     return "know-me/users/{id}/profile-images/{file}".format(
-        file=filename, id=item.topic.profile.km_user.id
+        file=filename, id=item.km_user_id
     )
 
 
+def get_profile_permissions(profiles, request):
+    """
+    Get the permissions a request has on several profiles at once.
+
+    Args:
+        profiles:
+            An iterable of tuples containing a key, the ID of the Know Me
+            user who owns the profile, and a boolean indicating if the
+            profile is private. The key is typically the ID of the
+            profile or of an object belonging to the profile.
+        request:
+            The request to check permissions for.
+
+    Returns:
+        A dictionary mapping each key to a dictionary containing the
+        ``read`` and ``write`` permissions of the request. As in
+        :py:meth:`Profile.has_object_read_permission`, reading a private
+        profile requires write access to its Know Me user.
+    """
+    profiles = list(profiles)
+    km_user_permissions = apps.get_model(
+        "know_me", "KMUser"
+    ).get_batch_permissions({profile[1] for profile in profiles}, request)
+
+    permissions = {}
+    for key, km_user_id, is_private in profiles:
+        km_user_permission = km_user_permissions[km_user_id]
+        if is_private:
+            permissions[key] = {
+                "read": km_user_permission["write"],
+                "write": km_user_permission["write"],
+            }
+        else:
+            permissions[key] = dict(km_user_permission)
+
+    return permissions
+
+
 class ListEntry(mixins.IsAuthenticatedMixin, models.Model):
     """
     An entry in a list for a profile item.
@@ -54,6 +93,18 @@ class ListEntry(mixins.IsAuthenticatedMixin, models.Model):
         help_text=_("The time that the list entry was created."),
         verbose_name=_("created at"),
     )
+    km_user = models.ForeignKey(
+        "know_me.KMUser",
+        editable=False,
+        help_text=_(
+            "The Know Me user who owns the list entry. This is kept in sync "
+            "with the list entry's profile."
+        ),
+        on_delete=models.CASCADE,
+        related_name="list_entries",
+        related_query_name="list_entry",
+        verbose_name=_("Know Me user"),
+    )
     profile_item = models.ForeignKey(
         "profile.ProfileItem",
         help_text=_("The profile item that the list entry belongs to."),
@@ -98,6 +149,28 @@ class ListEntry(mixins.IsAuthenticatedMixin, models.Model):
             "know-me:profile:list-entry-detail", kwargs={"pk": self.pk}
         )
 
+    @classmethod
+    def get_batch_object_permissions(cls, instances, request):
+        """
+        Check the object permissions of several instances at once.
+
+        Args:
+            instances:
+                The list entries to check permissions on.
+            request:
+                The request to check permissions for.
+
+        Returns:
+            A list containing a dictionary with the ``read`` and
+            ``write`` permissions of each instance.
+        """
+        items = ProfileItem.objects.filter(
+            pk__in={entry.profile_item_id for entry in instances}
+        ).values_list("pk", "km_user_id", "topic__profile__is_private")
+        permissions = get_profile_permissions(items, request)
+
+        return [permissions[entry.profile_item_id] for entry in instances]
+
     def has_object_read_permission(self, request):
         """
         Check read permissions on the instance for a given request.
@@ -126,6 +199,16 @@ class ListEntry(mixins.IsAuthenticatedMixin, models.Model):
         """
         return self.profile_item.has_object_write_permission(request)
 
+    def save(self, *args, **kwargs):
+        """
+        Save the list entry.
+
+        The owner of the entry is copied from its profile item.
+        """
+        self.km_user_id = self.profile_item.km_user_id
+
+        super().save(*args, **kwargs)
+
 
 class MediaResource(mixins.IsAuthenticatedMixin, models.Model):
     """
@@ -208,6 +291,29 @@ class MediaResource(mixins.IsAuthenticatedMixin, models.Model):
             "know-me:profile:media-resource-detail", kwargs={"pk": self.pk}
         )
 
+    @classmethod
+    def get_batch_object_permissions(cls, instances, request):
+        """
+        Check the object permissions of several instances at once.
+
+        Args:
+            instances:
+                The media resources to check permissions on.
+            request:
+                The request to check permissions for.
+
+        Returns:
+            A list containing a dictionary with the ``read`` and
+            ``write`` permissions of each instance.
+        """
+        permissions = apps.get_model(
+            "know_me", "KMUser"
+        ).get_batch_permissions(
+            {resource.km_user_id for resource in instances}, request
+        )
+
+        return [permissions[resource.km_user_id] for resource in instances]
+
     def has_object_read_permission(self, request):
         """
         Check read permissions on the instance for a given request.
@@ -298,6 +404,29 @@ class MediaResourceCoverStyle(mixins.IsAuthenticatedMixin, models.Model):
             kwargs={"pk": self.pk},
         )
 
+    @classmethod
+    def get_batch_object_permissions(cls, instances, request):
+        """
+        Check the object permissions of several instances at once.
+
+        Args:
+            instances:
+                The cover styles to check permissions on.
+            request:
+                The request to check permissions for.
+
+        Returns:
+            A list containing a dictionary with the ``read`` and
+            ``write`` permissions of each instance.
+        """
+        permissions = apps.get_model(
+            "know_me", "KMUser"
+        ).get_batch_permissions(
+            {style.km_user_id for style in instances}, request
+        )
+
+        return [permissions[style.km_user_id] for style in instances]
+
     def has_object_read_permission(self, request):
         """
         Check read permissions on the instance for a given request.
@@ -379,6 +508,19 @@ class Profile(mixins.IsAuthenticatedMixin, models.Model):
         """
         return self.name
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Create an instance from a database row.
+
+        The owner of the instance is recorded so that :py:meth:`save`
+        can tell if the owner has changed.
+        """
+        instance = super().from_db(db, field_names, values)
+        instance._saved_km_user_id = instance.__dict__.get("km_user_id")
+
+        return instance
+
     def get_absolute_url(self):
         """
         Get the URL of the instance's detail view.
@@ -401,6 +543,31 @@ class Profile(mixins.IsAuthenticatedMixin, models.Model):
             "know-me:profile:profile-topic-list", kwargs={"pk": self.pk}
         )
 
+    @classmethod
+    def get_batch_object_permissions(cls, instances, request):
+        """
+        Check the object permissions of several instances at once.
+
+        Args:
+            instances:
+                The profiles to check permissions on.
+            request:
+                The request to check permissions for.
+
+        Returns:
+            A list containing a dictionary with the ``read`` and
+            ``write`` permissions of each instance.
+        """
+        permissions = get_profile_permissions(
+            (
+                (profile.pk, profile.km_user_id, profile.is_private)
+                for profile in instances
+            ),
+            request,
+        )
+
+        return [permissions[profile.pk] for profile in instances]
+
     def has_object_read_permission(self, request):
         """
         Check read permissions on the instance for a request.
@@ -437,6 +604,31 @@ class Profile(mixins.IsAuthenticatedMixin, models.Model):
         """
         return self.km_user.has_object_write_permission(request)
 
+    def save(self, *args, **kwargs):
+        """
+        Save the profile.
+
+        If the profile is given to a different Know Me user, the owner of
+        its topics, items, and list entries is updated as well.
+        """
+        super().save(*args, **kwargs)
+
+        previous_km_user_id = getattr(
+            self, "_saved_km_user_id", self.km_user_id
+        )
+        if previous_km_user_id != self.km_user_id:
+            ProfileTopic.objects.filter(profile=self).update(
+                km_user=self.km_user_id
+            )
+            ProfileItem.objects.filter(topic__profile=self).update(
+                km_user=self.km_user_id
+            )
+            ListEntry.objects.filter(profile_item__topic__profile=self).update(
+                km_user=self.km_user_id
+            )
+
+        self._saved_km_user_id = self.km_user_id
+
 
 class ProfileItem(mixins.IsAuthenticatedMixin, models.Model):
     """
@@ -459,6 +651,18 @@ class ProfileItem(mixins.IsAuthenticatedMixin, models.Model):
         upload_to=get_profile_item_image_upload_path,
         verbose_name=_("image"),
     )
+    km_user = models.ForeignKey(
+        "know_me.KMUser",
+        editable=False,
+        help_text=_(
+            "The Know Me user who owns the item. This is kept in sync "
+            "with the item's profile."
+        ),
+        on_delete=models.CASCADE,
+        related_name="profile_items",
+        related_query_name="profile_item",
+        verbose_name=_("Know Me user"),
+    )
     media_resource = models.ForeignKey(
         "profile.MediaResource",
         blank=True,
@@ -502,6 +706,20 @@ class ProfileItem(mixins.IsAuthenticatedMixin, models.Model):
         """
         return self.name
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Create an instance from a database row.
+
+        The owner and image of the instance are recorded so that
+        changes to them can be detected when the instance is saved.
+        """
+        instance = super().from_db(db, field_names, values)
+        instance._saved_image_name = instance.__dict__.get("image")
+        instance._saved_km_user_id = instance.__dict__.get("km_user_id")
+
+        return instance
+
     def get_absolute_url(self):
         """
         Get the URL of the instance's detail view.
@@ -524,6 +742,28 @@ class ProfileItem(mixins.IsAuthenticatedMixin, models.Model):
             "know-me:profile:list-entry-list", kwargs={"pk": self.pk}
         )
 
+    @classmethod
+    def get_batch_object_permissions(cls, instances, request):
+        """
+        Check the object permissions of several instances at once.
+
+        Args:
+            instances:
+                The profile items to check permissions on.
+            request:
+                The request to check permissions for.
+
+        Returns:
+            A list containing a dictionary with the ``read`` and
+            ``write`` permissions of each instance.
+        """
+        topics = ProfileTopic.objects.filter(
+            pk__in={item.topic_id for item in instances}
+        ).values_list("pk", "profile__km_user_id", "profile__is_private")
+        permissions = get_profile_permissions(topics, request)
+
+        return [permissions[item.topic_id] for item in instances]
+
     def has_object_read_permission(self, request):
         """
         Check read permissions on the instance for a request.
@@ -552,6 +792,29 @@ class ProfileItem(mixins.IsAuthenticatedMixin, models.Model):
         """
         return self.topic.has_object_write_permission(request)
 
+    def save(self, *args, **kwargs):
+        """
+        Save the profile item.
+
+        The owner of the item is copied from its topic. If the item is
+        moved to a topic owned by a different Know Me user, the owner of
+        its list entries is updated as well.
+        """
+        self.km_user_id = self.topic.km_user_id
+
+        super().save(*args, **kwargs)
+
+        previous_km_user_id = getattr(
+            self, "_saved_km_user_id", self.km_user_id
+        )
+        if previous_km_user_id != self.km_user_id:
+            ListEntry.objects.filter(profile_item=self).update(
+                km_user=self.km_user_id
+            )
+
+        self._saved_image_name = self.image.name
+        self._saved_km_user_id = self.km_user_id
+
 
 class ProfileTopic(mixins.IsAuthenticatedMixin, models.Model):
     """
@@ -571,6 +834,18 @@ class ProfileTopic(mixins.IsAuthenticatedMixin, models.Model):
         ),
         verbose_name=_("is detailed"),
     )
+    km_user = models.ForeignKey(
+        "know_me.KMUser",
+        editable=False,
+        help_text=_(
+            "The Know Me user who owns the topic. This is kept in sync "
+            "with the topic's profile."
+        ),
+        on_delete=models.CASCADE,
+        related_name="profile_topics",
+        related_query_name="profile_topic",
+        verbose_name=_("Know Me user"),
+    )
     name = models.CharField(
         help_text=_("The name of the topic."),
         max_length=255,
@@ -604,6 +879,19 @@ class ProfileTopic(mixins.IsAuthenticatedMixin, models.Model):
         """
         return self.name
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Create an instance from a database row.
+
+        The owner of the instance is recorded so that :py:meth:`save`
+        can tell if the owner has changed.
+        """
+        instance = super().from_db(db, field_names, values)
+        instance._saved_km_user_id = instance.__dict__.get("km_user_id")
+
+        return instance
+
     def get_absolute_url(self):
         """
         Get the URL of the instance's detail view.
@@ -626,6 +914,28 @@ class ProfileTopic(mixins.IsAuthenticatedMixin, models.Model):
             "know-me:profile:profile-item-list", kwargs={"pk": self.pk}
         )
 
+    @classmethod
+    def get_batch_object_permissions(cls, instances, request):
+        """
+        Check the object permissions of several instances at once.
+
+        Args:
+            instances:
+                The profile topics to check permissions on.
+            request:
+                The request to check permissions for.
+
+        Returns:
+            A list containing a dictionary with the ``read`` and
+            ``write`` permissions of each instance.
+        """
+        profiles = Profile.objects.filter(
+            pk__in={topic.profile_id for topic in instances}
+        ).values_list("pk", "km_user_id", "is_private")
+        permissions = get_profile_permissions(profiles, request)
+
+        return [permissions[topic.profile_id] for topic in instances]
+
     def has_object_read_permission(self, request):
         """
         Check read permissions on the instance for a request.
@@ -653,3 +963,28 @@ class ProfileTopic(mixins.IsAuthenticatedMixin, models.Model):
             permissions on the instance.
         """
         return self.profile.has_object_write_permission(request)
+
+    def save(self, *args, **kwargs):
+        """
+        Save the profile topic.
+
+        The owner of the topic is copied from its profile. If the topic
+        is moved to a profile owned by a different Know Me user, the
+        owner of its items and list entries is updated as well.
+        """
+        self.km_user_id = self.profile.km_user_id
+
+        super().save(*args, **kwargs)
+
+        previous_km_user_id = getattr(
+            self, "_saved_km_user_id", self.km_user_id
+        )
+        if previous_km_user_id != self.km_user_id:
+            ProfileItem.objects.filter(topic=self).update(
+                km_user=self.km_user_id
+            )
+            ListEntry.objects.filter(profile_item__topic=self).update(
+                km_user=self.km_user_id
+            )
+
+        self._saved_km_user_id = self.km_user_id
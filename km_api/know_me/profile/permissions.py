@@ -1,8 +1,10 @@
 from django.conf import settings
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 
 from rest_framework import permissions
 
+from know_me.models import Subscription
 from know_me.profile import models
 
 
@@ -26,14 +28,16 @@ class HasListEntryListPermissions(permissions.BasePermission):
             A boolean indicating if the requesting user should be
             granted access to the view.
         """
-        query = {"pk": view.kwargs.get("pk")}
-
-        if settings.KNOW_ME_PREMIUM_ENABLED:
-            # fmt: off
-            query["topic__profile__km_user__user__know_me_subscription__is_active"] = True  # noqa
-            # fmt: on
-
-        item = get_object_or_404(models.ProfileItem, **query)
+        item = get_object_or_404(models.ProfileItem, pk=view.kwargs.get("pk"))
+
+        # The subscription is checked with a separate query because it
+        # is not stored on the shard that the item may be stored on.
+        if settings.KNOW_ME_PREMIUM_ENABLED and not (
+            Subscription.objects.premium()
+            .filter(user__km_user=item.km_user_id)
+            .exists()
+        ):
+            raise Http404
 
         if request.method in permissions.SAFE_METHODS:
             return item.has_object_read_permission(request)
@@ -1,19 +1,32 @@
 from django.utils.translation import ugettext_lazy as _
 
-from dry_rest_permissions.generics import DRYPermissionsField
-
 from rest_framework import serializers
 
+from custom_storages.serializers import ImageDerivativesField, UploadTokenField
+from know_me.list_serializers import KMListSerializer
 from know_me.profile import models
+from permission_utils.serializers import BatchPermissionsField
+from serializer_utils.fields import TemplatedHyperlinkedIdentityField
+from serializer_utils.mixins import SparseFieldsetMixin
 
 
-class MediaResourceSerializer(serializers.HyperlinkedModelSerializer):
+class MediaResourceSerializer(
+    SparseFieldsetMixin, serializers.HyperlinkedModelSerializer
+):
     """
     Serializer for ``MediaResource`` instances.
     """
 
-    permissions = DRYPermissionsField()
-    url = serializers.HyperlinkedIdentityField(
+    file_upload_token = UploadTokenField(
+        models.MediaResource._meta.get_field("file"),
+        help_text=_(
+            "A token for a file uploaded using the Know Me user's upload "
+            "endpoint. This may be provided in place of the file."
+        ),
+        source="file",
+    )
+    permissions = BatchPermissionsField()
+    url = TemplatedHyperlinkedIdentityField(
         view_name="know-me:profile:media-resource-detail"
     )
 
@@ -26,10 +39,12 @@ class MediaResourceSerializer(serializers.HyperlinkedModelSerializer):
             "cover_art",
             "cover_style",
             "file",
+            "file_upload_token",
             "link",
             "name",
             "permissions",
         )
+        list_serializer_class = KMListSerializer
         model = models.MediaResource
 
     def validate(self, data):
@@ -77,8 +92,8 @@ class MediaResourceCoverStyleSerializer(
     Serializer for ``MediaResourceCoverStyle`` instances.
     """
 
-    permissions = DRYPermissionsField()
-    url = serializers.HyperlinkedIdentityField(
+    permissions = BatchPermissionsField()
+    url = TemplatedHyperlinkedIdentityField(
         view_name="know-me:profile:media-resource-cover-style-detail"
     )
 
@@ -92,6 +107,7 @@ class MediaResourceCoverStyleSerializer(
             "name",
             "permissions",
         )
+        list_serializer_class = KMListSerializer
         model = models.MediaResourceCoverStyle
 
 
@@ -103,13 +119,13 @@ class MediaResourceCoverStyleSerializer(
 # that they can be nested under each other.
 
 
-class ListEntrySerializer(serializers.ModelSerializer):
+class ListEntrySerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer for list entries.
     """
 
-    permissions = DRYPermissionsField()
-    url = serializers.HyperlinkedIdentityField(
+    permissions = BatchPermissionsField()
+    url = TemplatedHyperlinkedIdentityField(
         view_name="know-me:profile:list-entry-detail"
     )
 
@@ -123,23 +139,41 @@ class ListEntrySerializer(serializers.ModelSerializer):
             "profile_item_id",
             "text",
         )
+        list_serializer_class = KMListSerializer
         model = models.ListEntry
 
 
-class ProfileItemListSerializer(serializers.HyperlinkedModelSerializer):
+class ProfileItemListSerializer(
+    SparseFieldsetMixin, serializers.HyperlinkedModelSerializer
+):
     """
     Serializer for a list of profile items.
     """
 
-    list_entries_url = serializers.HyperlinkedIdentityField(
+    image_derivatives = ImageDerivativesField(
+        help_text=_("URLs of resized copies of the item's image."),
+        source="image",
+    )
+    list_entries_url = TemplatedHyperlinkedIdentityField(
         view_name="know-me:profile:list-entry-list"
     )
-    permissions = DRYPermissionsField()
-    url = serializers.HyperlinkedIdentityField(
+    permissions = BatchPermissionsField()
+    url = TemplatedHyperlinkedIdentityField(
         view_name="know-me:profile:profile-item-detail"
     )
 
     class Meta:
+        expandable_fields = {
+            "list_entries": (
+                ListEntrySerializer,
+                {"many": True, "read_only": True},
+            ),
+            "media_resource": (MediaResourceSerializer, {"read_only": True}),
+        }
+        field_prefetches = {
+            "list_entries": ("list_entries",),
+            "media_resource": ("media_resource",),
+        }
         fields = (
             "id",
             "url",
@@ -147,11 +181,13 @@ class ProfileItemListSerializer(serializers.HyperlinkedModelSerializer):
             "updated_at",
             "description",
             "image",
+            "image_derivatives",
             "list_entries_url",
             "name",
             "permissions",
             "topic_id",
         )
+        list_serializer_class = KMListSerializer
         model = models.ProfileItem
 
 
@@ -160,6 +196,14 @@ class ProfileItemDetailSerializer(ProfileItemListSerializer):
     Serializer for profile items.
     """
 
+    image_upload_token = UploadTokenField(
+        models.ProfileItem._meta.get_field("image"),
+        help_text=_(
+            "A token for an image uploaded using the Know Me user's upload "
+            "endpoint. This may be provided in place of the image."
+        ),
+        source="image",
+    )
     list_entries = ListEntrySerializer(many=True, read_only=True)
     media_resource = MediaResourceSerializer(read_only=True)
     media_resource_id = serializers.PrimaryKeyRelatedField(
@@ -173,6 +217,7 @@ class ProfileItemDetailSerializer(ProfileItemListSerializer):
 
     class Meta(ProfileItemListSerializer.Meta):
         fields = ProfileItemListSerializer.Meta.fields + (
+            "image_upload_token",
             "list_entries",
             "media_resource",
             "media_resource_id",
@@ -205,7 +250,7 @@ class ProfileItemDetailSerializer(ProfileItemListSerializer):
             return resource
 
         if self.instance is not None:
-            km_user = self.instance.topic.profile.km_user
+            km_user = self.instance.km_user
         else:
             assert "km_user" in self.context, (
                 "The serializer class '%s' requires 'km_user' to be provided "
@@ -222,23 +267,32 @@ class ProfileItemDetailSerializer(ProfileItemListSerializer):
         return resource
 
 
-class ProfileTopicListSerializer(serializers.HyperlinkedModelSerializer):
+class ProfileTopicListSerializer(
+    SparseFieldsetMixin, serializers.HyperlinkedModelSerializer
+):
     """
     Serializer for a list of profile topics.
     """
 
-    items_url = serializers.HyperlinkedIdentityField(
+    items_url = TemplatedHyperlinkedIdentityField(
         view_name="know-me:profile:profile-item-list"
     )
-    permissions = DRYPermissionsField()
+    permissions = BatchPermissionsField()
     profile_id = serializers.PrimaryKeyRelatedField(
         read_only=True, source="profile"
     )
-    url = serializers.HyperlinkedIdentityField(
+    url = TemplatedHyperlinkedIdentityField(
         view_name="know-me:profile:profile-topic-detail"
     )
 
     class Meta:
+        expandable_fields = {
+            "items": (
+                ProfileItemListSerializer,
+                {"many": True, "read_only": True},
+            )
+        }
+        field_prefetches = {"items": ("items",)}
         fields = (
             "id",
             "url",
@@ -250,6 +304,7 @@ class ProfileTopicListSerializer(serializers.HyperlinkedModelSerializer):
             "permissions",
             "profile_id",
         )
+        list_serializer_class = KMListSerializer
         model = models.ProfileTopic
 
 
@@ -264,20 +319,29 @@ class ProfileTopicDetailSerializer(ProfileTopicListSerializer):
         fields = ProfileTopicListSerializer.Meta.fields + ("items",)
 
 
-class ProfileListSerializer(serializers.HyperlinkedModelSerializer):
+class ProfileListSerializer(
+    SparseFieldsetMixin, serializers.HyperlinkedModelSerializer
+):
     """
     Serializer for multiple profile instances.
     """
 
-    permissions = DRYPermissionsField()
-    topics_url = serializers.HyperlinkedIdentityField(
+    permissions = BatchPermissionsField()
+    topics_url = TemplatedHyperlinkedIdentityField(
         view_name="know-me:profile:profile-topic-list"
     )
-    url = serializers.HyperlinkedIdentityField(
+    url = TemplatedHyperlinkedIdentityField(
         view_name="know-me:profile:profile-detail"
     )
 
     class Meta:
+        expandable_fields = {
+            "topics": (
+                ProfileTopicListSerializer,
+                {"many": True, "read_only": True},
+            )
+        }
+        field_prefetches = {"topics": ("topics",)}
         fields = (
             "id",
             "url",
@@ -288,6 +352,7 @@ class ProfileListSerializer(serializers.HyperlinkedModelSerializer):
             "permissions",
             "topics_url",
         )
+        list_serializer_class = KMListSerializer
         model = models.Profile
 
 
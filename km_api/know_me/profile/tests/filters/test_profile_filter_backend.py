@@ -28,7 +28,11 @@ def test_filter_queryset_owner(api_rf, km_user_factory, profile_factory):
 
 
 def test_filter_queryset_shared_admin(
-    api_rf, km_user_accessor_factory, km_user_factory, profile_factory
+    api_rf,
+    km_user_accessor_factory,
+    km_user_factory,
+    profile_factory,
+    user_factory,
 ):
     """
     If the shared user is an admin, they should be able to see private
@@ -36,7 +40,10 @@ def test_filter_queryset_shared_admin(
     """
     km_user = km_user_factory()
     accessor = km_user_accessor_factory(
-        is_accepted=True, is_admin=True, km_user=km_user
+        is_accepted=True,
+        is_admin=True,
+        km_user=km_user,
+        user_with_access=user_factory(),
     )
 
     profile_factory(is_private=False, km_user=km_user)
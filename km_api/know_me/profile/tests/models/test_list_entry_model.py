@@ -27,6 +27,30 @@ def test_get_absolute_url(list_entry_factory):
     assert entry.get_absolute_url() == expected
 
 
+def test_get_batch_object_permissions(
+    api_rf, django_assert_num_queries, list_entry_factory
+):
+    """
+    The permissions of several list entries should be checked using the
+    profiles the entries belong to.
+    """
+    owned = list_entry_factory()
+    other = list_entry_factory()
+
+    api_rf.user = owned.profile_item.topic.profile.km_user.user
+    request = api_rf.get("/")
+
+    with django_assert_num_queries(3):
+        permissions = models.ListEntry.get_batch_object_permissions(
+            [owned, other], request
+        )
+
+    assert permissions == [
+        {"read": True, "write": True},
+        {"read": False, "write": False},
+    ]
+
+
 @mock.patch("know_me.profile.models.ProfileItem.has_object_read_permission")
 def test_has_object_read_permission(
     mock_parent_permission, api_rf, list_entry_factory
@@ -79,6 +103,15 @@ def test_ordering(list_entry_factory, profile_item_factory):
     assert list(item.list_entries.all()) == [l3, l1, l2]
 
 
+def test_save_km_user(list_entry_factory):
+    """
+    Saving a list entry should copy the owner of its profile item.
+    """
+    entry = list_entry_factory()
+
+    assert entry.km_user == entry.profile_item.topic.profile.km_user
+
+
 def test_string_conversion(list_entry_factory):
     """
     Converting a list entry to a string should return the entry's text.
@@ -27,11 +27,11 @@ def test_get_profile_item_image_upload_path():
     a directory titled ``know-me/users/{id}/profile-images``.
     """
     profile_item = mock.Mock(name="Mock Profile Item")
-    profile_item.topic.profile.km_user.id = 1
+    profile_item.km_user_id = 1
     filename = "image.jpg"
 
     result = models.get_profile_item_image_upload_path(profile_item, filename)
     expected = "know-me/users/{id}/profile-images/{file}".format(
-        file=filename, id=profile_item.topic.profile.km_user.id
+        file=filename, id=profile_item.km_user_id
     )
     assert result == expected
@@ -83,6 +83,50 @@ def test_has_object_write_permission(
     assert mock_parent_permission.call_args[0] == (request,)
 
 
+def test_save_km_user(profile_item_factory):
+    """
+    Saving an item should copy the owner of its topic.
+    """
+    item = profile_item_factory()
+
+    assert item.km_user == item.topic.profile.km_user
+
+
+def test_save_move_to_other_km_user(
+    list_entry_factory, profile_item_factory, profile_topic_factory
+):
+    """
+    Moving an item to a topic owned by a different Know Me user should
+    update the owner of the item's list entries.
+    """
+    entry = list_entry_factory()
+    new_topic = profile_topic_factory()
+
+    item = models.ProfileItem.objects.get(pk=entry.profile_item.pk)
+    item.topic = new_topic
+    item.save()
+    entry.refresh_from_db()
+
+    assert item.km_user == new_topic.km_user
+    assert entry.km_user == new_topic.km_user
+
+
+def test_save_no_move_no_update(
+    django_assert_num_queries, profile_item_factory
+):
+    """
+    Saving an item without changing its owner should not update its
+    list entries.
+    """
+    item = models.ProfileItem.objects.select_related("topic").get(
+        pk=profile_item_factory().pk
+    )
+
+    # Only the item itself should be updated.
+    with django_assert_num_queries(1):
+        item.save()
+
+
 def test_string_conversion(profile_item_factory):
     """
     Converting a profile item to a string should return the item's name.
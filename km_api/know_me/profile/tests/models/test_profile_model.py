@@ -39,6 +39,44 @@ def test_get_topic_list_url(profile_factory):
     assert profile.get_topic_list_url() == expected
 
 
+def test_get_batch_object_permissions(
+    api_rf, km_user_accessor_factory, profile_factory, user_factory
+):
+    """
+    Private profiles should only be readable by users with write access
+    to the profile's owner.
+    """
+    user = user_factory()
+    accessor = km_user_accessor_factory(
+        is_accepted=True, user_with_access=user
+    )
+    public = profile_factory(km_user=accessor.km_user)
+    private = profile_factory(is_private=True, km_user=accessor.km_user)
+    owned = profile_factory(is_private=True, km_user__user=user)
+
+    api_rf.user = user
+    request = api_rf.get("/")
+
+    profiles = [public, private, owned]
+    expected = [
+        {
+            "read": profile.has_object_read_permission(request),
+            "write": profile.has_object_write_permission(request),
+        }
+        for profile in profiles
+    ]
+
+    assert (
+        models.Profile.get_batch_object_permissions(profiles, request)
+        == expected
+    )
+    assert [permissions["read"] for permissions in expected] == [
+        True,
+        False,
+        True,
+    ]
+
+
 @mock.patch("know_me.models.KMUser.has_object_read_permission")
 def test_has_object_read_permission(
     mock_parent_permission, api_rf, profile_factory
@@ -97,6 +135,28 @@ def test_has_object_write_permission(
     assert mock_parent_permission.call_args[0] == (request,)
 
 
+def test_save_change_km_user(km_user_factory, list_entry_factory):
+    """
+    Giving a profile to a different Know Me user should update the owner
+    of everything in the profile.
+    """
+    entry = list_entry_factory()
+    new_km_user = km_user_factory()
+
+    profile = models.Profile.objects.get(
+        pk=entry.profile_item.topic.profile.pk
+    )
+    profile.km_user = new_km_user
+    profile.save()
+    entry.refresh_from_db()
+
+    assert models.ProfileTopic.objects.get(profile=profile).km_user == (
+        new_km_user
+    )
+    assert models.ProfileItem.objects.get().km_user == new_km_user
+    assert entry.km_user == new_km_user
+
+
 def test_string_conversion(profile_factory):
     """
     Converting a profile instance to a string should return the
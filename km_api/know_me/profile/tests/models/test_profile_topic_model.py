@@ -76,6 +76,37 @@ def test_has_object_write_permission(
     assert mock_parent_permission.call_args[0] == (request,)
 
 
+def test_save_km_user(profile_topic_factory):
+    """
+    Saving a topic should copy the owner of its profile.
+    """
+    topic = profile_topic_factory()
+
+    assert topic.km_user == topic.profile.km_user
+
+
+def test_save_move_to_other_km_user(
+    list_entry_factory, profile_factory, profile_topic_factory
+):
+    """
+    Moving a topic to a profile owned by a different Know Me user should
+    update the owner of the topic's items and list entries.
+    """
+    topic = profile_topic_factory()
+    entry = list_entry_factory(profile_item__topic=topic)
+    new_profile = profile_factory()
+
+    topic = models.ProfileTopic.objects.get(pk=topic.pk)
+    topic.profile = new_profile
+    topic.save()
+    entry.refresh_from_db()
+    entry.profile_item.refresh_from_db()
+
+    assert topic.km_user == new_profile.km_user
+    assert entry.profile_item.km_user == new_profile.km_user
+    assert entry.km_user == new_profile.km_user
+
+
 def test_string_conversion(profile_topic_factory):
     """
     Converting a profile topic to a string should return the topic's
@@ -1,7 +1,9 @@
+import datetime
 from unittest import mock
 
 import pytest
 from django.http import Http404
+from django.utils import timezone
 from rest_framework.permissions import SAFE_METHODS
 
 from know_me.profile import permissions
@@ -55,6 +57,36 @@ def test_has_permission(
     assert perm_func.call_args[0] == (request,)
 
 
+def test_has_permission_expired_subscription(
+    api_rf,
+    apple_receipt_factory,
+    enable_premium_requirement,
+    profile_item_factory,
+):
+    """
+    If the receipt of the profile owner's subscription has expired, an
+    ``Http404`` exception should be raised even if the subscription has
+    not been deactivated yet.
+    """
+    item = profile_item_factory()
+    apple_receipt_factory(
+        expiration_time=timezone.now() - datetime.timedelta(days=1),
+        subscription__is_active=True,
+        subscription__user=item.topic.profile.km_user.user,
+    )
+
+    api_rf.user = item.topic.profile.km_user.user
+    request = api_rf.get("/")
+
+    view = mock.Mock(name="Mock View")
+    view.kwargs = {"pk": item.pk}
+
+    permission = permissions.HasListEntryListPermissions()
+
+    with pytest.raises(Http404):
+        permission.has_permission(request, view)
+
+
 def test_has_permission_no_premium(
     api_rf, enable_premium_requirement, profile_item_factory
 ):
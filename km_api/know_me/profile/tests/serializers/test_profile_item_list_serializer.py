@@ -25,6 +25,9 @@ def test_serialize(api_rf, image, profile_item_factory, serialized_time):
         "updated_at": serialized_time(item.updated_at),
         "description": item.description,
         "image": image_url,
+        "image_derivatives": serializer.fields[
+            "image_derivatives"
+        ].to_representation(item.image),
         "list_entries_url": list_entries_url,
         "name": item.name,
         "permissions": {
@@ -49,6 +49,6 @@ def test_get_subscription_owner():
     request = mock.Mock()
     item = mock.Mock()
 
-    expected = item.topic.profile.km_user.user
+    expected = item.km_user.user
 
     assert view.get_subscription_owner(request, item) == expected
@@ -49,6 +49,6 @@ def test_get_subscription_owner():
     request = mock.Mock()
     topic = mock.Mock()
 
-    expected = topic.profile.km_user.user
+    expected = topic.km_user.user
 
     assert view.get_subscription_owner(request, topic) == expected
@@ -3,6 +3,7 @@ from dry_rest_permissions.generics import DRYPermissions
 
 from rest_framework import generics
 
+from idempotency.mixins import IdempotentCreateMixin
 from know_me.filters import KMUserAccessFilterBackend
 from know_me.models import KMUser
 from know_me.permissions import (
@@ -11,11 +12,17 @@ from know_me.permissions import (
     CollectionOwnerHasPremium,
 )
 from know_me.profile import filters, models, permissions, serializers
+from know_me.view_mixins import KMUserResponseCacheMixin
 from rest_order.generics import SortView
 from rest_order.serializers import create_sort_serializer
+from serializer_utils.view_mixins import SparseFieldsetViewMixin
 
 
-class ListEntryDetailView(generics.RetrieveUpdateDestroyAPIView):
+class ListEntryDetailView(
+    KMUserResponseCacheMixin,
+    SparseFieldsetViewMixin,
+    generics.RetrieveUpdateDestroyAPIView,
+):
     """
     delete:
     Delete a specific list entry.
@@ -30,6 +37,7 @@ class ListEntryDetailView(generics.RetrieveUpdateDestroyAPIView):
     Update a specific list entry's information.
     """
 
+    km_user_lookup_model = models.ListEntry
     permission_classes = (DRYPermissions, ObjectOwnerHasPremium)
     queryset = models.ListEntry.objects.all()
     serializer_class = serializers.ListEntrySerializer
@@ -50,10 +58,16 @@ class ListEntryDetailView(generics.RetrieveUpdateDestroyAPIView):
             The user who owns the profile that the list entry is a part
             of.
         """
-        return list_entry.profile_item.topic.profile.km_user.user
+        return list_entry.km_user.user
 
 
-class ListEntryListView(SortView, generics.ListCreateAPIView):
+class ListEntryListView(
+    IdempotentCreateMixin,
+    KMUserResponseCacheMixin,
+    SparseFieldsetViewMixin,
+    SortView,
+    generics.ListCreateAPIView,
+):
     """
     get:
     Get a list of the list entries belonging to a specific profile item.
@@ -66,6 +80,7 @@ class ListEntryListView(SortView, generics.ListCreateAPIView):
     item.
     """
 
+    km_user_lookup_model = models.ProfileItem
     permission_classes = (
         DRYPermissions,
         permissions.HasListEntryListPermissions,
@@ -109,7 +124,11 @@ class ListEntryListView(SortView, generics.ListCreateAPIView):
         return serializer.save(profile_item=item)
 
 
-class MediaResourceDetailView(generics.RetrieveUpdateDestroyAPIView):
+class MediaResourceDetailView(
+    KMUserResponseCacheMixin,
+    SparseFieldsetViewMixin,
+    generics.RetrieveUpdateDestroyAPIView,
+):
     """
     delete:
     Delete a specific media resource.
@@ -124,6 +143,7 @@ class MediaResourceDetailView(generics.RetrieveUpdateDestroyAPIView):
     Update the information for a specific media resource.
     """
 
+    km_user_lookup_model = models.MediaResource
     permission_classes = (DRYPermissions, ObjectOwnerHasPremium)
     queryset = models.MediaResource.objects.all()
     serializer_class = serializers.MediaResourceSerializer
@@ -146,7 +166,12 @@ class MediaResourceDetailView(generics.RetrieveUpdateDestroyAPIView):
         return media_resource.km_user.user
 
 
-class MediaResourceListView(generics.ListCreateAPIView):
+class MediaResourceListView(
+    IdempotentCreateMixin,
+    KMUserResponseCacheMixin,
+    SparseFieldsetViewMixin,
+    generics.ListCreateAPIView,
+):
     """
     get:
     Get a list of the media resources belonging to a specific Know Me
@@ -197,7 +222,9 @@ class MediaResourceListView(generics.ListCreateAPIView):
         return serializer.save(km_user=km_user)
 
 
-class MediaResourceCoverStyleDetailView(generics.RetrieveUpdateDestroyAPIView):
+class MediaResourceCoverStyleDetailView(
+    KMUserResponseCacheMixin, generics.RetrieveUpdateDestroyAPIView
+):
     """
     delete:
     Delete a specific media resource cover style.
@@ -212,6 +239,7 @@ class MediaResourceCoverStyleDetailView(generics.RetrieveUpdateDestroyAPIView):
     Update the information for a specific media resource cover Style.
     """
 
+    km_user_lookup_model = models.MediaResourceCoverStyle
     permission_classes = (DRYPermissions, ObjectOwnerHasPremium)
     queryset = models.MediaResourceCoverStyle.objects.all()
     serializer_class = serializers.MediaResourceCoverStyleSerializer
@@ -234,7 +262,9 @@ class MediaResourceCoverStyleDetailView(generics.RetrieveUpdateDestroyAPIView):
         return media_resource_cover_style.km_user.user
 
 
-class MediaResourceCoverStyleListView(generics.ListCreateAPIView):
+class MediaResourceCoverStyleListView(
+    IdempotentCreateMixin, KMUserResponseCacheMixin, generics.ListCreateAPIView
+):
     """
     get:
     Get a list of the media resource categories belonging to a specific Know Me
@@ -285,7 +315,11 @@ class MediaResourceCoverStyleListView(generics.ListCreateAPIView):
         return serializer.save(km_user=km_user)
 
 
-class ProfileDetailView(generics.RetrieveUpdateDestroyAPIView):
+class ProfileDetailView(
+    KMUserResponseCacheMixin,
+    SparseFieldsetViewMixin,
+    generics.RetrieveUpdateDestroyAPIView,
+):
     """
     delete:
     Delete a specific profile.
@@ -300,6 +334,7 @@ class ProfileDetailView(generics.RetrieveUpdateDestroyAPIView):
     Update a specific profile.
     """
 
+    km_user_lookup_model = models.Profile
     permission_classes = (DRYPermissions, ObjectOwnerHasPremium)
     queryset = models.Profile.objects.all()
     serializer_class = serializers.ProfileDetailSerializer
@@ -322,7 +357,13 @@ class ProfileDetailView(generics.RetrieveUpdateDestroyAPIView):
         return profile.km_user.user
 
 
-class ProfileListView(SortView, generics.ListCreateAPIView):
+class ProfileListView(
+    IdempotentCreateMixin,
+    KMUserResponseCacheMixin,
+    SparseFieldsetViewMixin,
+    SortView,
+    generics.ListCreateAPIView,
+):
     """
     get:
     List the profiles of a specific Know Me user.
@@ -382,7 +423,11 @@ class ProfileListView(SortView, generics.ListCreateAPIView):
         return serializer.save(km_user=km_user)
 
 
-class ProfileItemDetailView(generics.RetrieveUpdateDestroyAPIView):
+class ProfileItemDetailView(
+    KMUserResponseCacheMixin,
+    SparseFieldsetViewMixin,
+    generics.RetrieveUpdateDestroyAPIView,
+):
     """
     delete:
     Delete a specific profile item.
@@ -397,6 +442,7 @@ class ProfileItemDetailView(generics.RetrieveUpdateDestroyAPIView):
     Update a specific profile item's information.
     """
 
+    km_user_lookup_model = models.ProfileItem
     permission_classes = (DRYPermissions, ObjectOwnerHasPremium)
     queryset = models.ProfileItem.objects.all()
     serializer_class = serializers.ProfileItemDetailSerializer
@@ -416,10 +462,16 @@ class ProfileItemDetailView(generics.RetrieveUpdateDestroyAPIView):
         Returns:
             The owner of the profile item.
         """
-        return profile_item.topic.profile.km_user.user
+        return profile_item.km_user.user
 
 
-class ProfileItemListView(SortView, generics.ListCreateAPIView):
+class ProfileItemListView(
+    IdempotentCreateMixin,
+    KMUserResponseCacheMixin,
+    SparseFieldsetViewMixin,
+    SortView,
+    generics.ListCreateAPIView,
+):
     """
     get:
     List the profile items that belong to the specified topic.
@@ -431,6 +483,7 @@ class ProfileItemListView(SortView, generics.ListCreateAPIView):
     Set the order of the items in the specified topic.
     """
 
+    km_user_lookup_model = models.ProfileTopic
     permission_classes = (
         DRYPermissions,
         permissions.HasProfileItemListPermissions,
@@ -482,7 +535,11 @@ class ProfileItemListView(SortView, generics.ListCreateAPIView):
 
         pk = self.kwargs.get("pk")
         if pk is not None:
-            context["km_user"] = KMUser.objects.get(profile__topic__pk=pk)
+            context["km_user"] = (
+                models.ProfileTopic.objects.select_related("km_user")
+                .get(pk=pk)
+                .km_user
+            )
         else:
             context["km_user"] = None
 
@@ -503,9 +560,11 @@ class ProfileItemListView(SortView, generics.ListCreateAPIView):
             The user who must have an active premium subscription in
             order for the collection of profile items to be accessed.
         """
-        return get_user_model().objects.get(
-            km_user__profile__topic__pk=self.kwargs.get("pk")
-        )
+        topic = models.ProfileTopic.objects.select_related(
+            "km_user__user"
+        ).get(pk=self.kwargs.get("pk"))
+
+        return topic.km_user.user
 
     def perform_create(self, serializer):
         """
@@ -524,7 +583,11 @@ class ProfileItemListView(SortView, generics.ListCreateAPIView):
         return serializer.save(topic=topic)
 
 
-class ProfileTopicDetailView(generics.RetrieveUpdateDestroyAPIView):
+class ProfileTopicDetailView(
+    KMUserResponseCacheMixin,
+    SparseFieldsetViewMixin,
+    generics.RetrieveUpdateDestroyAPIView,
+):
     """
     delete:
     Delete a specific profile topic.
@@ -539,6 +602,7 @@ class ProfileTopicDetailView(generics.RetrieveUpdateDestroyAPIView):
     Update a specific profile topic's information.
     """
 
+    km_user_lookup_model = models.ProfileTopic
     permission_classes = (DRYPermissions, ObjectOwnerHasPremium)
     queryset = models.ProfileTopic.objects.all()
     serializer_class = serializers.ProfileTopicListSerializer
@@ -558,10 +622,16 @@ class ProfileTopicDetailView(generics.RetrieveUpdateDestroyAPIView):
         Returns:
             The user who owns the specified profile topic.
         """
-        return topic.profile.km_user.user
+        return topic.km_user.user
 
 
-class ProfileTopicListView(SortView, generics.ListCreateAPIView):
+class ProfileTopicListView(
+    IdempotentCreateMixin,
+    KMUserResponseCacheMixin,
+    SparseFieldsetViewMixin,
+    SortView,
+    generics.ListCreateAPIView,
+):
     """
     get:
     List the topics that belong to the specified profile.
@@ -573,6 +643,7 @@ class ProfileTopicListView(SortView, generics.ListCreateAPIView):
     Set the order of the topics in the specified profile.
     """
 
+    km_user_lookup_model = models.Profile
     permission_classes = (
         DRYPermissions,
         permissions.HasProfileTopicListPermissions,
@@ -624,10 +695,12 @@ class ProfileTopicListView(SortView, generics.ListCreateAPIView):
         Returns:
             The owner of the collection.
         """
-        return get_user_model().objects.get(
-            km_user__profile__pk=self.kwargs.get("pk")
+        profile = models.Profile.objects.select_related("km_user__user").get(
+            pk=self.kwargs.get("pk")
         )
 
+        return profile.km_user.user
+
     def perform_create(self, serializer):
         """
         Create a new topic associated with the specified profile.
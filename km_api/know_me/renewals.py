@@ -0,0 +1,226 @@
+"""Functions used by the subscription worker to renew Apple receipts.
+
+Each receipt stores the time that it should next be checked. The index
+on that column acts as a schedule of upcoming renewals, so a worker can
+claim the receipts that are due and sleep until the next one is due
+instead of scanning every receipt on a fixed interval.
+"""
+
+import datetime
+import logging
+
+from django.db import transaction
+from django.db.models import Min
+from django.utils import timezone
+
+from know_me import models, subscriptions
+
+
+logger = logging.getLogger(__name__)
+
+
+LEASE_DURATION = datetime.timedelta(minutes=10)
+"""
+The amount of time a claimed receipt is hidden from other workers. If
+the worker that claimed it dies, the receipt becomes due again once the
+lease expires.
+"""
+
+MAX_RETRY_DELAY = datetime.timedelta(days=1)
+"""
+The longest delay between checks of a receipt that has not been
+renewed.
+"""
+
+RETRY_DELAY = datetime.timedelta(minutes=5)
+"""
+The delay before the first recheck of a receipt that has not been
+renewed. The delay is doubled for each subsequent attempt.
+"""
+
+
+def claim_receipts(limit):
+    """
+    Claim a batch of receipts whose renewal checks are due.
+
+    The rows are locked with ``SKIP LOCKED`` so that multiple workers
+    can claim receipts at the same time without claiming the same
+    receipt.
+
+    Args:
+        limit:
+            The maximum number of receipts to claim.
+
+    Returns:
+        A list of the claimed receipts.
+    """
+    now = timezone.now()
+
+    with transaction.atomic():
+        receipts = list(
+            models.AppleReceipt.objects.select_for_update(skip_locked=True)
+            .filter(next_renewal_check__lte=now)
+            .order_by("next_renewal_check")[:limit]
+        )
+
+        for receipt in receipts:
+            receipt.next_renewal_check = now + LEASE_DURATION
+
+        models.AppleReceipt.objects.bulk_update(
+            receipts, ["next_renewal_check"]
+        )
+
+    return receipts
+
+
+def deactivate_orphan_subscriptions():
+    """
+    Deactivate all active subscriptions that do not have a payment
+    method associated with them.
+
+    The criteria for an orphan subscription are:
+
+    1. Active subscription.
+    2. No associated apple receipt.
+    3. Not a legacy subscription.
+
+    Each subscription is saved individually so that the cached responses
+    of its owner's Know Me users are invalidated.
+
+    Returns:
+        The number of deactivated subscriptions.
+    """
+    subscriptions = models.Subscription.objects.filter(
+        apple_receipt__isnull=True,
+        is_legacy_subscription=False,
+        is_active=True,
+    )
+
+    count = 0
+    for subscription in subscriptions:
+        subscription.is_active = False
+        subscription.save()
+        count += 1
+
+    return count
+
+
+def get_next_check_time():
+    """
+    Get the time that the next renewal check is due.
+
+    Returns:
+        The earliest scheduled renewal check, or ``None`` if there are
+        no receipts.
+    """
+    return models.AppleReceipt.objects.aggregate(
+        next_check=Min("next_renewal_check")
+    )["next_check"]
+
+
+def renew_receipt(receipt):
+    """
+    Check if a claimed receipt has been renewed and update its
+    subscription.
+
+    If the receipt has not been renewed yet, it is checked again after
+    an exponentially increasing delay. Cancelled receipts are deleted.
+    Only the fields that changed are saved.
+
+    Args:
+        receipt:
+            The receipt to renew.
+
+    """
+    now = timezone.now()
+    attempts = receipt.renewal_attempts
+    changed = set()
+
+    try:
+        changed.update(receipt.update_info())
+    except subscriptions.CancelledReceiptException as e:
+        logger.info(
+            "Apple receipt for original transaction %s has been cancelled "
+            "and will be deleted: %s",
+            receipt.transaction_id,
+            e.msg,
+        )
+        set_subscription_active(receipt.subscription_id, False)
+        receipt.delete()
+
+        return
+    except subscriptions.ReceiptException as e:
+        logger.info(
+            "Apple receipt %s failed validation: %s", receipt.pk, e.msg
+        )
+        is_active = False
+    except Exception:
+        # Errors communicating with Apple say nothing about the receipt,
+        # so the subscription is left alone until the next attempt.
+        logger.exception("Failed to renew Apple receipt %s", receipt.pk)
+        _schedule_retry(receipt, attempts, now)
+        receipt.save(update_fields=["next_renewal_check", "renewal_attempts"])
+
+        return
+    else:
+        is_active = receipt.expiration_time >= now
+
+    # Receipts whose renewal window has already started were not renewed
+    # by Apple yet.
+    if receipt.next_renewal_check <= now or not is_active:
+        _schedule_retry(receipt, attempts, now)
+        changed.update(["next_renewal_check", "renewal_attempts"])
+
+    # Only the changed fields are written so that the compressed receipt
+    # data is not rewritten when Apple returns the same receipt.
+    if changed:
+        receipt.save(update_fields=changed)
+
+    set_subscription_active(receipt.subscription_id, is_active)
+
+
+def set_subscription_active(subscription_id, is_active):
+    """
+    Set the status of a subscription.
+
+    The subscription is saved rather than updated in bulk so that the
+    signals invalidating the cached responses of its owner's Know Me
+    users are sent.
+
+    Args:
+        subscription_id:
+            The ID of the subscription to update.
+        is_active:
+            A boolean indicating if the subscription is active.
+    """
+    subscription = models.Subscription.objects.filter(
+        pk=subscription_id
+    ).first()
+
+    if subscription is not None and subscription.is_active != is_active:
+        subscription.is_active = is_active
+        subscription.save()
+
+
+def _schedule_retry(receipt, attempts, now):
+    """
+    Schedule the next check of a receipt that has not been renewed.
+
+    A receipt that has not expired yet is always checked again before
+    it expires so that its subscription is not left active afterwards.
+
+    Args:
+        receipt:
+            The receipt to schedule.
+        attempts:
+            The number of earlier checks that found the receipt had not
+            been renewed.
+        now:
+            The current time.
+    """
+    next_check = now + min(RETRY_DELAY * 2 ** attempts, MAX_RETRY_DELAY)
+    if receipt.expiration_time > now:
+        next_check = min(next_check, receipt.expiration_time)
+
+    receipt.next_renewal_check = next_check
+    receipt.renewal_attempts = attempts + 1
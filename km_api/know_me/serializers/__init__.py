@@ -10,8 +10,19 @@ from rest_framework import serializers
 from rest_framework.settings import api_settings
 
 from account.serializers import UserInfoSerializer
+from custom_storages.serializers import (
+    ImageDerivativesField,
+    UploadRequestSerializer,
+    UploadTokenField,
+)
 from know_me import models
+from know_me.list_serializers import KMListSerializer
+from know_me.journal import models as journal_models
+from know_me.profile import models as profile_models
 from know_me.profile.serializers import ProfileListSerializer
+from permission_utils.serializers import BatchPermissionsField
+from serializer_utils.fields import TemplatedHyperlinkedIdentityField
+from serializer_utils.mixins import SparseFieldsetMixin
 
 
 class ConfigSerializer(serializers.ModelSerializer):
@@ -39,30 +50,38 @@ class KMUserInfoSerializer(serializers.ModelSerializer):
         model = models.KMUser
 
 
-class KMUserListSerializer(serializers.HyperlinkedModelSerializer):
+class KMUserListSerializer(
+    SparseFieldsetMixin, serializers.HyperlinkedModelSerializer
+):
     """
     Serializer for multiple ``KMUser`` instances.
     """
 
+    image_derivatives = ImageDerivativesField(
+        help_text=_("URLs of resized copies of the Know Me user's image."),
+        source="image",
+    )
     is_premium_user = serializers.BooleanField(read_only=True)
     is_owned_by_current_user = serializers.SerializerMethodField()
-    journal_entries_url = serializers.HyperlinkedIdentityField(
+    journal_entries_url = TemplatedHyperlinkedIdentityField(
         view_name="know-me:journal:entry-list"
     )
-    media_resource_cover_styles_url = serializers.HyperlinkedIdentityField(
+    media_resource_cover_styles_url = TemplatedHyperlinkedIdentityField(
         view_name="know-me:profile:media-resource-cover-style-list"
     )
-    media_resources_url = serializers.HyperlinkedIdentityField(
+    media_resources_url = TemplatedHyperlinkedIdentityField(
         view_name="know-me:profile:media-resource-list"
     )
-    permissions = DRYPermissionsField()
-    profiles_url = serializers.HyperlinkedIdentityField(
+    permissions = BatchPermissionsField()
+    profiles_url = TemplatedHyperlinkedIdentityField(
         view_name="know-me:profile:profile-list"
     )
-    url = serializers.HyperlinkedIdentityField(
-        view_name="know-me:km-user-detail"
-    )
+    url = TemplatedHyperlinkedIdentityField(view_name="know-me:km-user-detail")
     user_image = serializers.ImageField(read_only=True, source="user.image")
+    user_image_derivatives = ImageDerivativesField(
+        help_text=_("URLs of resized copies of the owner's image."),
+        source="user.image",
+    )
 
     class Meta:
         extra_kwargs = {
@@ -75,6 +94,7 @@ class KMUserListSerializer(serializers.HyperlinkedModelSerializer):
                 )
             },
         }
+        field_prefetches = {"profiles": ("profiles",)}
         fields = (
             "id",
             "url",
@@ -84,6 +104,7 @@ class KMUserListSerializer(serializers.HyperlinkedModelSerializer):
             "is_premium_user",
             "is_owned_by_current_user",
             "image",
+            "image_derivatives",
             "journal_entries_url",
             "media_resource_cover_styles_url",
             "media_resources_url",
@@ -92,7 +113,9 @@ class KMUserListSerializer(serializers.HyperlinkedModelSerializer):
             "profiles_url",
             "quote",
             "user_image",
+            "user_image_derivatives",
         )
+        list_serializer_class = KMListSerializer
         model = models.KMUser
         read_only_fields = ("is_legacy_user",)
 
@@ -119,10 +142,81 @@ class KMUserDetailSerializer(KMUserListSerializer):
     This serializer builds off of the ``KMUserListSerializer``.
     """
 
+    image_upload_token = UploadTokenField(
+        models.KMUser._meta.get_field("image"),
+        help_text=_(
+            "A token for an image uploaded using the Know Me user's upload "
+            "endpoint. Setting this field replaces the user's image."
+        ),
+        source="image",
+    )
     profiles = ProfileListSerializer(many=True, read_only=True)
 
     class Meta(KMUserListSerializer.Meta):
-        fields = KMUserListSerializer.Meta.fields + ("permissions", "profiles")
+        fields = KMUserListSerializer.Meta.fields + (
+            "image_upload_token",
+            "permissions",
+            "profiles",
+        )
+
+
+class KMUserUploadSerializer(UploadRequestSerializer):
+    """
+    Serializer for requesting a direct upload of a file owned by a Know
+    Me user.
+    """
+
+    # Each target maps to the file field being uploaded and a function
+    # that builds an unsaved instance which can be used to generate the
+    # upload path for the given Know Me user.
+    TARGETS = {
+        "journal-entry-attachment": (
+            journal_models.Entry._meta.get_field("attachment"),
+            lambda km_user: journal_models.Entry(km_user=km_user),
+        ),
+        "km-user-image": (
+            models.KMUser._meta.get_field("image"),
+            lambda km_user: km_user,
+        ),
+        "media-resource-file": (
+            profile_models.MediaResource._meta.get_field("file"),
+            lambda km_user: profile_models.MediaResource(km_user=km_user),
+        ),
+        "profile-item-image": (
+            profile_models.ProfileItem._meta.get_field("image"),
+            lambda km_user: profile_models.ProfileItem(km_user=km_user),
+        ),
+    }
+
+    target = serializers.ChoiceField(
+        choices=sorted(TARGETS.keys()),
+        help_text=_("The type of file being uploaded."),
+        write_only=True,
+    )
+
+    def create(self, validated_data):
+        """
+        Create an upload for the requested target.
+
+        Args:
+            validated_data:
+                The validated data provided to the serializer. The Know
+                Me user who will own the file must be passed as the
+                ``km_user`` argument to ``save``.
+
+        Returns:
+            A dictionary describing the new upload.
+        """
+        field, build_instance = self.TARGETS[validated_data.pop("target")]
+        km_user = validated_data.pop("km_user")
+
+        return super().create(
+            {
+                **validated_data,
+                "field": field,
+                "instance": build_instance(km_user),
+            }
+        )
 
 
 class KMUserAccessorAcceptSerializer(serializers.ModelSerializer):
@@ -140,12 +234,12 @@ class KMUserAccessorSerializer(serializers.HyperlinkedModelSerializer):
     Serializer for ``KMUserAccessor`` instances.
     """
 
-    accept_url = serializers.HyperlinkedIdentityField(
+    accept_url = TemplatedHyperlinkedIdentityField(
         view_name="know-me:accessor-accept"
     )
     km_user = KMUserInfoSerializer(read_only=True)
     permissions = DRYPermissionsField(additional_actions=["accept"])
-    url = serializers.HyperlinkedIdentityField(
+    url = TemplatedHyperlinkedIdentityField(
         view_name="know-me:accessor-detail"
     )
     user_with_access = UserInfoSerializer(read_only=True)
@@ -221,7 +315,7 @@ class LegacyUserSerializer(serializers.HyperlinkedModelSerializer):
     Serializer for legacy users.
     """
 
-    url = serializers.HyperlinkedIdentityField(
+    url = TemplatedHyperlinkedIdentityField(
         view_name="know-me:legacy-user-detail"
     )
 
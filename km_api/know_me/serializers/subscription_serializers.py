@@ -118,6 +118,14 @@ class AppleReceiptSerializer(serializers.ModelSerializer):
     Serializer for an Apple receipt.
     """
 
+    # The receipt data is stored compressed, so it is not mapped to a
+    # text field automatically.
+    receipt_data = serializers.CharField(
+        help_text=_(
+            "The base64 encoded data used to identify the receipt with Apple."
+        )
+    )
+
     class Meta:
         fields = (
             "id",
@@ -162,7 +170,7 @@ class AppleReceiptSerializer(serializers.ModelSerializer):
             The validated data.
         """
         self.instance = self.instance or models.AppleReceipt()
-        self.instance.receipt_data = data["receipt_data"]
+        self.instance.set_receipt_data(data["receipt_data"])
 
         try:
             self.instance.update_info()
@@ -233,9 +241,13 @@ class SubscriptionTransferSerializer(serializers.Serializer):
 
         with transaction.atomic():
             models.Subscription.objects.filter(user=recipient).delete()
-            models.Subscription.objects.filter(user=owner).update(
-                user=recipient
-            )
+
+            # The subscription is saved rather than updated in bulk so
+            # that the cached responses of both users' Know Me users are
+            # invalidated.
+            subscription = models.Subscription.objects.get(user=owner)
+            subscription.user = recipient
+            subscription.save()
 
     def validate(self, data):
         """
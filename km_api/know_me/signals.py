@@ -1,17 +1,40 @@
 import logging
 
-from django.db.models.signals import post_save
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 from rest_email_auth.models import EmailAddress
 from rest_email_auth.signals import user_registered
 
-from know_me import models
+from custom_storages import derivatives
+from know_me import access, cache as response_cache, models
+from know_me.journal.models import Entry, EntryComment
+from know_me.profile.models import (
+    ListEntry,
+    MediaResource,
+    MediaResourceCoverStyle,
+    Profile,
+    ProfileItem,
+    ProfileTopic,
+)
 
 
 logger = logging.getLogger(__name__)
 
 
+@receiver(post_delete, sender=models.KMUserAccessor)
+def remove_accessor_access(instance, **kwargs):
+    """
+    Remove the access granted by an accessor that was deleted.
+
+    Args:
+        instance:
+            The accessor that was deleted.
+    """
+    access.remove_accessor_access(instance)
+
+
 @receiver(user_registered)
 def create_km_user(user, **kwargs):
     """
@@ -29,6 +52,181 @@ def create_km_user(user, **kwargs):
     logger.info("Created Know Me user for user %s", user)
 
 
+@receiver(post_delete, sender=Entry)
+@receiver(post_delete, sender=ListEntry)
+@receiver(post_delete, sender=MediaResource)
+@receiver(post_delete, sender=MediaResourceCoverStyle)
+@receiver(post_delete, sender=models.KMUser)
+@receiver(post_delete, sender=models.KMUserAccessor)
+@receiver(post_delete, sender=Profile)
+@receiver(post_delete, sender=ProfileItem)
+@receiver(post_delete, sender=ProfileTopic)
+@receiver(post_save, sender=Entry)
+@receiver(post_save, sender=ListEntry)
+@receiver(post_save, sender=MediaResource)
+@receiver(post_save, sender=MediaResourceCoverStyle)
+@receiver(post_save, sender=models.KMUser)
+@receiver(post_save, sender=models.KMUserAccessor)
+@receiver(post_save, sender=Profile)
+@receiver(post_save, sender=ProfileItem)
+@receiver(post_save, sender=ProfileTopic)
+def invalidate_response_cache(instance, raw=False, **kwargs):
+    """
+    Invalidate the cached responses of the Know Me user who owns an
+    instance that was saved or deleted.
+
+    If the instance was moved to a different Know Me user, the cached
+    responses of the previous owner are also invalidated.
+
+    Args:
+        instance:
+            The instance that was saved or deleted.
+        raw:
+            A boolean indicating if the instance is being loaded from a
+            fixture.
+    """
+    if raw:
+        return
+
+    if isinstance(instance, models.KMUser):
+        response_cache.bump_generation(instance.pk)
+    else:
+        response_cache.bump_generation(
+            instance.km_user_id, getattr(instance, "_saved_km_user_id", None)
+        )
+
+
+@receiver(post_delete, sender=EntryComment)
+@receiver(post_save, sender=EntryComment)
+def invalidate_comment_response_cache(instance, raw=False, **kwargs):
+    """
+    Invalidate the cached responses of the Know Me user who owns the
+    journal entry that a comment was saved on or deleted from.
+
+    Args:
+        instance:
+            The comment that was saved or deleted.
+        raw:
+            A boolean indicating if the instance is being loaded from a
+            fixture.
+    """
+    if raw:
+        return
+
+    # The entry may already be gone if it is being deleted along with
+    # its comments. In that case, deleting the entry invalidates the
+    # cache.
+    km_user_id = (
+        Entry.objects.filter(pk=instance.entry_id)
+        .values_list("km_user_id", flat=True)
+        .first()
+    )
+    response_cache.bump_generation(km_user_id)
+
+
+@receiver(post_delete, sender=models.AppleReceipt)
+@receiver(post_delete, sender=models.Subscription)
+@receiver(post_save, sender=models.AppleReceipt)
+@receiver(post_save, sender=models.Subscription)
+def invalidate_subscription_response_cache(instance, raw=False, **kwargs):
+    """
+    Invalidate the cached responses of the Know Me users owned by the
+    owner of a subscription or Apple receipt that was saved or deleted.
+
+    Some views are only available to the users of premium accounts, so
+    the responses cached for them depend on the owner's subscription.
+
+    Args:
+        instance:
+            The subscription or receipt that was saved or deleted.
+        raw:
+            A boolean indicating if the instance is being loaded from a
+            fixture.
+    """
+    if raw:
+        return
+
+    if isinstance(instance, models.Subscription):
+        user_ids = [
+            instance.user_id,
+            getattr(instance, "_saved_user_id", None),
+        ]
+    else:
+        # The subscription may already be gone if it is being deleted
+        # along with its receipt, in which case deleting the
+        # subscription invalidates the cache.
+        user_ids = models.Subscription.objects.filter(
+            pk=instance.subscription_id
+        ).values_list("user_id", flat=True)
+
+    response_cache.bump_generation(
+        *models.KMUser.objects.filter(user__in=user_ids).values_list(
+            "pk", flat=True
+        )
+    )
+
+
+@receiver(post_save, sender=get_user_model())
+def invalidate_user_response_cache(
+    instance, raw=False, update_fields=None, **kwargs
+):
+    """
+    Invalidate the cached responses of the Know Me users owned by a user
+    who was saved.
+
+    Saves that only record a login are ignored since they happen every
+    time the user logs in and do not change any response.
+
+    Args:
+        instance:
+            The user who was saved.
+        raw:
+            A boolean indicating if the instance is being loaded from a
+            fixture.
+        update_fields:
+            The names of the fields that were saved, or ``None`` if
+            every field was saved.
+    """
+    if raw or (
+        update_fields is not None and set(update_fields) <= {"last_login"}
+    ):
+        return
+
+    response_cache.bump_generation(
+        *models.KMUser.objects.filter(user=instance).values_list(
+            "pk", flat=True
+        )
+    )
+
+
+@receiver(post_save, sender=get_user_model())
+@receiver(post_save, sender=models.KMUser)
+@receiver(post_save, sender=ProfileItem)
+def schedule_image_derivatives(instance, raw=False, **kwargs):
+    """
+    Schedule the generation of resized copies of an instance's image.
+
+    The derivatives are only scheduled if the instance was saved with a
+    different image than the one it was loaded with.
+
+    Args:
+        instance:
+            The instance that was just saved.
+        raw:
+            A boolean indicating if the instance is being loaded from a
+            fixture.
+    """
+    if raw or not instance.image:
+        return
+
+    if instance.image.name == getattr(instance, "_saved_image_name", None):
+        return
+
+    derivatives.schedule_derivatives(
+        instance._meta.get_field("image"), instance.image.name
+    )
+
+
 @receiver(post_save, sender=EmailAddress)
 def update_accessor(instance, **kwargs):
     """
@@ -75,3 +273,39 @@ def update_accessor(instance, **kwargs):
         accessor.save()
 
         logger.info("Updated KMUserAccessor for email %s", instance.email)
+
+
+@receiver(post_save, sender=models.KMUserAccessor)
+def update_accessor_access(instance, raw=False, **kwargs):
+    """
+    Update the access granted by an accessor that was saved.
+
+    Args:
+        instance:
+            The accessor that was saved.
+        raw:
+            A boolean indicating if the instance is being loaded from a
+            fixture, in which case the access is not updated.
+    """
+    if raw:
+        return
+
+    access.update_accessor_access(instance)
+
+
+@receiver(post_save, sender=models.KMUser)
+def update_owner_access(instance, raw=False, **kwargs):
+    """
+    Grant the owner of a Know Me user that was saved access to it.
+
+    Args:
+        instance:
+            The Know Me user that was saved.
+        raw:
+            A boolean indicating if the instance is being loaded from a
+            fixture, in which case the access is not updated.
+    """
+    if raw:
+        return
+
+    access.update_owner_access(instance)
@@ -0,0 +1,119 @@
+"""Coalescing of concurrent calls that do the same work.
+
+Only one call for a key is in flight at a time. Callers that arrive
+while a call is in flight wait for it and share its result rather than
+repeating the work. Calls made by threads of the same process share a
+future. Calls made by other processes are coordinated through a lock in
+the cache. The result of the call is stored in the cache under the
+lock's token so that only the callers that waited for that call can
+see it.
+"""
+
+import threading
+import time
+import uuid
+from concurrent import futures
+
+from django.core.cache import cache
+
+
+LOCK_KEY = "know-me:single-flight:lock:{key}"
+RESULT_KEY = "know-me:single-flight:result:{token}"
+
+LOCK_TIMEOUT = 60
+"""
+The number of seconds that a call may hold the lock for its key. A
+caller stops waiting and makes its own call once the lock expires.
+"""
+
+POLL_INTERVAL = 0.05
+"""
+The number of seconds between checks of a lock held by another process.
+"""
+
+_flights = {}
+_flights_lock = threading.Lock()
+_missing = object()
+
+
+def call(key, func, *args, **kwargs):
+    """
+    Call a function unless a call for the same key is already in
+    flight, in which case wait for that call's result.
+
+    Args:
+        key:
+            A string identifying the work done by the call.
+        func:
+            The function to call.
+        *args:
+            Positional arguments to pass to the function.
+        **kwargs:
+            Keyword arguments to pass to the function.
+
+    Returns:
+        The result of the call.
+
+    Raises:
+        Exception:
+            Any exception raised by a call made in this process.
+    """
+    with _flights_lock:
+        future = _flights.get(key)
+        is_leader = future is None
+        if is_leader:
+            future = futures.Future()
+            _flights[key] = future
+
+    if not is_leader:
+        return future.result()
+
+    try:
+        result = _call_across_processes(key, func, *args, **kwargs)
+    except BaseException as e:
+        future.set_exception(e)
+
+        raise
+    else:
+        future.set_result(result)
+
+        return result
+    finally:
+        with _flights_lock:
+            del _flights[key]
+
+
+def _call_across_processes(key, func, *args, **kwargs):
+    """
+    Call a function unless another process has a call for the same key
+    in flight.
+
+    If the other process's call fails, the lock is taken over and the
+    function is called again.
+    """
+    lock_key = LOCK_KEY.format(key=key)
+    deadline = time.monotonic() + LOCK_TIMEOUT
+
+    while True:
+        token = uuid.uuid4().hex
+        if cache.add(lock_key, token, LOCK_TIMEOUT):
+            try:
+                result = func(*args, **kwargs)
+                cache.set(RESULT_KEY.format(token=token), result, LOCK_TIMEOUT)
+
+                return result
+            finally:
+                if cache.get(lock_key) == token:
+                    cache.delete(lock_key)
+
+        leader_token = cache.get(lock_key)
+        while leader_token is not None and cache.get(lock_key) == leader_token:
+            if time.monotonic() >= deadline:
+                return func(*args, **kwargs)
+
+            time.sleep(POLL_INTERVAL)
+
+        if leader_token is not None:
+            result = cache.get(RESULT_KEY.format(token=leader_token), _missing)
+            if result is not _missing:
+                return result
@@ -1,16 +1,25 @@
 import datetime
 import enum
+import hashlib
 import logging
 
 from django.conf import settings
 from django.utils.translation import ugettext_lazy as _, ugettext
 
 from apple.receipts import get_receipt_info
+from know_me import single_flight
 
 
 logger = logging.getLogger(__name__)
 
 
+RENEWAL_WINDOW = datetime.timedelta(hours=1)
+"""
+The amount of time prior to an existing subscription's expiration
+date that we should begin attempting to renew it.
+"""
+
+
 class AppleReceiptCodes(enum.IntEnum):
     """
     Enum containing the possible status codes that can be returned from
@@ -178,6 +187,9 @@ def validate_apple_receipt(receipt_data):
     server, passes that to the validation method, then returns the
     result.
 
+    Concurrent validations of the same receipt, such as those made when
+    a user restores their purchases, share a single request to Apple.
+
     Args:
         receipt_data:
             The receipt data to validate.
@@ -186,7 +198,10 @@ def validate_apple_receipt(receipt_data):
         The output of the :py:func:`validate_apple_receipt_response`
         function.
     """
-    receipt_info = get_receipt_info(receipt_data)
+    receipt_hash = hashlib.sha256(receipt_data.encode()).hexdigest()
+    receipt_info = single_flight.call(
+        f"apple-receipt:{receipt_hash}", get_receipt_info, receipt_data
+    )
 
     return validate_apple_receipt_response(receipt_info)
 
@@ -0,0 +1,32 @@
+from know_me import access, models
+
+
+def test_rebuild_access(
+    km_user_accessor_factory, km_user_factory, user_factory,
+):
+    """
+    Rebuilding the access should replace the existing entries with one
+    for the owner of each Know Me user and one for each accepted
+    accessor.
+    """
+    km_user = km_user_factory()
+    accessor = km_user_accessor_factory(
+        is_accepted=True,
+        is_admin=True,
+        km_user=km_user,
+        user_with_access=user_factory(),
+    )
+    km_user_accessor_factory(
+        is_accepted=False, km_user=km_user, user_with_access=user_factory()
+    )
+    models.KMUserAccess.objects.all().delete()
+
+    count = access.rebuild_access()
+
+    entries = models.KMUserAccess.objects.order_by("-is_owner")
+
+    assert count == 2
+    assert [(e.user, e.is_owner, e.can_write) for e in entries] == [
+        (km_user.user, True, True),
+        (accessor.user_with_access, False, True),
+    ]
@@ -0,0 +1,68 @@
+from know_me import access, models
+
+
+def test_update_accepted(km_user_accessor_factory, user_factory):
+    """
+    Accepting an accessor should give its user access to the Know Me
+    user.
+    """
+    accessor = km_user_accessor_factory(
+        is_accepted=True, is_admin=False, user_with_access=user_factory()
+    )
+
+    access.update_accessor_access(accessor)
+
+    entry = models.KMUserAccess.objects.get(user=accessor.user_with_access)
+
+    assert entry.km_user == accessor.km_user
+    assert not entry.can_see_private
+    assert not entry.can_write
+    assert not entry.is_owner
+
+
+def test_update_admin(km_user_accessor_factory, user_factory):
+    """
+    Making an accessor an admin should allow its user to modify the
+    Know Me user and see its private profiles.
+    """
+    accessor = km_user_accessor_factory(
+        is_accepted=True, is_admin=False, user_with_access=user_factory()
+    )
+    accessor.is_admin = True
+
+    access.update_accessor_access(accessor)
+
+    entry = models.KMUserAccess.objects.get(user=accessor.user_with_access)
+
+    assert entry.can_see_private
+    assert entry.can_write
+
+
+def test_update_not_accepted(km_user_accessor_factory, user_factory):
+    """
+    An accessor that has not been accepted should not grant access.
+    """
+    accessor = km_user_accessor_factory(
+        is_accepted=True, user_with_access=user_factory()
+    )
+    accessor.is_accepted = False
+
+    access.update_accessor_access(accessor)
+
+    assert not models.KMUserAccess.objects.filter(
+        user=accessor.user_with_access
+    ).exists()
+
+
+def test_update_without_user(km_user_accessor_factory):
+    """
+    An accessor that has not been linked to a user should not create an
+    access entry.
+    """
+    accessor = km_user_accessor_factory(is_accepted=True)
+
+    access.update_accessor_access(accessor)
+
+    assert not models.KMUserAccess.objects.filter(
+        is_owner=False, km_user=accessor.km_user
+    ).exists()
@@ -0,0 +1,35 @@
+from know_me import access, models
+
+
+def test_update_owner_access(km_user_factory):
+    """
+    The owner of a Know Me user should have full access to it.
+    """
+    km_user = km_user_factory()
+    models.KMUserAccess.objects.all().delete()
+
+    access.update_owner_access(km_user)
+
+    entry = models.KMUserAccess.objects.get(km_user=km_user)
+
+    assert entry.user == km_user.user
+    assert entry.can_see_private
+    assert entry.can_write
+    assert entry.is_owner
+
+
+def test_update_owner_changed(km_user_factory, user_factory):
+    """
+    If the owner of a Know Me user changes, the previous owner should
+    lose their access.
+    """
+    km_user = km_user_factory()
+    previous_owner = km_user.user
+    km_user.user = user_factory()
+
+    access.update_owner_access(km_user)
+
+    assert not models.KMUserAccess.objects.filter(user=previous_owner).exists()
+    assert models.KMUserAccess.objects.filter(
+        is_owner=True, user=km_user.user
+    ).exists()
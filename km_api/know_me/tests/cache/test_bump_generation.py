@@ -0,0 +1,18 @@
+from know_me import cache
+
+
+def test_bump_generation(km_user_factory):
+    """
+    Bumping the generation of a Know Me user should change the
+    generation of that Know Me user only.
+    """
+    km_user = km_user_factory()
+    other_km_user = km_user_factory()
+
+    generation = cache.get_generation(km_user.pk)
+    other_generation = cache.get_generation(other_km_user.pk)
+
+    cache.bump_generation(km_user.pk, None)
+
+    assert cache.get_generation(km_user.pk) != generation
+    assert cache.get_generation(other_km_user.pk) == other_generation
@@ -0,0 +1,85 @@
+import datetime
+
+from django.contrib.auth.models import AnonymousUser
+from django.utils import timezone
+
+from know_me import cache, models
+
+
+def test_get_access_level_anonymous(km_user_factory):
+    """
+    Anonymous users should not have an access level.
+    """
+    km_user = km_user_factory()
+
+    assert cache.get_access_level(AnonymousUser(), km_user.pk) is None
+
+
+def test_get_access_level_no_access(km_user_factory, user_factory):
+    """
+    Users without access to the Know Me user should not have an access
+    level.
+    """
+    km_user = km_user_factory()
+
+    assert cache.get_access_level(user_factory(), km_user.pk) is None
+
+
+def test_get_access_level_receipt_expired(
+    apple_receipt_factory, km_user_factory
+):
+    """
+    The access level should change as soon as the receipt of the owner's
+    subscription expires, even if nothing is saved.
+    """
+    km_user = km_user_factory()
+    receipt = apple_receipt_factory(
+        expiration_time=timezone.now() + datetime.timedelta(days=1),
+        subscription__is_active=True,
+        subscription__user=km_user.user,
+    )
+    premium_level = cache.get_access_level(km_user.user, km_user.pk)
+
+    models.AppleReceipt.objects.filter(pk=receipt.pk).update(
+        expiration_time=timezone.now() - datetime.timedelta(days=1)
+    )
+
+    assert cache.get_access_level(km_user.user, km_user.pk) != premium_level
+
+
+def test_get_access_level_shared(
+    km_user_accessor_factory, km_user_factory, user_factory
+):
+    """
+    Users with different access to a Know Me user should have different
+    access levels while users with the same access should share one.
+    """
+    km_user = km_user_factory()
+    admin = km_user_accessor_factory(
+        is_accepted=True,
+        is_admin=True,
+        km_user=km_user,
+        user_with_access=user_factory(),
+    )
+    viewers = [
+        km_user_accessor_factory(
+            is_accepted=True,
+            is_admin=False,
+            km_user=km_user,
+            user_with_access=user_factory(),
+        )
+        for _ in range(2)
+    ]
+
+    levels = [
+        cache.get_access_level(user, km_user.pk)
+        for user in (
+            km_user.user,
+            admin.user_with_access,
+            viewers[0].user_with_access,
+            viewers[1].user_with_access,
+        )
+    ]
+
+    assert len(set(levels[:3])) == 3
+    assert levels[2] == levels[3]
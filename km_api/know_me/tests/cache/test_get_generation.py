@@ -0,0 +1,21 @@
+from django.core.cache import cache as django_cache
+
+from know_me import cache
+
+
+def test_get_generation_evicted():
+    """
+    If the generation is evicted from the cache, a new generation should
+    be created rather than reusing the previous one.
+    """
+    generation = cache.get_generation(1)
+    django_cache.delete(cache.GENERATION_KEY.format(km_user_id=1))
+
+    assert cache.get_generation(1) != generation
+
+
+def test_get_generation_stable():
+    """
+    The generation should not change until it is bumped.
+    """
+    assert cache.get_generation(1) == cache.get_generation(1)
@@ -0,0 +1,64 @@
+import json
+
+from know_me import export
+
+
+def test_iter_export_records(
+    journal_entry_comment_factory,
+    km_user_factory,
+    media_resource_factory,
+    profile_list_entry_factory,
+):
+    """
+    The export should include a record for each object owned by the
+    Know Me user.
+    """
+    km_user = km_user_factory()
+    list_entry = profile_list_entry_factory(
+        profile_item__topic__profile__km_user=km_user
+    )
+    resource = media_resource_factory(km_user=km_user)
+    comment = journal_entry_comment_factory(entry__km_user=km_user)
+
+    records = list(export.iter_export_records(km_user))
+    ids_by_type = {}
+    for record in records:
+        ids_by_type.setdefault(record["type"], []).append(record["data"]["id"])
+
+    item = list_entry.profile_item
+    assert ids_by_type == {
+        "km_user": [km_user.pk],
+        "profile": [item.topic.profile.pk],
+        "profile_topic": [item.topic.pk],
+        "profile_item": [item.pk],
+        "list_entry": [list_entry.pk],
+        "media_resource": [resource.pk],
+        "journal_entry": [comment.entry.pk],
+        "journal_entry_comment": [comment.pk],
+    }
+
+
+def test_iter_export_records_other_user(km_user_factory, profile_factory):
+    """
+    Records owned by other Know Me users should not be exported.
+    """
+    km_user = km_user_factory()
+    profile_factory()
+
+    records = list(export.iter_export_records(km_user))
+
+    assert [record["type"] for record in records] == ["km_user"]
+
+
+def test_iter_ndjson(km_user_factory, profile_factory):
+    """
+    Each exported record should be encoded as a single line of JSON.
+    """
+    km_user = km_user_factory()
+    profile = profile_factory(km_user=km_user, name="Profile")
+
+    lines = list(export.iter_ndjson(km_user))
+
+    assert len(lines) == 2
+    assert all(line.endswith(b"\n") for line in lines)
+    assert json.loads(lines[1])["data"]["name"] == profile.name
@@ -0,0 +1,54 @@
+import io
+import json
+import zipfile
+
+from know_me import export
+
+
+def test_iter_zip(journal_entry_factory, km_user_factory, text_file):
+    """
+    The zip export should contain the exported records as well as the
+    files uploaded by the Know Me user.
+    """
+    km_user = km_user_factory()
+    entry = journal_entry_factory(attachment=text_file, km_user=km_user)
+
+    archive = zipfile.ZipFile(io.BytesIO(b"".join(export.iter_zip(km_user))))
+    data = archive.read(export.EXPORT_DATA_FILENAME).decode().splitlines()
+    media_name = f"{export.EXPORT_MEDIA_DIRECTORY}/{entry.attachment.name}"
+
+    assert [json.loads(line)["type"] for line in data] == [
+        "km_user",
+        "journal_entry",
+    ]
+    assert archive.read(media_name) == entry.attachment.read()
+
+
+def test_iter_zip_large_files(
+    journal_entry_factory, km_user_factory, text_file
+):
+    """
+    Every entry should be written in the zip64 format since the archive
+    is streamed and the size of an entry is not known when its header is
+    written.
+    """
+    km_user = km_user_factory()
+    journal_entry_factory(attachment=text_file, km_user=km_user)
+
+    archive = zipfile.ZipFile(io.BytesIO(b"".join(export.iter_zip(km_user))))
+
+    assert len(archive.infolist()) == 2
+    for info in archive.infolist():
+        assert info.extract_version >= zipfile.ZIP64_VERSION
+
+
+def test_iter_zip_missing_file(journal_entry_factory, km_user_factory):
+    """
+    Files that no longer exist in storage should be skipped.
+    """
+    km_user = km_user_factory()
+    journal_entry_factory(attachment="missing.txt", km_user=km_user)
+
+    archive = zipfile.ZipFile(io.BytesIO(b"".join(export.iter_zip(km_user))))
+
+    assert archive.namelist() == [export.EXPORT_DATA_FILENAME]
@@ -0,0 +1,58 @@
+import zlib
+
+from django.db import connection
+
+from know_me import models
+from know_me.fields import CompressedTextField
+
+
+def test_deconstruct():
+    """
+    Unlike binary fields, the field should be editable by default.
+    """
+    field = CompressedTextField()
+
+    _, _, _, kwargs = field.deconstruct()
+
+    assert field.editable
+    assert "editable" not in kwargs
+
+
+def test_round_trip(apple_receipt_factory):
+    """
+    Text saved to the field should be stored compressed and read back
+    unchanged.
+    """
+    receipt_data = "receipt-data" * 1000
+    receipt = apple_receipt_factory(receipt_data=receipt_data)
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT receipt_data FROM know_me_applereceipt WHERE id = %s",
+            [receipt.pk.hex],
+        )
+        stored = bytes(cursor.fetchone()[0])
+
+    assert zlib.decompress(stored).decode() == receipt_data
+    assert len(stored) < len(receipt_data)
+    assert (
+        models.AppleReceipt.objects.get(pk=receipt.pk).receipt_data
+        == receipt_data
+    )
+
+
+def test_to_python_empty():
+    """
+    An empty value should be converted to an empty string.
+    """
+    assert CompressedTextField().to_python(b"") == ""
+
+
+def test_value_to_string():
+    """
+    The field should be serialized as its text.
+    """
+    receipt = models.AppleReceipt(receipt_data="foo")
+    field = models.AppleReceipt._meta.get_field("receipt_data")
+
+    assert field.value_to_string(receipt) == "foo"
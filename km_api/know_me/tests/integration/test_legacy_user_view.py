@@ -57,3 +57,23 @@ def test_post_new_legacy_user(api_client, api_rf, user_factory):
     )
 
     assert response.data == serializer.data
+
+
+@pytest.mark.integration
+def test_post_retry_with_idempotency_key(api_client, user_factory):
+    """
+    Retrying a POST request with the same idempotency key should not
+    create a second legacy user.
+    """
+    user = user_factory(is_staff=True)
+    api_client.force_authenticate(user=user)
+
+    data = {"email": "test@example.com"}
+
+    first = api_client.post(url, data, HTTP_IDEMPOTENCY_KEY="retry")
+    retry = api_client.post(url, data, HTTP_IDEMPOTENCY_KEY="retry")
+
+    assert first.status_code == status.HTTP_201_CREATED
+    assert retry.status_code == status.HTTP_201_CREATED
+    assert retry.data == first.data
+    assert models.LegacyUser.objects.count() == 1
@@ -0,0 +1,32 @@
+import json
+
+import pytest
+from django.core import management
+
+
+def test_export_to_file(km_user_factory, profile_factory, tmp_path):
+    """
+    The command should write the export of the specified Know Me user to
+    the given file.
+    """
+    km_user = km_user_factory()
+    profile_factory(km_user=km_user)
+    output = tmp_path / "export.ndjson"
+
+    management.call_command("exportkmuser", km_user.pk, output=str(output))
+
+    lines = output.read_text().splitlines()
+
+    assert [json.loads(line)["type"] for line in lines] == [
+        "km_user",
+        "profile",
+    ]
+
+
+def test_export_missing_user(db):
+    """
+    Attempting to export a Know Me user that doesn't exist should raise
+    an error.
+    """
+    with pytest.raises(management.CommandError):
+        management.call_command("exportkmuser", 1)
@@ -0,0 +1,23 @@
+from unittest import mock
+
+from django.core import management
+
+from custom_storages import derivatives
+
+
+def test_generate(image, km_user_factory, profile_item_factory):
+    """
+    The command should generate the derivatives of every saved image.
+    """
+    km_user = km_user_factory(image=image)
+    item = profile_item_factory(image=None)
+
+    with mock.patch.object(
+        derivatives, "generate_derivatives", autospec=True
+    ) as mock_generate:
+        management.call_command("generateimagederivatives")
+
+    names = [call[0][1] for call in mock_generate.call_args_list]
+
+    assert km_user.image.name in names
+    assert item.image.name not in names
@@ -0,0 +1,17 @@
+from unittest import mock
+
+from django.core import management
+
+from know_me import access
+
+
+def test_rebuild():
+    """
+    The command should rebuild the access to every Know Me user.
+    """
+    with mock.patch.object(
+        access, "rebuild_access", autospec=True, return_value=3
+    ) as mock_rebuild:
+        management.call_command("rebuildkmuseraccess")
+
+    assert mock_rebuild.call_count == 1
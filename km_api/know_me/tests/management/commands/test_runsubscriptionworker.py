@@ -0,0 +1,51 @@
+import datetime
+from unittest import mock
+
+from django.core import management
+from django.utils import timezone
+
+from know_me import renewals
+from know_me.management.commands.runsubscriptionworker import Command
+
+
+def test_get_sleep_time(apple_receipt_factory):
+    """
+    The worker should sleep until the next receipt is due.
+    """
+    apple_receipt_factory(
+        next_renewal_check=timezone.now() + datetime.timedelta(seconds=60)
+    )
+
+    assert 50 < Command().get_sleep_time(300) <= 60
+
+
+def test_get_sleep_time_capped(apple_receipt_factory):
+    """
+    The worker should not sleep longer than the maximum sleep time.
+    """
+    apple_receipt_factory(
+        next_renewal_check=timezone.now() + datetime.timedelta(days=1)
+    )
+
+    assert Command().get_sleep_time(300) == 300
+
+
+def test_run_once(apple_receipt_factory):
+    """
+    Running the worker once should check every due receipt and exit.
+    """
+    due = timezone.now() - datetime.timedelta(minutes=1)
+    receipts = [
+        apple_receipt_factory(next_renewal_check=due) for _ in range(3)
+    ]
+
+    with mock.patch.object(
+        renewals, "renew_receipt", autospec=True
+    ) as mock_renew:
+        management.call_command(
+            "runsubscriptionworker", "--once", "--batch-size", "2"
+        )
+
+    assert sorted(c[0][0].pk for c in mock_renew.call_args_list) == sorted(
+        receipt.pk for receipt in receipts
+    )
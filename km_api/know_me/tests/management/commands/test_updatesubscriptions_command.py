@@ -11,6 +11,19 @@ PREMIUM_PRODUCT_CODE = "premium"
 RENEWAL_WINDOW = datetime.timedelta(hours=1)
 
 
+@pytest.fixture
+def mock_set_subscription_active():
+    """
+    Fixture to mock the function used to activate or deactivate a
+    subscription.
+    """
+    with mock.patch(
+        "know_me.management.commands.updatesubscriptions.renewals.set_subscription_active",  # noqa
+        autospec=True,
+    ) as mock_set_active:
+        yield mock_set_active
+
+
 @pytest.fixture
 def mock_subscription_qs():
     """
@@ -36,8 +49,11 @@ def test_deactivate_orphan_subscriptions(mock_subscription_qs):
     Subscriptions that have no receipts activating them should be
     deactivated.
     """
-    mock_filtered_qs = mock.Mock(name="Mock Subscription Queryset")
-    mock_subscription_qs.filter.return_value = mock_filtered_qs
+    orphans = [
+        mock.Mock(name=f"Mock Subscription {i}", is_active=True)
+        for i in range(3)
+    ]
+    mock_subscription_qs.filter.return_value = orphans
 
     result = Command.deactivate_orphan_subscriptions()
 
@@ -46,8 +62,13 @@ def test_deactivate_orphan_subscriptions(mock_subscription_qs):
         "is_legacy_subscription": False,
         "is_active": True,
     }
-    assert mock_filtered_qs.update.call_args[1] == {"is_active": False}
-    assert result == mock_filtered_qs.update.return_value
+    assert result == len(orphans)
+
+    # Each subscription is saved individually so the cached responses of
+    # its owner are invalidated.
+    for subscription in orphans:
+        assert not subscription.is_active
+        assert subscription.save.call_count == 1
 
 
 @mock.patch("know_me.management.commands.updatesubscriptions.timezone.now")
@@ -73,7 +94,7 @@ def test_handle(mock_update_apple, mock_deactivate_orphans, mock_now):
 
 
 def test_update_apple_subscriptions_cancelled(
-    mock_apple_receipt_qs, mock_subscription_qs
+    mock_apple_receipt_qs, mock_set_subscription_active
 ):
     """
     If an Apple subscription has been cancelled by Apple, the receipt
@@ -97,10 +118,10 @@ def test_update_apple_subscriptions_cancelled(
         "expiration_time__lte": now + RENEWAL_WINDOW
     }
     assert receipt.update_info.call_count == 1
-    assert mock_subscription_qs.filter.call_args[1] == {
-        "apple_receipt": receipt
-    }
-    assert mock_subscription_qs.update.call_args[1] == {"is_active": False}
+    assert mock_set_subscription_active.call_args[0] == (
+        receipt.subscription_id,
+        False,
+    )
 
     # Receipts that were cancelled should be deleted
     assert mock_apple_receipt_qs.filter.call_args_list[1][1] == {
@@ -110,7 +131,7 @@ def test_update_apple_subscriptions_cancelled(
 
 
 def test_update_apple_subscriptions_error(
-    mock_apple_receipt_qs, mock_subscription_qs
+    mock_apple_receipt_qs, mock_set_subscription_active
 ):
     """
     If there is an error when trying to update a receipt's information,
@@ -128,14 +149,14 @@ def test_update_apple_subscriptions_error(
         "expiration_time__lte": now + RENEWAL_WINDOW
     }
     assert receipt.update_info.call_count == 1
-    assert mock_subscription_qs.filter.call_args[1] == {
-        "apple_receipt": receipt
-    }
-    assert mock_subscription_qs.update.call_args[1] == {"is_active": False}
+    assert mock_set_subscription_active.call_args[0] == (
+        receipt.subscription_id,
+        False,
+    )
 
 
 def test_update_apple_subscriptions_expiring(
-    mock_apple_receipt_qs, mock_subscription_qs
+    mock_apple_receipt_qs, mock_set_subscription_active
 ):
     """
     If an Apple receipt's expiration time has passed, its parent
@@ -153,14 +174,14 @@ def test_update_apple_subscriptions_expiring(
         "expiration_time__lte": now + RENEWAL_WINDOW
     }
     assert receipt.update_info.call_count == 1
-    assert mock_subscription_qs.filter.call_args[1] == {
-        "apple_receipt": receipt
-    }
-    assert mock_subscription_qs.update.call_args[1] == {"is_active": False}
+    assert mock_set_subscription_active.call_args[0] == (
+        receipt.subscription_id,
+        False,
+    )
 
 
 def test_update_apple_subscriptions_renewed(
-    mock_apple_receipt_qs, mock_subscription_qs
+    mock_apple_receipt_qs, mock_set_subscription_active
 ):
     """
     If a receipt that had previously expired becomes active again, the
@@ -178,10 +199,10 @@ def test_update_apple_subscriptions_renewed(
         "expiration_time__lte": now + RENEWAL_WINDOW
     }
     assert receipt.update_info.call_count == 1
-    assert mock_subscription_qs.filter.call_args[1] == {
-        "apple_receipt": receipt
-    }
-    assert mock_subscription_qs.update.call_args[1] == {"is_active": True}
+    assert mock_set_subscription_active.call_args[0] == (
+        receipt.subscription_id,
+        True,
+    )
 
 
 def test_update_apple_subscriptions_still_valid(
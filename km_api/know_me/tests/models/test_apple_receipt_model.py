@@ -108,11 +108,88 @@ def test_update_info(mock_validate):
     )
 
     receipt = models.AppleReceipt(receipt_data=receipt_data)
-    receipt.update_info()
+    receipt.renewal_attempts = 3
+    changed = receipt.update_info()
 
     assert receipt.expiration_time == expires_date
+    assert receipt.next_renewal_check == (
+        expires_date - subscriptions.RENEWAL_WINDOW
+    )
     assert receipt.receipt_data == new_receipt_data
+    assert receipt.receipt_data_hash == (
+        models.AppleReceipt.get_receipt_data_hash(new_receipt_data)
+    )
+    assert receipt.renewal_attempts == 0
     assert receipt.transaction_id == original_transaction_id
+    assert changed == [
+        "expiration_time",
+        "next_renewal_check",
+        "receipt_data",
+        "receipt_data_hash",
+        "renewal_attempts",
+        "time_updated",
+        "transaction_id",
+    ]
+
+
+@mock.patch("know_me.subscriptions.validate_apple_receipt", autospec=True)
+def test_update_info_unchanged(mock_validate):
+    """
+    If nothing about the receipt changed, there should be no fields to
+    save.
+    """
+    receipt_data = "foo"
+    expires_date = timezone.now().replace(microsecond=0)
+    mock_validate.return_value = subscriptions.AppleTransaction(
+        {
+            "expires_date_ms": int(expires_date.timestamp()) * 1000,
+            "original_transaction_id": "1234",
+        },
+        receipt_data,
+    )
+
+    receipt = models.AppleReceipt(
+        expiration_time=expires_date,
+        next_renewal_check=expires_date - subscriptions.RENEWAL_WINDOW,
+        receipt_data=receipt_data,
+        receipt_data_hash=models.AppleReceipt.get_receipt_data_hash(
+            receipt_data
+        ),
+        renewal_attempts=0,
+        transaction_id="1234",
+    )
+
+    assert receipt.update_info() == []
+
+
+def test_save_receipt_data_changed(apple_receipt_factory):
+    """
+    Saving a receipt whose receipt data was set directly should update
+    the hash of the receipt data.
+    """
+    receipt = apple_receipt_factory(receipt_data="foo")
+    receipt.receipt_data = "bar"
+    receipt.save()
+    receipt.refresh_from_db()
+
+    assert receipt.receipt_data_hash == (
+        models.AppleReceipt.get_receipt_data_hash("bar")
+    )
+
+
+def test_save_receipt_data_update_fields(apple_receipt_factory):
+    """
+    If the receipt data is one of the fields being updated, its hash
+    should be saved with it.
+    """
+    receipt = apple_receipt_factory(receipt_data="foo")
+    receipt.receipt_data = "bar"
+    receipt.save(update_fields=["receipt_data"])
+    receipt.refresh_from_db()
+
+    assert receipt.receipt_data_hash == (
+        models.AppleReceipt.get_receipt_data_hash("bar")
+    )
 
 
 def test_str():
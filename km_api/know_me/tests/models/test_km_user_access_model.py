@@ -0,0 +1,26 @@
+from know_me import models
+
+
+def test_create_for_owner(km_user_factory):
+    """
+    Creating a Know Me user should create an access entry for its owner.
+    """
+    km_user = km_user_factory()
+
+    entry = models.KMUserAccess.objects.get(km_user=km_user)
+
+    assert entry.user == km_user.user
+    assert entry.is_owner
+
+
+def test_string_conversion(km_user_factory):
+    """
+    Converting an access entry to a string should return a string
+    identifying the user and the Know Me user.
+    """
+    km_user = km_user_factory()
+    entry = models.KMUserAccess.objects.get(km_user=km_user)
+
+    expected = f"Access for user {km_user.user.pk} to {km_user.pk}"
+
+    assert str(entry) == expected
@@ -82,6 +82,79 @@ def test_get_profile_list_url_request(api_rf, km_user_factory):
     assert km_user.get_profile_list_url(request) == expected
 
 
+def test_get_batch_object_permissions(
+    api_rf, km_user_accessor_factory, km_user_factory, user_factory
+):
+    """
+    The permissions of several Know Me users should be the same as those
+    given by the individual permission checks.
+    """
+    user = user_factory()
+    owned = km_user_factory(user=user)
+    admin = km_user_accessor_factory(
+        is_accepted=True, is_admin=True, user_with_access=user
+    ).km_user
+    shared = km_user_accessor_factory(
+        is_accepted=True, user_with_access=user
+    ).km_user
+    pending = km_user_accessor_factory(
+        is_accepted=False, user_with_access=user
+    ).km_user
+    other = km_user_factory()
+
+    api_rf.user = user
+    request = api_rf.get("/")
+
+    km_users = [owned, admin, shared, pending, other]
+    expected = [
+        {
+            "read": km_user.has_object_read_permission(request),
+            "write": km_user.has_object_write_permission(request),
+        }
+        for km_user in km_users
+    ]
+
+    assert (
+        models.KMUser.get_batch_object_permissions(km_users, request)
+        == expected
+    )
+    assert expected == [
+        {"read": True, "write": True},
+        {"read": True, "write": True},
+        {"read": True, "write": False},
+        {"read": False, "write": False},
+        {"read": False, "write": False},
+    ]
+
+
+def test_get_batch_permissions_anonymous(api_rf, km_user_factory):
+    """
+    Anonymous users should not have access to any Know Me users.
+    """
+    km_user = km_user_factory()
+    request = api_rf.get("/")
+
+    assert models.KMUser.get_batch_permissions([km_user.pk], request) == {
+        km_user.pk: {"read": False, "write": False}
+    }
+
+
+def test_get_batch_permissions_queries(
+    api_rf, django_assert_num_queries, km_user_factory
+):
+    """
+    The permissions should be checked with a constant number of queries.
+    """
+    km_users = [km_user_factory() for _ in range(5)]
+    api_rf.user = km_users[0].user
+    request = api_rf.get("/")
+
+    with django_assert_num_queries(2):
+        models.KMUser.get_batch_permissions(
+            [km_user.pk for km_user in km_users], request
+        )
+
+
 def test_has_object_read_permission_other(
     api_rf, km_user_factory, user_factory
 ):
@@ -1,5 +1,9 @@
+import datetime
 from unittest import mock
 
+import pytest
+from django.utils import timezone
+
 from account.models import User
 from know_me import models
 
@@ -69,3 +73,40 @@ def test_string_conversion():
         "account.models.User.get_full_name", return_value=user_str
     ):
         assert str(subscription) == expected
+
+
+@pytest.mark.parametrize(
+    "is_active,is_legacy,expiration_delta,expected",
+    [
+        (False, False, None, False),
+        (True, False, None, True),
+        (True, True, datetime.timedelta(days=-1), True),
+        (True, False, datetime.timedelta(days=1), True),
+        (True, False, datetime.timedelta(days=-1), False),
+        (False, False, datetime.timedelta(days=1), False),
+    ],
+)
+def test_is_premium(
+    apple_receipt_factory,
+    subscription_factory,
+    is_active,
+    is_legacy,
+    expiration_delta,
+    expected,
+):
+    """
+    A subscription should only grant premium access while it is active
+    and, unless it is a legacy subscription, its receipt has not
+    expired. The queryset of premium subscriptions should agree.
+    """
+    subscription = subscription_factory(
+        is_active=is_active, is_legacy_subscription=is_legacy
+    )
+    if expiration_delta is not None:
+        apple_receipt_factory(
+            expiration_time=timezone.now() + expiration_delta,
+            subscription=subscription,
+        )
+
+    assert subscription.is_premium == expected
+    assert models.Subscription.objects.premium().exists() == expected
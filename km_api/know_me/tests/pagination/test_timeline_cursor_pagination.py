@@ -0,0 +1,125 @@
+import datetime
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from django.utils import timezone
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+
+from know_me.journal.models import Entry
+from know_me.pagination import TimelineCursorPagination
+
+
+def create_entries(journal_entry_factory, km_user, *ages):
+    """
+    Create journal entries with specific ages.
+
+    Args:
+        journal_entry_factory:
+            The factory used to create entries.
+        km_user:
+            The Know Me user who owns the entries.
+        *ages:
+            The age of each entry in minutes.
+
+    Returns:
+        A list containing the created entries.
+    """
+    now = timezone.now()
+    entries = []
+    for age in ages:
+        entry = journal_entry_factory(km_user=km_user)
+        entry.created_at = now - datetime.timedelta(minutes=age)
+        Entry.objects.filter(pk=entry.pk).update(created_at=entry.created_at)
+        entries.append(entry)
+
+    return entries
+
+
+def get_cursor(link):
+    """
+    Get the cursor from the link to a page.
+    """
+    return parse_qs(urlparse(link).query)["cursor"][0]
+
+
+def paginate(api_rf, querysets, params=None):
+    """
+    Get a page of results.
+
+    Returns:
+        A tuple containing the paginator and the page of results.
+    """
+    paginator = TimelineCursorPagination()
+    request = Request(api_rf.get("/feed/", params or {}))
+    page = paginator.paginate_queryset(querysets, request)
+
+    return paginator, page
+
+
+def test_paginate_invalid_cursor(api_rf):
+    """
+    An invalid cursor should result in a 404 error.
+    """
+    with pytest.raises(NotFound):
+        paginate(api_rf, Entry.objects.all(), {"cursor": "invalid"})
+
+
+def test_paginate_merged(api_rf, journal_entry_factory, km_user_factory):
+    """
+    The results of several querysets should be merged from newest to
+    oldest, and the next link should continue after the last result.
+    """
+    k1, k2 = km_user_factory(), km_user_factory()
+    e1, e3, e5 = create_entries(journal_entry_factory, k1, 1, 3, 5)
+    e2, e4 = create_entries(journal_entry_factory, k2, 2, 4)
+    querysets = [
+        Entry.objects.filter(km_user=k1),
+        Entry.objects.filter(km_user=k2),
+    ]
+
+    paginator, page = paginate(api_rf, querysets, {"page_size": 2})
+    cursor = get_cursor(paginator.get_next_link())
+
+    assert page == [e1, e2]
+    assert paginator.get_previous_link() is None
+
+    paginator, page = paginate(
+        api_rf, querysets, {"cursor": cursor, "page_size": 2}
+    )
+    cursor = get_cursor(paginator.get_next_link())
+    _, last_page = paginate(
+        api_rf, querysets, {"cursor": cursor, "page_size": 2}
+    )
+
+    assert page == [e3, e4]
+    assert last_page == [e5]
+
+
+def test_paginate_last_page(api_rf, journal_entry_factory, km_user_factory):
+    """
+    There should be no next link on the last page.
+    """
+    create_entries(journal_entry_factory, km_user_factory(), 1, 2)
+
+    paginator, page = paginate(api_rf, Entry.objects.all())
+
+    assert len(page) == 2
+    assert paginator.get_next_link() is None
+
+
+def test_paginate_same_time(api_rf, journal_entry_factory, km_user_factory):
+    """
+    Entries created at the same time should be ordered by their ID so
+    that none are skipped between pages.
+    """
+    entries = create_entries(journal_entry_factory, km_user_factory(), 1, 1, 1)
+    entries.sort(key=lambda entry: entry.pk, reverse=True)
+
+    paginator, first = paginate(api_rf, Entry.objects.all(), {"page_size": 2})
+    cursor = get_cursor(paginator.get_next_link())
+    _, second = paginate(
+        api_rf, Entry.objects.all(), {"cursor": cursor, "page_size": 2}
+    )
+
+    assert first + second == entries
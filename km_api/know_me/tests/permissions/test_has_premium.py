@@ -1,5 +1,8 @@
+import datetime
 from unittest import mock
 
+from django.utils import timezone
+
 from know_me.permissions import HasPremium
 
 
@@ -46,6 +49,29 @@ def test_has_permission_anonymous_no_premium_requirement(api_rf):
     assert perm.has_permission(request, view)
 
 
+def test_has_permission_expired_receipt(
+    api_rf, apple_receipt_factory, enable_premium_requirement, user_factory
+):
+    """
+    If the requesting user's subscription is marked active but its
+    receipt has expired, permission should be denied without waiting
+    for the receipt to be checked again.
+    """
+    user = user_factory(has_premium=True)
+    apple_receipt_factory(
+        expiration_time=timezone.now() - datetime.timedelta(minutes=1),
+        subscription=user.know_me_subscription,
+    )
+    api_rf.user = user
+
+    request = api_rf.get("/")
+    view = mock.Mock(name="Mock View")
+
+    perm = HasPremium()
+
+    assert not perm.has_permission(request, view)
+
+
 def test_has_permission_inactive_subscription(
     api_rf, enable_premium_requirement, user_factory, subscription_factory
 ):
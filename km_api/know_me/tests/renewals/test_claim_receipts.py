@@ -0,0 +1,60 @@
+import datetime
+
+from django.utils import timezone
+
+from know_me import models, renewals
+
+
+def test_claim_receipts(apple_receipt_factory):
+    """
+    Claiming receipts should return the due receipts in the order they
+    are due and hide them from other workers.
+    """
+    now = timezone.now()
+    later = apple_receipt_factory(
+        next_renewal_check=now - datetime.timedelta(minutes=1)
+    )
+    earlier = apple_receipt_factory(
+        next_renewal_check=now - datetime.timedelta(minutes=2)
+    )
+    apple_receipt_factory(next_renewal_check=now + datetime.timedelta(days=1))
+
+    claimed = renewals.claim_receipts(10)
+
+    assert claimed == [earlier, later]
+    assert renewals.claim_receipts(10) == []
+
+    later.refresh_from_db()
+    assert later.next_renewal_check > now
+
+
+def test_claim_receipts_limit(apple_receipt_factory):
+    """
+    No more receipts than the given limit should be claimed.
+    """
+    due = timezone.now() - datetime.timedelta(minutes=1)
+    apple_receipt_factory(next_renewal_check=due)
+    apple_receipt_factory(next_renewal_check=due)
+
+    assert len(renewals.claim_receipts(1)) == 1
+    assert models.AppleReceipt.objects.filter(
+        next_renewal_check__lte=timezone.now()
+    ).exists()
+
+
+def test_get_next_check_time(apple_receipt_factory):
+    """
+    The next check time should be the earliest scheduled check.
+    """
+    now = timezone.now()
+    apple_receipt_factory(next_renewal_check=now + datetime.timedelta(days=2))
+    apple_receipt_factory(next_renewal_check=now + datetime.timedelta(days=1))
+
+    assert renewals.get_next_check_time() == now + datetime.timedelta(days=1)
+
+
+def test_get_next_check_time_no_receipts(db):
+    """
+    If there are no receipts, there is no next check time.
+    """
+    assert renewals.get_next_check_time() is None
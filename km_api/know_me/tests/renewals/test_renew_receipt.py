@@ -0,0 +1,194 @@
+import datetime
+from unittest import mock
+
+import pytest
+from django.utils import timezone
+
+from know_me import cache, models, renewals, subscriptions
+
+
+@pytest.fixture
+def mock_update_info():
+    """
+    Fixture to mock the revalidation of receipts with Apple.
+    """
+    with mock.patch.object(
+        models.AppleReceipt, "update_info", autospec=True
+    ) as mock_update:
+        mock_update.return_value = []
+
+        yield mock_update
+
+
+def test_renew_receipt_cancelled(apple_receipt_factory, mock_update_info):
+    """
+    Cancelled receipts should be deleted and their subscription
+    deactivated.
+    """
+    receipt = apple_receipt_factory(subscription__is_active=True)
+    mock_update_info.side_effect = subscriptions.CancelledReceiptException(
+        "cancelled"
+    )
+
+    renewals.renew_receipt(receipt)
+
+    receipt.subscription.refresh_from_db()
+    assert not receipt.subscription.is_active
+    assert not models.AppleReceipt.objects.exists()
+
+
+def test_renew_receipt_error(apple_receipt_factory, mock_update_info):
+    """
+    If Apple cannot be reached, the receipt should be retried later
+    without changing its subscription.
+    """
+    receipt = apple_receipt_factory(subscription__is_active=True)
+    mock_update_info.side_effect = ConnectionError()
+
+    renewals.renew_receipt(receipt)
+
+    receipt.refresh_from_db()
+    receipt.subscription.refresh_from_db()
+    assert receipt.renewal_attempts == 1
+    assert receipt.next_renewal_check > timezone.now()
+    assert receipt.subscription.is_active
+
+
+def test_renew_receipt_invalid(apple_receipt_factory, mock_update_info):
+    """
+    If the receipt fails validation, its subscription should be
+    deactivated and the receipt retried later.
+    """
+    receipt = apple_receipt_factory(subscription__is_active=True)
+    mock_update_info.side_effect = subscriptions.ReceiptException("invalid")
+
+    renewals.renew_receipt(receipt)
+
+    receipt.refresh_from_db()
+    receipt.subscription.refresh_from_db()
+    assert receipt.renewal_attempts == 1
+    assert not receipt.subscription.is_active
+
+
+def test_renew_receipt_not_renewed(apple_receipt_factory, mock_update_info):
+    """
+    If Apple has not renewed the receipt yet, it should be checked again
+    after a delay that grows with each attempt.
+    """
+    now = timezone.now()
+    receipt = apple_receipt_factory(
+        expiration_time=now + datetime.timedelta(minutes=30),
+        renewal_attempts=2,
+        subscription__is_active=True,
+    )
+
+    def update_info(receipt):
+        receipt.next_renewal_check = (
+            receipt.expiration_time - subscriptions.RENEWAL_WINDOW
+        )
+        receipt.renewal_attempts = 0
+
+        return ["next_renewal_check", "renewal_attempts"]
+
+    mock_update_info.side_effect = update_info
+
+    renewals.renew_receipt(receipt)
+
+    receipt.refresh_from_db()
+    receipt.subscription.refresh_from_db()
+    assert receipt.renewal_attempts == 3
+    assert receipt.next_renewal_check >= now + renewals.RETRY_DELAY * 4
+    assert receipt.subscription.is_active
+
+
+def test_renew_receipt_not_renewed_before_expiration(
+    apple_receipt_factory, mock_update_info
+):
+    """
+    A receipt that has not expired should be checked again no later than
+    its expiration time.
+    """
+    expiration_time = timezone.now() + datetime.timedelta(minutes=1)
+    receipt = apple_receipt_factory(
+        expiration_time=expiration_time, renewal_attempts=5
+    )
+
+    renewals.renew_receipt(receipt)
+
+    receipt.refresh_from_db()
+    assert receipt.next_renewal_check == expiration_time
+
+
+def test_renew_receipt_renewed(apple_receipt_factory, mock_update_info):
+    """
+    If the receipt was renewed, its next check should be scheduled
+    before its new expiration time.
+    """
+    new_expiration = timezone.now() + datetime.timedelta(days=30)
+    receipt = apple_receipt_factory(
+        renewal_attempts=2, subscription__is_active=False
+    )
+
+    def update_info(receipt):
+        receipt.expiration_time = new_expiration
+        receipt.next_renewal_check = (
+            new_expiration - subscriptions.RENEWAL_WINDOW
+        )
+        receipt.renewal_attempts = 0
+
+        return [
+            "expiration_time",
+            "next_renewal_check",
+            "renewal_attempts",
+            "time_updated",
+        ]
+
+    mock_update_info.side_effect = update_info
+
+    renewals.renew_receipt(receipt)
+
+    receipt.refresh_from_db()
+    receipt.subscription.refresh_from_db()
+    assert receipt.renewal_attempts == 0
+    assert receipt.next_renewal_check == (
+        new_expiration - subscriptions.RENEWAL_WINDOW
+    )
+    assert receipt.subscription.is_active
+
+
+def test_renew_receipt_saves_changed_fields(
+    apple_receipt_factory, mock_update_info
+):
+    """
+    Only the fields that changed should be saved so that unchanged
+    receipt data is not rewritten.
+    """
+    expiration_time = timezone.now() + datetime.timedelta(days=30)
+    receipt = apple_receipt_factory(
+        expiration_time=expiration_time,
+        next_renewal_check=expiration_time - subscriptions.RENEWAL_WINDOW,
+    )
+    mock_update_info.return_value = ["expiration_time"]
+
+    with mock.patch.object(
+        models.AppleReceipt, "save", autospec=True
+    ) as mock_save:
+        renewals.renew_receipt(receipt)
+
+    assert mock_save.call_args[1] == {"update_fields": {"expiration_time"}}
+
+
+def test_set_subscription_active_invalidates_cache(
+    km_user_factory, subscription_factory
+):
+    """
+    Changing the status of a subscription should invalidate the cached
+    responses of its owner's Know Me users.
+    """
+    subscription = subscription_factory(is_active=False)
+    km_user = km_user_factory(user=subscription.user)
+    generation = cache.get_generation(km_user.pk)
+
+    renewals.set_subscription_active(subscription.pk, True)
+
+    assert cache.get_generation(km_user.pk) != generation
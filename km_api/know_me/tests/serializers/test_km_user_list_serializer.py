@@ -87,6 +87,9 @@ def test_serialize(
         "created_at": serialized_time(km_user.created_at),
         "updated_at": serialized_time(km_user.updated_at),
         "image": image_url,
+        "image_derivatives": serializer.fields[
+            "image_derivatives"
+        ].to_representation(km_user.image),
         "is_legacy_user": km_user.is_legacy_user,
         "is_premium_user": km_user.is_premium_user,
         "is_owned_by_current_user": km_user.user == request.user,
@@ -101,6 +104,9 @@ def test_serialize(
         "profiles_url": profiles_url,
         "quote": km_user.quote,
         "user_image": user_image_url,
+        "user_image_derivatives": serializer.fields[
+            "user_image_derivatives"
+        ].to_representation(km_user.user.image),
     }
 
     assert serializer.data == expected
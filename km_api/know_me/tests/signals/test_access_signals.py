@@ -0,0 +1,60 @@
+from know_me import models
+
+
+def test_accessor_deleted(km_user_accessor_factory, user_factory):
+    """
+    Deleting an accessor should revoke the access it granted.
+    """
+    accessor = km_user_accessor_factory(
+        is_accepted=True, user_with_access=user_factory()
+    )
+    user = accessor.user_with_access
+
+    accessor.delete()
+
+    assert not models.KMUserAccess.objects.filter(user=user).exists()
+
+
+def test_accessor_saved(km_user_accessor_factory, user_factory):
+    """
+    Saving an accepted accessor should grant access to the Know Me user.
+    """
+    accessor = km_user_accessor_factory(
+        is_accepted=True, user_with_access=user_factory()
+    )
+
+    assert models.KMUserAccess.objects.filter(
+        km_user=accessor.km_user, user=accessor.user_with_access
+    ).exists()
+
+
+def test_accessor_user_changed(km_user_accessor_factory, user_factory):
+    """
+    Changing the user an accessor is linked to should move the access it
+    grants to the new user.
+    """
+    accessor = km_user_accessor_factory(
+        is_accepted=True, user_with_access=user_factory()
+    )
+    previous_user = accessor.user_with_access
+
+    accessor.user_with_access = user_factory()
+    accessor.save()
+
+    assert not models.KMUserAccess.objects.filter(
+        km_user=accessor.km_user, user=previous_user
+    ).exists()
+    assert models.KMUserAccess.objects.filter(
+        km_user=accessor.km_user, user=accessor.user_with_access
+    ).exists()
+
+
+def test_km_user_created(km_user_factory):
+    """
+    Creating a Know Me user should grant its owner access to it.
+    """
+    km_user = km_user_factory()
+
+    assert models.KMUserAccess.objects.filter(
+        is_owner=True, km_user=km_user, user=km_user.user
+    ).exists()
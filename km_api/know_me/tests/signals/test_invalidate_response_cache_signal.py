@@ -0,0 +1,93 @@
+from django.contrib.auth.models import update_last_login
+
+from know_me import cache
+
+
+def test_comment_saved(journal_entry_comment_factory, journal_entry_factory):
+    """
+    Saving a comment should invalidate the cached responses of the Know
+    Me user who owns the journal entry.
+    """
+    entry = journal_entry_factory()
+    generation = cache.get_generation(entry.km_user.pk)
+
+    journal_entry_comment_factory(entry=entry)
+
+    assert cache.get_generation(entry.km_user.pk) != generation
+
+
+def test_profile_moved(km_user_factory, profile_factory):
+    """
+    Moving a profile to a different Know Me user should invalidate the
+    cached responses of both Know Me users.
+    """
+    profile = profile_factory()
+    previous_km_user = profile.km_user
+    profile.refresh_from_db()
+    new_km_user = km_user_factory()
+
+    generations = (
+        cache.get_generation(previous_km_user.pk),
+        cache.get_generation(new_km_user.pk),
+    )
+
+    profile.km_user = new_km_user
+    profile.save()
+
+    assert cache.get_generation(previous_km_user.pk) != generations[0]
+    assert cache.get_generation(new_km_user.pk) != generations[1]
+
+
+def test_user_saved(km_user_factory):
+    """
+    Saving a user should invalidate the cached responses of the Know Me
+    user they own.
+    """
+    km_user = km_user_factory()
+    generation = cache.get_generation(km_user.pk)
+
+    km_user.user.save()
+
+    assert cache.get_generation(km_user.pk) != generation
+
+
+def test_user_logged_in(km_user_factory):
+    """
+    Recording a user's login should not invalidate the cached responses
+    of the Know Me user they own.
+    """
+    km_user = km_user_factory()
+    generation = cache.get_generation(km_user.pk)
+
+    update_last_login(None, km_user.user)
+
+    assert cache.get_generation(km_user.pk) == generation
+
+
+def test_apple_receipt_saved(apple_receipt_factory, km_user_factory):
+    """
+    Saving an Apple receipt should invalidate the cached responses of
+    the Know Me user owned by the subscription's owner.
+    """
+    km_user = km_user_factory()
+    receipt = apple_receipt_factory(subscription__user=km_user.user)
+    generation = cache.get_generation(km_user.pk)
+
+    receipt.save()
+
+    assert cache.get_generation(km_user.pk) != generation
+
+
+def test_subscription_saved(km_user_factory, subscription_factory):
+    """
+    Saving a subscription should invalidate the cached responses of the
+    Know Me user owned by the subscription's owner.
+    """
+    km_user = km_user_factory()
+    subscription = subscription_factory(user=km_user.user)
+    generation = cache.get_generation(km_user.pk)
+
+    subscription.is_active = True
+    subscription.save()
+
+    assert cache.get_generation(km_user.pk) != generation
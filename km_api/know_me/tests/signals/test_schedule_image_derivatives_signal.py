@@ -0,0 +1,67 @@
+from unittest import mock
+
+import pytest
+
+from know_me import models
+
+
+@pytest.fixture
+def mock_schedule():
+    """
+    Fixture to mock the function used to schedule the generation of an
+    image's derivatives.
+    """
+    with mock.patch(
+        "know_me.signals.derivatives.schedule_derivatives", autospec=True
+    ) as mock_schedule:
+        yield mock_schedule
+
+
+def test_save_raw(image, km_user_factory, mock_schedule):
+    """
+    Instances loaded from a fixture should not schedule anything.
+    """
+    km_user = km_user_factory(image=image)
+    mock_schedule.reset_mock()
+
+    models.KMUser.save_base(km_user, raw=True)
+
+    assert mock_schedule.call_count == 0
+
+
+def test_save_unchanged_image(image, km_user_factory, mock_schedule):
+    """
+    Saving an instance loaded from the database without changing its
+    image should not schedule anything.
+    """
+    km_user = km_user_factory(image=image)
+    km_user = models.KMUser.objects.get(pk=km_user.pk)
+    mock_schedule.reset_mock()
+
+    km_user.save()
+
+    assert mock_schedule.call_count == 0
+
+
+def test_save_with_image(image, km_user_factory, mock_schedule):
+    """
+    Saving an instance with a new image should schedule the generation
+    of the image's derivatives.
+    """
+    km_user = km_user_factory(image=image)
+
+    assert mock.call(
+        models.KMUser._meta.get_field("image"), km_user.image.name
+    ) in (mock_schedule.call_args_list)
+
+
+def test_save_without_image(mock_schedule, profile_item_factory):
+    """
+    Saving an instance without an image should not schedule anything.
+    """
+    profile_item_factory(image=None)
+
+    assert not any(
+        call[0][0].model.__name__ == "ProfileItem"
+        for call in mock_schedule.call_args_list
+    )
@@ -0,0 +1,144 @@
+import threading
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+
+from know_me import single_flight
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """
+    Fixture to clear the locks and results left in the cache.
+    """
+    cache.clear()
+
+    yield
+
+    cache.clear()
+
+
+def test_call():
+    """
+    Without a call in flight, the function should be called and its
+    result returned.
+    """
+    func = mock.Mock(return_value={"foo": "bar"})
+
+    assert single_flight.call("key", func, 1, two=2) == {"foo": "bar"}
+    assert func.call_args == mock.call(1, two=2)
+    assert cache.get(single_flight.LOCK_KEY.format(key="key")) is None
+
+
+def test_call_concurrent_threads():
+    """
+    Threads calling with the same key while a call is in flight should
+    share its result instead of calling the function again.
+    """
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def func():
+        calls.append(None)
+        started.set()
+        release.wait(5)
+
+        return "result"
+
+    results = []
+
+    def run():
+        results.append(single_flight.call("key", func))
+
+    leader = threading.Thread(target=run)
+    leader.start()
+    started.wait(5)
+
+    followers = [threading.Thread(target=run) for _ in range(3)]
+    for follower in followers:
+        follower.start()
+
+    release.set()
+    for thread in [leader] + followers:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert results == ["result"] * 4
+
+
+def test_call_exception():
+    """
+    If the function raises an exception, it should be propagated and
+    the lock released.
+    """
+    func = mock.Mock(side_effect=ValueError("boom"))
+
+    with pytest.raises(ValueError):
+        single_flight.call("key", func)
+
+    assert cache.get(single_flight.LOCK_KEY.format(key="key")) is None
+
+
+def test_call_other_process_in_flight():
+    """
+    If another process holds the lock for the key, the result of its
+    call should be used once it is released.
+    """
+    lock_key = single_flight.LOCK_KEY.format(key="key")
+    cache.set(lock_key, "other")
+    func = mock.Mock()
+
+    def finish(_):
+        cache.set(single_flight.RESULT_KEY.format(token="other"), "shared")
+        cache.delete(lock_key)
+
+    with mock.patch.object(
+        single_flight.time, "sleep", autospec=True, side_effect=finish
+    ):
+        result = single_flight.call("key", func)
+
+    assert result == "shared"
+    assert func.call_count == 0
+
+
+def test_call_other_process_failed():
+    """
+    If the call made by another process fails, the function should be
+    called again.
+    """
+    lock_key = single_flight.LOCK_KEY.format(key="key")
+    cache.set(lock_key, "other")
+    func = mock.Mock(return_value="own")
+
+    with mock.patch.object(
+        single_flight.time,
+        "sleep",
+        autospec=True,
+        side_effect=lambda _: cache.delete(lock_key),
+    ):
+        result = single_flight.call("key", func)
+
+    assert result == "own"
+    assert func.call_count == 1
+
+
+def test_call_other_process_timeout():
+    """
+    If the lock held by another process is not released before the
+    timeout, the function should be called without waiting any longer.
+    """
+    cache.set(single_flight.LOCK_KEY.format(key="key"), "other")
+    func = mock.Mock(return_value="own")
+
+    with mock.patch.object(
+        single_flight.time,
+        "monotonic",
+        autospec=True,
+        side_effect=[0, single_flight.LOCK_TIMEOUT],
+    ):
+        result = single_flight.call("key", func)
+
+    assert result == "own"
+    assert func.call_count == 1
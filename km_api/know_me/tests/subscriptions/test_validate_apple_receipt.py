@@ -1,3 +1,4 @@
+import hashlib
 from unittest import mock
 
 from know_me import subscriptions
@@ -15,6 +16,7 @@ def test_validate_apple_receipt():
     ) as mock_get_info, mock.patch(
         "know_me.subscriptions.validate_apple_receipt_response", autospec=True
     ) as mock_validate:
+        mock_get_info.return_value = {"status": 0}
         result = subscriptions.validate_apple_receipt(receipt_data)
 
     assert mock_get_info.call_count == 1
@@ -22,3 +24,26 @@ def test_validate_apple_receipt():
     assert mock_validate.call_count == 1
     assert mock_validate.call_args[0] == (mock_get_info.return_value,)
     assert result == mock_validate.return_value
+
+
+def test_validate_apple_receipt_coalesced():
+    """
+    Concurrent validations of the same receipt should be coalesced
+    using the hash of the receipt data.
+    """
+    receipt_data = "test-data"
+    receipt_hash = hashlib.sha256(receipt_data.encode()).hexdigest()
+
+    with mock.patch(
+        "know_me.subscriptions.single_flight.call", autospec=True
+    ) as mock_call, mock.patch(
+        "know_me.subscriptions.validate_apple_receipt_response", autospec=True
+    ) as mock_validate:
+        subscriptions.validate_apple_receipt(receipt_data)
+
+    assert mock_call.call_args[0] == (
+        f"apple-receipt:{receipt_hash}",
+        subscriptions.get_receipt_info,
+        receipt_data,
+    )
+    assert mock_validate.call_args[0] == (mock_call.return_value,)
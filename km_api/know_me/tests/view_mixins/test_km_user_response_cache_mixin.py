@@ -0,0 +1,131 @@
+from django.core.cache import cache
+from django.urls import reverse
+
+import pytest
+
+from know_me.profile import models
+
+
+@pytest.fixture(autouse=True)
+def enable_response_cache(settings):
+    """
+    Enable response caching with an empty cache.
+    """
+    settings.KNOW_ME_RESPONSE_CACHE_TIMEOUT = 60
+    cache.clear()
+
+    yield
+
+    cache.clear()
+
+
+def get_profile_names(api_client, km_user):
+    """
+    Get the names of the profiles returned by the profile list view.
+    """
+    url = reverse("know-me:profile:profile-list", kwargs={"pk": km_user.pk})
+
+    return [profile["name"] for profile in api_client.get(url).data]
+
+
+@pytest.mark.integration
+def test_cache_hit(api_client, django_assert_num_queries, km_user_factory):
+    """
+    Repeating a request should return the cached response without
+    serializing the data again.
+    """
+    km_user = km_user_factory()
+    models.Profile.objects.create(km_user=km_user, name="Profile")
+    api_client.force_authenticate(user=km_user.user)
+
+    assert get_profile_names(api_client, km_user) == ["Profile"]
+
+    # Only the access lookups made by the permissions and the cache.
+    with django_assert_num_queries(2):
+        assert get_profile_names(api_client, km_user) == ["Profile"]
+
+
+@pytest.mark.integration
+def test_invalidated_by_write(api_client, km_user_factory):
+    """
+    Changing the Know Me user's data should invalidate the cached
+    responses.
+    """
+    km_user = km_user_factory()
+    profile = models.Profile.objects.create(km_user=km_user, name="Old")
+    api_client.force_authenticate(user=km_user.user)
+
+    get_profile_names(api_client, km_user)
+
+    profile.name = "New"
+    profile.save()
+
+    assert get_profile_names(api_client, km_user) == ["New"]
+
+
+@pytest.mark.integration
+def test_not_shared_across_access_levels(
+    api_client, km_user_accessor_factory, km_user_factory, user_factory
+):
+    """
+    A response cached for the owner should not be returned to a user
+    who is not allowed to see private profiles.
+    """
+    km_user = km_user_factory()
+    models.Profile.objects.create(
+        is_private=True, km_user=km_user, name="Private"
+    )
+    accessor = km_user_accessor_factory(
+        is_accepted=True,
+        is_admin=False,
+        km_user=km_user,
+        user_with_access=user_factory(),
+    )
+
+    api_client.force_authenticate(user=km_user.user)
+    assert get_profile_names(api_client, km_user) == ["Private"]
+
+    api_client.force_authenticate(user=accessor.user_with_access)
+    assert get_profile_names(api_client, km_user) == []
+
+
+@pytest.mark.integration
+def test_not_shared_without_access(api_client, km_user_factory, user_factory):
+    """
+    A cached response should not be returned to a user without access to
+    the Know Me user.
+    """
+    km_user = km_user_factory()
+    api_client.force_authenticate(user=km_user.user)
+    get_profile_names(api_client, km_user)
+
+    api_client.force_authenticate(user=user_factory())
+    url = reverse("know-me:profile:profile-list", kwargs={"pk": km_user.pk})
+
+    assert api_client.get(url).status_code == 404
+
+
+@pytest.mark.integration
+def test_object_permissions_checked_on_hit(
+    api_client, journal_entry_factory, settings, subscription_factory
+):
+    """
+    The object permissions of a detail view should still be checked
+    before a cached response is returned.
+    """
+    settings.KNOW_ME_PREMIUM_ENABLED = True
+    entry = journal_entry_factory()
+    subscription = subscription_factory(
+        is_active=True, user=entry.km_user.user
+    )
+    api_client.force_authenticate(user=entry.km_user.user)
+    url = reverse("know-me:journal:entry-detail", kwargs={"pk": entry.pk})
+
+    assert api_client.get(url).status_code == 200
+
+    # Bypass the signals so the cached response is not invalidated.
+    type(subscription).objects.filter(pk=subscription.pk).update(
+        is_active=False
+    )
+
+    assert api_client.get(url).status_code == 404
@@ -0,0 +1,91 @@
+import json
+
+from rest_framework import status
+from rest_framework.reverse import reverse
+
+from know_me import views
+
+
+km_user_export_view = views.KMUserExportView.as_view()
+
+
+def test_export_admin_accessor(
+    api_rf, km_user_accessor_factory, km_user_factory, user_factory
+):
+    """
+    Account administrators should be able to export a Know Me user.
+    """
+    user = user_factory()
+    api_rf.user = user
+
+    km_user = km_user_factory()
+    km_user_accessor_factory(
+        is_accepted=True, is_admin=True, km_user=km_user, user_with_access=user
+    )
+
+    url = reverse("know-me:km-user-export", kwargs={"pk": km_user.pk})
+    response = km_user_export_view(api_rf.get(url), pk=km_user.pk)
+
+    assert response.status_code == status.HTTP_200_OK
+
+
+def test_export_non_admin_accessor(
+    api_rf, km_user_accessor_factory, km_user_factory, user_factory
+):
+    """
+    Users with read-only access to a Know Me user should not be able to
+    export the user's data.
+    """
+    user = user_factory()
+    api_rf.user = user
+
+    km_user = km_user_factory()
+    km_user_accessor_factory(
+        is_accepted=True, km_user=km_user, user_with_access=user
+    )
+
+    url = reverse("know-me:km-user-export", kwargs={"pk": km_user.pk})
+    response = km_user_export_view(api_rf.get(url), pk=km_user.pk)
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_export_own(api_rf, km_user_factory, profile_factory, user_factory):
+    """
+    A user should be able to export their own Know Me user as newline
+    delimited JSON.
+    """
+    user = user_factory()
+    api_rf.user = user
+
+    km_user = km_user_factory(user=user)
+    profile_factory(km_user=km_user)
+
+    url = reverse("know-me:km-user-export", kwargs={"pk": km_user.pk})
+    response = km_user_export_view(api_rf.get(url), pk=km_user.pk)
+    lines = b"".join(response.streaming_content).decode().splitlines()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Type"] == "application/x-ndjson"
+    assert [json.loads(line)["type"] for line in lines] == [
+        "km_user",
+        "profile",
+    ]
+
+
+def test_export_own_with_media(api_rf, km_user_factory, user_factory):
+    """
+    Requesting media files should return a zip archive.
+    """
+    user = user_factory()
+    api_rf.user = user
+
+    km_user = km_user_factory(user=user)
+
+    url = reverse("know-me:km-user-export", kwargs={"pk": km_user.pk})
+    response = km_user_export_view(
+        api_rf.get(url, {"media": "true"}), pk=km_user.pk
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Type"] == "application/zip"
@@ -1,3 +1,6 @@
+import datetime
+
+from django.utils import timezone
 from rest_framework.reverse import reverse
 
 from know_me import views
@@ -131,6 +134,37 @@ def test_get_queryset_shared_without_premium(
     assert list(view.get_queryset()) == []
 
 
+def test_get_queryset_shared_expired_receipt(
+    api_rf,
+    apple_receipt_factory,
+    enable_premium_requirement,
+    km_user_accessor_factory,
+    user_factory,
+):
+    """
+    If the other user's subscription is still marked active but its
+    receipt has expired, the other user should not be included in the
+    queryset.
+    """
+    user = user_factory()
+    api_rf.user = user
+
+    accessor = km_user_accessor_factory(
+        is_accepted=True,
+        km_user__user__has_premium=True,
+        user_with_access=user,
+    )
+    apple_receipt_factory(
+        expiration_time=timezone.now() - datetime.timedelta(minutes=1),
+        subscription=accessor.km_user.user.know_me_subscription,
+    )
+
+    view = views.KMUserListView()
+    view.request = api_rf.get(url)
+
+    assert list(view.get_queryset()) == []
+
+
 def test_get_shared_without_premium_feature_disabled(
     api_rf, km_user_accessor_factory, user_factory
 ):
@@ -152,3 +186,68 @@ def test_get_shared_without_premium_feature_disabled(
     view.request = api_rf.get(url)
 
     assert list(view.get_queryset()) == [accessor.km_user]
+
+
+def test_get_paginated(api_rf, km_user_factory):
+    """
+    Providing a page number should paginate the response.
+    """
+    km_user = km_user_factory()
+    api_rf.user = km_user.user
+
+    view = views.KMUserListView.as_view()
+    response = view(api_rf.get(url, {"page": 1}))
+
+    assert response.status_code == 200
+    assert response.data["count"] == 1
+    assert [r["id"] for r in response.data["results"]] == [km_user.pk]
+
+
+def test_get_query_count(
+    api_rf, django_assert_num_queries, km_user_accessor_factory, user_factory
+):
+    """
+    The number of queries used to list Know Me users should not depend
+    on the number of users being listed.
+    """
+    user = user_factory()
+    api_rf.user = user
+
+    for _ in range(3):
+        km_user_accessor_factory(
+            is_accepted=True,
+            km_user__user__has_premium=True,
+            user_with_access=user,
+        )
+
+    view = views.KMUserListView()
+    view.request = api_rf.get(url)
+
+    with django_assert_num_queries(1):
+        km_users = list(view.get_queryset())
+        assert all(k.is_premium_user for k in km_users)
+        assert [k.name for k in km_users]
+
+
+def test_get_queryset_search(
+    api_rf, km_user_accessor_factory, km_user_factory, user_factory
+):
+    """
+    Providing a search term should only list Know Me users whose name
+    contains the term.
+    """
+    user = user_factory(first_name="Alice")
+    api_rf.user = user
+    km_user_factory(user=user)
+
+    accessor = km_user_accessor_factory(
+        is_accepted=True,
+        km_user__user__first_name="Bob",
+        km_user__user__has_premium=True,
+        user_with_access=user,
+    )
+
+    view = views.KMUserListView()
+    view.request = api_rf.get(url, {"q": "bo"})
+
+    assert list(view.get_queryset()) == [accessor.km_user]
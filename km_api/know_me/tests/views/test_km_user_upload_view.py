@@ -0,0 +1,80 @@
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from rest_framework import status
+from rest_framework.reverse import reverse
+
+from know_me import views
+from know_me.profile.serializers import ProfileItemDetailSerializer
+
+
+km_user_upload_view = views.KMUserUploadView.as_view()
+
+
+def test_create_upload_non_admin_accessor(
+    api_rf, km_user_accessor_factory, km_user_factory, user_factory
+):
+    """
+    Users with read-only access to a Know Me user should not be able to
+    upload files for the user.
+    """
+    user = user_factory()
+    api_rf.user = user
+
+    km_user = km_user_factory()
+    km_user_accessor_factory(
+        is_accepted=True, km_user=km_user, user_with_access=user
+    )
+
+    url = reverse("know-me:km-user-upload", kwargs={"pk": km_user.pk})
+    request = api_rf.post(
+        url, {"filename": "foo.png", "target": "km-user-image"}
+    )
+    response = km_user_upload_view(request, pk=km_user.pk)
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_create_upload_profile_item_image(api_rf, km_user_factory):
+    """
+    The owner of a Know Me user should be able to request an upload for
+    a profile item's image. The returned token can then be used to set
+    the image of a profile item.
+    """
+    km_user = km_user_factory()
+    api_rf.user = km_user.user
+
+    url = reverse("know-me:km-user-upload", kwargs={"pk": km_user.pk})
+    request = api_rf.post(
+        url, {"filename": "foo.png", "target": "profile-item-image"}
+    )
+    response = km_user_upload_view(request, pk=km_user.pk)
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.data["key"].startswith(
+        f"know-me/users/{km_user.pk}/profile-images/"
+    )
+    assert response.data["method"] == "PUT"
+
+    default_storage.save(response.data["key"], ContentFile(b"foo"))
+
+    serializer = ProfileItemDetailSerializer(
+        data={"image_upload_token": response.data["token"], "name": "Foo"}
+    )
+
+    assert serializer.is_valid(), serializer.errors
+    assert serializer.validated_data["image"] == response.data["key"]
+
+
+def test_create_upload_invalid_target(api_rf, km_user_factory):
+    """
+    Requesting an upload for an unknown target should fail.
+    """
+    km_user = km_user_factory()
+    api_rf.user = km_user.user
+
+    url = reverse("know-me:km-user-upload", kwargs={"pk": km_user.pk})
+    request = api_rf.post(url, {"filename": "foo.png", "target": "foo"})
+    response = km_user_upload_view(request, pk=km_user.pk)
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "target" in response.data
@@ -92,4 +92,14 @@ urlpatterns = [
         views.KMUserDetailView.as_view(),
         name="km-user-detail",
     ),
+    url(
+        r"^users/(?P<pk>[0-9]+)/export/$",
+        views.KMUserExportView.as_view(),
+        name="km-user-export",
+    ),
+    path(
+        "users/<int:pk>/uploads/",
+        views.KMUserUploadView.as_view(),
+        name="km-user-upload",
+    ),
 ]
@@ -0,0 +1,112 @@
+"""Mixins for views that expose a Know Me user's data.
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework import mixins, status
+from rest_framework.response import Response
+
+from know_me import cache as response_cache
+
+
+class KMUserOwnedViewMixin(object):
+    """
+    Mixin for views whose data is owned by a single Know Me user.
+
+    By default the ``pk`` URL argument is assumed to be the ID of the
+    Know Me user. Views where it identifies a different object should
+    set ``km_user_lookup_model`` to that object's model and
+    ``km_user_lookup_field`` to the lookup for its owner's ID.
+    """
+
+    km_user_lookup_field = "km_user_id"
+    km_user_lookup_model = None
+
+    def get_km_user_id(self):
+        """
+        Get the ID of the Know Me user who owns the requested data.
+
+        Returns:
+            The ID of the Know Me user, or ``None`` if the object
+            identified in the URL does not exist.
+        """
+        pk = self.kwargs.get("pk")
+
+        if self.km_user_lookup_model is None:
+            return pk
+
+        return (
+            self.km_user_lookup_model.objects.filter(pk=pk)
+            .values_list(self.km_user_lookup_field, flat=True)
+            .first()
+        )
+
+
+class KMUserResponseCacheMixin(KMUserOwnedViewMixin):
+    """
+    Mixin to cache the responses to ``GET`` requests for a Know Me
+    user's data.
+
+    Responses are only cached if ``KNOW_ME_RESPONSE_CACHE_TIMEOUT`` is
+    set. They are shared by users with the same access to the Know Me
+    user and are invalidated whenever the Know Me user's data or its
+    owner's subscription changes. Object permissions are still checked
+    before a cached response is returned.
+    """
+
+    # Set for views whose responses depend on the requesting user
+    # rather than only their access to the Know Me user.
+    cache_vary_on_user = False
+
+    def get(self, request, *args, **kwargs):
+        """
+        Handle a ``GET`` request, using a cached response if possible.
+
+        Args:
+            request:
+                The request being made.
+            *args:
+                Positional arguments captured from the URL.
+            **kwargs:
+                Keyword arguments captured from the URL.
+
+        Returns:
+            The response to the request.
+        """
+        timeout = settings.KNOW_ME_RESPONSE_CACHE_TIMEOUT
+        if not timeout:
+            return super().get(request, *args, **kwargs)
+
+        km_user_id = self.get_km_user_id()
+        if km_user_id is None:
+            return super().get(request, *args, **kwargs)
+
+        access_level = response_cache.get_access_level(
+            request.user, km_user_id
+        )
+        if access_level is None:
+            return super().get(request, *args, **kwargs)
+
+        key = response_cache.get_response_key(
+            self,
+            request,
+            access_level,
+            response_cache.get_generation(km_user_id),
+            user=request.user if self.cache_vary_on_user else None,
+        )
+
+        data = cache.get(key)
+        if data is not None:
+            # Detail views check their object permissions when the
+            # object is retrieved, so it must still be retrieved even
+            # though the cached response is used.
+            if isinstance(self, mixins.RetrieveModelMixin):
+                self.get_object()
+
+            return Response(data)
+
+        response = super().get(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            cache.set(key, response.data, timeout)
+
+        return response
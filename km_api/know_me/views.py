@@ -4,19 +4,23 @@ import logging
 
 from django.conf import settings
 from django.db.models import Case, PositiveSmallIntegerField, Q, Value, When
-from django.http import HttpResponse, HttpRequest
+from django.http import HttpResponse, HttpRequest, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from dry_rest_permissions.generics import DRYGlobalPermissions, DRYPermissions
 from rest_framework import generics, pagination, status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
-from know_me import models, permissions, serializers
+from idempotency.mixins import IdempotentCreateMixin
+from know_me import export, models, permissions, serializers
+from know_me.pagination import OptionalPageNumberPagination
 from know_me.serializers import (
     subscription_serializers,
     email_reminder_subscriber_serializers,
 )
+from know_me.view_mixins import KMUserResponseCacheMixin
 from permission_utils.view_mixins import DocumentActionMixin
+from serializer_utils.view_mixins import SparseFieldsetViewMixin
 
 
 logger = logging.getLogger(__name__)
@@ -220,7 +224,7 @@ class AccessorDetailView(
         return models.KMUserAccessor.objects.filter(query)
 
 
-class AccessorListView(generics.ListCreateAPIView):
+class AccessorListView(IdempotentCreateMixin, generics.ListCreateAPIView):
     """
     get:
     Endpoint for listing the accessors that grant access to the current
@@ -299,7 +303,11 @@ class ConfigDetailView(generics.RetrieveUpdateAPIView):
         return config
 
 
-class KMUserDetailView(generics.RetrieveUpdateAPIView):
+class KMUserDetailView(
+    KMUserResponseCacheMixin,
+    SparseFieldsetViewMixin,
+    generics.RetrieveUpdateAPIView,
+):
     """
     get:
     Endpoint for retrieving the details of a specific Know Me user.
@@ -317,7 +325,69 @@ class KMUserDetailView(generics.RetrieveUpdateAPIView):
     serializer_class = serializers.KMUserDetailSerializer
 
 
-class KMUserListView(generics.ListAPIView):
+class KMUserExportView(generics.GenericAPIView):
+    """
+    get:
+    Export all of the data owned by a specific Know Me user.
+
+    The data is streamed as newline delimited JSON where each line
+    contains an object with a `type` and `data` key. If the `media`
+    query parameter is set to `true`, a zip archive containing the JSON
+    data as well as the user's uploaded files is returned instead.
+
+    Only the owner of the Know Me user or an account administrator may
+    export the user's data.
+    """
+
+    permission_classes = (DRYPermissions,)
+    queryset = models.KMUser.objects.all()
+    serializer_class = serializers.KMUserListSerializer
+
+    def check_object_permissions(self, request, obj):
+        """
+        Require write access to the Know Me user being exported since
+        the export includes private profiles.
+
+        Args:
+            request:
+                The request being made.
+            obj:
+                The Know Me user being exported.
+        """
+        super().check_object_permissions(request, obj)
+
+        if not obj.has_object_write_permission(request):
+            self.permission_denied(request)
+
+    def get(self, request, *args, **kwargs):
+        km_user = self.get_object()
+
+        include_media = (
+            request.query_params.get("media", "false").lower() == "true"
+        )
+
+        if include_media:
+            response = StreamingHttpResponse(
+                export.iter_zip(km_user), content_type="application/zip"
+            )
+            extension = "zip"
+        else:
+            response = StreamingHttpResponse(
+                export.iter_ndjson(km_user),
+                content_type="application/x-ndjson",
+            )
+            extension = "ndjson"
+
+        response[
+            "Content-Disposition"
+        ] = f'attachment; filename="know-me-export-{km_user.pk}.{extension}"'
+
+        logger.info("Exporting data for Know Me user %d", km_user.pk)
+
+        return response
+
+
+class KMUserListView(SparseFieldsetViewMixin, generics.ListAPIView):
     """
     get:
     Endpoint for listing the Know Me users that the current user has
@@ -325,8 +395,13 @@ class KMUserListView(generics.ListAPIView):
 
     The Know Me user owned by the requesting user is guaranteed to be
     the first element returned.
+
+    The list can be filtered to users whose name contains the value of
+    the `q` query parameter. Providing a `page` or `page_size` query
+    parameter paginates the response.
     """
 
+    pagination_class = OptionalPageNumberPagination
     permission_classes = (DRYPermissions,)
     serializer_class = serializers.KMUserListSerializer
 
@@ -334,27 +409,39 @@ class KMUserListView(generics.ListAPIView):
         """
         Get the list of Know Me users the requesting user has access to.
 
+        The accessible users are found through the requesting user's
+        materialized access entries, so the owned and shared users are
+        selected by a single indexed join without a ``DISTINCT``. The
+        owner, subscription, and receipt of each Know Me user are
+        selected in the same query because the serializer needs them.
+
         Returns:
             A queryset containing the ``KMUser`` instances accessible to
             the requesting user.
         """
-        # User granted access through an accessor. Note that the owner
-        # of the Know Me user being shared must have an active premium
-        # subscription.
-        filter_args = Q(km_user_accessor__is_accepted=True)
-        filter_args &= Q(km_user_accessor__user_with_access=self.request.user)
+        access = Q(access_entry__user=self.request.user)
 
-        # If the premium requirement is enabled, the shared user must
-        # have an active premium subscription.
+        # If the premium requirement is enabled, a shared user must have
+        # an active premium subscription. The owner's subscription is
+        # checked directly so that expired subscriptions are excluded
+        # before their receipts are checked again.
         if settings.KNOW_ME_PREMIUM_ENABLED:
-            filter_args &= Q(
-                km_user_accessor__km_user__user__know_me_subscription__is_active=True  # noqa
+            access &= Q(access_entry__is_owner=True) | (
+                models.get_premium_filter("user__know_me_subscription__")
             )
 
-        # Requesting user is the user
-        filter_args |= Q(user=self.request.user)
+        query = models.KMUser.objects.filter(access).select_related(
+            "user",
+            "user__know_me_subscription",
+            "user__know_me_subscription__apple_receipt",
+        )
 
-        query = models.KMUser.objects.filter(filter_args).distinct()
+        search_term = self.request.GET.get("q")
+        if search_term:
+            query = query.filter(
+                Q(user__first_name__icontains=search_term)
+                | Q(user__last_name__icontains=search_term)
+            )
 
         # Allow us to sort the query with the requesting user's Know Me
         # user first. See conditional expression documentation:
@@ -367,7 +454,57 @@ class KMUserListView(generics.ListAPIView):
             )
         )
 
-        return query.order_by("-owned_by_user", "created_at")
+        return query.order_by("-owned_by_user", "created_at", "pk")
+
+
+class KMUserUploadView(generics.CreateAPIView):
+    """
+    post:
+    Request an upload for a file owned by a Know Me user.
+
+    The `target` parameter determines which type of file is being
+    uploaded. The response contains the `url`, `method`, and
+    `form_fields` needed to upload the file directly to storage. Once
+    the upload has completed, the returned `token` can be provided in
+    place of the file when creating or updating the object that owns
+    the file.
+
+    Only the owner of the Know Me user or an admin accessor may request
+    uploads.
+    """
+
+    permission_classes = (
+        permissions.HasKMUserAccess,
+        permissions.CollectionOwnerHasPremium,
+    )
+    serializer_class = serializers.KMUserUploadSerializer
+
+    def get_subscription_owner(self, request):
+        """
+        Get the user who must have an active premium subscription in
+        order to upload files for the Know Me user.
+
+        Args:
+            request:
+                The request being made.
+
+        Returns:
+            The owner of the Know Me user that the file is being
+            uploaded for.
+        """
+        return models.KMUser.objects.get(pk=self.kwargs["pk"]).user
+
+    def perform_create(self, serializer):
+        """
+        Create an upload for the Know Me user specified in the URL.
+
+        Args:
+            serializer:
+                The serializer containing the upload request.
+        """
+        km_user = models.KMUser.objects.get(pk=self.kwargs["pk"])
+
+        serializer.save(km_user=km_user)
 
 
 class LegacyUserDetailView(generics.RetrieveUpdateDestroyAPIView):
@@ -390,7 +527,7 @@ class LegacyUserDetailView(generics.RetrieveUpdateDestroyAPIView):
     serializer_class = serializers.LegacyUserSerializer
 
 
-class LegacyUserListView(generics.ListCreateAPIView):
+class LegacyUserListView(IdempotentCreateMixin, generics.ListCreateAPIView):
     """
     get:
     Get a list of all legacy users.
@@ -461,7 +598,9 @@ class ReminderEmailSubscriberDetailView(generics.RetrieveUpdateDestroyAPIView):
         )
 
 
-class ReminderEmailSubscriberListView(generics.ListCreateAPIView):
+class ReminderEmailSubscriberListView(
+    IdempotentCreateMixin, generics.ListCreateAPIView
+):
     """
     Endpoint for listing reminder email subscribers
     """
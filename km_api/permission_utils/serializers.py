@@ -0,0 +1,142 @@
+"""Serializers for evaluating permissions in bulk.
+
+``DRYPermissionsField`` calls the object permission methods of each
+instance in a list independently. For models whose permissions are
+derived from a parent object, this means the same parent is looked up
+and checked once for every instance being serialized.
+
+Models may provide a ``get_batch_object_permissions`` class method to
+evaluate the object permissions of a list of instances at once::
+
+    class Entry(models.Model):
+
+        @classmethod
+        def get_batch_object_permissions(cls, instances, request):
+            # Return a list containing a dictionary for each instance
+            # that maps action names such as "read" and "write" to a
+            # boolean indicating if the request has permission.
+            ...
+
+The results are used by :py:class:`BatchPermissionsField` when the
+instances are serialized by a :py:class:`BatchPermissionsListSerializer`.
+"""
+
+from django.db import models
+from dry_rest_permissions.generics import DRYPermissionsField
+from rest_framework import serializers
+
+
+class BatchPermissionsField(DRYPermissionsField):
+    """
+    Permissions field that can use object permissions evaluated in
+    bulk by :py:class:`BatchPermissionsListSerializer`.
+
+    When an instance is serialized on its own, or its model does not
+    support batch evaluation, the field behaves exactly like
+    ``DRYPermissionsField``.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """
+        Create a new permissions field.
+
+        The arguments are the same as those accepted by
+        ``DRYPermissionsField``.
+        """
+        super().__init__(*args, **kwargs)
+
+        self.batch_permissions = {}
+
+    def to_representation(self, value):
+        """
+        Get the permissions the request has on an instance.
+
+        Args:
+            value:
+                The instance to get the permissions of.
+
+        Returns:
+            A dictionary mapping action names to a boolean indicating if
+            the request is allowed to perform the action.
+        """
+        object_permissions = self.batch_permissions.get(id(value))
+        if object_permissions is None:
+            return super().to_representation(value)
+
+        model = self.parent.Meta.model
+        request = self.context["request"]
+
+        results = {}
+        for action, method_names in self.action_method_map.items():
+            global_method = method_names.get("global")
+            if not self.object_only and global_method is not None:
+                results[action] = getattr(model, global_method)(request)
+
+            object_method = method_names.get("object")
+            if (
+                not self.global_only
+                and results.get(action, True)
+                and object_method is not None
+            ):
+                if action in object_permissions:
+                    results[action] = object_permissions[action]
+                else:
+                    results[action] = getattr(value, object_method)(request)
+
+        return results
+
+
+class BatchPermissionsListSerializer(serializers.ListSerializer):
+    """
+    List serializer that evaluates the object permissions of every
+    instance in the list at once.
+
+    Use it by setting ``list_serializer_class`` in the ``Meta`` class of
+    a serializer with a :py:class:`BatchPermissionsField`.
+    """
+
+    def to_representation(self, data):
+        """
+        Serialize a list of instances.
+
+        Args:
+            data:
+                The instances to serialize.
+
+        Returns:
+            A list containing the serialized representation of each
+            instance.
+        """
+        iterable = data.all() if isinstance(data, models.Manager) else data
+        instances = list(iterable)
+
+        model = self.child.Meta.model
+        request = self.context.get("request")
+        permission_fields = [
+            field
+            for field in self.child.fields.values()
+            if isinstance(field, BatchPermissionsField)
+        ]
+
+        if (
+            not instances
+            or not permission_fields
+            or request is None
+            or not hasattr(model, "get_batch_object_permissions")
+        ):
+            return super().to_representation(instances)
+
+        permissions = model.get_batch_object_permissions(instances, request)
+        by_instance = {
+            id(instance): instance_permissions
+            for instance, instance_permissions in zip(instances, permissions)
+        }
+
+        for field in permission_fields:
+            field.batch_permissions = by_instance
+
+        try:
+            return super().to_representation(instances)
+        finally:
+            for field in permission_fields:
+                field.batch_permissions = {}
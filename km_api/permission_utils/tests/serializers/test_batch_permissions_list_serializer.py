@@ -0,0 +1,89 @@
+from unittest import mock
+
+from rest_framework import serializers
+
+from know_me.journal import models
+from permission_utils.serializers import (
+    BatchPermissionsField,
+    BatchPermissionsListSerializer,
+)
+
+
+class EntrySerializer(serializers.ModelSerializer):
+    permissions = BatchPermissionsField()
+
+    class Meta:
+        fields = ("id", "permissions")
+        list_serializer_class = BatchPermissionsListSerializer
+        model = models.Entry
+
+
+def test_serialize_list(
+    api_rf, django_assert_num_queries, journal_entry_factory, km_user_factory
+):
+    """
+    The permissions of every instance in the list should be evaluated
+    with a constant number of queries.
+    """
+    km_user = km_user_factory()
+    entries = [journal_entry_factory(km_user=km_user) for _ in range(3)]
+    entries.append(journal_entry_factory())
+
+    api_rf.user = km_user.user
+    request = api_rf.get("/")
+    serializer = EntrySerializer(
+        entries, context={"request": request}, many=True
+    )
+
+    with django_assert_num_queries(2):
+        data = serializer.data
+
+    assert [item["permissions"] for item in data] == [
+        {"read": True, "write": True},
+        {"read": True, "write": True},
+        {"read": True, "write": True},
+        {"read": False, "write": False},
+    ]
+
+
+def test_serialize_list_anonymous(api_rf, journal_entry_factory):
+    """
+    The global permissions should still be checked before the batched
+    object permissions are used.
+    """
+    entry = journal_entry_factory()
+    request = api_rf.get("/")
+
+    with mock.patch.object(
+        models.Entry, "get_batch_object_permissions", autospec=True
+    ) as mock_batch:
+        mock_batch.return_value = [{"read": True, "write": True}]
+        serializer = EntrySerializer(
+            [entry], context={"request": request}, many=True
+        )
+
+        data = serializer.data
+
+    assert data[0]["permissions"] == {"read": False, "write": False}
+
+
+def test_serialize_single(api_rf, journal_entry_factory):
+    """
+    Serializing a single instance should use the permission methods of
+    the instance.
+    """
+    entry = journal_entry_factory()
+    api_rf.user = entry.km_user.user
+    request = api_rf.get("/")
+
+    with mock.patch.object(
+        models.Entry, "get_batch_object_permissions"
+    ) as mock_batch:
+        serializer = EntrySerializer(entry, context={"request": request})
+
+        assert serializer.data["permissions"] == {
+            "read": True,
+            "write": True,
+        }
+
+    assert mock_batch.call_count == 0
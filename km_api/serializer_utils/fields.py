@@ -0,0 +1,131 @@
+"""Custom serializer fields.
+"""
+
+import re
+import threading
+
+from django.urls import get_script_prefix, get_urlconf
+from rest_framework import serializers
+from rest_framework.reverse import reverse
+
+
+# A value substituted for the lookup value when reversing a URL in order
+# to find where the lookup value belongs in the resulting path. It must
+# match the patterns of the URLs it is used with, which capture integer
+# primary keys.
+_LOOKUP_SENTINEL = "7391046285"
+
+_INTEGER_PATTERN = re.compile(r"^[0-9]+$")
+
+
+class TemplatedHyperlinkedIdentityField(serializers.HyperlinkedIdentityField):
+    """
+    Hyperlinked identity field that avoids resolving a URL for every
+    instance it serializes.
+
+    The first time the field is used for a view, the view's URL is
+    reversed once and converted into a template which is cached for the
+    lifetime of the process. Each instance's URL is then built by
+    formatting the template with the instance's lookup value and
+    prefixing it with the scheme and host of the request, which is only
+    computed once per request.
+
+    URLs that cannot be built from a template, such as those using a
+    format suffix, a versioning scheme, or a lookup value that is not
+    an integer, are built the same way as the parent class.
+    """
+
+    _templates = {}
+    _templates_lock = threading.Lock()
+
+    def get_url(self, obj, view_name, request, format):
+        """
+        Get the URL of an instance.
+
+        Args:
+            obj:
+                The instance to get the URL of.
+            view_name:
+                The name of the view to link to.
+            request:
+                The request being processed.
+            format:
+                The format suffix to include in the URL.
+
+        Returns:
+            The absolute URL of the instance, or ``None`` if the
+            instance has not been saved.
+        """
+        if hasattr(obj, "pk") and obj.pk in (None, ""):
+            return None
+
+        lookup_value = str(getattr(obj, self.lookup_field))
+
+        if (
+            format
+            or getattr(request, "versioning_scheme", None) is not None
+            or not _INTEGER_PATTERN.match(lookup_value)
+        ):
+            return super().get_url(obj, view_name, request, format)
+
+        path = self.get_template(view_name).format(lookup_value)
+
+        if request is None:
+            return path
+
+        return self.get_base_url(request) + path
+
+    @staticmethod
+    def get_base_url(request):
+        """
+        Get the scheme and host that URLs for a request start with.
+
+        Args:
+            request:
+                The request to get the base URL of.
+
+        Returns:
+            The absolute URL of the request's root without a trailing
+            slash.
+        """
+        base_url = getattr(request, "_hyperlink_base_url", None)
+        if base_url is None:
+            base_url = request.build_absolute_uri("/")[:-1]
+            request._hyperlink_base_url = base_url
+
+        return base_url
+
+    def get_template(self, view_name):
+        """
+        Get the template used to build the path of a view's URL.
+
+        Args:
+            view_name:
+                The name of the view to get the template for.
+
+        Returns:
+            A format string for the view's path with a single
+            placeholder for the lookup value.
+        """
+        key = (
+            view_name,
+            self.lookup_url_kwarg,
+            get_script_prefix(),
+            get_urlconf(),
+        )
+
+        template = self._templates.get(key)
+        if template is None:
+            path = reverse(
+                view_name, kwargs={self.lookup_url_kwarg: _LOOKUP_SENTINEL}
+            )
+            template = (
+                path.replace("{", "{{")
+                .replace("}", "}}")
+                .replace(_LOOKUP_SENTINEL, "{0}")
+            )
+
+            with self._templates_lock:
+                self._templates[key] = template
+
+        return template
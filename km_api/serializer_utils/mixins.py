@@ -0,0 +1,119 @@
+"""Mixins for serializers.
+"""
+
+from rest_framework.permissions import SAFE_METHODS
+
+
+def parse_field_list(value):
+    """
+    Parse a comma separated list of field names.
+
+    Args:
+        value:
+            The string to parse.
+
+    Returns:
+        A set containing the field names in the string.
+    """
+    if not value:
+        return set()
+
+    return {name.strip() for name in value.split(",") if name.strip()}
+
+
+class SparseFieldsetMixin:
+    """
+    Mixin allowing clients to choose the fields included in a response.
+
+    When a serializer using the mixin is the root serializer of a
+    ``GET`` request, the following query parameters are supported:
+
+    ``fields``
+        A comma separated list of the fields to include. Fields that are
+        not listed are removed before serialization, so they are never
+        computed.
+
+    ``expand``
+        A comma separated list of optional fields to add. The optional
+        fields are declared as ``Meta.expandable_fields``, a dictionary
+        mapping the name of each field to a tuple containing the class
+        of the field and the keyword arguments used to create it.
+        Expanded fields are included even if they are not listed in the
+        ``fields`` parameter.
+
+    Serializers may also provide ``Meta.field_prefetches``, a dictionary
+    mapping field names to the lookups that should be prefetched when
+    the field is included. See :py:meth:`optimize_queryset`.
+    """
+
+    def get_fields(self):
+        """
+        Get the fields to serialize based on the request parameters.
+
+        Returns:
+            A dictionary mapping field names to field instances.
+        """
+        fields = super().get_fields()
+
+        request = self.context.get("request")
+        if (
+            request is None
+            or request.method not in SAFE_METHODS
+            or not self._is_root_serializer()
+        ):
+            return fields
+
+        expand = parse_field_list(request.GET.get("expand"))
+        expandable = getattr(self.Meta, "expandable_fields", {})
+        for name in sorted(expand):
+            if name in expandable and name not in fields:
+                field_class, kwargs = expandable[name]
+                fields[name] = field_class(**kwargs)
+
+        requested = parse_field_list(request.GET.get("fields"))
+        if requested:
+            fields = fields.__class__(
+                (name, field)
+                for name, field in fields.items()
+                if name in requested or name in expand
+            )
+
+        return fields
+
+    def optimize_queryset(self, queryset):
+        """
+        Prefetch the relationships used by the serializer's fields.
+
+        Only the lookups for fields that will actually be serialized are
+        prefetched.
+
+        Args:
+            queryset:
+                The queryset being serialized.
+
+        Returns:
+            The queryset with the required lookups prefetched.
+        """
+        prefetches = getattr(self.Meta, "field_prefetches", {})
+        lookups = []
+        for name in self.fields:
+            lookups.extend(prefetches.get(name, ()))
+
+        if lookups:
+            queryset = queryset.prefetch_related(*lookups)
+
+        return queryset
+
+    def _is_root_serializer(self):
+        """
+        Determine if the serializer is the top level serializer, or the
+        child of a top level list serializer.
+
+        Returns:
+            A boolean indicating if the serializer is the root.
+        """
+        parent = getattr(self, "parent", None)
+        if parent is None:
+            return True
+
+        return parent.parent is None and getattr(parent, "many", False)
@@ -0,0 +1,147 @@
+from unittest import mock
+
+from rest_framework import serializers
+
+from know_me.profile import models
+from serializer_utils.mixins import SparseFieldsetMixin
+
+
+class ItemSerializer(serializers.ModelSerializer):
+    class Meta:
+        fields = ("id", "name")
+        model = models.ProfileItem
+
+
+class TopicSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    class Meta:
+        expandable_fields = {
+            "items": (ItemSerializer, {"many": True, "read_only": True})
+        }
+        field_prefetches = {"items": ("items",), "profile": ("profile",)}
+        fields = ("id", "is_detailed", "name", "profile")
+        model = models.ProfileTopic
+
+
+def get_field_names(api_rf, method="get", path="/", **kwargs):
+    request = getattr(api_rf, method)(path)
+    serializer = TopicSerializer(context={"request": request}, **kwargs)
+
+    return list(serializer.fields.keys())
+
+
+def test_get_fields_default(api_rf):
+    """
+    If no parameters are provided, the serializer's normal fields should
+    be used.
+    """
+    assert get_field_names(api_rf) == ["id", "is_detailed", "name", "profile"]
+
+
+def test_get_fields_expand(api_rf):
+    """
+    Expandable fields should be added if they are requested.
+    """
+    assert get_field_names(api_rf, path="/?expand=items,bogus") == [
+        "id",
+        "is_detailed",
+        "name",
+        "profile",
+        "items",
+    ]
+
+
+def test_get_fields_no_request():
+    """
+    If there is no request, the serializer's normal fields should be
+    used.
+    """
+    serializer = TopicSerializer()
+
+    assert list(serializer.fields.keys()) == [
+        "id",
+        "is_detailed",
+        "name",
+        "profile",
+    ]
+
+
+def test_get_fields_nested(api_rf):
+    """
+    Serializers nested inside another serializer should not be affected
+    by the request parameters.
+    """
+
+    class ParentSerializer(serializers.Serializer):
+        topic = TopicSerializer()
+
+    request = api_rf.get("/?fields=name")
+    serializer = ParentSerializer(context={"request": request})
+
+    assert list(serializer.fields["topic"].fields.keys()) == [
+        "id",
+        "is_detailed",
+        "name",
+        "profile",
+    ]
+
+
+def test_get_fields_many(api_rf):
+    """
+    The children of a top level list serializer should have their
+    fields restricted.
+    """
+    request = api_rf.get("/?fields=id,name")
+    serializer = TopicSerializer(context={"request": request}, many=True)
+
+    assert list(serializer.child.fields.keys()) == ["id", "name"]
+
+
+def test_get_fields_sparse(api_rf):
+    """
+    Only the requested fields and expanded fields should be included.
+    """
+    assert get_field_names(api_rf, path="/?fields=id, name&expand=items") == [
+        "id",
+        "name",
+        "items",
+    ]
+
+
+def test_get_fields_unsafe_method(api_rf):
+    """
+    The parameters should be ignored for requests that modify data.
+    """
+    assert get_field_names(api_rf, method="post", path="/?fields=id") == [
+        "id",
+        "is_detailed",
+        "name",
+        "profile",
+    ]
+
+
+def test_optimize_queryset(api_rf):
+    """
+    Only the relationships of the fields being serialized should be
+    prefetched.
+    """
+    queryset = mock.Mock(name="Queryset")
+    request = api_rf.get("/?expand=items&fields=id")
+    serializer = TopicSerializer(context={"request": request})
+
+    result = serializer.optimize_queryset(queryset)
+
+    assert result == queryset.prefetch_related.return_value
+    assert queryset.prefetch_related.call_args == mock.call("items")
+
+
+def test_optimize_queryset_no_prefetches(api_rf):
+    """
+    If none of the serialized fields require a prefetch, the queryset
+    should be returned unmodified.
+    """
+    queryset = mock.Mock(name="Queryset")
+    request = api_rf.get("/?fields=id,name")
+    serializer = TopicSerializer(context={"request": request})
+
+    assert serializer.optimize_queryset(queryset) == queryset
+    assert queryset.prefetch_related.call_count == 0
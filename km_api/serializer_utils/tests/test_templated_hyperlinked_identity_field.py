@@ -0,0 +1,98 @@
+from unittest import mock
+
+from django.urls import set_script_prefix
+from rest_framework import serializers
+
+from know_me import models
+from serializer_utils.fields import TemplatedHyperlinkedIdentityField
+
+
+def get_urls(obj, request, **kwargs):
+    """
+    Get the URL of an object from both the templated field and the
+    field provided by DRF.
+    """
+    fields = (
+        TemplatedHyperlinkedIdentityField(
+            view_name="know-me:km-user-detail", **kwargs
+        ),
+        serializers.HyperlinkedIdentityField(
+            view_name="know-me:km-user-detail", **kwargs
+        ),
+    )
+
+    return [
+        field.get_url(obj, field.view_name, request, None) for field in fields
+    ]
+
+
+def test_get_url(api_rf):
+    """
+    The field should produce the same URL as DRF's identity field.
+    """
+    km_user = models.KMUser(pk=42)
+    request = api_rf.get("/")
+
+    templated, expected = get_urls(km_user, request)
+
+    assert templated == expected
+    assert templated == "http://testserver/know-me/users/42/"
+
+
+def test_get_url_format(api_rf):
+    """
+    URLs with a format suffix should fall back to being reversed.
+    """
+    km_user = models.KMUser(pk=1)
+    field = TemplatedHyperlinkedIdentityField(
+        view_name="know-me:km-user-detail"
+    )
+
+    with mock.patch(
+        "rest_framework.serializers.HyperlinkedIdentityField.get_url",
+        return_value="foo",
+    ) as mock_get_url:
+        url = field.get_url(km_user, field.view_name, api_rf.get("/"), "json")
+
+    assert url == "foo"
+    assert mock_get_url.call_count == 1
+
+
+def test_get_url_script_prefix(api_rf):
+    """
+    Templates should be cached separately for each script prefix.
+    """
+    km_user = models.KMUser(pk=1)
+    request = api_rf.get("/")
+
+    set_script_prefix("/api/")
+    try:
+        templated, expected = get_urls(km_user, request)
+    finally:
+        set_script_prefix("/")
+
+    assert templated == expected
+    assert templated == "http://testserver/api/know-me/users/1/"
+    assert get_urls(km_user, request)[0] == (
+        "http://testserver/know-me/users/1/"
+    )
+
+
+def test_get_url_unsaved(api_rf):
+    """
+    Unsaved instances should not have a URL.
+    """
+    assert get_urls(models.KMUser(), api_rf.get("/")) == [None, None]
+
+
+def test_get_url_without_request():
+    """
+    If there is no request, the path of the URL should be returned.
+    """
+    field = TemplatedHyperlinkedIdentityField(
+        view_name="know-me:km-user-detail"
+    )
+
+    url = field.get_url(models.KMUser(pk=3), field.view_name, None, None)
+
+    assert url == "/know-me/users/3/"
@@ -0,0 +1,37 @@
+"""Mixins for views.
+"""
+
+
+class SparseFieldsetViewMixin:
+    """
+    Mixin for views whose serializer uses
+    :py:class:`serializer_utils.mixins.SparseFieldsetMixin`.
+
+    The view's queryset is optimized to prefetch only the relationships
+    needed by the fields being serialized.
+    """
+
+    def filter_queryset(self, queryset):
+        """
+        Filter the view's queryset and prefetch the relationships the
+        serializer will use.
+
+        Args:
+            queryset:
+                The queryset to filter.
+
+        Returns:
+            The filtered and optimized queryset.
+        """
+        queryset = super().filter_queryset(queryset)
+
+        # Only the serializer's fields are needed, so the full context
+        # from ``get_serializer_context`` is not required.
+        serializer_class = self.get_serializer_class()
+        serializer = serializer_class(
+            context={"request": self.request, "view": self}
+        )
+        if hasattr(serializer, "optimize_queryset"):
+            queryset = serializer.optimize_queryset(queryset)
+
+        return queryset
@@ -0,0 +1,19 @@
+"""Horizontal sharding of the data owned by Know Me users.
+
+The profiles, media resources, and journal of each Know Me user are
+stored on one of the databases listed in the ``SHARD_DATABASES``
+setting, or on the default database. The shard map, stored on the
+default database as :py:class:`sharding.models.ShardAssignment`
+instances, records where each Know Me user's data lives. Know Me users
+without an assignment live on the default database.
+
+Users and Know Me users are copied to every shard so that the owned
+data can reference and join against them. The IDs of sharded rows are
+allocated from the default database so that they are unique across
+shards and rows keep their IDs when they are moved.
+
+Sharding is disabled when ``SHARD_DATABASES`` is empty, in which case
+everything is stored on the default database as usual.
+"""
+
+default_app_config = "sharding.apps.ShardingConfig"
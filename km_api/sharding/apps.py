@@ -0,0 +1,20 @@
+"""App configurations for the ``sharding`` module.
+"""
+
+from django.apps import AppConfig
+from django.utils.translation import ugettext_lazy as _
+
+
+class ShardingConfig(AppConfig):
+    """
+    Default app config.
+    """
+
+    name = "sharding"
+    verbose_name = _("Sharding")
+
+    def ready(self):
+        """
+        Register the signal handlers that maintain the shards.
+        """
+        import sharding.signals  # noqa
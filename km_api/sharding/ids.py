@@ -0,0 +1,126 @@
+"""Allocation of IDs that are unique across shards.
+
+Each shard has its own sequences, so rows created on different shards
+would otherwise be given the same IDs. Instead, while sharding is
+enabled, the IDs of sharded rows are taken from blocks reserved on the
+default database. Reserving a block of ``BLOCK_SIZE`` IDs at a time
+means only one row in every ``BLOCK_SIZE`` requires a query.
+"""
+
+import threading
+
+from django.core.management.color import no_style
+from django.db import connections
+from django.db.models import Max
+
+from sharding import models, routing
+
+
+BLOCK_SIZE = 100
+
+
+class IdAllocator(object):
+    """
+    Allocator that hands out the IDs of the blocks it reserves.
+    """
+
+    def __init__(self):
+        """
+        Create a new allocator without any reserved IDs.
+        """
+        self._end_id = None
+        self._last_block = 0
+        self._lock = threading.Lock()
+        self._next_id = None
+        self._seeded = False
+
+    def allocate(self):
+        """
+        Allocate a new ID.
+
+        Returns:
+            An ID that has never been allocated before.
+        """
+        with self._lock:
+            if self._next_id is None or self._next_id >= self._end_id:
+                block = self._reserve_block()
+                self._next_id = block * BLOCK_SIZE
+                self._end_id = self._next_id + BLOCK_SIZE
+
+            allocated = self._next_id
+            self._next_id += 1
+
+        return allocated
+
+    def _reserve_block(self):
+        """
+        Reserve a new block of IDs.
+
+        Returns:
+            The number of the reserved block.
+        """
+        if not self._seeded:
+            seed_blocks()
+            self._seeded = True
+
+        block = models.IdBlock.objects.using(routing.DEFAULT_DATABASE).create()
+
+        # If the reservation of an earlier block was rolled back, some
+        # databases hand out the same number again.
+        while block.pk <= self._last_block:
+            block = models.IdBlock.objects.using(
+                routing.DEFAULT_DATABASE
+            ).create()
+
+        self._last_block = block.pk
+
+        return block.pk
+
+
+allocator = IdAllocator()
+
+
+def allocate_id():
+    """
+    Allocate an ID for a new row of a sharded model.
+
+    Returns:
+        An ID that is unique across every shard.
+    """
+    return allocator.allocate()
+
+
+def seed_blocks():
+    """
+    Ensure that new blocks do not contain the ID of any existing row.
+
+    This is necessary when sharding is first enabled because existing
+    rows were given IDs by the default database's sequences.
+    """
+    max_ids = [
+        model._base_manager.using(database).aggregate(max_id=Max("pk"))[
+            "max_id"
+        ]
+        or 0
+        for database in routing.get_shards()
+        for model in routing.get_sharded_models()
+    ]
+    first_block = max(max_ids, default=0) // BLOCK_SIZE + 1
+
+    blocks = models.IdBlock.objects.using(routing.DEFAULT_DATABASE)
+    last_block = blocks.aggregate(max_id=Max("pk"))["max_id"] or 0
+
+    if last_block >= first_block:
+        return
+
+    blocks.create(pk=first_block)
+
+    # Inserting a row with an explicit ID does not advance the sequence
+    # used by some databases.
+    connection = connections[routing.DEFAULT_DATABASE]
+    statements = connection.ops.sequence_reset_sql(
+        no_style(), [models.IdBlock]
+    )
+    with connection.cursor() as cursor:
+        for statement in statements:
+            cursor.execute(statement)
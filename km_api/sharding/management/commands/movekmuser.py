@@ -0,0 +1,69 @@
+from django.core import management
+
+from know_me.models import KMUser
+from sharding import moves, routing
+
+
+class Command(management.BaseCommand):
+    """
+    Management command to move a Know Me user's data to a different
+    shard.
+    """
+
+    help = (
+        "Move the profiles, media resources, and journal of a Know Me user "
+        "to a different shard. The Know Me user should not be in use while "
+        "their data is being moved."
+    )
+
+    def add_arguments(self, parser):
+        """
+        Add the command's arguments.
+
+        Args:
+            parser:
+                The parser to add arguments to.
+        """
+        parser.add_argument(
+            "km_user_id", help="The ID of the Know Me user to move.", type=int
+        )
+        parser.add_argument(
+            "database",
+            help="The alias of the shard to move the Know Me user to.",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Execute the command.
+
+        Args:
+            *args:
+                Positional arguments provided to the command.
+            **options:
+                Keyword arguments provided to the command.
+        """
+        database = options["database"]
+        if database not in routing.get_shards():
+            raise management.CommandError(
+                f"{database} is not a shard. The shards are: "
+                f"{', '.join(routing.get_shards())}."
+            )
+
+        try:
+            km_user = KMUser.objects.using(routing.DEFAULT_DATABASE).get(
+                pk=options["km_user_id"]
+            )
+        except KMUser.DoesNotExist:
+            raise management.CommandError(
+                f"There is no Know Me user with the ID "
+                f"{options['km_user_id']}."
+            )
+
+        moved = moves.move_km_user(km_user, database)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Moved {moved} rows of Know Me user {km_user.pk} to "
+                f"{database}."
+            )
+        )
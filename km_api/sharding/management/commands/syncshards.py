@@ -0,0 +1,36 @@
+from django.core import management
+
+from sharding import ids, references, routing
+
+
+class Command(management.BaseCommand):
+    """
+    Management command to prepare the shards for use.
+    """
+
+    help = (
+        "Copy every content type, user, and Know Me user to each shard, "
+        "and reserve IDs for sharded data above the IDs of existing rows. "
+        "Run this after adding a shard and after migrating the shards."
+    )
+
+    def handle(self, *args, **options):
+        """
+        Execute the command.
+
+        Args:
+            *args:
+                Positional arguments provided to the command.
+            **options:
+                Keyword arguments provided to the command.
+        """
+        for database in routing.get_shards()[1:]:
+            copied = references.copy_content_types(database)
+            self.stdout.write(f"Copied {copied} content types to {database}.")
+
+            copied = references.copy_users(database)
+            self.stdout.write(f"Copied {copied} users to {database}.")
+
+        ids.seed_blocks()
+
+        self.stdout.write(self.style.SUCCESS("Finished syncing shards."))
@@ -0,0 +1,65 @@
+"""Middleware to route requests to the shard of the data they access.
+"""
+
+from django.urls import Resolver404, resolve
+
+from sharding import routing
+
+
+class ShardRoutingMiddleware(object):
+    """
+    Middleware that sends the sharded queries made by a request to the
+    shard of the Know Me user who owns the requested data.
+
+    The owner is determined from the ``pk`` URL argument of views that
+    declare how to find the owner of their data by providing a
+    ``km_user_lookup_model`` attribute. If it is ``None``, the argument
+    is the ID of the Know Me user. Otherwise it is the ID of an instance
+    of that model, which is located on whichever shard stores it.
+    """
+
+    def __init__(self, get_response):
+        """
+        Create a new middleware instance.
+
+        Args:
+            get_response:
+                The callable used to get the response to a request.
+        """
+        self.get_response = get_response
+
+    def __call__(self, request):
+        """
+        Handle a request.
+
+        Args:
+            request:
+                The request being made.
+
+        Returns:
+            The response to the request.
+        """
+        if not routing.is_enabled():
+            return self.get_response(request)
+
+        try:
+            match = resolve(request.path_info)
+        except Resolver404:
+            return self.get_response(request)
+
+        view_class = getattr(match.func, "view_class", None)
+        pk = match.kwargs.get("pk")
+
+        if pk is None or not hasattr(view_class, "km_user_lookup_model"):
+            return self.get_response(request)
+
+        if view_class.km_user_lookup_model is None:
+            with routing.use_km_user_shard(pk):
+                return self.get_response(request)
+
+        database = routing.locate(view_class.km_user_lookup_model, pk)
+        if database is None:
+            return self.get_response(request)
+
+        with routing.use_shard(database):
+            return self.get_response(request)
@@ -0,0 +1,70 @@
+# Generated by Django 2.2.28 on 2026-10-19 14:02
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("know_me", "0020_kmuseraccess"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IdBlock",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "ID block",
+                "verbose_name_plural": "ID blocks",
+            },
+        ),
+        migrations.CreateModel(
+            name="ShardAssignment",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "database",
+                    models.CharField(
+                        help_text="The alias of the database that the Know Me user's data is stored on.",
+                        max_length=100,
+                        verbose_name="database",
+                    ),
+                ),
+                (
+                    "km_user",
+                    models.OneToOneField(
+                        help_text="The Know Me user whose data is stored on the shard.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="shard_assignment",
+                        to="know_me.KMUser",
+                        verbose_name="Know Me user",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "shard assignment",
+                "verbose_name_plural": "shard assignments",
+            },
+        ),
+    ]
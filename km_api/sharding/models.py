@@ -0,0 +1,60 @@
+from django.db import models
+from django.utils.translation import ugettext_lazy as _
+
+
+class IdBlock(models.Model):
+    """
+    A block of IDs reserved for rows of sharded models.
+
+    The IDs reserved by a block are the ``BLOCK_SIZE`` consecutive
+    integers starting at the block's primary key multiplied by
+    ``BLOCK_SIZE``. See :py:mod:`sharding.ids`.
+    """
+
+    class Meta:
+        verbose_name = _("ID block")
+        verbose_name_plural = _("ID blocks")
+
+    def __str__(self):
+        """
+        Get a string representation of the block.
+
+        Returns:
+            A string containing the block's ID.
+        """
+        return f"ID block {self.pk}"
+
+
+class ShardAssignment(models.Model):
+    """
+    The database that a Know Me user's data is stored on.
+    """
+
+    database = models.CharField(
+        help_text=_(
+            "The alias of the database that the Know Me user's data is "
+            "stored on."
+        ),
+        max_length=100,
+        verbose_name=_("database"),
+    )
+    km_user = models.OneToOneField(
+        "know_me.KMUser",
+        help_text=_("The Know Me user whose data is stored on the shard."),
+        on_delete=models.CASCADE,
+        related_name="shard_assignment",
+        verbose_name=_("Know Me user"),
+    )
+
+    class Meta:
+        verbose_name = _("shard assignment")
+        verbose_name_plural = _("shard assignments")
+
+    def __str__(self):
+        """
+        Get a string representation of the assignment.
+
+        Returns:
+            A string describing the Know Me user and their shard.
+        """
+        return f"Know Me user {self.km_user_id} on {self.database}"
@@ -0,0 +1,106 @@
+"""Moving the data of Know Me users between shards.
+"""
+
+import logging
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from watson import search as watson
+
+from know_me.journal import models as journal_models
+from know_me.profile import models as profile_models
+from sharding import models, references, routing
+
+
+logger = logging.getLogger(__name__)
+
+
+# The sharded models in the order their rows are copied. Each model only
+# refers to models that come before it. Each model is paired with the
+# lookup used to filter its rows to a single Know Me user.
+MOVE_SPECS = (
+    (profile_models.MediaResourceCoverStyle, "km_user"),
+    (profile_models.MediaResource, "km_user"),
+    (profile_models.Profile, "km_user"),
+    (profile_models.ProfileTopic, "km_user"),
+    (profile_models.ProfileItem, "km_user"),
+    (profile_models.ListEntry, "km_user"),
+    (journal_models.Entry, "km_user"),
+    (journal_models.EntryComment, "entry__km_user"),
+)
+
+
+def move_km_user(km_user, database, batch_size=500):
+    """
+    Move a Know Me user's data to a different shard.
+
+    The data is copied to the target shard before the shard map is
+    updated, and only deleted from the source shard afterwards. Changes
+    made to the data while it is being moved may be lost, so the Know
+    Me user should not be in use during the move.
+
+    Args:
+        km_user:
+            The Know Me user to move.
+        database:
+            The alias of the shard to move the Know Me user to.
+        batch_size:
+            The number of rows to create at a time.
+
+    Returns:
+        The number of rows that were moved.
+    """
+    source = routing.get_km_user_shard(km_user.pk)
+    if source == database:
+        return 0
+
+    # The rows being moved may refer to any of these users.
+    owner_ids = {km_user.user_id}
+    owner_ids.update(
+        journal_models.EntryComment.objects.using(source)
+        .filter(entry__km_user=km_user)
+        .values_list("user_id", flat=True)
+    )
+    for user in get_user_model().objects.filter(pk__in=owner_ids):
+        references.copy_instance(user, database)
+    references.copy_instance(km_user, database)
+
+    moved = 0
+    with transaction.atomic(using=database):
+        for model, lookup in MOVE_SPECS:
+            rows = list(
+                model._base_manager.using(source)
+                .filter(**{lookup: km_user.pk})
+                .order_by("pk")
+            )
+            model._base_manager.using(database).bulk_create(
+                rows, batch_size=batch_size
+            )
+            moved += len(rows)
+
+    models.ShardAssignment.objects.using(
+        routing.DEFAULT_DATABASE
+    ).update_or_create(km_user=km_user, defaults={"database": database})
+
+    with routing.use_shard(database):
+        entries = journal_models.Entry.objects.using(database).filter(
+            km_user=km_user
+        )
+        for entry in entries.iterator():
+            watson.default_search_engine.update_obj_index(entry)
+
+    with routing.use_shard(source), transaction.atomic(using=source):
+        for model, lookup in reversed(MOVE_SPECS):
+            model._base_manager.using(source).filter(
+                **{lookup: km_user.pk}
+            ).delete()
+
+    logger.info(
+        "Moved %d rows of Know Me user %s from %s to %s",
+        moved,
+        km_user.pk,
+        source,
+        database,
+    )
+
+    return moved
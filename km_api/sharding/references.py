@@ -0,0 +1,170 @@
+"""Copies of the users referenced by sharded data.
+
+Sharded rows have foreign keys to users and Know Me users, and queries
+for sharded data join against them. Each shard therefore keeps a copy
+of every user and Know Me user, which is updated whenever the original
+on the default database changes.
+
+Search entries refer to content types by the IDs they have on the
+default database, so each shard also keeps a copy of every content type
+with the same ID.
+"""
+
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+
+from sharding import routing
+
+
+def copy_content_types(database):
+    """
+    Copy every content type to a shard.
+
+    Migrating a shard creates its own content types, whose IDs may not
+    match the default database. Content types on the shard that do not
+    match the default database are deleted along with the rows that
+    refer to them before the content types are copied.
+
+    Args:
+        database:
+            The alias of the shard to copy the content types to.
+
+    Returns:
+        The number of content types copied.
+    """
+    content_types = ContentType.objects.using(routing.DEFAULT_DATABASE)
+    expected = {
+        pk: (app_label, model)
+        for pk, app_label, model in content_types.values_list(
+            "pk", "app_label", "model"
+        )
+    }
+
+    shard_content_types = ContentType.objects.using(database)
+    conflicting = [
+        pk
+        for pk, app_label, model in shard_content_types.values_list(
+            "pk", "app_label", "model"
+        )
+        if expected.get(pk) != (app_label, model)
+    ]
+    shard_content_types.filter(pk__in=conflicting).delete()
+
+    copied = copy_queryset(content_types.all(), database)
+    ContentType.objects.clear_cache()
+
+    return copied
+
+
+def copy_instance(instance, database):
+    """
+    Copy an instance to another database, replacing any existing copy.
+
+    Args:
+        instance:
+            The instance to copy.
+        database:
+            The alias of the database to copy the instance to.
+    """
+    model = type(instance)
+    values = {
+        field.attname: getattr(instance, field.attname)
+        for field in model._meta.concrete_fields
+        if not field.primary_key
+    }
+
+    manager = model._base_manager.using(database)
+    if not manager.filter(pk=instance.pk).update(**values):
+        manager.bulk_create([model(pk=instance.pk, **values)])
+
+
+def copy_queryset(queryset, database, batch_size=500):
+    """
+    Copy every instance in a queryset to another database.
+
+    Instances that do not exist on the target database yet are created
+    in bulk. Existing copies are updated individually.
+
+    Args:
+        queryset:
+            A queryset containing the instances to copy.
+        database:
+            The alias of the database to copy the instances to.
+        batch_size:
+            The number of instances to create at a time.
+
+    Returns:
+        The number of instances copied.
+    """
+    model = queryset.model
+    existing = set(
+        model._base_manager.using(database).values_list("pk", flat=True)
+    )
+
+    copied = 0
+    missing = []
+    for instance in queryset.order_by("pk").iterator(chunk_size=batch_size):
+        if instance.pk in existing:
+            copy_instance(instance, database)
+        else:
+            missing.append(instance)
+
+        copied += 1
+
+    model._base_manager.using(database).bulk_create(
+        missing, batch_size=batch_size
+    )
+
+    return copied
+
+
+def copy_users(database):
+    """
+    Copy every user and Know Me user to a shard.
+
+    Args:
+        database:
+            The alias of the shard to copy the users to.
+
+    Returns:
+        The number of instances copied.
+    """
+    from know_me.models import KMUser
+
+    copied = 0
+    for model in (get_user_model(), KMUser):
+        copied += copy_queryset(
+            model._base_manager.using(routing.DEFAULT_DATABASE).all(),
+            database,
+        )
+
+    return copied
+
+
+def delete_copies(instance):
+    """
+    Delete the copies of an instance from every shard.
+
+    Deleting a copy also deletes the sharded data that refers to it.
+
+    Args:
+        instance:
+            The instance that was deleted from the default database.
+    """
+    model = type(instance)
+
+    for database in routing.get_shards()[1:]:
+        with routing.use_shard(database):
+            model._base_manager.using(database).filter(pk=instance.pk).delete()
+
+
+def update_copies(instance):
+    """
+    Update the copies of an instance on every shard.
+
+    Args:
+        instance:
+            The instance that was saved to the default database.
+    """
+    for database in routing.get_shards()[1:]:
+        copy_instance(instance, database)
@@ -0,0 +1,144 @@
+"""Database routers.
+"""
+
+from django.conf import settings
+
+from sharding import routing
+
+
+class ShardRouter(object):
+    """
+    Router that sends queries for sharded models to the shard of the
+    Know Me user who owns the data.
+
+    The shard is determined from the instance given as a hint if
+    possible, and otherwise from the current shard set by
+    :py:func:`sharding.routing.use_shard`. Other models are written to
+    the default database, and reads of them are left to the routers
+    that follow this one.
+    """
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        """
+        Determine if migrations may be run on a database.
+
+        Shards are created empty and receive their data from
+        ``syncshards`` and ``movekmuser``, so data migrations are only
+        run on the default database. A data migration that must also
+        update the rows on every shard can opt in by passing the name
+        of a sharded model in its hints, and must then use the
+        database of the schema editor it is given.
+
+        Args:
+            db:
+                The alias of the database.
+            app_label:
+                The label of the app being migrated.
+            model_name:
+                The name of the model being migrated, which is only
+                given for operations that change a model's schema
+                unless a data migration provides it as a hint.
+            **hints:
+                Additional information about the migration.
+
+        Returns:
+            ``False`` for data migrations on shards, and ``None`` to
+            let the other routers decide otherwise.
+        """
+        if db in settings.SHARD_DATABASES and model_name is None:
+            return False
+
+        return None
+
+    def allow_relation(self, obj1, obj2, **hints):
+        """
+        Determine if a relation between two objects is allowed.
+
+        Args:
+            obj1:
+                The first object.
+            obj2:
+                The second object.
+            **hints:
+                Additional information about the relation.
+
+        Returns:
+            ``True`` if sharding is enabled because every shard has a
+            copy of the users that sharded data refers to, and ``None``
+            to let Django decide otherwise.
+        """
+        if routing.is_enabled():
+            return True
+
+        return None
+
+    def db_for_read(self, model, **hints):
+        """
+        Get the database to read a model from.
+
+        Args:
+            model:
+                The model being read.
+            **hints:
+                Additional information about the query.
+
+        Returns:
+            The alias of a shard for sharded models, or ``None`` for
+            other models.
+        """
+        if not routing.is_sharded(model):
+            return None
+
+        return self._get_shard(model, hints)
+
+    def db_for_write(self, model, **hints):
+        """
+        Get the database to write a model to.
+
+        Args:
+            model:
+                The model being written.
+            **hints:
+                Additional information about the query.
+
+        Returns:
+            The alias of a shard for sharded models, the default
+            database for other models if sharding is enabled, and
+            ``None`` otherwise.
+        """
+        if not routing.is_sharded(model):
+            # Without an explicit database, Django would write the
+            # instance to the database of a related instance given as a
+            # hint, which may be a shard.
+            if routing.is_enabled():
+                return routing.DEFAULT_DATABASE
+
+            return None
+
+        return self._get_shard(model, hints)
+
+    @staticmethod
+    def _get_shard(model, hints):
+        """
+        Get the shard that a query should be sent to.
+
+        Args:
+            model:
+                The model being queried.
+            hints:
+                Additional information about the query.
+
+        Returns:
+            The alias of the shard, or ``None`` if sharding is
+            disabled.
+        """
+        if not routing.is_enabled():
+            return None
+
+        instance = hints.get("instance")
+        if instance is not None:
+            database = routing.get_instance_shard(instance)
+            if database is not None:
+                return database
+
+        return routing.get_current_shard() or routing.DEFAULT_DATABASE
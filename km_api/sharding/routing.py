@@ -0,0 +1,282 @@
+"""Lookups in the shard map and tracking of the current shard.
+"""
+
+import contextlib
+import threading
+
+from django.apps import apps
+from django.conf import settings
+from django.db.models import Count
+
+
+DEFAULT_DATABASE = "default"
+
+# The apps whose models are stored on shards.
+SHARDED_APP_LABELS = ("profile", "journal")
+
+# Models from other apps that are stored on shards. Search entries
+# must live next to the journal entries they index.
+SHARDED_MODEL_LABELS = ("watson.searchentry",)
+
+_state = threading.local()
+
+
+def choose_shard():
+    """
+    Choose the shard to store a new Know Me user's data on.
+
+    Returns:
+        The alias of the shard with the fewest Know Me users.
+    """
+    from know_me.models import KMUser
+    from sharding.models import ShardAssignment
+
+    counts = dict(
+        ShardAssignment.objects.using(DEFAULT_DATABASE)
+        .values_list("database")
+        .annotate(count=Count("pk"))
+    )
+    counts[DEFAULT_DATABASE] = KMUser.objects.using(
+        DEFAULT_DATABASE
+    ).count() - sum(
+        count
+        for database, count in counts.items()
+        if database != DEFAULT_DATABASE
+    )
+
+    return min(get_shards(), key=lambda database: counts.get(database, 0))
+
+
+def get_current_shard():
+    """
+    Get the shard that sharded queries without a more specific hint are
+    sent to.
+
+    Returns:
+        The alias of the current shard, or ``None`` if there is no
+        current shard.
+    """
+    return getattr(_state, "shard", None)
+
+
+def get_instance_shard(instance):
+    """
+    Get the shard that data related to an instance is stored on.
+
+    Args:
+        instance:
+            A sharded model instance or a Know Me user.
+
+    Returns:
+        The alias of the shard, or ``None`` if it cannot be determined
+        from the instance.
+    """
+    from know_me.models import KMUser
+
+    if isinstance(instance, KMUser):
+        return get_km_user_shard(instance.pk)
+
+    if not is_sharded(type(instance)):
+        return None
+
+    if instance._state.db is not None:
+        return instance._state.db
+
+    km_user_id = getattr(instance, "km_user_id", None)
+    if km_user_id is not None:
+        return get_km_user_shard(km_user_id)
+
+    # Instances without an owner, such as comments, are stored with the
+    # object they belong to.
+    for related in instance._state.fields_cache.values():
+        if (
+            related is not None
+            and is_sharded(type(related))
+            and related._state.db is not None
+        ):
+            return related._state.db
+
+    return None
+
+
+def get_km_user_shard(km_user_id):
+    """
+    Get the shard that a Know Me user's data is stored on.
+
+    Args:
+        km_user_id:
+            The ID of the Know Me user.
+
+    Returns:
+        The alias of the shard.
+    """
+    if not is_enabled():
+        return DEFAULT_DATABASE
+
+    current = getattr(_state, "km_user", None)
+    if current is not None and str(current[0]) == str(km_user_id):
+        return current[1]
+
+    from sharding.models import ShardAssignment
+
+    database = (
+        ShardAssignment.objects.using(DEFAULT_DATABASE)
+        .filter(km_user_id=km_user_id)
+        .values_list("database", flat=True)
+        .first()
+    )
+
+    return database or DEFAULT_DATABASE
+
+
+def get_km_user_shards(km_user_ids):
+    """
+    Group Know Me users by the shard their data is stored on.
+
+    Args:
+        km_user_ids:
+            The IDs of the Know Me users.
+
+    Returns:
+        A dictionary mapping the alias of each shard that stores data
+        for any of the Know Me users to a list of the IDs of the Know Me
+        users whose data it stores.
+    """
+    km_user_ids = list(km_user_ids)
+    if not km_user_ids:
+        return {}
+
+    if not is_enabled():
+        return {DEFAULT_DATABASE: km_user_ids}
+
+    from sharding.models import ShardAssignment
+
+    assignments = dict(
+        ShardAssignment.objects.using(DEFAULT_DATABASE)
+        .filter(km_user_id__in=km_user_ids)
+        .values_list("km_user_id", "database")
+    )
+
+    shards = {}
+    for km_user_id in km_user_ids:
+        database = assignments.get(km_user_id, DEFAULT_DATABASE)
+        shards.setdefault(database, []).append(km_user_id)
+
+    return shards
+
+
+def get_shards():
+    """
+    Get every database that sharded data may be stored on.
+
+    Returns:
+        A list containing the alias of each shard, starting with the
+        default database.
+    """
+    return [DEFAULT_DATABASE] + list(settings.SHARD_DATABASES)
+
+
+def get_sharded_models():
+    """
+    Get the models owned by Know Me users that are stored on shards.
+
+    Returns:
+        A list of the sharded models from the sharded apps.
+    """
+    return [
+        model
+        for app_label in SHARDED_APP_LABELS
+        for model in apps.get_app_config(app_label).get_models()
+    ]
+
+
+def is_enabled():
+    """
+    Determine if sharding is enabled.
+
+    Returns:
+        A boolean indicating if there are any shards besides the default
+        database.
+    """
+    return bool(settings.SHARD_DATABASES)
+
+
+def is_sharded(model):
+    """
+    Determine if a model is stored on shards.
+
+    Args:
+        model:
+            The model to check.
+
+    Returns:
+        A boolean indicating if the model's rows are stored on the shard
+        of the Know Me user who owns them.
+    """
+    return (
+        model._meta.app_label in SHARDED_APP_LABELS
+        or model._meta.label_lower in SHARDED_MODEL_LABELS
+    )
+
+
+def locate(model, pk):
+    """
+    Find the shard that a sharded row is stored on.
+
+    Because the IDs of sharded rows are unique across shards, at most
+    one shard contains the row.
+
+    Args:
+        model:
+            The model of the row.
+        pk:
+            The primary key of the row.
+
+    Returns:
+        The alias of the shard containing the row, or ``None`` if the
+        row does not exist.
+    """
+    for database in get_shards():
+        if model._base_manager.using(database).filter(pk=pk).exists():
+            return database
+
+    return None
+
+
+@contextlib.contextmanager
+def use_km_user_shard(km_user_id):
+    """
+    Send sharded queries made in the block to a Know Me user's shard.
+
+    Args:
+        km_user_id:
+            The ID of the Know Me user.
+    """
+    database = get_km_user_shard(km_user_id)
+
+    previous = getattr(_state, "km_user", None)
+    _state.km_user = (km_user_id, database)
+
+    try:
+        with use_shard(database):
+            yield database
+    finally:
+        _state.km_user = previous
+
+
+@contextlib.contextmanager
+def use_shard(database):
+    """
+    Send sharded queries made in the block to a specific shard.
+
+    Args:
+        database:
+            The alias of the shard.
+    """
+    previous = get_current_shard()
+    _state.shard = database
+
+    try:
+        yield database
+    finally:
+        _state.shard = previous
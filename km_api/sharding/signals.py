@@ -0,0 +1,99 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from know_me.models import KMUser
+from sharding import ids, models, references, routing
+
+
+@receiver(post_save, sender=KMUser)
+def assign_shard(instance, created, raw=False, using=None, **kwargs):
+    """
+    Choose the shard that a new Know Me user's data is stored on.
+
+    Args:
+        instance:
+            The Know Me user that was saved.
+        created:
+            A boolean indicating if the Know Me user was created.
+        raw:
+            A boolean indicating if the instance is being loaded from a
+            fixture.
+        using:
+            The alias of the database the instance was saved to.
+    """
+    if (
+        not routing.is_enabled()
+        or not created
+        or raw
+        or using != routing.DEFAULT_DATABASE
+    ):
+        return
+
+    models.ShardAssignment.objects.using(routing.DEFAULT_DATABASE).create(
+        database=routing.choose_shard(), km_user=instance
+    )
+
+
+@receiver(pre_save)
+def assign_sharded_id(sender, instance, raw=False, **kwargs):
+    """
+    Give new rows of sharded models an ID that is unique across shards.
+
+    Args:
+        sender:
+            The model of the instance being saved.
+        instance:
+            The instance being saved.
+        raw:
+            A boolean indicating if the instance is being loaded from a
+            fixture.
+    """
+    if (
+        not routing.is_enabled()
+        or raw
+        or instance.pk is not None
+        or sender._meta.app_label not in routing.SHARDED_APP_LABELS
+    ):
+        return
+
+    instance.pk = ids.allocate_id()
+
+
+@receiver(post_delete, sender=KMUser)
+@receiver(post_delete, sender=get_user_model())
+def delete_reference_copies(instance, using=None, **kwargs):
+    """
+    Delete the copies of a user or Know Me user from every shard.
+
+    Args:
+        instance:
+            The user or Know Me user that was deleted.
+        using:
+            The alias of the database the instance was deleted from.
+    """
+    if not routing.is_enabled() or using != routing.DEFAULT_DATABASE:
+        return
+
+    references.delete_copies(instance)
+
+
+@receiver(post_save, sender=KMUser)
+@receiver(post_save, sender=get_user_model())
+def update_reference_copies(instance, raw=False, using=None, **kwargs):
+    """
+    Update the copies of a user or Know Me user on every shard.
+
+    Args:
+        instance:
+            The user or Know Me user that was saved.
+        raw:
+            A boolean indicating if the instance is being loaded from a
+            fixture.
+        using:
+            The alias of the database the instance was saved to.
+    """
+    if not routing.is_enabled() or raw or using != routing.DEFAULT_DATABASE:
+        return
+
+    references.update_copies(instance)
@@ -0,0 +1,45 @@
+from unittest import mock
+
+from django.core import management
+
+import pytest
+
+from sharding import moves
+
+
+def test_move(km_user_factory, settings):
+    """
+    The command should move the Know Me user to the given shard.
+    """
+    km_user = km_user_factory()
+    settings.SHARD_DATABASES = ["shard0"]
+
+    with mock.patch.object(
+        moves, "move_km_user", autospec=True, return_value=3
+    ) as mock_move:
+        management.call_command("movekmuser", str(km_user.pk), "shard0")
+
+    assert mock_move.call_args[0] == (km_user, "shard0")
+
+
+@pytest.mark.django_db
+def test_move_missing_km_user(settings):
+    """
+    Moving a Know Me user that does not exist should fail.
+    """
+    settings.SHARD_DATABASES = ["shard0"]
+
+    with pytest.raises(management.CommandError):
+        management.call_command("movekmuser", "1", "shard0")
+
+
+def test_move_unknown_shard(km_user_factory, settings):
+    """
+    Moving a Know Me user to a database that is not a shard should
+    fail.
+    """
+    km_user = km_user_factory()
+    settings.SHARD_DATABASES = ["shard0"]
+
+    with pytest.raises(management.CommandError):
+        management.call_command("movekmuser", str(km_user.pk), "shard9")
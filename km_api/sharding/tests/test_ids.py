@@ -0,0 +1,43 @@
+import pytest
+
+from sharding import ids
+
+
+@pytest.mark.django_db
+def test_allocate_block():
+    """
+    The IDs allocated from a block should be consecutive.
+    """
+    allocator = ids.IdAllocator()
+
+    first = allocator.allocate()
+    second = allocator.allocate()
+
+    assert second == first + 1
+    assert first % ids.BLOCK_SIZE == 0
+
+
+@pytest.mark.django_db
+def test_allocate_new_block():
+    """
+    Once a block is used up, another block should be reserved.
+    """
+    allocator = ids.IdAllocator()
+
+    allocated = [allocator.allocate() for _ in range(ids.BLOCK_SIZE + 1)]
+
+    assert len(set(allocated)) == len(allocated)
+    assert allocated[-1] // ids.BLOCK_SIZE > allocated[0] // ids.BLOCK_SIZE
+
+
+def test_seed_blocks(profile_factory, settings):
+    """
+    Seeding should ensure allocated IDs are above the IDs of existing
+    sharded rows.
+    """
+    settings.SHARD_DATABASES = []
+    profile = profile_factory()
+
+    ids.seed_blocks()
+
+    assert ids.IdAllocator().allocate() > profile.pk
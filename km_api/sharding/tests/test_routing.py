@@ -0,0 +1,135 @@
+import pytest
+
+from know_me.journal.models import Entry
+from know_me.models import KMUser
+from know_me.profile.models import Profile
+from sharding import models, routing
+
+
+def test_choose_shard(km_user_factory, settings):
+    """
+    New Know Me users should be assigned to the shard with the fewest
+    Know Me users.
+    """
+    km_user_factory()
+    models.ShardAssignment.objects.create(
+        database="shard0", km_user=km_user_factory()
+    )
+    models.ShardAssignment.objects.create(
+        database="shard0", km_user=km_user_factory()
+    )
+    settings.SHARD_DATABASES = ["shard0", "shard1"]
+
+    assert routing.choose_shard() == "shard1"
+
+
+def test_get_km_user_shard_assigned(km_user_factory, settings):
+    """
+    The shard of a Know Me user should be read from their assignment.
+    """
+    km_user = km_user_factory()
+    models.ShardAssignment.objects.create(database="shard0", km_user=km_user)
+    settings.SHARD_DATABASES = ["shard0"]
+
+    assert routing.get_km_user_shard(km_user.pk) == "shard0"
+
+
+def test_get_km_user_shard_current(settings):
+    """
+    Inside a block for a Know Me user, their shard should be known
+    without a query.
+    """
+    settings.SHARD_DATABASES = ["shard0"]
+    routing._state.km_user = (1, "shard0")
+
+    try:
+        assert routing.get_km_user_shard(1) == "shard0"
+    finally:
+        routing._state.km_user = None
+
+
+def test_get_km_user_shards(km_user_factory, settings):
+    """
+    Know Me users should be grouped by the shard their data is stored
+    on, with unassigned Know Me users on the default database.
+    """
+    k1, k2, k3 = km_user_factory(), km_user_factory(), km_user_factory()
+    models.ShardAssignment.objects.create(database="shard0", km_user=k2)
+    settings.SHARD_DATABASES = ["shard0"]
+
+    assert routing.get_km_user_shards([k1.pk, k2.pk, k3.pk]) == {
+        "default": [k1.pk, k3.pk],
+        "shard0": [k2.pk],
+    }
+
+
+def test_get_km_user_shards_disabled(settings):
+    """
+    If sharding is disabled, every Know Me user should be on the default
+    database without a query.
+    """
+    settings.SHARD_DATABASES = []
+
+    assert routing.get_km_user_shards([1, 2]) == {"default": [1, 2]}
+
+
+def test_get_km_user_shards_empty(settings):
+    """
+    Grouping no Know Me users should not give any shards.
+    """
+    settings.SHARD_DATABASES = ["shard0"]
+
+    assert routing.get_km_user_shards([]) == {}
+
+
+@pytest.mark.django_db
+def test_get_km_user_shard_unassigned(settings):
+    """
+    Know Me users without an assignment should be stored on the default
+    database.
+    """
+    settings.SHARD_DATABASES = ["shard0"]
+
+    assert routing.get_km_user_shard(1) == "default"
+
+
+def test_is_sharded():
+    """
+    Models from the profile and journal apps should be sharded.
+    """
+    assert routing.is_sharded(Entry)
+    assert routing.is_sharded(Profile)
+    assert not routing.is_sharded(KMUser)
+
+
+def test_locate(profile_factory, settings):
+    """
+    Locating a row should return the shard that stores it.
+    """
+    settings.SHARD_DATABASES = []
+    profile = profile_factory()
+
+    assert routing.locate(Profile, profile.pk) == "default"
+
+
+@pytest.mark.django_db
+def test_locate_missing(settings):
+    """
+    Locating a row that does not exist should return ``None``.
+    """
+    settings.SHARD_DATABASES = []
+
+    assert routing.locate(Profile, 1) is None
+
+
+def test_use_shard_nested():
+    """
+    Leaving a nested shard block should restore the outer shard.
+    """
+    with routing.use_shard("shard0"):
+        with routing.use_shard("shard1"):
+            assert routing.get_current_shard() == "shard1"
+
+        assert routing.get_current_shard() == "shard0"
+
+    assert routing.get_current_shard() is None
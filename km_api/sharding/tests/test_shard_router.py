@@ -0,0 +1,154 @@
+from know_me.models import KMUser
+from know_me.profile.models import Profile
+from sharding import models, routers, routing
+
+
+def test_allow_migrate_data_migration_default(settings):
+    """
+    Data migrations should be run on the default database.
+    """
+    settings.SHARD_DATABASES = ["shard0"]
+    router = routers.ShardRouter()
+
+    assert router.allow_migrate("default", "know_me") is None
+
+
+def test_allow_migrate_data_migration_shard(settings):
+    """
+    Data migrations should not be run on shards because their data is
+    copied from the default database.
+    """
+    settings.SHARD_DATABASES = ["shard0"]
+    router = routers.ShardRouter()
+
+    assert router.allow_migrate("shard0", "know_me") is False
+
+
+def test_allow_migrate_schema_shard(settings):
+    """
+    Schema changes should be left to the other routers on shards.
+    """
+    settings.SHARD_DATABASES = ["shard0"]
+    router = routers.ShardRouter()
+
+    assert (
+        router.allow_migrate("shard0", "know_me", model_name="kmuser") is None
+    )
+
+
+def test_allow_relation_disabled(settings):
+    """
+    If sharding is disabled, Django should decide if relations are
+    allowed.
+    """
+    settings.SHARD_DATABASES = []
+    router = routers.ShardRouter()
+
+    assert router.allow_relation(None, None) is None
+
+
+def test_allow_relation_enabled(settings):
+    """
+    If sharding is enabled, relations between databases should be
+    allowed because users are copied to every shard.
+    """
+    settings.SHARD_DATABASES = ["shard0"]
+    router = routers.ShardRouter()
+
+    assert router.allow_relation(None, None) is True
+
+
+def test_db_for_read_current_shard(settings):
+    """
+    Without an instance hint, sharded models should be read from the
+    current shard.
+    """
+    settings.SHARD_DATABASES = ["shard0"]
+    router = routers.ShardRouter()
+
+    with routing.use_shard("shard0"):
+        assert router.db_for_read(Profile) == "shard0"
+
+
+def test_db_for_read_disabled(settings):
+    """
+    If sharding is disabled, the router should not choose a database.
+    """
+    settings.SHARD_DATABASES = []
+    router = routers.ShardRouter()
+
+    with routing.use_shard("shard0"):
+        assert router.db_for_read(Profile) is None
+
+
+def test_db_for_read_instance_hint(km_user_factory, settings):
+    """
+    If a Know Me user is given as a hint, their data should be read
+    from their shard.
+    """
+    km_user = km_user_factory()
+    models.ShardAssignment.objects.create(database="shard0", km_user=km_user)
+    settings.SHARD_DATABASES = ["shard0"]
+    router = routers.ShardRouter()
+
+    assert router.db_for_read(Profile, instance=km_user) == "shard0"
+
+
+def test_db_for_read_no_shard(settings):
+    """
+    Without a hint or a current shard, sharded models should be read
+    from the default database.
+    """
+    settings.SHARD_DATABASES = ["shard0"]
+    router = routers.ShardRouter()
+
+    assert router.db_for_read(Profile) == "default"
+
+
+def test_db_for_read_not_sharded(settings):
+    """
+    Models that are not sharded should be left to the other routers.
+    """
+    settings.SHARD_DATABASES = ["shard0"]
+    router = routers.ShardRouter()
+
+    with routing.use_shard("shard0"):
+        assert router.db_for_read(KMUser) is None
+
+
+def test_db_for_write_saved_instance(km_user_factory, settings):
+    """
+    Saved instances of sharded models should be written to the database
+    they were loaded from.
+    """
+    profile = Profile(km_user=km_user_factory())
+    profile._state.db = "shard0"
+    settings.SHARD_DATABASES = ["shard0"]
+    router = routers.ShardRouter()
+
+    assert router.db_for_write(Profile, instance=profile) == "shard0"
+
+
+def test_db_for_write_not_sharded(km_user_factory, settings):
+    """
+    If sharding is enabled, models that are not sharded should be
+    written to the default database even if a related instance was
+    loaded from a shard.
+    """
+    profile = Profile(km_user=km_user_factory())
+    profile._state.db = "shard0"
+    settings.SHARD_DATABASES = ["shard0"]
+    router = routers.ShardRouter()
+
+    assert router.db_for_write(KMUser, instance=profile) == "default"
+
+
+def test_db_for_write_not_sharded_disabled(settings):
+    """
+    If sharding is disabled, the router should not choose a database
+    for models that are not sharded.
+    """
+    settings.SHARD_DATABASES = []
+    router = routers.ShardRouter()
+
+    assert router.db_for_write(KMUser) is None
@@ -0,0 +1,74 @@
+from unittest import mock
+
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.urls import reverse
+
+import pytest
+
+from sharding import middleware, models, routing
+
+
+def test_get_km_user_view(km_user_factory, settings):
+    """
+    Requests for a Know Me user's data should be sent to the Know Me
+    user's shard.
+    """
+    km_user = km_user_factory()
+    models.ShardAssignment.objects.create(database="shard0", km_user=km_user)
+    settings.SHARD_DATABASES = ["shard0"]
+
+    request = RequestFactory().get(
+        reverse("know-me:profile:profile-list", kwargs={"pk": km_user.pk})
+    )
+
+    def get_response(request):
+        assert routing.get_current_shard() == "shard0"
+
+        return HttpResponse()
+
+    middleware.ShardRoutingMiddleware(get_response)(request)
+
+    assert routing.get_current_shard() is None
+
+
+def test_get_lookup_model_view(profile_factory, settings):
+    """
+    Requests for an object owned by a Know Me user should be sent to the
+    shard storing the object.
+    """
+    profile = profile_factory()
+    settings.SHARD_DATABASES = ["shard0"]
+
+    request = RequestFactory().get(
+        reverse("know-me:profile:profile-detail", kwargs={"pk": profile.pk})
+    )
+
+    def get_response(request):
+        assert routing.get_current_shard() == "default"
+
+        return HttpResponse()
+
+    # Only the default database exists in tests.
+    with mock.patch.object(
+        routing, "get_shards", autospec=True, return_value=["default"]
+    ):
+        middleware.ShardRoutingMiddleware(get_response)(request)
+
+
+@pytest.mark.django_db
+def test_get_unrelated_view(settings):
+    """
+    Requests for views that are not owned by a Know Me user should not
+    set a shard.
+    """
+    settings.SHARD_DATABASES = ["shard0"]
+
+    request = RequestFactory().get("/")
+
+    def get_response(request):
+        assert routing.get_current_shard() is None
+
+        return HttpResponse()
+
+    middleware.ShardRoutingMiddleware(get_response)(request)
@@ -0,0 +1,59 @@
+from unittest import mock
+
+from know_me.profile.models import Profile
+from sharding import ids, models, routing, signals
+
+
+def test_assign_shard(km_user_factory, settings):
+    """
+    New Know Me users should be assigned to a shard.
+    """
+    km_user = km_user_factory()
+    settings.SHARD_DATABASES = ["shard0"]
+
+    with mock.patch.object(
+        routing, "choose_shard", autospec=True, return_value="shard0"
+    ):
+        signals.assign_shard(
+            instance=km_user, created=True, using=routing.DEFAULT_DATABASE
+        )
+
+    assert models.ShardAssignment.objects.get().database == "shard0"
+
+
+def test_assign_shard_disabled(km_user_factory, settings):
+    """
+    If sharding is disabled, Know Me users should not be assigned to a
+    shard.
+    """
+    settings.SHARD_DATABASES = []
+    km_user_factory()
+
+    assert not models.ShardAssignment.objects.exists()
+
+
+def test_assign_sharded_id(settings):
+    """
+    New rows of sharded models should be given an allocated ID.
+    """
+    settings.SHARD_DATABASES = ["shard0"]
+    profile = Profile()
+
+    with mock.patch.object(
+        ids, "allocate_id", autospec=True, return_value=1234
+    ):
+        signals.assign_sharded_id(sender=Profile, instance=profile)
+
+    assert profile.pk == 1234
+
+
+def test_assign_sharded_id_disabled(settings):
+    """
+    If sharding is disabled, IDs should be left to the database.
+    """
+    settings.SHARD_DATABASES = []
+    profile = Profile()
+
+    signals.assign_sharded_id(sender=Profile, instance=profile)
+
+    assert profile.pk is None
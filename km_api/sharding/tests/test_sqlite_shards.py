@@ -0,0 +1,136 @@
+import io
+
+from django.contrib.auth import get_user_model
+from django.core import management
+from django.db import connections
+
+import pytest
+from rest_framework import status
+
+from know_me.journal.models import Entry
+from know_me.models import KMUserAccess
+from sharding import models, moves, routing
+
+
+SHARD = "shard0"
+
+
+@pytest.fixture
+def sqlite_shard(settings, tmpdir, transactional_db):
+    """
+    Add a shard stored in its own SQLite file and prepare it the same
+    way a new shard is prepared in production.
+
+    Data is committed by the ``transactional_db`` fixture so that it is
+    visible through the shard's connection.
+    """
+    connections.databases[SHARD] = {
+        **connections["default"].settings_dict,
+        "NAME": str(tmpdir.join(f"{SHARD}.sqlite3")),
+    }
+    settings.SHARD_DATABASES = [SHARD]
+
+    management.call_command("migrate", database=SHARD, verbosity=0)
+    management.call_command("syncshards", stdout=io.StringIO())
+
+    yield SHARD
+
+    connections[SHARD].close()
+    delattr(connections._connections, SHARD)
+    del connections.databases[SHARD]
+
+
+@pytest.fixture
+def shared_entry(
+    km_user_accessor_factory,
+    km_user_factory,
+    sqlite_shard,
+    subscription_factory,
+    user_factory,
+):
+    """
+    Create a journal entry owned by a premium Know Me user who shares
+    their account with another user.
+    """
+    km_user = km_user_factory()
+    subscription_factory(is_active=True, user=km_user.user)
+    km_user_accessor_factory(
+        is_accepted=True, km_user=km_user, user_with_access=user_factory()
+    )
+
+    # Factories save to the default database explicitly, so the entry
+    # is created the same way a request would create it.
+    with routing.use_km_user_shard(km_user.pk):
+        return Entry.objects.create(km_user=km_user, text="Shared entry")
+
+
+def assert_can_read(api_client, entry):
+    """
+    Assert that the owner of an entry's Know Me user and the user it is
+    shared with can both read the entry.
+    """
+    accessor = entry.km_user.km_user_accessors.get()
+
+    for user in (entry.km_user.user, accessor.user_with_access):
+        api_client.force_authenticate(user=user)
+        response = api_client.get(entry.get_absolute_url())
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["id"] == entry.pk
+
+
+def test_migrate_shard(sqlite_shard, user_factory):
+    """
+    A new shard should be migrated without running the data migrations
+    of the default database and then receive a copy of every user.
+    """
+    user = user_factory()
+
+    assert (
+        get_user_model()
+        .objects.using(sqlite_shard)
+        .filter(pk=user.pk)
+        .exists()
+    )
+    assert not KMUserAccess.objects.using(sqlite_shard).exists()
+
+
+def test_move_km_user(api_client, shared_entry, sqlite_shard):
+    """
+    Moving a Know Me user between shards should move their data while
+    the owner and the users it is shared with can still read it.
+    """
+    km_user = shared_entry.km_user
+
+    assert models.ShardAssignment.objects.get(km_user=km_user).database == (
+        sqlite_shard
+    )
+    assert (
+        Entry.objects.using(sqlite_shard).filter(pk=shared_entry.pk).exists()
+    )
+    assert_can_read(api_client, shared_entry)
+
+    moved = moves.move_km_user(km_user, "default")
+
+    assert moved == 1
+    assert models.ShardAssignment.objects.get(km_user=km_user).database == (
+        "default"
+    )
+    assert not Entry.objects.using(sqlite_shard).exists()
+    assert_can_read(api_client, Entry.objects.using("default").get())
+
+    moves.move_km_user(km_user, sqlite_shard)
+
+    assert not Entry.objects.using("default").exists()
+    assert_can_read(api_client, Entry.objects.using(sqlite_shard).get())
+
+
+def test_read_related_from_shard(shared_entry, sqlite_shard):
+    """
+    Models that are not sharded should be read from the default database
+    even when they are related to an instance loaded from a shard.
+    """
+    entry = Entry.objects.using(sqlite_shard).get(pk=shared_entry.pk)
+
+    assert entry.km_user._state.db == "default"
+    assert entry.km_user.km_user_accessors.count() == 1
@@ -0,0 +1,10 @@
+"""Startup of the project's processes.
+
+Every web worker, management command, and scheduled job imports the
+project's settings, so work done there delays all of them. This app
+contains the pieces of startup that are deferred until they are needed,
+and the ``importprofile`` management command, which reports the time
+taken to import each module while the project starts.
+"""
+
+default_app_config = "startup.apps.StartupConfig"
@@ -0,0 +1,14 @@
+"""App configurations for the ``startup`` module.
+"""
+
+from django.apps import AppConfig
+from django.utils.translation import ugettext_lazy as _
+
+
+class StartupConfig(AppConfig):
+    """
+    Default app config.
+    """
+
+    name = "startup"
+    verbose_name = _("Startup")
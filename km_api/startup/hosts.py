@@ -0,0 +1,213 @@
+"""Lazy discovery of the hosts that the API is served from.
+
+When running as an ECS task, the load balancer checks the status
+endpoint using the private IP of the task, which is only known from the
+ECS metadata endpoint. The IP is looked up the first time the allowed
+hosts are used, rather than when the settings are imported, so that
+processes which never validate a host do not make the request at all.
+
+The discovered hosts are written to a file so that other processes in
+the same container can reuse them without querying the endpoint again.
+
+This module is imported by the settings, so it must not import anything
+that requires Django to be configured.
+"""
+
+import collections.abc
+import json
+import logging
+import os
+import socket
+import tempfile
+import threading
+import time
+
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_CACHE_PATH = os.path.join(
+    tempfile.gettempdir(), "km-api-ecs-hosts.json"
+)
+
+METADATA_TIMEOUT = 2
+"""
+The number of seconds to wait for a response from the metadata
+endpoint.
+"""
+
+METADATA_URL = "http://169.254.170.2/v2/metadata"
+
+RETRY_INTERVAL = 60
+"""
+The number of seconds to wait before querying the metadata endpoint
+again after a failed attempt.
+"""
+
+
+class LazyHostList(collections.abc.Sequence):
+    """
+    List of hosts that includes hosts discovered the first time it is
+    used.
+
+    If discovery fails, only the static hosts are used until discovery
+    is attempted again.
+    """
+
+    def __init__(self, hosts, discover):
+        """
+        Create a new host list.
+
+        Args:
+            hosts:
+                The hosts that are known in advance.
+            discover:
+                A function returning a list of additional hosts.
+        """
+        self._discover = discover
+        self._failed_at = None
+        self._hosts = list(hosts)
+        self._lock = threading.Lock()
+        self._resolved = None
+
+    def __getitem__(self, index):
+        """
+        Get a host from the list.
+        """
+        return self.resolve()[index]
+
+    def __len__(self):
+        """
+        Returns:
+            The number of hosts in the list.
+        """
+        return len(self.resolve())
+
+    def __repr__(self):
+        """
+        Returns:
+            A string containing the hosts in the list.
+        """
+        return f"<{self.__class__.__name__}: {self.resolve()!r}>"
+
+    def resolve(self):
+        """
+        Get the complete list of hosts, discovering them if necessary.
+
+        Returns:
+            A list containing the static and discovered hosts.
+        """
+        if self._resolved is not None:
+            return self._resolved
+
+        with self._lock:
+            if self._resolved is not None:
+                return self._resolved
+
+            if (
+                self._failed_at is not None
+                and time.monotonic() - self._failed_at < RETRY_INTERVAL
+            ):
+                return self._hosts
+
+            try:
+                discovered = self._discover()
+            except Exception:
+                logger.warning("Failed to discover hosts.", exc_info=True)
+                self._failed_at = time.monotonic()
+
+                return self._hosts
+
+            self._resolved = self._hosts + [
+                host for host in discovered if host not in self._hosts
+            ]
+
+        return self._resolved
+
+
+def discover_ecs_hosts(cache_path=DEFAULT_CACHE_PATH):
+    """
+    Get the private IP of the ECS task running the process.
+
+    Args:
+        cache_path:
+            The path of the file to cache the result in.
+
+    Returns:
+        A list containing the task's private IP.
+    """
+    hosts = read_cache(cache_path)
+    if hosts is not None:
+        return hosts
+
+    # Requests is imported here because most processes never need it.
+    import requests
+
+    response = requests.get(METADATA_URL, timeout=METADATA_TIMEOUT)
+    response.raise_for_status()
+
+    container = response.json()["Containers"][0]
+    hosts = [container["Networks"][0]["IPv4Addresses"][0]]
+
+    write_cache(cache_path, hosts)
+    logger.info("Discovered ECS hosts %s.", hosts)
+
+    return hosts
+
+
+def read_cache(path):
+    """
+    Read the hosts cached by another process.
+
+    Args:
+        path:
+            The path of the cache file.
+
+    Returns:
+        The cached hosts, or ``None`` if there is no usable cache. A
+        cache written by a different container is not used.
+    """
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(data, dict) or data.get("hostname") != (
+        socket.gethostname()
+    ):
+        return None
+
+    return data.get("hosts")
+
+
+def write_cache(path, hosts):
+    """
+    Cache discovered hosts for other processes.
+
+    The file is replaced atomically so that other processes never read a
+    partially written cache. Failing to write the cache is not an error.
+
+    Args:
+        path:
+            The path of the cache file.
+        hosts:
+            The hosts to cache.
+    """
+    data = {"hostname": socket.gethostname(), "hosts": hosts}
+
+    try:
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".")
+    except OSError:
+        logger.warning("Failed to cache hosts in %s.", path, exc_info=True)
+
+        return
+
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f)
+
+        os.replace(temp_path, path)
+    except OSError:
+        logger.warning("Failed to cache hosts in %s.", path, exc_info=True)
+        os.unlink(temp_path)
@@ -0,0 +1,107 @@
+import subprocess
+
+from django.conf import settings
+from django.core import management
+
+from startup import profiling
+
+
+class Command(management.BaseCommand):
+    """
+    Management command to report the time taken to import each module
+    while the project starts.
+    """
+
+    help = (
+        "Start the project in a new process and report the modules that "
+        "took the longest to import."
+    )
+
+    def add_arguments(self, parser):
+        """
+        Add arguments to the command.
+
+        Args:
+            parser:
+                The parser to add arguments to.
+        """
+        parser.add_argument(
+            "--limit",
+            default=25,
+            help="The number of modules to report. Defaults to 25.",
+            type=int,
+        )
+        parser.add_argument(
+            "--sort",
+            choices=("cumulative", "self"),
+            default="cumulative",
+            help=(
+                "Sort by the cumulative time including nested imports, or by "
+                "the time spent in the module itself. Defaults to "
+                "cumulative."
+            ),
+        )
+        parser.add_argument(
+            "--wsgi",
+            action="store_true",
+            help=(
+                "Also load the WSGI application, as a web worker does when "
+                "it starts."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        """
+        Execute the command.
+
+        Args:
+            *args:
+                Positional arguments provided to the command.
+            **options:
+                Keyword arguments provided to the command.
+        """
+        results = self.profile(options["wsgi"])
+        entries = sorted(
+            results["entries"],
+            key=lambda entry: entry[options["sort"]],
+            reverse=True,
+        )
+
+        self.stdout.write(
+            f"Imported {len(entries)} modules in "
+            f"{results['total'] * 1000:.1f} ms."
+        )
+        self.stdout.write("")
+        self.stdout.write(f"{'cumulative':>12} {'self':>10}  module")
+
+        for entry in entries[: options["limit"]]:
+            self.stdout.write(
+                f"{entry['cumulative'] * 1000:>9.1f} ms "
+                f"{entry['self'] * 1000:>7.1f} ms  {entry['module']}"
+            )
+
+    @staticmethod
+    def profile(load_wsgi):
+        """
+        Profile the project's startup in a new interpreter.
+
+        Args:
+            load_wsgi:
+                A boolean indicating if the WSGI application should be
+                loaded.
+
+        Returns:
+            The results of :py:func:`startup.profiling.profile_startup`.
+
+        Raises:
+            CommandError:
+                If the project fails to start.
+        """
+        try:
+            return profiling.profile_startup(
+                load_wsgi=load_wsgi, cwd=settings.BASE_DIR
+            )
+        except subprocess.CalledProcessError as e:
+            raise management.CommandError(
+                f"Failed to start the project:\n{e.stderr}"
+            )
@@ -0,0 +1,112 @@
+"""Measurement of the time taken to import each module.
+
+The project is started in a new interpreter with Python's
+``-X importtime`` option, and the timings it writes to standard error
+are parsed. Because modules are only imported once, the measurements
+must be made in a fresh interpreter rather than the current one.
+
+Python does not time modules loaded with ``importlib.import_module``,
+which Django uses for the settings and for the apps and their models.
+Those modules are not listed themselves, but the modules they import
+are.
+"""
+
+import os
+import subprocess
+import sys
+
+
+IMPORTTIME_PREFIX = "import time:"
+
+# The code run to start the project, depending on whether the WSGI
+# application should be loaded too.
+STARTUP_CODE = "import django; django.setup()"
+WSGI_CODE = (
+    "from django.core.wsgi import get_wsgi_application; "
+    "get_wsgi_application()"
+)
+
+
+def parse_importtime(output):
+    """
+    Parse the timings written by Python's ``-X importtime`` option.
+
+    The cumulative time of a module includes the modules it imports
+    while it is executed. Its self time excludes them.
+
+    Args:
+        output:
+            The standard error of the profiled process. Lines that do
+            not contain timings are ignored.
+
+    Returns:
+        A dictionary containing the total time taken and the entry for
+        each imported module. Times are given in seconds.
+    """
+    entries = []
+    total = 0.0
+
+    for line in output.splitlines():
+        if not line.startswith(IMPORTTIME_PREFIX):
+            continue
+
+        timings = line.partition(IMPORTTIME_PREFIX)[2]
+        self_time, cumulative, name = timings.split("|")
+
+        # The header line labels the columns rather than timing a module.
+        if not self_time.strip().isdigit():
+            continue
+
+        entry = {
+            "cumulative": int(cumulative) / 1e6,
+            "module": name.strip(),
+            "self": int(self_time) / 1e6,
+        }
+        entries.append(entry)
+
+        # Nested imports are indented by two spaces for each level, so
+        # only the top level imports add to the total.
+        if name == f" {entry['module']}":
+            total += entry["cumulative"]
+
+    return {"entries": entries, "total": total}
+
+
+def profile_startup(load_wsgi=False, cwd=None):
+    """
+    Profile the imports made while the project starts.
+
+    Args:
+        load_wsgi:
+            A boolean indicating if the WSGI application should be
+            loaded too, which also imports the middleware.
+        cwd:
+            The directory to start the project in.
+
+    Returns:
+        The results of :py:func:`parse_importtime` for the new process.
+
+    Raises:
+        subprocess.CalledProcessError:
+            If the project fails to start.
+    """
+    env = dict(os.environ)
+    env.setdefault("DJANGO_SETTINGS_MODULE", "km_api.settings")
+
+    process = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            WSGI_CODE if load_wsgi else STARTUP_CODE,
+        ],
+        check=True,
+        cwd=cwd,
+        env=env,
+        stderr=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+        universal_newlines=True,
+    )
+
+    return parse_importtime(process.stderr)
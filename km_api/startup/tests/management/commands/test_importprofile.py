@@ -0,0 +1,50 @@
+from io import StringIO
+from unittest import mock
+
+from django.core import management
+
+from startup.management.commands.importprofile import Command
+
+
+RESULTS = {
+    "entries": [
+        {"cumulative": 0.002, "module": "fast", "self": 0.002},
+        {"cumulative": 0.005, "module": "slow", "self": 0.001},
+    ],
+    "total": 0.01,
+}
+
+
+def test_importprofile():
+    """
+    The command should report the slowest modules by cumulative time.
+    """
+    output = StringIO()
+
+    with mock.patch.object(
+        Command, "profile", autospec=True, return_value=RESULTS
+    ) as mock_profile:
+        management.call_command("importprofile", limit=1, stdout=output)
+
+    lines = output.getvalue().splitlines()
+
+    assert mock_profile.call_args[0] == (False,)
+    assert lines[0] == "Imported 2 modules in 10.0 ms."
+    assert lines[-1].endswith("slow")
+    assert len(lines) == 4
+
+
+def test_importprofile_sort_self():
+    """
+    The modules can be sorted by the time spent in the module itself.
+    """
+    output = StringIO()
+
+    with mock.patch.object(
+        Command, "profile", autospec=True, return_value=RESULTS
+    ):
+        management.call_command(
+            "importprofile", limit=1, sort="self", stdout=output
+        )
+
+    assert output.getvalue().splitlines()[-1].endswith("fast")
@@ -0,0 +1,117 @@
+import json
+import socket
+from unittest import mock
+
+import pytest
+
+from startup import hosts
+
+
+def test_discover_ecs_hosts(tmpdir):
+    """
+    The private IP of the task should be read from the metadata
+    endpoint and cached for other processes.
+    """
+    cache_path = str(tmpdir.join("hosts.json"))
+    response = mock.Mock()
+    response.json.return_value = {
+        "Containers": [{"Networks": [{"IPv4Addresses": ["10.0.0.1"]}]}]
+    }
+
+    with mock.patch("requests.get", return_value=response) as mock_get:
+        result = hosts.discover_ecs_hosts(cache_path)
+
+    assert result == ["10.0.0.1"]
+    assert mock_get.call_args == mock.call(
+        hosts.METADATA_URL, timeout=hosts.METADATA_TIMEOUT
+    )
+    assert hosts.read_cache(cache_path) == ["10.0.0.1"]
+
+
+def test_discover_ecs_hosts_cached(tmpdir):
+    """
+    If another process cached the hosts, the metadata endpoint should
+    not be queried.
+    """
+    cache_path = str(tmpdir.join("hosts.json"))
+    hosts.write_cache(cache_path, ["10.0.0.2"])
+
+    with mock.patch("requests.get") as mock_get:
+        result = hosts.discover_ecs_hosts(cache_path)
+
+    assert result == ["10.0.0.2"]
+    assert mock_get.call_count == 0
+
+
+def test_lazy_host_list():
+    """
+    Hosts should only be discovered once the list is used, and only
+    once.
+    """
+    discover = mock.Mock(return_value=["10.0.0.1", "example.com"])
+    host_list = hosts.LazyHostList(["example.com"], discover)
+
+    assert discover.call_count == 0
+    assert list(host_list) == ["example.com", "10.0.0.1"]
+    assert len(host_list) == 2
+    assert discover.call_count == 1
+
+
+def test_lazy_host_list_failure():
+    """
+    If discovery fails, the static hosts should be used and discovery
+    should not be retried until the retry interval has passed.
+    """
+    discover = mock.Mock(side_effect=[ConnectionError(), ["10.0.0.1"]])
+    host_list = hosts.LazyHostList(["example.com"], discover)
+
+    with mock.patch.object(
+        hosts.time, "monotonic", autospec=True, return_value=0
+    ) as mock_monotonic:
+        assert list(host_list) == ["example.com"]
+        assert list(host_list) == ["example.com"]
+        assert discover.call_count == 1
+
+        mock_monotonic.return_value = hosts.RETRY_INTERVAL
+
+        assert list(host_list) == ["example.com", "10.0.0.1"]
+
+
+@pytest.mark.parametrize(
+    "contents",
+    [
+        "not json",
+        json.dumps(["10.0.0.1"]),
+        json.dumps({"hostname": "other-container", "hosts": ["10.0.0.1"]}),
+    ],
+)
+def test_read_cache_unusable(contents, tmpdir):
+    """
+    Malformed caches and caches written by other containers should be
+    ignored.
+    """
+    cache_file = tmpdir.join("hosts.json")
+    cache_file.write(contents)
+
+    assert hosts.read_cache(str(cache_file)) is None
+
+
+def test_read_cache_missing(tmpdir):
+    """
+    If there is no cache, ``None`` should be returned.
+    """
+    assert hosts.read_cache(str(tmpdir.join("missing.json"))) is None
+
+
+def test_write_cache(tmpdir):
+    """
+    The cache should record the container that wrote it.
+    """
+    cache_file = tmpdir.join("hosts.json")
+
+    hosts.write_cache(str(cache_file), ["10.0.0.1"])
+
+    assert json.loads(cache_file.read()) == {
+        "hostname": socket.gethostname(),
+        "hosts": ["10.0.0.1"],
+    }
@@ -0,0 +1,47 @@
+from startup import profiling
+
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       500 |        500 |   marshal
+import time:      1000 |       1500 | _frozen_importlib_external
+Some other output
+import time:      2000 |       2000 |     parent.child
+import time:      3000 |       5000 |   parent.sibling
+import time:      1000 |       6000 | parent
+"""
+
+
+def test_parse_importtime():
+    """
+    The timings of each module should be parsed, and the total should
+    only include top level imports.
+    """
+    results = profiling.parse_importtime(IMPORTTIME_OUTPUT)
+
+    assert [entry["module"] for entry in results["entries"]] == [
+        "marshal",
+        "_frozen_importlib_external",
+        "parent.child",
+        "parent.sibling",
+        "parent",
+    ]
+    assert results["entries"][-1] == {
+        "cumulative": 0.006,
+        "module": "parent",
+        "self": 0.001,
+    }
+    assert results["total"] == 0.0075
+
+
+def test_profile_startup():
+    """
+    Profiling the startup should record the modules imported while the
+    project is set up in a new interpreter.
+    """
+    results = profiling.profile_startup()
+    modules = {entry["module"] for entry in results["entries"]}
+
+    assert "django" in modules
+    assert "know_me.signals" in modules
+    assert results["total"] > 0
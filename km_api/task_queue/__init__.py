@@ -0,0 +1,9 @@
+"""A task queue backed by the database.
+
+Work that does not need to happen while a request is being processed,
+such as sending email, is saved as a task and performed later by the
+``runtaskworker`` management command. Because the queue is stored in
+the application's database, no external message broker is required.
+"""
+
+default_app_config = "task_queue.apps.TaskQueueConfig"
@@ -0,0 +1,27 @@
+from django.contrib import admin
+
+from task_queue import models
+
+
+@admin.register(models.Task)
+class TaskAdmin(admin.ModelAdmin):
+    """
+    Admin for queued tasks.
+    """
+
+    date_hierarchy = "created_at"
+    fields = (
+        "name",
+        "status",
+        "payload",
+        "attempts",
+        "max_attempts",
+        "run_at",
+        "locked_at",
+        "last_error",
+        "created_at",
+        "updated_at",
+    )
+    list_display = ("name", "status", "attempts", "run_at")
+    list_filter = ("name", "status")
+    readonly_fields = ("created_at", "updated_at")
@@ -0,0 +1,22 @@
+"""App configurations for the ``task_queue`` module.
+"""
+
+from django.apps import AppConfig
+from django.utils.module_loading import autodiscover_modules
+from django.utils.translation import ugettext_lazy as _
+
+
+class TaskQueueConfig(AppConfig):
+    """
+    Default app config.
+    """
+
+    name = "task_queue"
+    verbose_name = _("Task Queue")
+
+    def ready(self):
+        """
+        Import the ``tasks`` module of each installed app so that the
+        tasks they define are registered.
+        """
+        autodiscover_modules("tasks")
@@ -0,0 +1,120 @@
+"""Email backend that sends email through the task queue.
+"""
+
+import base64
+
+from django.core.mail import EmailMessage, EmailMultiAlternatives
+from django.core.mail.backends.base import BaseEmailBackend
+
+
+class QueuedEmailBackend(BaseEmailBackend):
+    """
+    Email backend that queues messages instead of sending them.
+
+    Each message is saved as a task that is sent by a worker using the
+    backend specified by the ``TASK_QUEUE_EMAIL_BACKEND`` setting.
+    Since sending email no longer happens while a request is being
+    processed, slow or failing email providers do not affect the
+    request, and failed messages are retried.
+    """
+
+    def send_messages(self, email_messages):
+        """
+        Queue messages to be sent.
+
+        Args:
+            email_messages:
+                The messages to queue.
+
+        Returns:
+            The number of messages that were queued.
+        """
+        # Imported here because the tasks module imports this module.
+        from task_queue.tasks import send_email_message
+
+        count = 0
+        for message in email_messages:
+            if not message.recipients():
+                continue
+
+            send_email_message.enqueue(message=serialize_message(message))
+            count += 1
+
+        return count
+
+
+def deserialize_message(data):
+    """
+    Create an email message from its serialized form.
+
+    Args:
+        data:
+            The dictionary created by :py:func:`serialize_message`.
+
+    Returns:
+        An ``EmailMessage`` or ``EmailMultiAlternatives`` instance.
+    """
+    message_class = EmailMessage
+    kwargs = {}
+    if data["alternatives"]:
+        message_class = EmailMultiAlternatives
+        kwargs["alternatives"] = [tuple(a) for a in data["alternatives"]]
+
+    message = message_class(
+        attachments=[
+            (
+                name,
+                base64.b64decode(content) if encoded else content,
+                mimetype,
+            )
+            for name, content, mimetype, encoded in data["attachments"]
+        ],
+        bcc=data["bcc"],
+        body=data["body"],
+        cc=data["cc"],
+        from_email=data["from_email"],
+        headers=data["headers"],
+        reply_to=data["reply_to"],
+        subject=data["subject"],
+        to=data["to"],
+        **kwargs,
+    )
+    message.content_subtype = data["content_subtype"]
+
+    return message
+
+
+def serialize_message(message):
+    """
+    Convert an email message into a JSON serializable dictionary.
+
+    Args:
+        message:
+            The ``EmailMessage`` to serialize. Attachments must be
+            provided as ``(filename, content, mimetype)`` tuples rather
+            than MIME objects.
+
+    Returns:
+        A dictionary containing the contents of the message.
+    """
+    attachments = []
+    for name, content, mimetype in message.attachments:
+        if isinstance(content, bytes):
+            content = base64.b64encode(content).decode()
+            attachments.append((name, content, mimetype, True))
+        else:
+            attachments.append((name, content, mimetype, False))
+
+    return {
+        "alternatives": list(getattr(message, "alternatives", [])),
+        "attachments": attachments,
+        "bcc": list(message.bcc),
+        "body": message.body,
+        "cc": list(message.cc),
+        "content_subtype": message.content_subtype,
+        "from_email": message.from_email,
+        "headers": dict(message.extra_headers),
+        "reply_to": list(message.reply_to),
+        "subject": message.subject,
+        "to": list(message.to),
+    }
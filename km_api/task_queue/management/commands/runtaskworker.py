@@ -0,0 +1,82 @@
+import time
+
+from django.core import management
+
+from task_queue import worker
+
+
+class Command(management.BaseCommand):
+    """
+    Management command to run queued tasks.
+    """
+
+    help = (
+        "Run tasks from the task queue. By default the worker runs until it "
+        "is stopped, polling for new tasks when the queue is empty."
+    )
+
+    def add_arguments(self, parser):
+        """
+        Add the command's arguments.
+
+        Args:
+            parser:
+                The parser to add arguments to.
+        """
+        parser.add_argument(
+            "--batch-size",
+            default=50,
+            help="The maximum number of tasks to claim at once.",
+            type=int,
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit once there are no more tasks ready to run.",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            default=5.0,
+            help="The number of seconds to wait when the queue is empty.",
+            type=float,
+        )
+
+    def handle(self, *args, **options):
+        """
+        Execute the command.
+
+        Args:
+            *args:
+                Positional arguments provided to the command.
+            **options:
+                Keyword arguments provided to the command.
+        """
+        total_succeeded = total_failed = 0
+
+        while True:
+            tasks = worker.claim_tasks(options["batch_size"])
+
+            if not tasks:
+                if options["once"]:
+                    break
+
+                time.sleep(options["poll_interval"])
+
+                continue
+
+            succeeded, failed = worker.run_tasks(tasks)
+            total_succeeded += succeeded
+            total_failed += failed
+
+            if options["verbosity"] > 1:
+                self.stdout.write(
+                    f"Ran {len(tasks)} tasks: {succeeded} succeeded and "
+                    f"{failed} failed."
+                )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Finished running tasks: {total_succeeded} succeeded and "
+                f"{total_failed} failed."
+            )
+        )
@@ -0,0 +1,127 @@
+# Generated by Django 2.2.28 on 2026-10-19 13:14
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="Task",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "attempts",
+                    models.PositiveSmallIntegerField(
+                        default=0,
+                        help_text="The number of times the task has been attempted.",
+                        verbose_name="attempts",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True,
+                        help_text="The time that the task was created.",
+                        verbose_name="created at",
+                    ),
+                ),
+                (
+                    "last_error",
+                    models.TextField(
+                        blank=True,
+                        help_text="The error raised by the most recent attempt.",
+                        verbose_name="last error",
+                    ),
+                ),
+                (
+                    "locked_at",
+                    models.DateTimeField(
+                        blank=True,
+                        help_text="The time that a worker started running the task.",
+                        null=True,
+                        verbose_name="locked at",
+                    ),
+                ),
+                (
+                    "max_attempts",
+                    models.PositiveSmallIntegerField(
+                        default=5,
+                        help_text="The number of times the task is attempted before it is marked as failed.",
+                        verbose_name="max attempts",
+                    ),
+                ),
+                (
+                    "name",
+                    models.CharField(
+                        help_text="The name of the registered task to run.",
+                        max_length=255,
+                        verbose_name="name",
+                    ),
+                ),
+                (
+                    "payload",
+                    models.TextField(
+                        default="{}",
+                        help_text="The JSON encoded arguments passed to the task.",
+                        verbose_name="payload",
+                    ),
+                ),
+                (
+                    "run_at",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now,
+                        help_text="The earliest time that the task may be run.",
+                        verbose_name="run at",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("failed", "failed"),
+                            ("pending", "pending"),
+                            ("running", "running"),
+                        ],
+                        default="pending",
+                        help_text="The current state of the task.",
+                        max_length=10,
+                        verbose_name="status",
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(
+                        auto_now=True,
+                        help_text="The time that the task was last updated.",
+                        verbose_name="updated at",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "task",
+                "verbose_name_plural": "tasks",
+                "ordering": ("run_at",),
+            },
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["status", "run_at"],
+                name="task_queue__status_cf64d2_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,100 @@
+import json
+
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import ugettext_lazy as _
+
+
+class Task(models.Model):
+    """
+    A unit of work waiting to be performed by a worker.
+    """
+
+    STATUS_FAILED = "failed"
+    STATUS_PENDING = "pending"
+    STATUS_RUNNING = "running"
+
+    STATUS_CHOICES = (
+        (STATUS_FAILED, _("failed")),
+        (STATUS_PENDING, _("pending")),
+        (STATUS_RUNNING, _("running")),
+    )
+
+    attempts = models.PositiveSmallIntegerField(
+        default=0,
+        help_text=_("The number of times the task has been attempted."),
+        verbose_name=_("attempts"),
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        help_text=_("The time that the task was created."),
+        verbose_name=_("created at"),
+    )
+    last_error = models.TextField(
+        blank=True,
+        help_text=_("The error raised by the most recent attempt."),
+        verbose_name=_("last error"),
+    )
+    locked_at = models.DateTimeField(
+        blank=True,
+        help_text=_("The time that a worker started running the task."),
+        null=True,
+        verbose_name=_("locked at"),
+    )
+    max_attempts = models.PositiveSmallIntegerField(
+        default=5,
+        help_text=_(
+            "The number of times the task is attempted before it is marked "
+            "as failed."
+        ),
+        verbose_name=_("max attempts"),
+    )
+    name = models.CharField(
+        help_text=_("The name of the registered task to run."),
+        max_length=255,
+        verbose_name=_("name"),
+    )
+    payload = models.TextField(
+        default="{}",
+        help_text=_("The JSON encoded arguments passed to the task."),
+        verbose_name=_("payload"),
+    )
+    run_at = models.DateTimeField(
+        default=timezone.now,
+        help_text=_("The earliest time that the task may be run."),
+        verbose_name=_("run at"),
+    )
+    status = models.CharField(
+        choices=STATUS_CHOICES,
+        default=STATUS_PENDING,
+        help_text=_("The current state of the task."),
+        max_length=10,
+        verbose_name=_("status"),
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        help_text=_("The time that the task was last updated."),
+        verbose_name=_("updated at"),
+    )
+
+    class Meta:
+        indexes = [models.Index(fields=["status", "run_at"])]
+        ordering = ("run_at",)
+        verbose_name = _("task")
+        verbose_name_plural = _("tasks")
+
+    def __str__(self):
+        """
+        Get a user readable string representation of the instance.
+
+        Returns:
+            A string containing the task's name and ID.
+        """
+        return f"{self.name} (ID: {self.pk})"
+
+    @property
+    def arguments(self):
+        """
+        The decoded payload of the task.
+        """
+        return json.loads(self.payload)
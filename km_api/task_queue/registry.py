@@ -0,0 +1,132 @@
+"""Registration and enqueueing of tasks.
+
+Tasks are plain functions registered with the :py:func:`task`
+decorator. Workers look up the function to run by the name it was
+registered under, so every module defining tasks should be named
+``tasks`` in order to be imported when the app registry is ready.
+
+Example::
+
+    from task_queue.registry import task
+
+    @task("know_me.send_invite")
+    def send_invite(accessor_id):
+        ...
+
+    send_invite.enqueue(accessor_id=accessor.pk)
+"""
+
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from task_queue import models
+
+
+_registry = {}
+
+
+class RegisteredTask:
+    """
+    A function that can be run by a task worker.
+    """
+
+    def __init__(self, func, name, batch=False, max_attempts=5):
+        """
+        Create a new registered task.
+
+        Args:
+            func:
+                The function to run.
+            name:
+                The unique name of the task.
+            batch:
+                If ``True``, pending tasks are grouped together and the
+                function is called once with a list containing the
+                arguments of each task in the group. Otherwise the
+                function is called with the arguments of each task as
+                keyword arguments.
+            max_attempts:
+                The number of times to attempt the task before marking
+                it as failed.
+        """
+        self.batch = batch
+        self.func = func
+        self.max_attempts = max_attempts
+        self.name = name
+
+    def __call__(self, *args, **kwargs):
+        """
+        Run the task immediately.
+        """
+        return self.func(*args, **kwargs)
+
+    def enqueue(self, **kwargs):
+        """
+        Add the task to the queue.
+
+        The task is saved using the current database transaction, so it
+        is only visible to workers once the transaction is committed and
+        is discarded if the transaction is rolled back.
+
+        Args:
+            **kwargs:
+                The arguments to run the task with. They must be JSON
+                serializable.
+
+        Returns:
+            The created :py:class:`task_queue.models.Task` instance.
+        """
+        return models.Task.objects.create(
+            max_attempts=self.max_attempts,
+            name=self.name,
+            payload=json.dumps(kwargs, cls=DjangoJSONEncoder),
+        )
+
+
+def get_task(name):
+    """
+    Get a registered task.
+
+    Args:
+        name:
+            The name the task was registered with.
+
+    Returns:
+        The :py:class:`RegisteredTask` with the given name.
+
+    Raises:
+        KeyError:
+            If there is no task with the given name.
+    """
+    return _registry[name]
+
+
+def task(name, batch=False, max_attempts=5):
+    """
+    Decorator to register a function as a task.
+
+    Args:
+        name:
+            The unique name of the task.
+        batch:
+            A boolean indicating if pending instances of the task should
+            be run as a batch.
+        max_attempts:
+            The number of times to attempt the task before marking it as
+            failed.
+
+    Returns:
+        A decorator that registers the function it wraps and returns a
+        :py:class:`RegisteredTask`.
+    """
+
+    def decorator(func):
+        registered = RegisteredTask(
+            func, name, batch=batch, max_attempts=max_attempts
+        )
+        _registry[name] = registered
+
+        return registered
+
+    return decorator
@@ -0,0 +1,36 @@
+"""Tasks provided by the ``task_queue`` module.
+"""
+
+import logging
+
+from django.conf import settings
+from django.core.mail import get_connection
+
+from task_queue.backends import deserialize_message
+from task_queue.registry import task
+
+
+logger = logging.getLogger(__name__)
+
+
+# The name is kept from when messages were sent in batches so that
+# messages queued before then are still sent.
+@task("task_queue.send_email_messages")
+def send_email_message(message):
+    """
+    Send a queued email message.
+
+    Each message is sent by its own task so that if sending a message
+    fails, only that message is retried. Otherwise the messages that
+    were already delivered would be sent again.
+
+    Args:
+        message:
+            The serialized message to send.
+    """
+    connection = get_connection(
+        backend=settings.TASK_QUEUE_EMAIL_BACKEND, fail_silently=False
+    )
+    connection.send_messages([deserialize_message(message)])
+
+    logger.info("Sent queued email message")
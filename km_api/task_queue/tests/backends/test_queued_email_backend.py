@@ -0,0 +1,78 @@
+from unittest import mock
+
+from django.core import mail
+from django.test import override_settings
+
+from task_queue import models, worker
+from task_queue.backends import deserialize_message, serialize_message
+
+
+@override_settings(
+    EMAIL_BACKEND="task_queue.backends.QueuedEmailBackend",
+    TASK_QUEUE_EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend",
+)
+def test_send_queued(db):
+    """
+    Sending email should queue the messages, which are sent by a
+    worker.
+    """
+    mail.send_mail("Foo", "Body", "from@example.com", ["a@example.com"])
+    mail.send_mail("Bar", "Body", "from@example.com", ["b@example.com"])
+
+    assert len(mail.outbox) == 0
+    assert models.Task.objects.count() == 2
+
+    assert worker.run_tasks(worker.claim_tasks(10)) == (2, 0)
+    assert [m.subject for m in mail.outbox] == ["Foo", "Bar"]
+
+
+def test_serialize_round_trip():
+    """
+    Serializing and deserializing a message should preserve its
+    contents.
+    """
+    message = mail.EmailMultiAlternatives(
+        attachments=[("foo.bin", b"\x00\x01", "application/octet-stream")],
+        body="Body",
+        from_email="from@example.com",
+        headers={"X-Foo": "bar"},
+        subject="Subject",
+        to=["to@example.com"],
+    )
+    message.attach_alternative("<p>Body</p>", "text/html")
+
+    result = deserialize_message(serialize_message(message))
+
+    assert result.alternatives == message.alternatives
+    assert result.attachments == message.attachments
+    assert result.extra_headers == message.extra_headers
+    assert result.message().as_bytes().count(b"Subject: Subject") == 1
+
+
+@override_settings(
+    EMAIL_BACKEND="task_queue.backends.QueuedEmailBackend",
+    TASK_QUEUE_EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend",
+)
+def test_send_queued_failure(db):
+    """
+    If sending one message fails, only that message should be retried.
+    """
+    mail.send_mail("Foo", "Body", "from@example.com", ["a@example.com"])
+    mail.send_mail("Bar", "Body", "from@example.com", ["b@example.com"])
+
+    locmem_send = mail.backends.locmem.EmailBackend.send_messages
+
+    def send_messages(self, messages):
+        if messages[0].subject == "Bar":
+            raise ConnectionError("Unable to reach the email provider.")
+
+        return locmem_send(self, messages)
+
+    with mock.patch(
+        "django.core.mail.backends.locmem.EmailBackend.send_messages",
+        new=send_messages,
+    ):
+        assert worker.run_tasks(worker.claim_tasks(10)) == (1, 1)
+
+    assert [m.subject for m in mail.outbox] == ["Foo"]
+    assert models.Task.objects.count() == 1
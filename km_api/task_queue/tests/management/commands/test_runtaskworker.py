@@ -0,0 +1,20 @@
+from unittest import mock
+
+from django.core import management
+
+from task_queue import models, worker
+
+
+def test_run_once(db):
+    """
+    Running the worker with ``--once`` should run every available task
+    and then exit.
+    """
+    models.Task.objects.create(name="foo")
+
+    with mock.patch.object(
+        worker, "run_tasks", autospec=True, return_value=(1, 0)
+    ) as mock_run:
+        management.call_command("runtaskworker", "--once")
+
+    assert mock_run.call_count == 1
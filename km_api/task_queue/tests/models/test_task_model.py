@@ -0,0 +1,19 @@
+from task_queue import models
+
+
+def test_arguments():
+    """
+    The task's arguments should be decoded from its payload.
+    """
+    task = models.Task(payload='{"foo": "bar"}')
+
+    assert task.arguments == {"foo": "bar"}
+
+
+def test_string_conversion(db):
+    """
+    Converting a task to a string should return its name and ID.
+    """
+    task = models.Task.objects.create(name="foo")
+
+    assert str(task) == f"foo (ID: {task.pk})"
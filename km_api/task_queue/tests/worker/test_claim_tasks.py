@@ -0,0 +1,56 @@
+import datetime
+
+from django.utils import timezone
+
+from task_queue import models, worker
+
+
+def test_claim_tasks(db):
+    """
+    Claiming tasks should return pending tasks that are ready to run and
+    mark them as running.
+    """
+    ready = models.Task.objects.create(name="foo")
+    models.Task.objects.create(
+        name="foo", run_at=timezone.now() + datetime.timedelta(hours=1)
+    )
+    models.Task.objects.create(name="foo", status=models.Task.STATUS_FAILED)
+
+    tasks = worker.claim_tasks(10)
+
+    assert tasks == [ready]
+
+    ready.refresh_from_db()
+    assert ready.attempts == 1
+    assert ready.locked_at is not None
+    assert ready.status == models.Task.STATUS_RUNNING
+
+
+def test_claim_tasks_limit(db):
+    """
+    No more than the specified number of tasks should be claimed.
+    """
+    for _ in range(3):
+        models.Task.objects.create(name="foo")
+
+    assert len(worker.claim_tasks(2)) == 2
+    assert len(worker.claim_tasks(2)) == 1
+
+
+def test_claim_tasks_stale_lock(db):
+    """
+    Tasks that have been running for longer than the lock timeout should
+    be claimed again.
+    """
+    stale = models.Task.objects.create(
+        locked_at=timezone.now() - worker.LOCK_TIMEOUT * 2,
+        name="foo",
+        status=models.Task.STATUS_RUNNING,
+    )
+    models.Task.objects.create(
+        locked_at=timezone.now(),
+        name="foo",
+        status=models.Task.STATUS_RUNNING,
+    )
+
+    assert worker.claim_tasks(10) == [stale]
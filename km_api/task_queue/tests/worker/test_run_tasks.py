@@ -0,0 +1,87 @@
+from unittest import mock
+
+from task_queue import models, registry, worker
+
+
+calls = mock.Mock()
+
+
+@registry.task("task_queue.tests.batch", batch=True)
+def batch_task(payloads):
+    calls.batch(payloads)
+
+
+@registry.task("task_queue.tests.failing", max_attempts=2)
+def failing_task():
+    raise ValueError("Failed")
+
+
+@registry.task("task_queue.tests.single")
+def single_task(value):
+    calls.single(value)
+
+
+def claim(name, count=1, **kwargs):
+    """
+    Create and claim tasks with the given name.
+    """
+    for i in range(count):
+        models.Task.objects.create(name=name, **kwargs)
+
+    return worker.claim_tasks(count)
+
+
+def test_run_batch_task(db):
+    """
+    Tasks registered as batch tasks should be run with a single call.
+    """
+    calls.reset_mock()
+    tasks = claim("task_queue.tests.batch", count=3, payload='{"a": 1}')
+
+    assert worker.run_tasks(tasks) == (3, 0)
+    assert calls.batch.call_args == mock.call([{"a": 1}] * 3)
+    assert not models.Task.objects.exists()
+
+
+def test_run_failing_task(db):
+    """
+    Failed tasks should be retried later until they run out of
+    attempts.
+    """
+    failing_task.enqueue()
+
+    assert worker.run_tasks(worker.claim_tasks(1)) == (0, 1)
+
+    task = models.Task.objects.get()
+    assert task.status == models.Task.STATUS_PENDING
+    assert task.run_at > task.created_at
+    assert "Failed" in task.last_error
+
+    task.run_at = task.created_at
+    task.save()
+
+    assert worker.run_tasks(worker.claim_tasks(1)) == (0, 1)
+
+    task.refresh_from_db()
+    assert task.status == models.Task.STATUS_FAILED
+
+
+def test_run_single_task(db):
+    """
+    Regular tasks should be called with their arguments.
+    """
+    calls.reset_mock()
+    tasks = claim("task_queue.tests.single", payload='{"value": "foo"}')
+
+    assert worker.run_tasks(tasks) == (1, 0)
+    assert calls.single.call_args == mock.call("foo")
+
+
+def test_run_unknown_task(db):
+    """
+    Tasks without a registered function should fail.
+    """
+    tasks = claim("task_queue.tests.unknown")
+
+    assert worker.run_tasks(tasks) == (0, 1)
+    assert "no registered task" in models.Task.objects.get().last_error
@@ -0,0 +1,153 @@
+"""Functions used by workers to run queued tasks.
+"""
+
+import datetime
+import itertools
+import logging
+import traceback
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from task_queue import models, registry
+
+
+logger = logging.getLogger(__name__)
+
+
+LOCK_TIMEOUT = datetime.timedelta(minutes=10)
+"""
+The amount of time after which a running task is assumed to belong to
+a worker that has died and is made available to other workers.
+"""
+
+RETRY_DELAY = datetime.timedelta(seconds=30)
+"""
+The delay before the first retry of a failed task. The delay is doubled
+for each subsequent attempt.
+"""
+
+
+def claim_tasks(limit):
+    """
+    Claim a batch of tasks that are ready to run.
+
+    The rows are locked with ``SKIP LOCKED`` so that multiple workers
+    can claim tasks at the same time without claiming the same task.
+
+    Args:
+        limit:
+            The maximum number of tasks to claim.
+
+    Returns:
+        A list of the claimed tasks.
+    """
+    now = timezone.now()
+    available = Q(status=models.Task.STATUS_PENDING, run_at__lte=now)
+    available |= Q(
+        status=models.Task.STATUS_RUNNING, locked_at__lt=now - LOCK_TIMEOUT
+    )
+
+    with transaction.atomic():
+        tasks = list(
+            models.Task.objects.select_for_update(skip_locked=True)
+            .filter(available)
+            .order_by("run_at", "pk")[:limit]
+        )
+
+        for task in tasks:
+            task.attempts += 1
+            task.locked_at = now
+            task.status = models.Task.STATUS_RUNNING
+
+        models.Task.objects.bulk_update(
+            tasks, ["attempts", "locked_at", "status"]
+        )
+
+    return tasks
+
+
+def run_tasks(tasks):
+    """
+    Run a list of claimed tasks.
+
+    Tasks registered as batch tasks are grouped by name and run
+    together. Tasks that succeed are deleted. Tasks that fail are
+    rescheduled with an exponential backoff until they have used all
+    of their attempts, at which point they are marked as failed.
+
+    Args:
+        tasks:
+            The tasks to run.
+
+    Returns:
+        A tuple containing the number of tasks that succeeded and the
+        number of tasks that failed.
+    """
+    succeeded = failed = 0
+
+    tasks = sorted(tasks, key=lambda t: t.name)
+    for name, group in itertools.groupby(tasks, key=lambda t: t.name):
+        group = list(group)
+
+        try:
+            registered = registry.get_task(name)
+        except KeyError:
+            _fail_tasks(group, f"There is no registered task named {name}.")
+            failed += len(group)
+
+            continue
+
+        if registered.batch:
+            batches = [group]
+        else:
+            batches = [[task] for task in group]
+
+        for batch in batches:
+            try:
+                if registered.batch:
+                    registered([task.arguments for task in batch])
+                else:
+                    registered(**batch[0].arguments)
+            except Exception:
+                logger.exception("Task %s failed", name)
+                _fail_tasks(batch, traceback.format_exc())
+                failed += len(batch)
+            else:
+                models.Task.objects.filter(
+                    pk__in=[task.pk for task in batch]
+                ).delete()
+                succeeded += len(batch)
+
+    return succeeded, failed
+
+
+def _fail_tasks(tasks, error):
+    """
+    Record the failure of tasks and schedule any retries.
+
+    Args:
+        tasks:
+            The tasks that failed.
+        error:
+            A description of the error that caused the failure.
+    """
+    now = timezone.now()
+
+    for task in tasks:
+        task.last_error = error
+        task.locked_at = None
+
+        if task.attempts >= task.max_attempts:
+            task.status = models.Task.STATUS_FAILED
+            logger.error(
+                "Task %s failed after %d attempts", task, task.attempts
+            )
+        else:
+            task.run_at = now + RETRY_DELAY * 2 ** (task.attempts - 1)
+            task.status = models.Task.STATUS_PENDING
+
+    models.Task.objects.bulk_update(
+        tasks, ["last_error", "locked_at", "run_at", "status"]
+    )
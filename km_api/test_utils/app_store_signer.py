@@ -0,0 +1,223 @@
+"""
+A fake certificate authority for signing App Store data.
+
+The certificate chain mirrors the one Apple uses to sign server
+notifications, so payloads signed by it pass verification as long as
+the fingerprint of its root certificate is trusted.
+"""
+import base64
+import datetime
+import json
+
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.asymmetric.utils import (
+    decode_dss_signature,
+)
+from cryptography.x509.oid import NameOID
+
+from apple import jws
+
+
+def _encode(data):
+    """
+    Encode bytes as unpadded base64url.
+    """
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+class AppStoreSigner:
+    """
+    Signer that creates payloads in the format of the App Store.
+    """
+
+    # The bundle ID that notifications are signed for by default.
+    bundle_id = "com.example.app"
+
+    def __init__(self):
+        """
+        Create a new signer with a freshly generated certificate chain.
+        """
+        self.root_key = ec.generate_private_key(ec.SECP256R1())
+        self.root = self.create_certificate(
+            "Test Root", self.root_key, self.root_key, ca=True
+        )
+
+        self.intermediate_key = ec.generate_private_key(ec.SECP256R1())
+        self.intermediate = self.create_certificate(
+            "Test Intermediate",
+            self.intermediate_key,
+            self.root_key,
+            issuer=self.root,
+            ca=True,
+            marker=jws.INTERMEDIATE_CERTIFICATE_OID,
+        )
+
+        self.leaf_key = ec.generate_private_key(ec.SECP256R1())
+        self.leaf = self.create_certificate(
+            "Test Leaf",
+            self.leaf_key,
+            self.intermediate_key,
+            issuer=self.intermediate,
+            marker=jws.LEAF_CERTIFICATE_OID,
+        )
+
+    @property
+    def chain(self):
+        """
+        Returns:
+            The leaf, intermediate, and root certificates.
+        """
+        return [self.leaf, self.intermediate, self.root]
+
+    @property
+    def root_fingerprint(self):
+        """
+        Returns:
+            The SHA-256 fingerprint of the root certificate.
+        """
+        return self.root.fingerprint(hashes.SHA256()).hex()
+
+    @staticmethod
+    def create_certificate(
+        name,
+        key,
+        issuer_key,
+        issuer=None,
+        ca=False,
+        marker=None,
+        not_valid_after=None,
+    ):
+        """
+        Create a certificate.
+
+        Args:
+            name:
+                The common name of the certificate's subject.
+            key:
+                The private key whose public key is certified.
+            issuer_key:
+                The private key used to sign the certificate.
+            issuer:
+                The certificate of the issuer. Defaults to a self-signed
+                certificate.
+            ca:
+                A boolean indicating if the certificate may issue other
+                certificates.
+            marker:
+                The OID of an extension to mark the certificate with.
+            not_valid_after:
+                The expiration time of the certificate. Defaults to one
+                day from now.
+
+        Returns:
+            The created certificate.
+        """
+        now = datetime.datetime.now(datetime.timezone.utc)
+        subject = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, name)])
+
+        builder = (
+            x509.CertificateBuilder()
+            .subject_name(subject)
+            .issuer_name(issuer.subject if issuer else subject)
+            .public_key(key.public_key())
+            .serial_number(x509.random_serial_number())
+            .not_valid_before(now - datetime.timedelta(days=1))
+            .not_valid_after(
+                not_valid_after or now + datetime.timedelta(days=1)
+            )
+            .add_extension(
+                x509.BasicConstraints(ca=ca, path_length=None), critical=True
+            )
+        )
+        if marker is not None:
+            builder = builder.add_extension(
+                x509.UnrecognizedExtension(marker, b"\x05\x00"),
+                critical=False,
+            )
+
+        return builder.sign(issuer_key, hashes.SHA256())
+
+    def sign(self, payload, chain=None, key=None, header=None):
+        """
+        Sign a payload.
+
+        Args:
+            payload:
+                The payload to sign.
+            chain:
+                The certificate chain to include in the header. Defaults
+                to the signer's chain.
+            key:
+                The key to sign the payload with. Defaults to the key of
+                the leaf certificate.
+            header:
+                Additional values to include in the header.
+
+        Returns:
+            The signed payload in JWS compact serialization.
+        """
+        chain = chain or self.chain
+        key = key or self.leaf_key
+
+        full_header = {
+            "alg": "ES256",
+            "x5c": [
+                base64.b64encode(
+                    certificate.public_bytes(serialization.Encoding.DER)
+                ).decode("ascii")
+                for certificate in chain
+            ],
+        }
+        full_header.update(header or {})
+
+        signing_input = ".".join(
+            [
+                _encode(json.dumps(full_header).encode()),
+                _encode(json.dumps(payload).encode()),
+            ]
+        )
+        r, s = decode_dss_signature(
+            key.sign(signing_input.encode(), ec.ECDSA(hashes.SHA256()))
+        )
+        signature = r.to_bytes(32, "big") + s.to_bytes(32, "big")
+
+        return f"{signing_input}.{_encode(signature)}"
+
+    def sign_notification(self, transaction_info, signed_date=None, **data):
+        """
+        Sign a server notification containing a transaction.
+
+        The notification is for the signer's ``bundle_id`` in the
+        ``Sandbox`` environment unless other values are given.
+
+        Args:
+            transaction_info:
+                The transaction to include in the notification, or
+                ``None`` to omit the transaction.
+            signed_date:
+                The time that the notification was signed. Defaults to
+                the current time.
+            **data:
+                Additional values for the notification's data.
+
+        Returns:
+            The signed notification.
+        """
+        if signed_date is None:
+            signed_date = datetime.datetime.now(tz=datetime.timezone.utc)
+
+        data.setdefault("bundleId", self.bundle_id)
+        data.setdefault("environment", "Sandbox")
+        if transaction_info is not None:
+            data["signedTransactionInfo"] = self.sign(transaction_info)
+
+        return self.sign(
+            {
+                "data": data,
+                "notificationType": "DID_RENEW",
+                "signedDate": int(signed_date.timestamp() * 1000),
+                "version": "2.0",
+            }
+        )
@@ -11,8 +11,6 @@ from urllib.parse import urljoin
 import requests
 from flask import Flask, jsonify, request
 
-apple_validator_app = Flask(__name__)
-
 
 class StatusCache:
     """
@@ -76,41 +74,59 @@ class StatusCache:
         self.store[key].append({"qualifiers": qualifiers, "status": status})
 
 
-status_cache = StatusCache()
+def create_validator_app(import_name=__name__):
+    """
+    Create a new mock validation service with its own status cache.
+
+    Each app acts as a separate endpoint, such as Apple's production or
+    sandbox endpoint.
 
+    Args:
+        import_name:
+            The name of the Flask app.
 
-@apple_validator_app.route("/", methods=["POST"])
-def index():
-    """
-    Endpoint to mock the behavior of the Apple receipt validation
-    service.
+    Returns:
+        A tuple containing the Flask app and its status cache.
     """
-    data = request.get_json()
-    receipt_data = data.pop("receipt-data", None)
+    app = Flask(import_name)
+    cache = StatusCache()
+
+    @app.route("/", methods=["POST"])
+    def index():
+        """
+        Endpoint to mock the behavior of the Apple receipt validation
+        service.
+        """
+        data = request.get_json()
+        receipt_data = data.pop("receipt-data", None)
+
+        response = cache.next_status(receipt_data, **data)
+        if response is not None:
+            return jsonify(response)
 
-    response = status_cache.next_status(receipt_data, **data)
-    if response is not None:
-        return jsonify(response)
+        return jsonify({"status": 21005})
 
-    return jsonify({"status": 21005})
+    @app.route("/_add-status", methods=["POST"])
+    def add_status():
+        request_data = request.get_json()
+        receipt_data = request_data.pop("receipt-data")
+        status = request_data.pop("status")
 
+        cache.queue_status(receipt_data, status, **request_data)
 
-@apple_validator_app.route("/_add-status", methods=["POST"])
-def add_status():
-    request_data = request.get_json()
-    receipt_data = request_data.pop("receipt-data")
-    status = request_data.pop("status")
+        return jsonify({"ok": True})
 
-    status_cache.queue_status(receipt_data, status, **request_data)
+    @app.route("/_status", methods=["GET"])
+    def server_status():
+        return jsonify({"is_empty": cache.is_empty, "store": cache.store})
 
-    return jsonify({"ok": True})
+    return app, cache
 
 
-@apple_validator_app.route("/_status", methods=["GET"])
-def server_status():
-    return jsonify(
-        {"is_empty": status_cache.is_empty, "store": status_cache.store}
-    )
+apple_validator_app, status_cache = create_validator_app()
+apple_sandbox_validator_app, sandbox_status_cache = create_validator_app(
+    f"{__name__}.sandbox"
+)
 
 
 class AppleReceiptValidationClient(requests.Session):
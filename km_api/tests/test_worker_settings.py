@@ -0,0 +1,46 @@
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+
+from km_api import worker_settings
+
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_installed_apps():
+    """
+    Workers should keep every app except the ones that are only used to
+    serve requests.
+    """
+    expected = [
+        app
+        for app in settings.INSTALLED_APPS
+        if app not in worker_settings.REQUEST_ONLY_APPS
+    ]
+
+    assert worker_settings.INSTALLED_APPS == expected
+    assert set(settings.CUSTOM_APPS) <= set(worker_settings.INSTALLED_APPS)
+
+
+def test_system_checks(tmpdir):
+    """
+    The system checks should pass for the worker settings. Checks are
+    run in a new process since the settings of the current process
+    cannot be replaced.
+    """
+    env = dict(os.environ)
+    env["DJANGO_DB_NAME"] = str(tmpdir.join("db.sqlite3"))
+    env["DJANGO_SETTINGS_MODULE"] = "km_api.worker_settings"
+
+    result = subprocess.run(
+        [sys.executable, "manage.py", "check"],
+        cwd=BASE_DIR,
+        env=env,
+        stderr=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+    )
+
+    assert result.returncode == 0, result.stderr.decode()